@@ -5,6 +5,7 @@ v4.0.0
 
 from fastapi import APIRouter, HTTPException, status
 from app.models.schemas import HandMetadata
+from app.services.async_io import run_blocking
 from app.services.bigquery import BigQueryService
 
 router = APIRouter()
@@ -26,7 +27,8 @@ async def get_hand(hand_id: str):
         500: 서버 에러
     """
     try:
-        hand = bq_service.get_hand_by_id(hand_id)
+        # 동기 BigQuery 호출 → bigquery 스레드 풀에서 실행 (이벤트 루프 비차단)
+        hand = await run_blocking("bigquery", bq_service.get_hand_by_id, hand_id)
 
         if not hand:
             raise HTTPException(
@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException, Query, status
 from typing import Optional, List
 
 from app.models.schemas import SearchResponse
+from app.services.async_io import run_blocking
 from app.services.search import SearchService
 
 
@@ -33,7 +34,7 @@ async def search_hands(
         tags: 태그 필터, 쉼표 구분 (예: "BLUFF,HERO_CALL")
 
     Returns:
-        SearchResponse (results, total, query, query_time_ms)
+        SearchResponse (results, total, query, query_time_ms, rounds)
 
     Raises:
         400: 잘못된 쿼리
@@ -51,8 +52,10 @@ async def search_hands(
         if tags:
             tag_list = [tag.strip().upper() for tag in tags.split(",")]
 
-        # 검색 실행
-        results = search_service.search(
+        # 검색 실행 (동기 Vertex AI/BigQuery 호출 → search 스레드 풀, 이벤트 루프 비차단)
+        results, rounds = await run_blocking(
+            "search",
+            search_service.search_with_rounds,
             query=q,
             limit=limit,
             min_pot_bb=min_pot_bb,
@@ -67,7 +70,8 @@ async def search_hands(
             results=results,
             total=len(results),
             query=q,
-            query_time_ms=query_time_ms
+            query_time_ms=query_time_ms,
+            rounds=rounds
         )
 
     except ValueError as e:
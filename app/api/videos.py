@@ -5,6 +5,7 @@ v4.0.0
 
 from fastapi import APIRouter, HTTPException, status
 from app.models.schemas import VideoURLResponse
+from app.services.async_io import run_blocking
 from app.services.bigquery import BigQueryService
 from app.services.storage import StorageService
 from app.config import settings
@@ -30,7 +31,7 @@ async def get_video_url(hand_id: str):
     """
     try:
         # 1. BigQuery에서 핸드 조회
-        hand = bq_service.get_hand_by_id(hand_id)
+        hand = await run_blocking("bigquery", bq_service.get_hand_by_id, hand_id)
 
         if not hand:
             raise HTTPException(
@@ -39,7 +40,9 @@ async def get_video_url(hand_id: str):
             )
 
         # 2. GCS Signed URL 생성
-        signed_url = storage_service.get_video_signed_url(
+        signed_url = await run_blocking(
+            "storage",
+            storage_service.get_video_signed_url,
             hand_id,
             hand.video_url
         )
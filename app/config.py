@@ -26,6 +26,18 @@ class Settings(BaseSettings):
     VERTEX_AI_INDEX_ENDPOINT: str = os.getenv("VERTEX_AI_INDEX_ENDPOINT", "")
     VERTEX_AI_DEPLOYED_INDEX_ID: str = os.getenv("VERTEX_AI_DEPLOYED_INDEX_ID", "")
 
+    # 적응형 over-fetch (안전망 필터 후 limit개가 남을 때까지 num_neighbors 증가)
+    ADAPTIVE_FETCH_GROWTH: float = 2.0
+    ADAPTIVE_FETCH_MAX_NEIGHBORS: int = 200
+    ADAPTIVE_FETCH_BUDGET_MS: float = 250.0
+
+    # 블로킹 GCP 호출 스레드 풀 (의존성별 상한, 기본 run_in_threadpool 공용 풀 대신)
+    IO_POOL_SEARCH_WORKERS: int = 16  # 임베딩 + Vector Search + 메타데이터 조회
+    IO_POOL_BIGQUERY_WORKERS: int = 16
+    IO_POOL_STORAGE_WORKERS: int = 8
+    IO_POOL_DEFAULT_WORKERS: int = 4
+    BIGQUERY_QUERY_TIMEOUT_SECONDS: float = 30.0  # QueryJob.result(timeout=), 스레드 점유 상한
+
     # API 설정
     API_V1_PREFIX: str = "/api"
     PROJECT_NAME: str = "ATI Poker Archive Search"
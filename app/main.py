@@ -10,6 +10,7 @@ from datetime import datetime
 from app.config import settings
 from app.models.schemas import HealthResponse
 from app.api import hands, videos, search
+from app.services.async_io import shutdown_io_pools
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -49,6 +50,12 @@ app.include_router(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """종료 시 블로킹 호출 스레드 풀 정리"""
+    shutdown_io_pools()
+
+
 # Health Check
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
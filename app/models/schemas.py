@@ -93,6 +93,7 @@ class SearchResponse(BaseModel):
     total: int = Field(..., ge=0, description="총 결과 수")
     query: str = Field(..., description="검색 쿼리")
     query_time_ms: int = Field(..., ge=0, description="쿼리 실행 시간 (밀리초)")
+    rounds: int = Field(1, ge=0, description="Vector Search 조회 라운드 수 (적응형 over-fetch)")
 
 
 class VideoURLResponse(BaseModel):
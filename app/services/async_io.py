@@ -0,0 +1,70 @@
+"""
+블로킹 GCP 호출용 이름 붙은 스레드 풀
+v4.0.0
+
+의존성별 ThreadPoolExecutor (search, bigquery, storage)로 격리
+→ 느린 BigQuery 조회가 벡터 검색이나 Signed URL 생성 스레드까지 잡아먹지 않음
+(기본 run_in_threadpool은 모든 호출이 anyio 공용 스레드 풀 하나를 공유)
+
+종료 시 대기 중인 호출만 취소되고 실행 중인 호출은 중단되지 않음
+→ 블로킹 호출 자체의 타임아웃(BIGQUERY_QUERY_TIMEOUT_SECONDS 등)이 스레드 점유 상한
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def _pool_size(pool: str) -> int:
+    """풀 이름별 최대 스레드 수 (미등록 이름은 IO_POOL_DEFAULT_WORKERS)"""
+    return getattr(settings, f"IO_POOL_{pool.upper()}_WORKERS", settings.IO_POOL_DEFAULT_WORKERS)
+
+
+def get_io_executor(pool: str) -> ThreadPoolExecutor:
+    """이름 붙은 스레드 풀 반환 (최초 사용 시 생성)"""
+    with _lock:
+        executor = _executors.get(pool)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=_pool_size(pool),
+                thread_name_prefix=f"io-{pool}"
+            )
+            _executors[pool] = executor
+        return executor
+
+
+async def run_blocking(pool: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """동기 함수를 이름 붙은 스레드 풀에서 실행하고 결과를 await
+
+    Args:
+        pool: 풀 이름 (search, bigquery, storage)
+        fn: 동기 함수
+
+    Returns:
+        fn의 반환값 (예외는 그대로 전파)
+
+    Example:
+        hand = await run_blocking("bigquery", bq_service.get_hand_by_id, hand_id)
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, functools.partial(fn, *args, **kwargs))
+    return await loop.run_in_executor(get_io_executor(pool), call)
+
+
+def shutdown_io_pools():
+    """스레드 풀 종료 (대기 중인 호출 취소, 실행 중인 호출은 끝날 때까지 계속)"""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
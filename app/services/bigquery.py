@@ -42,7 +42,7 @@ class BigQueryService:
 
         try:
             query_job = self.client.query(query, job_config=job_config)
-            results = list(query_job.result())
+            results = list(query_job.result(timeout=settings.BIGQUERY_QUERY_TIMEOUT_SECONDS))
 
             if not results:
                 return None
@@ -76,7 +76,7 @@ class BigQueryService:
 
         try:
             query_job = self.client.query(query)
-            results = query_job.result()
+            results = query_job.result(timeout=settings.BIGQUERY_QUERY_TIMEOUT_SECONDS)
 
             hands = []
             for row in results:
@@ -149,7 +149,7 @@ class BigQueryService:
 
         try:
             query_job = self.client.query(query, job_config=job_config)
-            results = query_job.result()
+            results = query_job.result(timeout=settings.BIGQUERY_QUERY_TIMEOUT_SECONDS)
 
             return [self._row_to_hand_metadata(row) for row in results]
 
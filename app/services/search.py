@@ -3,8 +3,15 @@ Vertex AI Vector Search 서비스
 v4.0.0 - text-embedding-004
 """
 
-from typing import List, Optional
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 from google.cloud import aiplatform
+from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
+    Namespace,
+    NumericNamespace,
+)
 import vertexai
 from vertexai.language_models import TextEmbeddingModel, TextEmbeddingInput
 
@@ -13,6 +20,48 @@ from app.models.schemas import HandMetadata, SearchResult
 from app.services.bigquery import BigQueryService
 
 
+# restricts namespace (scripts/vertex-ai/upload_embeddings.py, Cloud Function과 동일)
+TOURNAMENT_NAMESPACE = "tournament_id"
+TAG_NAMESPACE = "tag"
+POT_NAMESPACE = "pot_bb"
+
+
+def build_restricts(
+    min_pot_bb: Optional[float] = None,
+    tournament_id: Optional[str] = None,
+    tags: Optional[List[str]] = None
+) -> Tuple[List[Namespace], List[NumericNamespace]]:
+    """메타데이터 필터 → find_neighbors restricts
+
+    같은 namespace의 토큰은 OR (tags 중 하나라도 일치), namespace 간에는 AND.
+
+    Returns:
+        (token restricts, numeric restricts)
+    """
+    token_filters = []
+    if tournament_id is not None:
+        token_filters.append(Namespace(TOURNAMENT_NAMESPACE, [tournament_id], []))
+    if tags:
+        token_filters.append(Namespace(TAG_NAMESPACE, list(tags), []))
+
+    numeric_filters = []
+    if min_pot_bb is not None:
+        numeric_filters.append(
+            NumericNamespace(name=POT_NAMESPACE, value_float=float(min_pot_bb), op="GREATER_EQUAL")
+        )
+
+    return token_filters, numeric_filters
+
+
+def filter_key(
+    min_pot_bb: Optional[float] = None,
+    tournament_id: Optional[str] = None,
+    tags: Optional[List[str]] = None
+) -> tuple:
+    """필터 조합별 생존 비율 키 (태그 순서 무관, backend VectorFilters.cache_key와 같은 구성)"""
+    return (tournament_id, tuple(sorted(tags or ())), min_pot_bb)
+
+
 class SearchService:
     """Vertex AI Vector Search 서비스"""
 
@@ -42,6 +91,32 @@ class SearchService:
         # BigQuery 서비스
         self.bq_service = BigQueryService()
 
+        # 적응형 over-fetch: 필터 조합별 생존 비율 EWMA (살아남은 핸드 / 조회 핸드)
+        # search_with_rounds는 스레드 풀에서 동시에 실행되므로 lock으로 갱신
+        self.selectivity: Dict[tuple, float] = {}
+        self.selectivity_initial = 1.0
+        self.selectivity_alpha = 0.2
+        self.selectivity_floor = 0.02
+        self._selectivity_lock = threading.Lock()
+
+    def _estimate_selectivity(self, key: tuple) -> float:
+        """필터 조합의 추정 생존 비율 (관측 전 selectivity_initial)"""
+        with self._selectivity_lock:
+            ratio = self.selectivity.get(key, self.selectivity_initial)
+        return max(ratio, self.selectivity_floor)
+
+    def _record_selectivity(self, key: tuple, fetched: int, kept: int):
+        """라운드 관측 기록 (조회 결과가 없으면 무시)"""
+        if fetched <= 0:
+            return
+        ratio = kept / fetched
+        with self._selectivity_lock:
+            previous = self.selectivity.get(key)
+            self.selectivity[key] = (
+                ratio if previous is None
+                else previous + self.selectivity_alpha * (ratio - previous)
+            )
+
     def generate_query_embedding(self, query: str) -> List[float]:
         """쿼리 텍스트 → 임베딩 벡터 변환
 
@@ -56,6 +131,56 @@ class SearchService:
         embeddings = self.embedding_model.get_embeddings(inputs)
         return embeddings[0].values
 
+    def _fetch_neighbors(
+        self,
+        query_embedding: List[float],
+        num_neighbors: int,
+        token_filters: List[Namespace],
+        numeric_filters: List[NumericNamespace]
+    ) -> List[Tuple[str, float]]:
+        """Vector Search 한 라운드 → (hand_id, distance) 리스트 (ANN 순서)"""
+        vector_results = self.endpoint.find_neighbors(
+            deployed_index_id=settings.VERTEX_AI_DEPLOYED_INDEX_ID,
+            queries=[query_embedding],
+            num_neighbors=num_neighbors,
+            filter=token_filters or None,
+            numeric_filter=numeric_filters or None
+        )
+        # DOT_PRODUCT (높을수록 유사)
+        return [(neighbor.id, neighbor.distance) for neighbor in vector_results[0]]
+
+    def _filter_hands(
+        self,
+        hand_ids: List[str],
+        min_pot_bb: Optional[float],
+        tournament_id: Optional[str],
+        tags: Optional[List[str]]
+    ) -> List[HandMetadata]:
+        """BigQuery 메타데이터 조회 + 안전망 필터 (ANN 순서 유지)"""
+        hands = self.bq_service.get_hands_by_ids(hand_ids)
+        rank_map = {hand_id: rank for rank, hand_id in enumerate(hand_ids)}
+        hands.sort(key=lambda hand: rank_map.get(hand.hand_id, len(rank_map)))
+
+        # 업로드 이후 메타데이터가 바뀐 datapoint 대비 안전망
+        filtered_hands = []
+        for hand in hands:
+            # min_pot_bb 필터
+            if min_pot_bb is not None and hand.pot_bb < min_pot_bb:
+                continue
+
+            # tournament_id 필터
+            if tournament_id is not None and hand.tournament_id != tournament_id:
+                continue
+
+            # tags 필터
+            if tags is not None and hand.tags:
+                if not any(tag in hand.tags for tag in tags):
+                    continue
+
+            filtered_hands.append(hand)
+
+        return filtered_hands
+
     def search(
         self,
         query: str,
@@ -66,6 +191,26 @@ class SearchService:
     ) -> List[SearchResult]:
         """하이브리드 검색 (Vector + Metadata Filter)
 
+        search_with_rounds()의 결과만 반환한다.
+        """
+        results, _ = self.search_with_rounds(query, limit, min_pot_bb, tournament_id, tags)
+        return results
+
+    def search_with_rounds(
+        self,
+        query: str,
+        limit: int = 20,
+        min_pot_bb: Optional[float] = None,
+        tournament_id: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> Tuple[List[SearchResult], int]:
+        """하이브리드 검색 (Vector + Metadata Filter) + Vector Search 라운드 수
+
+        메타데이터 필터는 Vertex AI restricts로 인덱스 안에서 처리하므로 보통 한 라운드로
+        limit개가 채워진다. 안전망 필터로 결과가 줄어들면 이전 요청들의 생존 비율로
+        num_neighbors를 기하급수적으로 늘려 다시 조회한다 (limit 확보 / 인덱스 소진 /
+        ADAPTIVE_FETCH_MAX_NEIGHBORS / ADAPTIVE_FETCH_BUDGET_MS 중 먼저 도달하면 종료).
+
         Args:
             query: 검색 쿼리
             limit: 결과 개수
@@ -74,52 +219,47 @@ class SearchService:
             tags: 태그 필터
 
         Returns:
-            검색 결과 (SearchResult 리스트)
+            (검색 결과 SearchResult 리스트, Vector Search 라운드 수)
         """
         # 1. 쿼리 임베딩 생성
         query_embedding = self.generate_query_embedding(query)
+        token_filters, numeric_filters = build_restricts(min_pot_bb, tournament_id, tags)
+        key = filter_key(min_pot_bb, tournament_id, tags)
 
-        # 2. Vector Search 실행
-        vector_results = self.endpoint.find_neighbors(
-            deployed_index_id=settings.VERTEX_AI_DEPLOYED_INDEX_ID,
-            queries=[query_embedding],
-            num_neighbors=limit * 3  # 필터링 고려하여 더 많이 조회
-        )
-
-        # 3. hand_id 추출
-        hand_ids = []
-        distance_map = {}  # hand_id → distance(score)
-
-        for neighbor in vector_results[0]:
-            hand_id = neighbor.id
-            distance = neighbor.distance  # DOT_PRODUCT (높을수록 유사)
-
-            hand_ids.append(hand_id)
-            distance_map[hand_id] = distance
+        # 2-5. Vector Search (restricts) → 메타데이터 조회 → 안전망 필터, 부족하면 재조회
+        max_neighbors = max(limit, settings.ADAPTIVE_FETCH_MAX_NEIGHBORS)
+        num_neighbors = min(max_neighbors, math.ceil(limit / self._estimate_selectivity(key)))
+        start = time.perf_counter()
+        rounds = 0
 
-        if not hand_ids:
-            return []
-
-        # 4. BigQuery에서 메타데이터 조회
-        hands = self.bq_service.get_hands_by_ids(hand_ids)
-
-        # 5. 메타데이터 필터링
-        filtered_hands = []
-        for hand in hands:
-            # min_pot_bb 필터
-            if min_pot_bb is not None and hand.pot_bb < min_pot_bb:
-                continue
+        while True:
+            neighbors = self._fetch_neighbors(
+                query_embedding, num_neighbors, token_filters, numeric_filters
+            )
+            rounds += 1
+            distance_map = dict(neighbors)  # hand_id → distance(score)
+            hand_ids = [hand_id for hand_id, _ in neighbors]
+            filtered_hands = (
+                self._filter_hands(hand_ids, min_pot_bb, tournament_id, tags) if hand_ids else []
+            )
 
-            # tournament_id 필터
-            if tournament_id is not None and hand.tournament_id != tournament_id:
-                continue
+            self._record_selectivity(key, len(hand_ids), len(filtered_hands))
 
-            # tags 필터
-            if tags is not None and hand.tags:
-                if not any(tag in hand.tags for tag in tags):
-                    continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if (
+                len(filtered_hands) >= limit
+                or len(hand_ids) < num_neighbors  # 인덱스 소진
+                or num_neighbors >= max_neighbors
+                or elapsed_ms >= settings.ADAPTIVE_FETCH_BUDGET_MS
+            ):
+                break
 
-            filtered_hands.append(hand)
+            # 관측 비율로 필요한 개수를 추정하되 최소 ADAPTIVE_FETCH_GROWTH 배로 증가
+            needed = math.ceil(limit / self._estimate_selectivity(key))
+            num_neighbors = min(
+                max_neighbors,
+                max(math.ceil(num_neighbors * settings.ADAPTIVE_FETCH_GROWTH), needed)
+            )
 
         # 6. SearchResult 생성 (score = distance)
         results = []
@@ -138,4 +278,4 @@ class SearchService:
                 )
             )
 
-        return results
+        return results, rounds
@@ -3,10 +3,13 @@ Autocomplete API 엔드포인트
 GET /api/autocomplete?q={query}&limit={limit}
 
 Architecture:
-- Tier 1: BigQuery prefix matching (fast, <10ms)
-- Tier 2: Vertex AI semantic search (fallback, <100ms)
-- Rate limiting: 100 requests/min per IP
-- Typo correction: Levenshtein distance ≤2
+- Tier 0: In-memory prefix index (BigQuery 빈도 사전을 주기적으로 재빌드, <1ms)
+  + 엔티티 사전 (태그, 토너먼트, 스트리트 액션, 핸드 타입, 포지션; 타입별 빈도순)
+- Tier 1: BigQuery prefix matching (인덱스 미준비 시, <10ms)
+- Tier 2: Vertex AI semantic search (hedged: Tier 0/1이 hedge delay 안에 충분한 결과를 못 내면 겹쳐 실행)
+- Deadline: 마감 시간까지 도착한 tier 결과만 병합, 나머지 tier는 취소
+- Rate limiting: 100 requests/min per IP (GCRA, memory 또는 Redis 공유 백엔드)
+- Typo correction: Levenshtein distance ≤2 (in-process SymSpell index)
 """
 
 from fastapi import APIRouter, Query, HTTPException, Request, Depends
@@ -16,13 +19,15 @@ from app.config import settings
 import structlog
 import time
 import re
-from typing import List, Optional, Literal, Dict
-from collections import defaultdict
-from datetime import datetime, timedelta
+from typing import List, Optional, Literal
 
 # Import actual services
 from app.services.bigquery import BigQueryAutocompleteService
-from app.services.vertex_search import VertexSearchService
+from app.services.vertex_search import VertexSearchService, get_vertex_search_service
+from app.services.autocomplete_index import AutocompleteIndex, get_autocomplete_index
+from app.services.fuzzy_matcher import bounded_levenshtein
+from app.services.rate_limiter import RateLimiter, create_rate_limiter
+from app.services.tier_scheduler import TierScheduler, merge_results
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -31,10 +36,15 @@ logger = structlog.get_logger()
 bigquery_service: Optional[BigQueryAutocompleteService] = None
 vertex_search: Optional[VertexSearchService] = None
 
-# Rate limiting storage (in-memory, replace with Redis in production)
-rate_limit_storage: Dict[str, List[datetime]] = defaultdict(list)
-RATE_LIMIT_PER_MINUTE = 100
-RATE_LIMIT_WINDOW = timedelta(minutes=1)
+# Tier scheduler (prefix tier와 Vertex AI tier를 hedged 방식으로 실행)
+tier_scheduler = TierScheduler(
+    deadline_ms=settings.autocomplete_deadline_ms,
+    hedge_delay_ms=settings.autocomplete_hedge_delay_ms,
+    min_results=settings.autocomplete_min_results
+)
+
+# Rate limiter (GCRA: IP당 TAT 하나만 저장, 유휴 IP는 주기적으로 제거)
+rate_limiter: RateLimiter = create_rate_limiter()
 
 
 # ====================
@@ -88,6 +98,35 @@ class AutocompleteRequest(BaseModel):
         return v
 
 
+class TierTiming(BaseModel):
+    """tier별 실행 상태 및 소요 시간"""
+
+    tier: Literal["memory_index", "bigquery_cache", "vertex_ai"] = Field(
+        ...,
+        description="tier 이름"
+    )
+    status: Literal["ok", "error", "timeout", "cancelled", "skipped"] = Field(
+        ...,
+        description="ok: 결과 병합, timeout: 마감 초과로 취소, cancelled: 앞 tier 결과가 충분해 취소, skipped: 시작 안 함"
+    )
+    elapsed_ms: Optional[float] = Field(
+        None,
+        description="tier 시작부터 완료/취소까지 시간 (밀리초)",
+        examples=[4.1]
+    )
+
+
+class TypedSuggestion(BaseModel):
+    """타입이 붙은 자동완성 결과 (인메모리 엔티티 사전)"""
+
+    text: str = Field(..., description="추천 텍스트", examples=["river call"])
+    type: Literal["player", "tag", "tournament", "street_action"] = Field(
+        ...,
+        description="엔티티 타입"
+    )
+    count: int = Field(..., description="핸드 메타데이터 내 등장 빈도", examples=[9])
+
+
 class AutocompleteResponse(BaseModel):
     """자동완성 응답 모델"""
 
@@ -102,9 +141,9 @@ class AutocompleteResponse(BaseModel):
         description="원본 쿼리",
         examples=["Phil Ivy"]
     )
-    source: Literal["bigquery_cache", "vertex_ai", "hybrid"] = Field(
+    source: Literal["memory_index", "bigquery_cache", "vertex_ai", "hybrid"] = Field(
         ...,
-        description="데이터 소스 (bigquery_cache: 빠른 캐시, vertex_semantic: 의미론적 검색)"
+        description="데이터 소스 (memory_index: 인메모리 인덱스, bigquery_cache: 빠른 캐시, vertex_semantic: 의미론적 검색)"
     )
     response_time_ms: float = Field(
         ...,
@@ -116,6 +155,14 @@ class AutocompleteResponse(BaseModel):
         description="총 추천 개수",
         examples=[3]
     )
+    tiers: List[TierTiming] = Field(
+        default_factory=list,
+        description="tier별 실행 상태 및 소요 시간"
+    )
+    entities: List[TypedSuggestion] = Field(
+        default_factory=list,
+        description="타입별 엔티티 추천 (타입 그룹 순서, 그룹 내 빈도순, 타입당 최대 limit개)"
+    )
 
 
 # ====================
@@ -135,36 +182,25 @@ async def check_rate_limit(client_ip: str) -> int:
     Raises:
         HTTPException: Rate limit 초과 시 429 에러
     """
-    now = datetime.now()
+    result = await rate_limiter.check(client_ip)
 
-    # 현재 IP의 요청 기록 가져오기
-    requests = rate_limit_storage[client_ip]
-
-    # 1분 이전 요청들 제거
-    requests[:] = [req_time for req_time in requests
-                   if now - req_time < RATE_LIMIT_WINDOW]
-
-    # Rate limit 체크
-    if len(requests) >= RATE_LIMIT_PER_MINUTE:
+    if not result.allowed:
         logger.warning(
             "rate_limit_exceeded",
             client_ip=client_ip,
-            requests_count=len(requests)
+            retry_after_seconds=result.retry_after_seconds
         )
         raise HTTPException(
             status_code=429,
             detail={
                 "error": "Rate limit exceeded",
-                "message": f"Maximum {RATE_LIMIT_PER_MINUTE} requests per minute",
+                "message": f"Maximum {rate_limiter.limit_per_period} requests per minute",
                 "query": None
-            }
+            },
+            headers={"Retry-After": str(max(1, int(result.retry_after_seconds + 0.999)))}
         )
 
-    # 현재 요청 기록
-    requests.append(now)
-    remaining = RATE_LIMIT_PER_MINUTE - len(requests)
-
-    return remaining
+    return result.remaining
 
 
 def get_client_ip(request: Request) -> str:
@@ -192,10 +228,10 @@ def get_bigquery_service() -> BigQueryAutocompleteService:
 
 
 def get_vertex_service() -> VertexSearchService:
-    """Vertex Search 서비스 싱글톤 인스턴스 반환"""
+    """Vertex Search 서비스 싱글톤 인스턴스 반환 (검색/RAG와 모델 핸들 공유)"""
     global vertex_search
     if vertex_search is None:
-        vertex_search = VertexSearchService()
+        vertex_search = get_vertex_search_service()
     return vertex_search
 
 
@@ -219,34 +255,13 @@ def levenshtein_distance(s1: str, s2: str) -> int:
         1
         >>> levenshtein_distance("Junglman", "Junglemann")
         2
-
-    TODO: Phase 1 구현
-    - python-Levenshtein 라이브러리 사용 권장
-    - 또는 아래 알고리즘 구현
     """
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-
-    if len(s2) == 0:
-        return len(s1)
-
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # 삽입, 삭제, 교체 비용
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
+    return bounded_levenshtein(s1, s2)
 
 
 def is_typo(query: str, suggestion: str, max_distance: int = 2) -> bool:
     """
-    오타 여부 판단
+    오타 여부 판단 (거리가 max_distance를 넘는 순간 계산 중단)
 
     Args:
         query: 사용자 입력
@@ -264,7 +279,7 @@ def is_typo(query: str, suggestion: str, max_distance: int = 2) -> bool:
         >>> is_typo("abc", "xyz")
         False  # distance = 3
     """
-    distance = levenshtein_distance(query.lower(), suggestion.lower())
+    distance = bounded_levenshtein(query.lower(), suggestion.lower(), max_distance)
     return distance <= max_distance and distance > 0
 
 
@@ -286,6 +301,8 @@ def is_typo(query: str, suggestion: str, max_distance: int = 2) -> bool:
 
     **Features**:
     - Typo correction (Levenshtein distance ≤2)
+    - In-memory prefix index (<1ms)
+    - Typed entity suggestions: players, tags, tournaments, street actions
     - Fast BigQuery cache (<10ms)
     - Semantic fallback with Vertex AI (<100ms)
     - Rate limiting: 100 requests/min per IP
@@ -313,17 +330,21 @@ async def autocomplete_suggestions(
         le=10
     ),
     bq_service: BigQueryAutocompleteService = Depends(get_bigquery_service),
-    vertex_service: VertexSearchService = Depends(get_vertex_service)
+    vertex_service: VertexSearchService = Depends(get_vertex_service),
+    autocomplete_index: AutocompleteIndex = Depends(get_autocomplete_index)
 ) -> AutocompleteResponse:
     """
     자동완성 API 메인 엔드포인트
 
     Flow:
     1. Input validation (Pydantic)
-    2. Rate limit check (TODO)
-    3. BigQuery prefix search (Tier 1 - fast)
-    4. If <3 results, fallback to Vertex AI (Tier 2 - semantic)
-    5. Return suggestions with metadata
+    2. Rate limit check
+    3. Prefix tier: in-memory index (Tier 0) or BigQuery if not ready (Tier 1)
+       + in-process entity dictionary, then typo correction if <3 results
+    4. Vertex AI (Tier 2 - semantic) hedged after a short delay, or as soon as
+       the prefix tier returns <3 results; merge what arrives before the deadline
+       and cancel the losing tier
+    5. Return suggestions with per-tier timing metadata
 
     Args:
         request: FastAPI Request (for IP extraction)
@@ -337,7 +358,7 @@ async def autocomplete_suggestions(
         HTTPException:
             - 422: Validation error (query too short/long, invalid chars)
             - 429: Rate limit exceeded
-            - 500: Internal server error
+            - 500: Internal server error (all tiers failed)
     """
     start_time = time.time()
     client_ip = get_client_ip(request)
@@ -356,43 +377,67 @@ async def autocomplete_suggestions(
         # 2. Rate limit check
         remaining = await check_rate_limit(client_ip)
 
-        # 3. BigQuery prefix search (Tier 1)
-        suggestions = await bq_service.get_autocomplete_suggestions(
-            query=autocomplete_req.query,
-            limit=autocomplete_req.limit
+        # 3. Prefix tier (Tier 0 인메모리 인덱스 또는 Tier 1 BigQuery) + Vertex AI tier (Tier 2)
+        prefix_tier = "memory_index" if autocomplete_index.is_ready else "bigquery_cache"
+
+        # 타입별 엔티티 사전 (in-process, 네트워크 왕복 없음)
+        entities = autocomplete_index.suggest_entities(
+            autocomplete_req.query,
+            limit_per_type=autocomplete_req.limit
         )
 
-        source = "bigquery_cache"
+        async def run_prefix_tier() -> List[str]:
+            if not autocomplete_index.is_ready:
+                return await bq_service.get_autocomplete_suggestions(
+                    query=autocomplete_req.query,
+                    limit=autocomplete_req.limit
+                )
 
-        # 4. Fallback to Vertex AI if insufficient results
-        if len(suggestions) < 3:
-            logger.info(
-                "bigquery_insufficient_results",
-                query=autocomplete_req.query,
-                count=len(suggestions),
-                fallback="vertex_semantic"
+            suggestions = autocomplete_index.search(
+                autocomplete_req.query,
+                limit=autocomplete_req.limit
             )
-
-            # Use Vertex AI service for semantic search
-            vertex_suggestions = await vertex_service.semantic_autocomplete(
+            # 선수명 결과가 부족하면 다른 타입 엔티티 ("river" → "river call")
+            if len(suggestions) < settings.autocomplete_min_results:
+                suggestions.extend(
+                    entity.text
+                    for entity in sorted(entities, key=lambda e: -e.count)
+                    if entity.type != "player"
+                )
+            # In-process typo correction (SymSpell, no network hop)
+            if len(suggestions) < settings.autocomplete_min_results:
+                suggestions.extend(autocomplete_index.correct(
+                    autocomplete_req.query,
+                    limit=autocomplete_req.limit
+                ))
+            return suggestions
+
+        async def run_vertex_tier() -> List[str]:
+            return await vertex_service.semantic_autocomplete(
                 query=autocomplete_req.query,
                 limit=autocomplete_req.limit,
                 similarity_threshold=settings.search_similarity_threshold
             )
 
-            # Merge results (BigQuery + Vertex AI)
-            suggestions.extend(vertex_suggestions)
+        # 4. Hedged 실행: Vertex AI는 hedge delay 후 또는 prefix tier 결과 부족 시 시작,
+        #    결과가 충분해지면 남은 tier 취소, deadline 초과 tier는 버림
+        outcomes = await tier_scheduler.run([
+            (prefix_tier, run_prefix_tier),
+            ("vertex_ai", run_vertex_tier),
+        ])
+        prefix_outcome, vertex_outcome = outcomes
 
-            # Remove duplicates, preserve order
-            seen = set()
-            unique_suggestions = []
-            for s in suggestions:
-                if s not in seen:
-                    seen.add(s)
-                    unique_suggestions.append(s)
+        if all(outcome.status == "error" for outcome in outcomes):
+            raise RuntimeError(prefix_outcome.error or vertex_outcome.error)
 
-            suggestions = unique_suggestions[:autocomplete_req.limit]
-            source = "hybrid"  # Both BigQuery and Vertex AI were used
+        suggestions = merge_results(outcomes, limit=autocomplete_req.limit)
+
+        if vertex_outcome.status != "ok":
+            source = prefix_tier
+        elif prefix_outcome.status != "ok":
+            source = "vertex_ai"
+        else:
+            source = "hybrid"  # Both prefix tier and Vertex AI were used
 
         # 5. Calculate response time
         response_time_ms = (time.time() - start_time) * 1000
@@ -402,6 +447,7 @@ async def autocomplete_suggestions(
             query=autocomplete_req.query,
             total=len(suggestions),
             source=source,
+            tiers=[(o.tier, o.status, o.elapsed_ms) for o in outcomes],
             response_time_ms=response_time_ms
         )
 
@@ -411,9 +457,18 @@ async def autocomplete_suggestions(
             query=autocomplete_req.query,
             source=source,
             response_time_ms=response_time_ms,
-            total=len(suggestions)
+            total=len(suggestions),
+            tiers=[
+                TierTiming(tier=o.tier, status=o.status, elapsed_ms=o.elapsed_ms)
+                for o in outcomes
+            ],
+            entities=[TypedSuggestion(**entity._asdict()) for entity in entities]
         )
 
+    except HTTPException:
+        # Rate limit (429) 등은 그대로 전달
+        raise
+
     except ValueError as e:
         # Pydantic validation errors
         logger.error(
@@ -464,11 +519,15 @@ async def autocomplete_suggestions(
     tags=["Autocomplete"],
     summary="Autocomplete service health check"
 )
-async def autocomplete_health():
+async def autocomplete_health(
+    autocomplete_index: AutocompleteIndex = Depends(get_autocomplete_index)
+):
     """
     자동완성 서비스 헬스 체크
 
     Checks:
+    - In-memory prefix index state
+    - BigQuery prefix result cache (hit/miss/narrowing counters)
     - BigQuery connection
     - Vertex AI connection
     - Rate limiter state
@@ -477,9 +536,19 @@ async def autocomplete_health():
     return {
         "status": "healthy",
         "services": {
+            "autocomplete_index": autocomplete_index.stats(),
             "bigquery": "not_implemented",
+            "bigquery_prefix_cache": (
+                bigquery_service.cache.stats()
+                if bigquery_service is not None and bigquery_service.cache is not None
+                else None
+            ),
             "vertex_ai": "not_implemented",
-            "rate_limiter": "not_implemented"
+            "rate_limiter": {
+                "backend": type(rate_limiter.backend).__name__,
+                "limit_per_minute": rate_limiter.limit_per_period,
+                "burst": rate_limiter.burst,
+            }
         },
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     }
@@ -1,13 +1,21 @@
 """
 RAG (Retrieval-Augmented Generation) API 엔드포인트
 POST /api/rag
+POST /api/rag/stream  (SSE: context_hands 먼저, 이후 답변 토큰)
+LLM 과부하(LLMScheduler 거절) 시 503 + Retry-After (스트림은 error 이벤트)
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.models import RAGRequest, RAGResponse, HandResult, ErrorResponse
-from app.services.vertex_search import VertexSearchService
-from app.services.llm_service import LLMService
+from app.services.answer_cache import create_answer_cache
+from app.services.hand_hydrator import get_hand_hydrator
+from app.services.vertex_search import get_vertex_search_service
+from app.services.llm_scheduler import PRIORITY_INTERACTIVE, PRIORITY_NORMAL, LLMOverloaded
+from app.services.llm_service import get_llm_service
 from app.config import settings
+from typing import List, Optional, Tuple
+import json
 import structlog
 import time
 
@@ -15,11 +23,115 @@ router = APIRouter()
 logger = structlog.get_logger()
 
 # 서비스 초기화
-vertex_search = VertexSearchService()
-llm_service = LLMService()
+vertex_search = get_vertex_search_service()
+hand_hydrator = get_hand_hydrator()
+llm_service = get_llm_service()
+answer_cache = create_answer_cache()
 
+# 검색 결과가 없을 때 답변
+NO_RESULTS_ANSWER = "죄송합니다. 관련된 핸드를 찾을 수 없습니다. 다른 질문을 시도해주세요."
 
-@router.post("/rag", response_model=RAGResponse, responses={500: {"model": ErrorResponse}})
+# SSE 응답 헤더 (프록시 버퍼링 / 캐시 방지)
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _retrieve_context(request: RAGRequest) -> Tuple[List[HandResult], float]:
+    """
+    RAG 컨텍스트 검색 (Vertex AI 검색 + hydration → HandResult)
+
+    Returns:
+        (context_hands, search_time_ms)
+    """
+    search_start = time.time()
+    search_results = await vertex_search.search(
+        query=request.query,
+        top_k=request.top_k or settings.rag_context_hands,
+        similarity_threshold=settings.search_similarity_threshold,
+    )
+    search_results = await hand_hydrator.hydrate(search_results)
+    search_time_ms = (time.time() - search_start) * 1000
+
+    context_hands = [
+        HandResult(
+            hand_id=result["hand_id"],
+            hero_name=result["hero_name"],
+            villain_name=result.get("villain_name"),
+            description=result["description"],
+            pot_bb=result["pot_bb"],
+            street=result["street"],
+            action=result["action"],
+            tournament=result.get("tournament"),
+            tags=result.get("tags", []),
+            video_url=result.get("video_url"),
+            timestamp=result.get("timestamp"),
+            distance=result.get("distance"),
+        )
+        for result in search_results
+    ]
+    return context_hands, search_time_ms
+
+
+async def _cached_answer(
+    request: RAGRequest, context_hands: List[HandResult]
+) -> Tuple[Optional[list], Optional[str]]:
+    """
+    시맨틱 답변 캐시 조회 (쿼리 임베딩 + 검색된 hand_id 집합 + thinking mode)
+
+    Returns:
+        (쿼리 임베딩, 캐시된 답변) — 캐시 비활성화 / 임베딩 없음이면 (None, None)
+    """
+    if answer_cache is None:
+        return None, None
+    query_embedding = await vertex_search.embed_query(request.query)
+    if query_embedding is None:
+        return None, None
+
+    answer = answer_cache.lookup(
+        query_embedding,
+        [hand.hand_id for hand in context_hands],
+        variant=request.use_thinking_mode,
+    )
+    if answer is not None:
+        logger.info("rag_answer_cache_hit", query=request.query)
+    return query_embedding, answer
+
+
+def _store_answer(
+    request: RAGRequest,
+    context_hands: List[HandResult],
+    query_embedding: Optional[list],
+    answer: str
+):
+    """생성된 답변을 시맨틱 답변 캐시에 저장"""
+    if answer_cache is not None and query_embedding is not None:
+        answer_cache.store(
+            query_embedding,
+            [hand.hand_id for hand in context_hands],
+            answer,
+            variant=request.use_thinking_mode,
+        )
+
+
+def _overloaded_detail(error: LLMOverloaded) -> dict:
+    """LLM 과부하 응답 본문"""
+    return {
+        "error": "llm_overloaded",
+        "message": "답변 생성 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+        "reason": error.reason,
+        "retry_after": error.retry_after_seconds,
+    }
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """SSE 프레임 한 개"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post(
+    "/rag",
+    response_model=RAGResponse,
+    responses={500: {"model": ErrorResponse}, 503: {"description": "LLM 과부하 (Retry-After)"}},
+)
 async def generate_rag_answer(request: RAGRequest) -> RAGResponse:
     """
     RAG 답변 생성 API (Qwen3-8B + Vertex AI Search)
@@ -28,6 +140,7 @@ async def generate_rag_answer(request: RAGRequest) -> RAGResponse:
     1. Vertex AI Vector Search로 관련 핸드 검색 (top_k개)
     2. 검색 결과를 컨텍스트로 Qwen3-8B에 전달
     3. Qwen3-8B Thinking Mode로 자연어 답변 생성
+    4. 생성 대기열이 가득 찼거나 예상 대기가 deadline을 넘으면 즉시 503 + Retry-After
 
     **Request Body**:
     ```json
@@ -46,7 +159,10 @@ async def generate_rag_answer(request: RAGRequest) -> RAGResponse:
       "context_hands": [...],
       "total_time_ms": 2500,
       "search_time_ms": 100,
-      "llm_time_ms": 2400
+      "llm_time_ms": 2400,
+      "cache_hit": false,
+      "prompt_tokens": 1320,
+      "prompt_tokens_approximate": true
     }
     ```
     """
@@ -60,53 +176,45 @@ async def generate_rag_answer(request: RAGRequest) -> RAGResponse:
             use_thinking_mode=request.use_thinking_mode,
         )
 
-        # Step 1: Vertex AI 검색
-        search_start = time.time()
-        search_results = await vertex_search.search(
-            query=request.query,
-            top_k=request.top_k or settings.rag_context_hands,
-            similarity_threshold=settings.search_similarity_threshold,
-        )
-        search_time_ms = (time.time() - search_start) * 1000
+        # Step 1-2: Vertex AI 검색 → HandResult 모델로 변환
+        context_hands, search_time_ms = await _retrieve_context(request)
 
-        if not search_results:
+        if not context_hands:
             logger.warning("rag_no_search_results", query=request.query)
             return RAGResponse(
                 query=request.query,
-                answer="죄송합니다. 관련된 핸드를 찾을 수 없습니다. 다른 질문을 시도해주세요.",
+                answer=NO_RESULTS_ANSWER,
                 context_hands=[],
                 total_time_ms=(time.time() - start_time) * 1000,
                 search_time_ms=search_time_ms,
                 llm_time_ms=0.0,
             )
 
-        # Step 2: 검색 결과를 HandResult 모델로 변환
-        context_hands = [
-            HandResult(
-                hand_id=result["hand_id"],
-                hero_name=result["hero_name"],
-                villain_name=result.get("villain_name"),
-                description=result["description"],
-                pot_bb=result["pot_bb"],
-                street=result["street"],
-                action=result["action"],
-                tournament=result.get("tournament"),
-                tags=result.get("tags", []),
-                video_url=result.get("video_url"),
-                timestamp=result.get("timestamp"),
-                distance=result.get("distance"),
+        # Step 3: 같은 핸드를 검색한 유사 질문의 답변이 캐시에 있으면 LLM 생성 생략
+        query_embedding, cached_answer = await _cached_answer(request, context_hands)
+        if cached_answer is not None:
+            return RAGResponse(
+                query=request.query,
+                answer=cached_answer,
+                context_hands=context_hands,
+                total_time_ms=(time.time() - start_time) * 1000,
+                search_time_ms=search_time_ms,
+                llm_time_ms=0.0,
+                cache_hit=True,
             )
-            for result in search_results
-        ]
 
-        # Step 3: Qwen3-8B로 답변 생성
+        # Step 4: Qwen3-8B로 답변 생성 (토큰 예산 안에서 컨텍스트 구성)
         llm_start = time.time()
+        prompt = llm_service.build_prompt(request.query, context_hands)
         answer = await llm_service.generate_answer(
             query=request.query,
             hands=context_hands,
             use_thinking_mode=request.use_thinking_mode,
+            prompt=prompt,
+            priority=PRIORITY_NORMAL,
         )
         llm_time_ms = (time.time() - llm_start) * 1000
+        _store_answer(request, context_hands, query_embedding, answer)
 
         total_time_ms = (time.time() - start_time) * 1000
 
@@ -117,6 +225,7 @@ async def generate_rag_answer(request: RAGRequest) -> RAGResponse:
             total_time_ms=total_time_ms,
             search_time_ms=search_time_ms,
             llm_time_ms=llm_time_ms,
+            prompt_tokens=prompt.prompt_tokens,
         )
 
         return RAGResponse(
@@ -126,8 +235,126 @@ async def generate_rag_answer(request: RAGRequest) -> RAGResponse:
             total_time_ms=total_time_ms,
             search_time_ms=search_time_ms,
             llm_time_ms=llm_time_ms,
+            prompt_tokens=prompt.prompt_tokens,
+            prompt_tokens_approximate=prompt.prompt_tokens_approximate,
+        )
+
+    except LLMOverloaded as e:
+        logger.warning("rag_llm_overloaded", reason=e.reason, query=request.query)
+        raise HTTPException(
+            status_code=503,
+            detail=_overloaded_detail(e),
+            headers={"Retry-After": str(e.retry_after_seconds)},
         )
 
     except Exception as e:
         logger.error("rag_error", error=str(e), query=request.query)
         raise HTTPException(status_code=500, detail=f"RAG 답변 생성 중 오류 발생: {str(e)}")
+
+
+@router.post("/rag/stream", responses={200: {"content": {"text/event-stream": {}}}})
+async def stream_rag_answer(request: RAGRequest) -> StreamingResponse:
+    """
+    RAG 답변 스트리밍 API (SSE)
+
+    **이벤트**:
+    - `context`: 검색된 context_hands + search_time_ms (LLM 호출 전에 전송)
+    - `token`: 답변 텍스트 조각 `{"text": "..."}` (Qwen3 stream=True 조각이 도착하는 대로)
+    - `done`: 타이밍 `{"total_time_ms", "search_time_ms", "llm_time_ms", "time_to_first_token_ms"}`
+      + `cache_hit` (시맨틱 답변 캐시 hit이면 답변 전체가 token 한 번)
+      + `prompt_tokens` / `prompt_tokens_approximate` (tokenizer 미설정 시 근사값)
+    - `error`: 스트림 도중 오류 `{"detail": "..."}`, LLM 과부하면 `{"status": 503, "detail": {..., "retry_after"}}`
+
+    스트리밍은 사용자가 첫 토큰을 기다리므로 대기열에서 /api/rag보다 먼저 처리된다.
+
+    **Example**:
+    ```
+    curl -N -X POST /api/rag/stream -H "Content-Type: application/json" \\
+         -d '{"query": "Phil Ivey의 블러프 전략은?", "top_k": 5}'
+    ```
+    """
+    start_time = time.time()
+
+    async def events():
+        try:
+            logger.info(
+                "rag_stream_request",
+                query=request.query,
+                top_k=request.top_k,
+                use_thinking_mode=request.use_thinking_mode,
+            )
+
+            # Step 1: 검색 → context 이벤트 (답변 생성 전에 화면에 표시 가능)
+            context_hands, search_time_ms = await _retrieve_context(request)
+            yield _sse_event("context", {
+                "query": request.query,
+                "context_hands": [hand.model_dump(mode="json") for hand in context_hands],
+                "search_time_ms": search_time_ms,
+            })
+
+            # Step 2: 답변 토큰 전달 (검색 결과 없음 / 캐시 hit이면 답변 한 조각)
+            time_to_first_token_ms = None
+            llm_time_ms = 0.0
+            cached_answer = None
+            prompt_tokens = None
+            prompt_tokens_approximate = None
+            if not context_hands:
+                logger.warning("rag_no_search_results", query=request.query)
+                yield _sse_event("token", {"text": NO_RESULTS_ANSWER})
+            else:
+                query_embedding, cached_answer = await _cached_answer(request, context_hands)
+
+            if cached_answer is not None:
+                yield _sse_event("token", {"text": cached_answer})
+            elif context_hands:
+                llm_start = time.time()
+                chunks = []
+                prompt = llm_service.build_prompt(request.query, context_hands)
+                prompt_tokens = prompt.prompt_tokens
+                prompt_tokens_approximate = prompt.prompt_tokens_approximate
+                async for text in llm_service.stream_answer(
+                    query=request.query,
+                    hands=context_hands,
+                    use_thinking_mode=request.use_thinking_mode,
+                    prompt=prompt,
+                    priority=PRIORITY_INTERACTIVE,
+                ):
+                    if time_to_first_token_ms is None:
+                        time_to_first_token_ms = (time.time() - llm_start) * 1000
+                    chunks.append(text)
+                    yield _sse_event("token", {"text": text})
+                llm_time_ms = (time.time() - llm_start) * 1000
+                _store_answer(request, context_hands, query_embedding, "".join(chunks))
+
+            total_time_ms = (time.time() - start_time) * 1000
+            logger.info(
+                "rag_stream_success",
+                query=request.query,
+                context_hands_count=len(context_hands),
+                total_time_ms=total_time_ms,
+                search_time_ms=search_time_ms,
+                llm_time_ms=llm_time_ms,
+                time_to_first_token_ms=time_to_first_token_ms,
+                cache_hit=cached_answer is not None,
+                prompt_tokens=prompt_tokens,
+            )
+            yield _sse_event("done", {
+                "total_time_ms": total_time_ms,
+                "search_time_ms": search_time_ms,
+                "llm_time_ms": llm_time_ms,
+                "time_to_first_token_ms": time_to_first_token_ms,
+                "cache_hit": cached_answer is not None,
+                "prompt_tokens": prompt_tokens,
+                "prompt_tokens_approximate": prompt_tokens_approximate,
+            })
+
+        except LLMOverloaded as e:
+            logger.warning("rag_stream_llm_overloaded", reason=e.reason, query=request.query)
+            yield _sse_event("error", {"status": 503, "detail": _overloaded_detail(e)})
+
+        except Exception as e:
+            # 응답 헤더는 이미 전송됨 → 상태 코드 대신 error 이벤트
+            logger.error("rag_stream_error", error=str(e), query=request.query)
+            yield _sse_event("error", {"detail": f"RAG 답변 생성 중 오류 발생: {str(e)}"})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -1,26 +1,69 @@
 """
 검색 API 엔드포인트
 GET /api/search?query={query}&top_k={top_k}
+GET /api/search?query={query}&top_k={top_k}&cursor={next_cursor}  (다음 페이지)
+GET /api/search/stream?query={query}&top_k={top_k}  (NDJSON / SSE 스트리밍)
 """
 
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from app.models import SearchRequest, SearchResponse, HandResult, ErrorResponse
-from app.services.vertex_search import VertexSearchService
+from app.services.hand_hydrator import get_hand_hydrator
+from app.services.search_cursor import decode_cursor, encode_cursor, get_search_cursor_store
+from app.services.vector_restricts import VectorFilters
+from app.services.vertex_search import get_vertex_search_service
 from app.config import settings
+from typing import List, Optional
+import json
 import structlog
 import time
 
 router = APIRouter()
 logger = structlog.get_logger()
 
+# 스트리밍 응답 헤더 (프록시 버퍼링 / 캐시 방지)
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 # Vertex Search 서비스 초기화 (싱글톤)
-vertex_search = VertexSearchService()
+vertex_search = get_vertex_search_service()
+hand_hydrator = get_hand_hydrator()
+cursor_store = get_search_cursor_store()
+
+
+def _hand_result(result: dict) -> HandResult:
+    """hydration된 검색 결과 dict → HandResult"""
+    return HandResult(
+        hand_id=result["hand_id"],
+        hero_name=result["hero_name"],
+        villain_name=result.get("villain_name"),
+        description=result["description"],
+        pot_bb=result["pot_bb"],
+        street=result["street"],
+        action=result["action"],
+        tournament=result.get("tournament"),
+        tags=result.get("tags", []),
+        video_url=result.get("video_url"),
+        timestamp=result.get("timestamp"),
+        distance=result.get("distance"),
+    )
+
+
+def _stream_event(event: dict, sse: bool) -> str:
+    """스트림 이벤트 한 개 → NDJSON 줄 또는 SSE 프레임"""
+    data = json.dumps(event, ensure_ascii=False)
+    if sse:
+        return f"event: {event['type']}\ndata: {data}\n\n"
+    return data + "\n"
 
 
 @router.get("/search", response_model=SearchResponse, responses={500: {"model": ErrorResponse}})
 async def search_hands(
     query: str = Query(..., description="검색 쿼리", min_length=1, max_length=500),
     top_k: int = Query(5, description="반환할 결과 개수", ge=1, le=20),
+    tournament_id: Optional[str] = Query(None, description="토너먼트 ID 필터"),
+    tags: Optional[List[str]] = Query(None, description="태그 필터 (하나라도 일치)"),
+    min_pot_bb: Optional[float] = Query(None, description="최소 팟 사이즈 (BB)", ge=0),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
 ) -> SearchResponse:
     """
     포커 핸드 검색 API
@@ -29,42 +72,67 @@ async def search_hands(
     - Vertex AI Vector Search (Hybrid: BM25 + Vector)
     - TextEmbedding-004로 쿼리 임베딩 생성
     - RRF (Reciprocal Rank Fusion)로 결과 결합
+    - 메타데이터 필터(tournament_id, tags, min_pot_bb)는 Vertex AI restricts로 인덱스 안에서 처리
+    - 페이지네이션: 첫 요청이 top_k × search_cursor_page_multiple개 순위 후보를 서버에 캐시하고
+      next_cursor 반환 → 다음 페이지는 같은 query / 필터 + cursor로 요청, 임베딩 / ANN 호출 없이
+      다음 구간만 hydration (캐시된 후보를 다 넘기면 그 offset부터 더 깊게 다시 검색,
+      search_cursor_depth까지)
 
     **Example**:
     ```
     GET /api/search?query=Phil Ivey bluff&top_k=5
+    GET /api/search?query=river bluff&tags=BLUFF&tags=HERO_CALL&min_pot_bb=100
+    GET /api/search?query=Phil Ivey bluff&top_k=5&cursor=<next_cursor>
     ```
     """
     start_time = time.time()
 
+    offset = 0
+    if cursor:
+        try:
+            candidate_key, offset = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
     try:
-        logger.info("search_request", query=query, top_k=top_k)
+        logger.info("search_request", query=query, top_k=top_k, offset=offset)
 
-        # Vertex AI Vector Search 호출
-        search_results = await vertex_search.search(
-            query=query,
-            top_k=top_k,
-            similarity_threshold=settings.search_similarity_threshold,
+        filters = VectorFilters(tournament_id=tournament_id, tags=tags, min_pot_bb=min_pot_bb)
+        fingerprint = (query, filters.cache_key())
+
+        # 커서가 가리키는 캐시된 순위 후보 (만료 / 다른 쿼리 / 잘린 목록 소진이면 None → 다시 검색)
+        entry = cursor_store.lookup(candidate_key, fingerprint) if cursor else None
+        if entry is not None and not entry.complete and offset + top_k > len(entry.results):
+            entry = None
+        if entry is None:
+            # Vertex AI Vector Search 호출 (다음 몇 페이지용 후보까지, search_cursor_depth 상한)
+            depth = max(
+                offset + top_k,
+                min(settings.search_cursor_depth, offset + top_k * settings.search_cursor_page_multiple),
+            )
+            candidates = await vertex_search.search(
+                query=query,
+                top_k=depth,
+                similarity_threshold=settings.search_similarity_threshold,
+                filters=filters,
+            )
+            # 요청보다 적게 나왔거나 상한까지 가져왔으면 더 깊은 후보 없음
+            complete = len(candidates) < depth or depth >= settings.search_cursor_depth
+            candidate_key = cursor_store.put(fingerprint, candidates, complete=complete)
+        else:
+            candidates, complete = entry.results, entry.complete
+            logger.info("search_cursor_hit", query=query, offset=offset)
+
+        # hand_id → 핸드 메타데이터 결합 (현재 페이지만, 캐시 miss만 일괄 조회, 순위 유지)
+        search_results = await hand_hydrator.hydrate(candidates[offset:offset + top_k])
+        next_offset = offset + top_k
+        has_more = next_offset < len(candidates) or (
+            not complete and next_offset < settings.search_cursor_depth
         )
+        next_cursor = encode_cursor(candidate_key, next_offset) if has_more else None
 
         # 응답 생성
-        results = [
-            HandResult(
-                hand_id=result["hand_id"],
-                hero_name=result["hero_name"],
-                villain_name=result.get("villain_name"),
-                description=result["description"],
-                pot_bb=result["pot_bb"],
-                street=result["street"],
-                action=result["action"],
-                tournament=result.get("tournament"),
-                tags=result.get("tags", []),
-                video_url=result.get("video_url"),
-                timestamp=result.get("timestamp"),
-                distance=result.get("distance"),
-            )
-            for result in search_results
-        ]
+        results = [_hand_result(result) for result in search_results]
 
         search_time_ms = (time.time() - start_time) * 1000
 
@@ -80,8 +148,112 @@ async def search_hands(
             total_results=len(results),
             results=results,
             search_time_ms=search_time_ms,
+            next_cursor=next_cursor,
         )
 
     except Exception as e:
         logger.error("search_error", error=str(e), query=query)
         raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
+
+
+@router.get("/search/stream", responses={200: {"content": {"application/x-ndjson": {}, "text/event-stream": {}}}})
+async def stream_search_hands(
+    request: Request,
+    query: str = Query(..., description="검색 쿼리", min_length=1, max_length=500),
+    top_k: int = Query(5, description="반환할 결과 개수", ge=1, le=20),
+    tournament_id: Optional[str] = Query(None, description="토너먼트 ID 필터"),
+    tags: Optional[List[str]] = Query(None, description="태그 필터 (하나라도 일치)"),
+    min_pot_bb: Optional[float] = Query(None, description="최소 팟 사이즈 (BB)", ge=0),
+) -> StreamingResponse:
+    """
+    포커 핸드 검색 API (스트리밍)
+
+    **기능**:
+    - /api/search와 같은 검색을 결과가 hydration되는 대로 한 줄씩 전송
+    - Hybrid 검색이면 BM25(lexical) 결과를 벡터 leg 완료 전에 먼저 전송
+    - 기본 NDJSON (application/x-ndjson), Accept: text/event-stream이면 SSE 프레임
+
+    **이벤트**:
+    - `{"type": "result", "stage": "lexical" | "final", "result": HandResult}` (hand_id당 한 번)
+    - `{"type": "done", "hand_ids": [...], ...}`: 최종 순위 (lexical로 먼저 받았지만 여기 없는 핸드는 제외)
+    - `{"type": "error", "detail": "..."}`: 스트림 도중 오류
+
+    **Example**:
+    ```
+    GET /api/search/stream?query=Phil Ivey bluff&top_k=5
+    ```
+    """
+    start_time = time.time()
+    sse = "text/event-stream" in request.headers.get("accept", "")
+    filters = VectorFilters(tournament_id=tournament_id, tags=tags, min_pot_bb=min_pot_bb)
+
+    async def events():
+        sent = set()
+        final_ids: List[str] = []
+        first_result_ms = None
+
+        try:
+            logger.info("search_stream_request", query=query, top_k=top_k)
+
+            async for stage, stage_results in vertex_search.search_stream(
+                query=query,
+                top_k=top_k,
+                similarity_threshold=settings.search_similarity_threshold,
+                filters=filters,
+            ):
+                # 이미 보낸 핸드는 제외하고 이번 단계의 새 핸드만 일괄 hydration
+                pending = [result for result in stage_results if result["hand_id"] not in sent]
+                for result in await hand_hydrator.hydrate(pending):
+                    if result["hand_id"] in sent:
+                        continue
+                    if first_result_ms is None:
+                        first_result_ms = (time.time() - start_time) * 1000
+                        logger.info(
+                            "search_stream_first_result",
+                            query=query,
+                            stage=stage,
+                            first_result_ms=first_result_ms,
+                        )
+                    sent.add(result["hand_id"])
+                    yield _stream_event(
+                        {
+                            "type": "result",
+                            "stage": stage,
+                            "result": _hand_result(result).model_dump(mode="json"),
+                        },
+                        sse,
+                    )
+
+                if stage == "final":
+                    final_ids = [r["hand_id"] for r in stage_results if r["hand_id"] in sent]
+
+            search_time_ms = (time.time() - start_time) * 1000
+            logger.info(
+                "search_stream_success",
+                query=query,
+                total_results=len(final_ids),
+                search_time_ms=search_time_ms,
+                first_result_ms=first_result_ms,
+            )
+            yield _stream_event(
+                {
+                    "type": "done",
+                    "query": query,
+                    "hand_ids": final_ids,
+                    "total_results": len(final_ids),
+                    "search_time_ms": search_time_ms,
+                    "first_result_ms": first_result_ms,
+                },
+                sse,
+            )
+
+        except Exception as e:
+            # 응답 헤더는 이미 전송됨 → 상태 코드 대신 error 이벤트
+            logger.error("search_stream_error", error=str(e), query=query)
+            yield _stream_event({"type": "error", "detail": f"검색 중 오류 발생: {str(e)}"}, sse)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers=STREAM_HEADERS,
+    )
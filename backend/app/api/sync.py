@@ -10,7 +10,8 @@ from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 from pydantic import BaseModel, Field
 
 from app.services.firestore import get_firestore_service
-from app.services.vertex_search import VertexSearchService
+from app.services.async_io import run_blocking
+from app.services.vertex_search import VertexSearchService, get_vertex_search_service
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -70,19 +71,23 @@ async def sync_firestore_to_vertex(
     """
     try:
         firestore_service = get_firestore_service()
-        vertex_service = VertexSearchService()
+        vertex_service = get_vertex_search_service()
 
         # Fetch hands from Firestore
         if request.force_reindex or request.video_ref_id:
             # Get all hands (with or without embeddings)
-            hands = firestore_service.get_all_hands(
+            hands = await run_blocking(
+                "firestore",
+                firestore_service.get_all_hands,
                 limit=request.limit,
                 video_ref_id=request.video_ref_id
             )
             logger.info(f"Fetched {len(hands)} hands from Firestore (force_reindex={request.force_reindex})")
         else:
             # Get only hands without embeddings
-            hands = firestore_service.get_hands_without_embeddings(limit=request.limit)
+            hands = await run_blocking(
+                "firestore", firestore_service.get_hands_without_embeddings, limit=request.limit
+            )
             logger.info(f"Fetched {len(hands)} hands without embeddings")
 
         if not hands:
@@ -133,11 +138,13 @@ async def get_sync_status():
         print(f"[DEBUG] Firestore service initialized: {firestore_service}")
 
         # Get all hands from Firestore
-        all_hands = firestore_service.get_all_hands(limit=1000)
+        all_hands = await run_blocking("firestore", firestore_service.get_all_hands, limit=1000)
         total_hands_in_firestore = len(all_hands)
 
         # Get hands without embeddings
-        hands_without_embeddings_list = firestore_service.get_hands_without_embeddings(limit=1000)
+        hands_without_embeddings_list = await run_blocking(
+            "firestore", firestore_service.get_hands_without_embeddings, limit=1000
+        )
         hands_without_embeddings = len(hands_without_embeddings_list)
 
         # Count hands with embeddings (approximation)
@@ -171,10 +178,10 @@ async def reindex_single_hand(hand_id: str):
     """
     try:
         firestore_service = get_firestore_service()
-        vertex_service = VertexSearchService()
+        vertex_service = get_vertex_search_service()
 
         # Get hand from Firestore
-        hand = firestore_service.get_hand_by_id(hand_id)
+        hand = await run_blocking("firestore", firestore_service.get_hand_by_id, hand_id)
 
         if not hand:
             raise HTTPException(status_code=404, detail=f"Hand {hand_id} not found in Firestore")
@@ -187,7 +194,9 @@ async def reindex_single_hand(hand_id: str):
         await vertex_service.index_hand(hand_id, embedding, hand)
 
         # Update Firestore with embedding
-        firestore_service.update_hand_embedding(hand_id, embedding, summary)
+        await run_blocking(
+            "firestore", firestore_service.update_hand_embedding, hand_id, embedding, summary
+        )
 
         logger.info(f"Successfully reindexed hand {hand_id}")
 
@@ -238,7 +247,9 @@ async def _sync_hands_background(
 
             # Update Firestore with embedding (if newly generated)
             if not hand.get("embedding"):
-                firestore_service.update_hand_embedding(hand_id, embedding, summary)
+                await run_blocking(
+                    "firestore", firestore_service.update_hand_embedding, hand_id, embedding, summary
+                )
 
             hands_indexed += 1
             logger.info(f"Indexed hand {hand_id} ({hands_indexed}/{len(hands)})")
@@ -37,6 +37,7 @@ class Settings(BaseSettings):
     bq_table_hand_summary: str = "hand_summary"
     bq_table_video_files: str = "video_files"
     bq_table_validation: str = "validation_results"
+    bq_table_player_name_stats: str = "player_name_stats"  # 자동완성용 이름 빈도 (ingestion 시 갱신)
 
     # Vertex AI Vector Search
     vertex_index_id: str
@@ -45,12 +46,89 @@ class Settings(BaseSettings):
     vertex_embedding_dimension: int = 768
     vertex_ai_index_endpoint: str = ""
     vertex_ai_deployed_index_id: str = ""
+    vertex_warmup_on_startup: bool = True  # 시작 시 모델/엔드포인트 핸들 생성 + 더미 호출
+    vertex_warmup_timeout_seconds: float = 20.0
+
+    # Vector Backend (vertex: find_neighbors, replica: 로컬 인덱스 우선 + Vertex fallback, local: 오프라인)
+    vector_backend: Literal["vertex", "replica", "local"] = "vertex"
+    local_vector_index_path: str = ""  # scripts/export_hand_embeddings.py 결과 (.npz)
+    local_vector_index_hnsw_threshold: int = 200000  # 이상이면 HNSW (hnswlib 설치 시)
+    # 양자화 저장소 (none: float32 .npz, int8/pq: QuantizedVectorIndex .npz + .vectors.npy 재순위화)
+    local_vector_index_quantization: Literal["none", "int8", "pq"] = "none"
+    local_vector_index_rerank_factor: int = 4  # 양자화 후보 top_k * N개를 원본 벡터로 재순위화
+
+    # Query Embedding Cache (LRU + 선택적 SQLite, 키: 모델 버전 + task type + 정규화 텍스트)
+    embedding_cache_enabled: bool = True
+    embedding_cache_max_entries: int = 10000
+    embedding_cache_disk_path: str = ""  # 예: "cache/embeddings.sqlite3" (빈 값: 메모리만)
+
+    # Query Embedding Micro-batching (동시 캐시 miss를 get_embeddings() 한 번으로)
+    embedding_batch_enabled: bool = True
+    embedding_batch_max_size: int = 16
+    embedding_batch_max_wait_ms: float = 5.0
 
     # Search Configuration
     search_type: Literal["hybrid", "vector"] = "hybrid"
     search_top_k: int = 5
     search_similarity_threshold: float = 0.7
 
+    # Search Pagination (첫 페이지에서 순위 후보를 캐시, 다음 페이지는 커서로 구간만 hydration)
+    search_cursor_depth: int = 100  # 커서로 넘길 수 있는 최대 후보 수
+    search_cursor_page_multiple: int = 4  # 한 번에 가져와 캐시할 후보 수 = top_k × 배수
+    search_cursor_ttl_seconds: float = 600.0
+    search_cursor_max_entries: int = 1000
+
+    # Hybrid Search BM25 leg (search_type=hybrid, hand_summary 인메모리 역색인 + RRF)
+    bm25_enabled: bool = True
+    bm25_refresh_seconds: int = 300  # updated_at watermark 이후 변경분만 증분 색인
+    bm25_k1: float = 1.2
+    bm25_b: float = 0.75
+    rrf_k: int = 60
+    hybrid_exact_name_shortcut: bool = True  # 정확한 선수명 쿼리는 BM25 결과로 즉시 응답
+
+    # Adaptive Over-fetch (임계값 통과 결과가 top_k가 될 때까지 num_neighbors 증가)
+    adaptive_fetch_enabled: bool = True
+    adaptive_fetch_growth: float = 2.0
+    adaptive_fetch_max_neighbors: int = 200
+    adaptive_fetch_budget_ms: float = 250.0  # 추가 라운드를 시작할 수 있는 누적 지연
+
+    # Search Result Hydration (hand_id → hand_summary 메타데이터, 핸드별 LRU + 일괄 조회)
+    hand_cache_max_entries: int = 20000
+    hand_cache_ttl_seconds: int = 3600
+
+    # Autocomplete In-Memory Index (BigQuery는 재빌드에만 사용)
+    autocomplete_index_enabled: bool = True
+    autocomplete_index_refresh_seconds: int = 300
+    autocomplete_index_top_k: int = 10
+    autocomplete_index_max_names: int = 200000
+    autocomplete_typo_max_distance: int = 2
+    autocomplete_entity_max_per_type: int = 50000  # 태그/토너먼트/스트리트 액션
+
+    # Autocomplete Prefix Result Cache (BigQuery tier, LRU + TTL + narrowing)
+    autocomplete_cache_enabled: bool = True
+    autocomplete_cache_max_entries: int = 10000
+    autocomplete_cache_ttl_seconds: int = 60
+
+    # Autocomplete Tier Scheduler (prefix tier ↔ Vertex AI tier 겹쳐 실행)
+    autocomplete_hedge_delay_ms: int = 30  # 0: 모든 tier 동시 시작
+    autocomplete_deadline_ms: int = 300
+    autocomplete_min_results: int = 3
+
+    # Rate Limiting (GCRA, 키당 O(1) 상태)
+    rate_limit_per_minute: int = 100
+    rate_limit_burst: int = 100
+    rate_limit_backend: Literal["memory", "redis"] = "memory"  # redis: 워커 간 한도 공유 (redis 패키지 필요)
+    rate_limit_idle_sweep_seconds: int = 60
+
+    # Blocking I/O Thread Pools (동기 google-cloud 호출 격리, 의존성별 상한)
+    io_pool_bigquery_workers: int = 16
+    io_pool_vertex_workers: int = 16
+    io_pool_firestore_workers: int = 8
+    io_pool_default_workers: int = 4
+    # 블로킹 호출 타임아웃 (종료 시 실행 중인 호출은 중단되지 않으므로 스레드 점유 상한)
+    bigquery_query_timeout_seconds: float = 30.0  # QueryJob.result(timeout=)
+    vertex_call_timeout_seconds: float = 10.0  # 임베딩 / find_neighbors / upsert 대기 상한
+
     # Pub/Sub
     pubsub_topic_new_metadata: str = "poker-metadata-new"
     pubsub_subscription_etl: str = "poker-etl-worker"
@@ -65,9 +143,25 @@ class Settings(BaseSettings):
     llm_max_tokens: int = 600
     llm_thinking_mode: bool = True
 
+    # LLM Admission Control (동시 생성 수 제한 + 우선순위 큐, 예상 대기가 길면 즉시 503)
+    llm_max_concurrency: int = 2  # Ollama OLLAMA_NUM_PARALLEL과 맞춤
+    llm_max_queue: int = 16
+    llm_queue_deadline_seconds: float = 20.0  # 허용 대기 시간 (초과 예상 시 거절)
+    llm_initial_service_seconds: float = 5.0  # 관측 전 생성 시간 추정치 (이후 EWMA)
+    llm_keepalive_connections: int = 8  # 공유 httpx 커넥션 풀 keep-alive 수
+    llm_keepalive_expiry_seconds: float = 60.0
+
     # RAG Parameters
     rag_context_hands: int = 5
     rag_prompt_template: Literal["korean", "english"] = "korean"
+    rag_prompt_token_budget: int = 1500  # 템플릿 + 질문 + 핸드 컨텍스트 토큰 상한
+    llm_tokenizer_path: str = ""  # Qwen tokenizer.json (빈 값/tokenizers 미설치: 근사 토큰 수)
+
+    # RAG Answer Cache (같은 핸드를 검색한 유사 질문은 저장된 답변 재사용)
+    rag_answer_cache_enabled: bool = True
+    rag_answer_cache_similarity: float = 0.92  # 쿼리 임베딩 코사인 유사도 하한
+    rag_answer_cache_max_entries: int = 2000
+    rag_answer_cache_ttl_seconds: float = 3600.0
 
     # Logging
     log_level: str = "INFO"
@@ -2,6 +2,7 @@
 FastAPI 메인 애플리케이션
 """
 
+import asyncio
 import os
 
 # IMPORTANT: Set Google Application Credentials BEFORE importing any GCP services
@@ -32,6 +33,14 @@ from fastapi.responses import JSONResponse
 import structlog
 
 from app.api import search, hands, rag, autocomplete, sync  # Firestore re-enabled with database param
+from app.services.autocomplete_index import get_autocomplete_index
+from app.services.async_io import io_pool_stats, shutdown_io_pools
+from app.services.bm25_index import get_hand_text_index
+from app.services.hand_hydrator import get_hand_hydrator
+from app.services.llm_scheduler import close_llm_http_client, get_llm_scheduler
+from app.services.search_cursor import get_search_cursor_store
+from app.services.single_flight import single_flight_stats
+from app.services.vertex_search import get_vertex_search_service
 
 # Structured Logger 설정
 logger = structlog.get_logger()
@@ -69,16 +78,46 @@ async def startup_event():
         llm_model=settings.llm_model,
     )
 
+    # 자동완성 Rate Limiter 유휴 키 정리 (요청 경로 대신 백그라운드에서 주기적으로)
+    autocomplete.rate_limiter.start_background_sweep()
+
+    # 자동완성 인메모리 인덱스 (첫 빌드 + 주기적 재빌드를 백그라운드로 수행)
+    if settings.autocomplete_index_enabled:
+        get_autocomplete_index().start_background_refresh()
+
+    # Hybrid Search BM25 인덱스 (첫 전체 빌드 + 주기적 증분 색인을 백그라운드로 수행)
+    if settings.search_type == "hybrid" and settings.bm25_enabled:
+        get_hand_text_index().start_background_refresh()
+
+    # Vertex AI 핸들 warmup (첫 검색 요청의 모델 로드/채널 연결 지연 제거)
+    if settings.vertex_warmup_on_startup:
+        try:
+            await asyncio.wait_for(
+                get_vertex_search_service().warmup(),
+                timeout=settings.vertex_warmup_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "vertex_warmup_timeout",
+                timeout_seconds=settings.vertex_warmup_timeout_seconds
+            )
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """앱 종료 시 실행"""
+    await get_autocomplete_index().stop()
+    await get_hand_text_index().stop()
+    await autocomplete.rate_limiter.stop()
+    shutdown_io_pools()
+    await close_llm_http_client()
     logger.info("application_shutdown")
 
 
 @app.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트"""
+    vertex_service = get_vertex_search_service()
     return JSONResponse(
         content={
             "status": "healthy",
@@ -90,6 +129,35 @@ async def health_check():
                 "llm_model": settings.llm_model,
                 "mock_mode": settings.enable_mock_mode,
             },
+            "io_pools": io_pool_stats(),
+            "single_flight": single_flight_stats(),
+            "vertex_handles": vertex_service.handle_stats(),
+            "embedding_cache": (
+                vertex_service.embedding_cache.stats()
+                if vertex_service.embedding_cache is not None
+                else None
+            ),
+            "adaptive_fetch": (
+                vertex_service.adaptive_fetcher.stats()
+                if vertex_service.adaptive_fetcher is not None
+                else None
+            ),
+            "hand_hydration": get_hand_hydrator().stats(),
+            "search_cursors": get_search_cursor_store().stats(),
+            "rag_answer_cache": (
+                rag.answer_cache.stats() if rag.answer_cache is not None else None
+            ),
+            "bm25_index": (
+                vertex_service.text_index.stats()
+                if vertex_service.text_index is not None
+                else None
+            ),
+            "embedding_batcher": (
+                vertex_service.embedding_batcher.stats()
+                if vertex_service.embedding_batcher is not None
+                else None
+            ),
+            "llm_scheduler": get_llm_scheduler().stats(),
         }
     )
 
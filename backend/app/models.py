@@ -41,6 +41,7 @@ class SearchResponse(BaseModel):
     total_results: int = Field(..., description="총 결과 개수")
     results: List[HandResult] = Field(..., description="검색 결과 목록")
     search_time_ms: float = Field(..., description="검색 소요 시간 (밀리초)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
 
 
 # ====================
@@ -62,6 +63,15 @@ class RAGResponse(BaseModel):
     total_time_ms: float = Field(..., description="총 소요 시간 (밀리초)")
     search_time_ms: float = Field(..., description="검색 소요 시간 (밀리초)")
     llm_time_ms: float = Field(..., description="LLM 생성 소요 시간 (밀리초)")
+    cache_hit: bool = Field(False, description="시맨틱 답변 캐시에서 반환 여부 (LLM 생성 생략)")
+    prompt_tokens: Optional[int] = Field(
+        None,
+        description="LLM 프롬프트 토큰 수 (LLM 미호출 시 None, prompt_tokens_approximate면 근사값)"
+    )
+    prompt_tokens_approximate: Optional[bool] = Field(
+        None,
+        description="prompt_tokens가 로컬 근사인지 여부 (llm_tokenizer_path 미설정 / tokenizers 미설치 시 true)"
+    )
 
 
 # ====================
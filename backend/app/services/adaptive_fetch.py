@@ -0,0 +1,186 @@
+"""
+적응형 over-fetch (유사도 임계값 / 필터로 결과가 줄어드는 검색용)
+고정 배수(top_k * 2)로 조회 후 잘라내면 top_k보다 적게 남는 문제를 라운드 반복으로 해결
+
+Architecture:
+- SelectivityEstimator: 키(임계값 등)별 생존 비율(살아남은 결과 / 조회 결과)을 EWMA로 추정
+- 첫 라운드 num_neighbors = ceil(top_k / 추정 생존 비율) → 보통 한 번에 top_k 확보
+- 부족할 때만 num_neighbors를 기하급수적으로 증가 (growth 배, 관측 비율로 필요한 만큼 점프)
+- 종료 조건: top_k 확보 / 인덱스 소진(요청보다 적게 반환) / max_neighbors / 지연 예산 소진
+- 쿼리별 라운드 수는 결과와 함께 반환, 분포는 LatencyHistogram으로 헬스 체크에 노출
+"""
+
+import math
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional, TypeVar
+
+from app.config import settings
+from app.services.metrics import LatencyHistogram
+
+T = TypeVar("T")
+
+
+class SelectivityEstimator:
+    """
+    키별 생존 비율 EWMA
+
+    Example:
+        >>> estimator = SelectivityEstimator(alpha=0.2, initial=0.5)
+        >>> estimator.record("0.70", fetched=20, kept=4)
+        >>> estimator.estimate("0.70")
+        0.2
+    """
+
+    def __init__(self, alpha: float = 0.2, initial: float = 0.5, floor: float = 0.02):
+        """
+        Args:
+            alpha: EWMA 가중치 (최근 관측 비중)
+            initial: 관측 전 기본 생존 비율
+            floor: 추정 하한 (0 근처에서 num_neighbors 폭주 방지)
+        """
+        self.alpha = alpha
+        self.initial = initial
+        self.floor = floor
+        self._ratios: Dict[Hashable, float] = {}
+
+    def estimate(self, key: Hashable) -> float:
+        return max(self.floor, self._ratios.get(key, self.initial))
+
+    def record(self, key: Hashable, fetched: int, kept: int):
+        """라운드 관측 기록 (조회 결과가 없으면 무시)"""
+        if fetched <= 0:
+            return
+        ratio = min(1.0, kept / fetched)
+        previous = self._ratios.get(key)
+        self._ratios[key] = (
+            ratio if previous is None else previous + self.alpha * (ratio - previous)
+        )
+
+    def snapshot(self) -> Dict[str, float]:
+        return {str(key): round(ratio, 4) for key, ratio in self._ratios.items()}
+
+
+class AdaptiveFetchResult(NamedTuple):
+    """적응형 조회 결과"""
+    results: list
+    rounds: int
+    num_neighbors: int
+    exhausted: bool
+    elapsed_ms: float
+
+
+class AdaptiveFetcher:
+    """
+    top_k 결과가 남을 때까지 num_neighbors를 늘려 다시 조회
+
+    Example:
+        >>> outcome = await fetcher.fetch(
+        ...     lambda n: service._vector_search(embedding, n, num_neighbors=n),
+        ...     keep=lambda hit: hit["distance"] >= 0.7,
+        ...     top_k=10,
+        ...     key="0.70",
+        ... )
+        >>> outcome.rounds
+        1
+    """
+
+    def __init__(
+        self,
+        estimator: Optional[SelectivityEstimator] = None,
+        growth: float = 2.0,
+        max_neighbors: int = 200,
+        budget_ms: float = 250.0,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Args:
+            estimator: 생존 비율 추정기 (기본: 새 인스턴스)
+            growth: 라운드당 최소 증가 배수
+            max_neighbors: num_neighbors 상한
+            budget_ms: 추가 라운드를 시작할 수 있는 누적 지연 예산
+            clock: 시계 함수 (테스트용 주입 가능)
+        """
+        self.estimator = estimator or SelectivityEstimator()
+        self.growth = growth
+        self.max_neighbors = max_neighbors
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self.rounds = LatencyHistogram(resolution=1.0)
+        self.short_results = 0
+
+    def initial_neighbors(self, top_k: int, key: Hashable) -> int:
+        """추정 생존 비율로 첫 라운드 num_neighbors 계산"""
+        return max(top_k, min(self.max_neighbors, math.ceil(top_k / self.estimator.estimate(key))))
+
+    async def fetch(
+        self,
+        fetch_fn: Callable[[int], Awaitable[List[T]]],
+        keep: Callable[[T], bool],
+        top_k: int,
+        key: Hashable = None
+    ) -> AdaptiveFetchResult:
+        """
+        적응형 조회
+
+        Args:
+            fetch_fn: num_neighbors → 순위순 결과 (앞부분은 라운드 간 동일하다고 가정)
+            keep: 결과 유지 여부 (임계값 / 필터)
+            top_k: 필요한 결과 개수
+            key: 생존 비율 추정 키
+
+        Returns:
+            AdaptiveFetchResult (results는 최대 top_k개, 순위 유지)
+        """
+        start = self.clock()
+        num_neighbors = self.initial_neighbors(top_k, key)
+        rounds = 0
+
+        while True:
+            raw = await fetch_fn(num_neighbors)
+            rounds += 1
+            kept = [item for item in raw if keep(item)]
+            self.estimator.record(key, len(raw), len(kept))
+
+            elapsed_ms = (self.clock() - start) * 1000
+            exhausted = len(raw) < num_neighbors
+            if (
+                len(kept) >= top_k
+                or exhausted
+                or num_neighbors >= self.max_neighbors
+                or elapsed_ms >= self.budget_ms
+            ):
+                break
+
+            # 관측 비율로 필요한 개수를 추정하되 최소 growth 배로 증가
+            needed = math.ceil(top_k / self.estimator.estimate(key))
+            num_neighbors = min(
+                self.max_neighbors,
+                max(math.ceil(num_neighbors * self.growth), needed),
+            )
+
+        self.rounds.record(rounds)
+        if len(kept) < top_k:
+            self.short_results += 1
+        return AdaptiveFetchResult(kept[:top_k], rounds, num_neighbors, exhausted, elapsed_ms)
+
+    def stats(self) -> dict:
+        """헬스 체크용 라운드 분포 / 생존 비율"""
+        return {
+            "queries": self.rounds.count,
+            "rounds": self.rounds.to_dict((50, 90, 99)),
+            "short_results": self.short_results,
+            "selectivity": self.estimator.snapshot(),
+            "max_neighbors": self.max_neighbors,
+            "budget_ms": self.budget_ms,
+        }
+
+
+def create_adaptive_fetcher() -> Optional[AdaptiveFetcher]:
+    """설정값으로 적응형 over-fetch 생성 (비활성화 시 None → 고정 배수 조회)"""
+    if not settings.adaptive_fetch_enabled:
+        return None
+    return AdaptiveFetcher(
+        growth=settings.adaptive_fetch_growth,
+        max_neighbors=settings.adaptive_fetch_max_neighbors,
+        budget_ms=settings.adaptive_fetch_budget_ms,
+    )
@@ -0,0 +1,169 @@
+"""
+RAG 시맨틱 답변 캐시
+의미가 같은 질문("Phil Ivey bluff strategy?" / "How does Ivey bluff?")이 같은 핸드를 검색하면
+LLM 생성 없이 저장된 답변 재사용
+
+Architecture:
+- 키: (검색된 hand_id 집합, 생성 옵션) → 컨텍스트가 정확히 같을 때만 후보
+- 후보 안에서 쿼리 임베딩 코사인 유사도 ≥ similarity_threshold인 가장 가까운 항목의 답변 반환
+  (컨텍스트 버킷 단위로 비교하므로 항목 수가 늘어도 조회 비용은 버킷 크기에 비례)
+- 전체 항목 LRU(max_entries) + TTL, 빈 / 제로 벡터 쿼리는 캐시하지 않음
+"""
+
+import time
+from collections import OrderedDict
+from itertools import count
+from typing import Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Sequence, Set
+
+import numpy as np
+
+from app.config import settings
+
+
+class CachedAnswer(NamedTuple):
+    """캐시 항목"""
+    context_key: Hashable
+    vector: np.ndarray
+    answer: str
+    expires_at: float
+
+
+def _unit(vector: Sequence[float]) -> Optional[np.ndarray]:
+    """L2 정규화 (영벡터 / 빈 벡터는 None)"""
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array)) if array.size else 0.0
+    return array / norm if norm > 0 else None
+
+
+class SemanticAnswerCache:
+    """
+    쿼리 임베딩 유사도 + 검색 컨텍스트 기반 답변 캐시
+
+    Example:
+        >>> cache = SemanticAnswerCache(similarity_threshold=0.92)
+        >>> cache.store(embedding, ["hand_001", "hand_002"], "Ivey는 ...", variant=True)
+        >>> cache.lookup(paraphrase_embedding, ["hand_002", "hand_001"], variant=True)
+        "Ivey는 ..."
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 2000,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            similarity_threshold: 답변을 재사용할 최소 쿼리 코사인 유사도
+            max_entries: 최대 답변 수 (초과 시 LRU 제거)
+            ttl_seconds: 답변 유효 시간
+            clock: 시계 함수 (테스트용 주입 가능)
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[int, CachedAnswer]" = OrderedDict()
+        self._buckets: Dict[Hashable, Set[int]] = {}
+        self._ids = count()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def context_key(hand_ids: Iterable[str], variant: Hashable = None) -> Hashable:
+        """검색 컨텍스트 키 (hand_id 순서 무관)"""
+        return frozenset(hand_ids), variant
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id)
+        bucket = self._buckets[entry.context_key]
+        bucket.discard(entry_id)
+        if not bucket:
+            del self._buckets[entry.context_key]
+
+    def lookup(
+        self,
+        query_embedding: Sequence[float],
+        hand_ids: Iterable[str],
+        variant: Hashable = None
+    ) -> Optional[str]:
+        """
+        저장된 답변 조회
+
+        Args:
+            query_embedding: 쿼리 임베딩
+            hand_ids: 이번 질문에서 검색된 hand_id
+            variant: 답변에 영향을 주는 생성 옵션 (예: thinking mode)
+
+        Returns:
+            같은 컨텍스트에서 가장 유사한 쿼리의 답변 (유사도 미달 / 없음이면 None)
+        """
+        query = _unit(query_embedding)
+        if query is None:
+            self.misses += 1
+            return None
+
+        key = self.context_key(hand_ids, variant)
+        now = self.clock()
+        best_id, best_similarity = None, self.similarity_threshold
+        for entry_id in list(self._buckets.get(key, ())):
+            entry = self._entries[entry_id]
+            if entry.expires_at <= now:
+                self._remove(entry_id)
+                continue
+            similarity = float(entry.vector @ query)
+            if similarity >= best_similarity:
+                best_id, best_similarity = entry_id, similarity
+
+        if best_id is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(best_id)
+        self.hits += 1
+        return self._entries[best_id].answer
+
+    def store(
+        self,
+        query_embedding: Sequence[float],
+        hand_ids: Iterable[str],
+        answer: str,
+        variant: Hashable = None
+    ):
+        """답변 저장 (임베딩이 없거나 답변이 비어 있으면 무시)"""
+        vector = _unit(query_embedding)
+        if vector is None or not answer:
+            return
+
+        entry_id = next(self._ids)
+        key = self.context_key(hand_ids, variant)
+        self._entries[entry_id] = CachedAnswer(key, vector, answer, self.clock() + self.ttl_seconds)
+        self._buckets.setdefault(key, set()).add(entry_id)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def stats(self) -> dict:
+        """헬스 체크용 hit/miss"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "contexts": len(self._buckets),
+            "max_entries": self.max_entries,
+            "similarity_threshold": self.similarity_threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def create_answer_cache() -> Optional[SemanticAnswerCache]:
+    """설정값으로 답변 캐시 생성 (비활성화 시 None → 매번 LLM 생성)"""
+    if not settings.rag_answer_cache_enabled:
+        return None
+    return SemanticAnswerCache(
+        similarity_threshold=settings.rag_answer_cache_similarity,
+        max_entries=settings.rag_answer_cache_max_entries,
+        ttl_seconds=settings.rag_answer_cache_ttl_seconds,
+    )
@@ -0,0 +1,129 @@
+"""
+비동기 I/O 계층 (동기 google-cloud 클라이언트용 전용 스레드 풀)
+async 핸들러 안에서 동기 BigQuery/Vertex AI/Firestore 호출이 이벤트 루프를 막지 않도록 격리
+
+Architecture:
+- 의존성별 이름 붙은 ThreadPoolExecutor (bigquery, vertex, firestore, ...)
+  → 느린 BigQuery job이 Vertex AI 호출용 스레드까지 잡아먹지 않음
+- 풀 크기는 설정값으로 제한 (io_pool_*_workers), 미등록 이름은 io_pool_default_workers
+- run_blocking(): contextvars(structlog 컨텍스트 등)를 유지한 채 풀에서 실행
+- timeout: 호출자는 기다림을 포기하지만 스레드에서 실행 중인 호출은 끝날 때까지 계속됨
+  → 블로킹 클라이언트 호출 자체에도 타임아웃을 둬야 스레드가 풀려남 (BigQuery result(timeout=) 등)
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_in_flight: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def _pool_size(pool: str) -> int:
+    """풀 이름별 최대 스레드 수"""
+    return getattr(settings, f"io_pool_{pool}_workers", None) or settings.io_pool_default_workers
+
+
+def get_io_executor(pool: str) -> ThreadPoolExecutor:
+    """이름 붙은 스레드 풀 반환 (최초 사용 시 생성)"""
+    executor = _executors.get(pool)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(pool)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=_pool_size(pool),
+                    thread_name_prefix=f"io-{pool}"
+                )
+                _executors[pool] = executor
+                _in_flight[pool] = 0
+                logger.info("io_pool_created", pool=pool, max_workers=executor._max_workers)
+    return executor
+
+
+async def run_blocking(
+    pool: str,
+    fn: Callable[..., T],
+    *args: Any,
+    timeout: Optional[float] = None,
+    **kwargs: Any
+) -> T:
+    """
+    동기 함수를 이름 붙은 스레드 풀에서 실행하고 결과를 await
+
+    Args:
+        pool: 풀 이름 (bigquery, vertex, firestore, ...)
+        fn: 동기 함수 (google-cloud 클라이언트 호출 등)
+        timeout: 최대 대기 시간 (초, None: 무제한). 초과 시 asyncio.TimeoutError,
+            스레드의 호출은 중단되지 않고 끝날 때까지 in_flight에 남음
+
+    Returns:
+        fn의 반환값 (예외는 그대로 전파)
+
+    Example:
+        >>> rows = await run_blocking("bigquery", lambda: list(client.query(sql).result()))
+    """
+    executor = get_io_executor(pool)
+    call = functools.partial(contextvars.copy_context().run, functools.partial(fn, *args, **kwargs))
+
+    with _lock:
+        _in_flight[pool] += 1
+    try:
+        future = executor.submit(call)
+    except BaseException:
+        _call_done(pool)
+        raise
+    # 스레드에서 실제로 끝났을 때 감소 (타임아웃으로 포기한 호출도 끝날 때까지 집계)
+    future.add_done_callback(lambda _: _call_done(pool))
+
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("io_call_timeout", pool=pool, timeout_seconds=timeout)
+        raise
+
+
+def _call_done(pool: str):
+    with _lock:
+        if pool in _in_flight:
+            _in_flight[pool] -= 1
+
+
+def io_pool_stats() -> Dict[str, dict]:
+    """헬스 체크용 풀 상태 (풀별 최대 스레드 수, 실행 중 + 대기 중 호출 수)"""
+    with _lock:
+        return {
+            pool: {
+                "max_workers": executor._max_workers,
+                "in_flight": _in_flight.get(pool, 0),
+            }
+            for pool, executor in _executors.items()
+        }
+
+
+def shutdown_io_pools(wait: bool = False, pools: Optional[list] = None):
+    """
+    스레드 풀 종료 (앱 종료 시 호출)
+
+    대기 중인 호출만 취소되고 이미 실행 중인 호출은 중단되지 않음 (Python 스레드는 강제 종료 불가)
+    → 종료 지연은 각 블로킹 호출의 타임아웃(bigquery_query_timeout_seconds 등)이 상한
+    """
+    with _lock:
+        names = list(_executors) if pools is None else [p for p in pools if p in _executors]
+        executors = [_executors.pop(name) for name in names]
+        for name in names:
+            _in_flight.pop(name, None)
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
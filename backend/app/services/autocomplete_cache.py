@@ -0,0 +1,160 @@
+"""
+자동완성 Prefix 결과 캐시 (LRU + TTL, narrowing 재사용)
+"ph" → "phi" → "phil" → "phil i" 처럼 이어지는 키 입력마다 BigQuery를 다시 조회하지 않도록 함
+
+Architecture:
+- 키: 정규화된 prefix (소문자, player_name_stats 범위 조회 name_lc >= @prefix AND name_lc < @prefix_next와
+  같은 의미 — prefix_range()가 같은 소문자 prefix로 구간을 만듦)
+- 완전한 결과: 조회 결과가 limit보다 적으면 해당 prefix의 모든 매칭을 담고 있음
+- narrowing: 더 긴 prefix 요청 시 캐시된 짧은 prefix의 완전한 결과를 로컬 필터링해 응답
+  (빈도순 정렬이 유지되므로 필터링 결과는 BigQuery 결과와 동일)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+
+def normalize_cache_key(prefix: str) -> str:
+    """캐시 키 정규화 (prefix_range()의 소문자 name_lc 구간과 같은 의미)"""
+    return prefix.lower()
+
+
+class _CacheEntry:
+    __slots__ = ("results", "limit", "complete", "expires_at")
+
+    def __init__(self, results: List[str], limit: int, complete: bool, expires_at: float):
+        self.results = results
+        self.limit = limit
+        self.complete = complete
+        self.expires_at = expires_at
+
+
+class PrefixResultCache:
+    """
+    Prefix 자동완성 결과 캐시
+
+    Example:
+        >>> cache = PrefixResultCache(max_entries=1000, ttl_seconds=60)
+        >>> cache.put("ph", limit=10, results=["Phil Ivey", "Phil Hellmuth"])  # 완전한 결과
+        >>> cache.get("phil i", limit=5)  # narrowing
+        ["Phil Ivey"]
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 60.0,
+        min_prefix_length: int = 2,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: 최대 캐시 항목 수 (초과 시 LRU 제거)
+            ttl_seconds: 항목 유효 시간
+            min_prefix_length: narrowing에 사용할 최소 prefix 길이
+            clock: 시계 함수 (테스트용 주입 가능)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.min_prefix_length = min_prefix_length
+        self.clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+
+        self.hits = 0
+        self.narrowing_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, key: str, now: float) -> Optional[_CacheEntry]:
+        """만료되지 않은 항목 조회 (LRU 순서 갱신)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, entry: _CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, prefix: str, limit: int) -> Optional[List[str]]:
+        """
+        캐시 조회
+
+        Args:
+            prefix: 검증된 자동완성 쿼리
+            limit: 요청 결과 개수
+
+        Returns:
+            결과 리스트 (캐시로 답할 수 없으면 None)
+        """
+        key = normalize_cache_key(prefix)
+        now = self.clock()
+
+        # 1. 같은 prefix: 완전한 결과이거나 더 큰 limit으로 조회한 결과면 그대로 사용
+        entry = self._lookup(key, now)
+        if entry is not None and (entry.complete or limit <= entry.limit):
+            self.hits += 1
+            return entry.results[:limit]
+
+        # 2. 짧은 prefix의 완전한 결과를 로컬 필터링 (긴 prefix부터 시도)
+        for length in range(len(key) - 1, self.min_prefix_length - 1, -1):
+            parent = self._lookup(key[:length], now)
+            if parent is None or not parent.complete:
+                continue
+
+            narrowed = [name for name in parent.results if name.lower().startswith(key)]
+            # 부모보다 오래 유지하지 않도록 부모의 만료 시각을 그대로 사용
+            self._store(key, _CacheEntry(narrowed, parent.limit, True, parent.expires_at))
+            self.narrowing_hits += 1
+            return narrowed[:limit]
+
+        self.misses += 1
+        return None
+
+    def put(self, prefix: str, limit: int, results: List[str]):
+        """
+        BigQuery 조회 결과 저장
+
+        Args:
+            prefix: 검증된 자동완성 쿼리
+            limit: 조회에 사용한 LIMIT
+            results: 조회 결과 (빈도순)
+        """
+        self._store(
+            normalize_cache_key(prefix),
+            _CacheEntry(
+                results=list(results),
+                limit=limit,
+                complete=len(results) < limit,
+                expires_at=self.clock() + self.ttl_seconds
+            )
+        )
+
+    def clear(self):
+        """모든 항목 제거"""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """헬스 체크용 hit/miss/narrowing 카운터"""
+        lookups = self.hits + self.narrowing_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "narrowing_hits": self.narrowing_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.narrowing_hits) / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
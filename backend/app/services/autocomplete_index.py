@@ -0,0 +1,407 @@
+"""
+자동완성 인메모리 Prefix 인덱스
+hero/villain 이름 빈도 사전을 메모리에 올려 /api/autocomplete를 마이크로초 단위로 응답
+
+Architecture:
+- PrefixIndex: 소문자 정렬 배열 + bisect 범위 탐색
+- 짧은 prefix(트라이 상위 노드)는 빈도순 top-k를 빌드 시 미리 계산
+- SymSpellIndex: 같은 사전으로 오타 교정 후보 생성 (편집 거리 ≤2)
+- EntityDictionary: 타입별 PrefixIndex (선수, 태그, 토너먼트, 스트리트 액션, 핸드 타입, 포지션)
+- BigQuery는 백그라운드 재빌드에만 사용 (요청 경로에서 호출하지 않음)
+"""
+
+import asyncio
+import heapq
+import re
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from app.config import settings
+from app.services.async_io import run_blocking
+from app.services.bigquery import BigQueryAutocompleteService
+from app.services.entity_dictionary import ENTITY_TYPES, EntitySuggestion
+from app.services.fuzzy_matcher import SymSpellIndex
+
+logger = structlog.get_logger()
+
+
+# '_'도 공백으로 취급 ("bad beat" → "BAD_BEAT" 태그 매칭)
+_WHITESPACE = re.compile(r"[\s_]+")
+
+
+def normalize_prefix(text: str) -> str:
+    """
+    소문자 변환 + 연속 공백('_' 포함) 정리
+
+    끝 공백 하나는 유지한다 ("phil "은 "philip"과 매칭되지 않아야 함).
+    """
+    return _WHITESPACE.sub(" ", text.lower()).lstrip()
+
+
+class PrefixIndex:
+    """
+    정렬 배열 기반 Prefix 인덱스 (불변, 재빌드 시 통째로 교체)
+
+    - keys: 정규화된 이름 (오름차순)
+    - precompute_depth 이하 길이의 prefix는 top-k 인덱스를 미리 계산
+      (범위가 넓어 매번 계산하면 비싼 구간)
+    - 더 긴 prefix는 범위가 좁으므로 구간 내에서 바로 top-k 계산
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, int]],
+        top_k: int = 10,
+        precompute_depth: int = 4
+    ):
+        """
+        Args:
+            entries: (표시 이름, 빈도) 목록
+            top_k: prefix 노드별로 미리 계산할 결과 개수
+            precompute_depth: top-k를 미리 계산할 최대 prefix 길이
+        """
+        # 정규화 키 기준 병합 (대소문자만 다른 이름은 빈도 합산, 최빈 표기 유지)
+        merged: Dict[str, List] = {}
+        for name, count in entries:
+            if not name:
+                continue
+            key = normalize_prefix(name).rstrip()
+            if not key:
+                continue
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = [name, count, count]
+            else:
+                entry[2] += count
+                if count > entry[1]:
+                    entry[0], entry[1] = name, count
+
+        self._keys: List[str] = sorted(merged)
+        self._names: List[str] = [merged[k][0] for k in self._keys]
+        self._counts: List[int] = [merged[k][2] for k in self._keys]
+        self.top_k = top_k
+        self.precompute_depth = precompute_depth
+        self._top: Dict[str, Tuple[int, ...]] = self._precompute()
+
+    def _precompute(self) -> Dict[str, Tuple[int, ...]]:
+        """깊이별로 같은 prefix를 공유하는 연속 구간을 찾아 top-k 계산"""
+        top: Dict[str, Tuple[int, ...]] = {}
+        keys = self._keys
+        n = len(keys)
+
+        for depth in range(1, self.precompute_depth + 1):
+            start = 0
+            while start < n:
+                if len(keys[start]) < depth:
+                    start += 1
+                    continue
+                prefix = keys[start][:depth]
+                end = start + 1
+                while end < n and keys[end].startswith(prefix):
+                    end += 1
+                top[prefix] = self._top_in_range(start, end, self.top_k)
+                start = end
+
+        return top
+
+    def _top_in_range(self, lo: int, hi: int, k: int) -> Tuple[int, ...]:
+        """[lo, hi) 구간에서 빈도 상위 k개 (동률은 이름순)"""
+        counts = self._counts
+        if hi - lo <= k:
+            return tuple(sorted(range(lo, hi), key=lambda i: -counts[i]))
+        return tuple(heapq.nlargest(k, range(lo, hi), key=counts.__getitem__))
+
+    def search(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        prefix로 시작하는 이름을 빈도순으로 반환
+
+        Args:
+            prefix: 사용자 입력 (대소문자 무관)
+            limit: 최대 결과 개수
+
+        Returns:
+            표시 이름 리스트 (빈도 내림차순)
+        """
+        return [self._names[i] for i in self._search_ids(prefix, limit)]
+
+    def top(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """search()와 같은 순서로 (표시 이름, 빈도) 반환"""
+        return [(self._names[i], self._counts[i]) for i in self._search_ids(prefix, limit)]
+
+    def _search_ids(self, prefix: str, limit: int) -> Tuple[int, ...]:
+        key = normalize_prefix(prefix)
+        if not key.strip() or limit <= 0:
+            return ()
+
+        if len(key) <= self.precompute_depth and limit <= self.top_k:
+            ids = self._top.get(key, ())
+        else:
+            lo = bisect_left(self._keys, key)
+            hi = bisect_left(self._keys, key[:-1] + chr(ord(key[-1]) + 1), lo)
+            ids = self._top_in_range(lo, hi, limit)
+
+        return ids[:limit]
+
+    def items(self) -> List[Tuple[str, int]]:
+        """(표시 이름, 빈도) 전체 목록"""
+        return list(zip(self._names, self._counts))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class EntityDictionary:
+    """
+    타입별 엔티티 사전 (불변, 재빌드 시 통째로 교체)
+
+    타입마다 PrefixIndex 하나를 두고, 결과는 타입 그룹 순서대로
+    각 타입 안에서 빈도순으로 반환한다.
+
+    Example:
+        >>> entities = EntityDictionary([("river call", "street_action", 9)])
+        >>> entities.search("riv")
+        [EntitySuggestion(text="river call", type="street_action", count=9)]
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, str, int]],
+        top_k: int = 10,
+        players: Optional[PrefixIndex] = None
+    ):
+        """
+        Args:
+            entries: (텍스트, 타입, 빈도) 목록 (알 수 없는 타입은 무시)
+            top_k: prefix 노드별로 미리 계산할 결과 개수
+            players: 선수명 PrefixIndex (기존 인덱스 재사용, 중복 빌드 없음)
+        """
+        grouped: Dict[str, List[Tuple[str, int]]] = {}
+        for text, entity_type, count in entries:
+            if entity_type in ENTITY_TYPES and entity_type != "player":
+                grouped.setdefault(entity_type, []).append((text, count))
+
+        self._indexes: Dict[str, PrefixIndex] = {}
+        if players is not None:
+            self._indexes["player"] = players
+        for entity_type in ENTITY_TYPES:
+            if entity_type in grouped:
+                self._indexes[entity_type] = PrefixIndex(grouped[entity_type], top_k=top_k)
+
+    def search(
+        self,
+        prefix: str,
+        limit_per_type: int = 5,
+        types: Optional[Iterable[str]] = None
+    ) -> List[EntitySuggestion]:
+        """
+        타입별 prefix 검색
+
+        Args:
+            prefix: 사용자 입력 (대소문자 무관, '_'와 공백 동일 취급)
+            limit_per_type: 타입별 최대 결과 개수
+            types: 검색할 타입 (기본: 전체)
+
+        Returns:
+            EntitySuggestion 리스트 (타입 그룹 순서, 그룹 내 빈도 내림차순)
+        """
+        wanted = ENTITY_TYPES if types is None else [t for t in ENTITY_TYPES if t in set(types)]
+        return [
+            EntitySuggestion(text, entity_type, count)
+            for entity_type in wanted
+            if entity_type in self._indexes
+            for text, count in self._indexes[entity_type].top(prefix, limit_per_type)
+        ]
+
+    def sizes(self) -> Dict[str, int]:
+        """타입별 엔티티 개수"""
+        return {entity_type: len(index) for entity_type, index in self._indexes.items()}
+
+
+class AutocompleteIndex:
+    """
+    자동완성 인덱스 서비스
+
+    - 시작 시 백그라운드로 첫 빌드, 이후 refresh_seconds 주기로 재빌드
+    - 재빌드는 새 PrefixIndex를 만든 뒤 참조만 교체 (요청 경로 lock 없음)
+    """
+
+    def __init__(
+        self,
+        bq_service: Optional[BigQueryAutocompleteService] = None,
+        refresh_seconds: Optional[int] = None,
+        top_k: Optional[int] = None,
+        max_names: Optional[int] = None,
+        typo_max_distance: Optional[int] = None,
+    ):
+        self.bq_service = bq_service
+        self.refresh_seconds = refresh_seconds or settings.autocomplete_index_refresh_seconds
+        self.top_k = top_k or settings.autocomplete_index_top_k
+        self.max_names = max_names or settings.autocomplete_index_max_names
+        self.typo_max_distance = (
+            typo_max_distance if typo_max_distance is not None
+            else settings.autocomplete_typo_max_distance
+        )
+
+        self._index: Optional[PrefixIndex] = None
+        self._fuzzy: Optional[SymSpellIndex] = None
+        self._entities: Optional[EntityDictionary] = None
+        self._entity_entries: List[Tuple[str, str, int]] = []
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.built_at: Optional[float] = None
+        self.build_time_ms: Optional[float] = None
+        self.build_count = 0
+        self.build_failures = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """인덱스가 한 번 이상 빌드되었는지 여부"""
+        return self._index is not None
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """인메모리 prefix 검색 (인덱스 미준비 시 빈 리스트)"""
+        index = self._index
+        if index is None:
+            return []
+        return index.search(query, limit)
+
+    def correct(self, query: str, limit: int = 5) -> List[str]:
+        """
+        오타 교정 후보 (편집 거리 ≤ typo_max_distance, 거리 → 빈도순)
+
+        Example:
+            >>> index.correct("Junglman")
+            ["Junglemann"]
+        """
+        fuzzy = self._fuzzy
+        if fuzzy is None:
+            return []
+        return [
+            match.term
+            for match in fuzzy.lookup(query, max_distance=self.typo_max_distance, limit=limit)
+        ]
+
+    def suggest_entities(
+        self,
+        query: str,
+        limit_per_type: int = 5,
+        types: Optional[Iterable[str]] = None
+    ) -> List[EntitySuggestion]:
+        """타입별 엔티티 검색 (인덱스 미준비 시 빈 리스트)"""
+        entities = self._entities
+        if entities is None:
+            return []
+        return entities.search(query, limit_per_type, types)
+
+    def build(
+        self,
+        entries: Iterable[Tuple[str, int]],
+        entity_entries: Optional[Iterable[Tuple[str, str, int]]] = None
+    ) -> int:
+        """
+        주어진 빈도 사전으로 인덱스를 빌드하고 교체
+
+        Args:
+            entries: (선수명, 빈도) 목록
+            entity_entries: (텍스트, 타입, 빈도) 목록 (None이면 직전 엔티티 사전 유지)
+        """
+        start = time.perf_counter()
+        entries = list(entries)
+        if entity_entries is not None:
+            self._entity_entries = list(entity_entries)
+        index = PrefixIndex(entries, top_k=self.top_k)
+        fuzzy = SymSpellIndex(entries, max_distance=self.typo_max_distance)
+        entities = EntityDictionary(self._entity_entries, top_k=self.top_k, players=index)
+        self._index, self._fuzzy, self._entities = index, fuzzy, entities
+        self.built_at = time.time()
+        self.build_time_ms = (time.perf_counter() - start) * 1000
+        self.build_count += 1
+
+        logger.info(
+            "autocomplete_index_built",
+            names=len(index),
+            entities=entities.sizes(),
+            build_time_ms=self.build_time_ms,
+        )
+        return len(index)
+
+    async def rebuild(self) -> int:
+        """
+        BigQuery에서 빈도 사전을 다시 읽어 인덱스 재빌드
+
+        Returns:
+            인덱스 이름 개수 (실패 시 기존 인덱스 유지, 0 반환)
+        """
+        if self.bq_service is None:
+            self.bq_service = BigQueryAutocompleteService()
+
+        try:
+            entries = await run_blocking(
+                "bigquery", self.bq_service.get_name_frequencies, self.max_names
+            )
+            entity_entries = await self._load_entity_entries()
+            return await run_blocking("autocomplete_index", self.build, entries, entity_entries)
+        except Exception as e:
+            self.build_failures += 1
+            logger.error("autocomplete_index_rebuild_failed", error=str(e))
+            return 0
+
+    async def _load_entity_entries(self) -> Optional[List[Tuple[str, str, int]]]:
+        """엔티티 사전 조회 (실패해도 선수명 인덱스는 재빌드, 직전 엔티티 사전 유지)"""
+        try:
+            return list(await run_blocking(
+                "bigquery",
+                self.bq_service.get_entity_frequencies,
+                settings.autocomplete_entity_max_per_type
+            ))
+        except Exception as e:
+            logger.warning("autocomplete_entity_load_failed", error=str(e))
+            return None
+
+    async def _refresh_loop(self):
+        """주기적 재빌드 루프"""
+        while True:
+            await self.rebuild()
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start_background_refresh(self):
+        """백그라운드 재빌드 태스크 시작 (첫 빌드 포함)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """백그라운드 재빌드 태스크 종료"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def stats(self) -> dict:
+        """헬스 체크용 상태"""
+        return {
+            "ready": self.is_ready,
+            "names": len(self._index) if self._index is not None else 0,
+            "entities": self._entities.sizes() if self._entities is not None else {},
+            "built_at": self.built_at,
+            "build_time_ms": self.build_time_ms,
+            "build_count": self.build_count,
+            "build_failures": self.build_failures,
+            "refresh_seconds": self.refresh_seconds,
+        }
+
+
+# 싱글톤 인스턴스
+_autocomplete_index: Optional[AutocompleteIndex] = None
+
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    """AutocompleteIndex 싱글톤 인스턴스 반환"""
+    global _autocomplete_index
+    if _autocomplete_index is None:
+        _autocomplete_index = AutocompleteIndex()
+    return _autocomplete_index
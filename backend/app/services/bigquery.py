@@ -3,17 +3,86 @@ BigQuery 서비스
 핸드 상세 정보 조회 및 자동완성
 """
 
+from datetime import datetime
 from google.cloud import bigquery
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.config import settings
 from app.models import HandDetail
+from app.services.async_io import run_blocking
+from app.services.autocomplete_cache import PrefixResultCache
+from app.services.entity_dictionary import count_entities
+from app.services.single_flight import get_single_flight
 import structlog
 import json
 import os
 import re
+from pathlib import Path
 
 logger = structlog.get_logger()
 
+# Mock 모드 자동완성 데이터 (빈도 내림차순)
+MOCK_PLAYER_NAMES = [
+    "Phil Ivey",
+    "Phil Hellmuth",
+    "Philip Ng",
+    "Tom Dwan",
+    "Daniel Negreanu",
+    "Doug Polk",
+    "Junglemann",
+    "Fedor Holz",
+    "Vanessa Selbst",
+    "Antonio Esfandiari",
+    "Jason Koon",
+    "Dan Smith",
+    "Bryn Kenney",
+    "Justin Bonomo",
+    "Stephen Chidwick",
+    "David Peters",
+    "Sam Greenwood",
+    "Mikita Badziakouski",
+    "Isaac Haxton",
+    "Timothy Adams"
+]
+
+# Mock 모드 핸드 원본 (ATI 합본 파일, test_data_path 기준: 엔티티 사전 / BM25 색인)
+MOCK_HANDS_FILE = "all_hands_combined.json"
+
+
+def prefix_range(prefix: str) -> Tuple[str, str]:
+    """
+    prefix 매칭을 정규화 이름의 반열린 구간으로 변환
+
+    Example:
+        >>> prefix_range("Phil")
+        ("phil", "phim")
+    """
+    lower = prefix.lower()
+    return lower, lower[:-1] + chr(ord(lower[-1]) + 1)
+
+
+def _fetch_rows(client: bigquery.Client, sql: str, job_config: bigquery.QueryJobConfig) -> list:
+    """
+    쿼리 실행 후 결과 행을 모두 읽음 (동기, run_blocking으로 호출)
+    result(timeout=)으로 스레드 점유 시간 상한 (풀 종료 시에도 실행 중인 호출은 중단되지 않음)
+    """
+    query_job = client.query(sql, job_config=job_config)
+    return list(query_job.result(timeout=settings.bigquery_query_timeout_seconds))
+
+
+def _load_mock_hands() -> List[dict]:
+    """Mock 핸드 행 (mock_data/synthetic_ati 합본 파일, 없으면 빈 리스트)"""
+    path = Path(settings.test_data_path) / MOCK_HANDS_FILE
+    if not path.exists():
+        # backend/ 에서 실행한 경우 저장소 루트 기준으로 다시 찾음
+        path = Path(__file__).resolve().parents[3] / settings.test_data_path / MOCK_HANDS_FILE
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("mock_hand_data_unavailable", path=str(path), error=str(e))
+        return []
+
 
 class BigQueryService:
     """BigQuery 서비스"""
@@ -75,8 +144,11 @@ class BigQueryService:
                 ]
             )
 
-            query_job = self.client.query(query, job_config=job_config)
-            results = list(query_job.result())
+            # 같은 hand_id 동시 조회는 BigQuery job 하나로 병합
+            results = await get_single_flight("bigquery_hand").do(
+                hand_id,
+                lambda: run_blocking("bigquery", _fetch_rows, self.client, query, job_config)
+            )
 
             if not results:
                 logger.warning("hand_not_found", hand_id=hand_id)
@@ -110,6 +182,99 @@ class BigQueryService:
             logger.error("bigquery_error", error=str(e), hand_id=hand_id)
             raise
 
+    def get_hand_documents(self, since: Optional[datetime] = None) -> List[dict]:
+        """
+        BM25 색인용 핸드 텍스트 필드 조회 (동기 호출, run_blocking으로 실행).
+
+        Args:
+            since: updated_at watermark (None이면 전체, 있으면 watermark 시각 포함 이후 변경분)
+                   같은 updated_at으로 늦게 커밋된 행을 놓치지 않도록 >= (upsert는 hand_id 기준 멱등)
+
+        Returns:
+            핸드 행 dict 리스트 (updated_at 오름차순)
+        """
+        if self.mock_mode:
+            return _load_mock_hands()
+
+        table_name = settings.get_bq_table_full_name(settings.bq_table_hand_summary)
+        sql = f"""
+        SELECT hand_id, hero_name, villain_name, description, street, action,
+               tournament, tags, updated_at
+        FROM `{table_name}`
+        WHERE @since IS NULL OR updated_at >= @since
+        ORDER BY updated_at
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("since", "TIMESTAMP", since)
+            ]
+        )
+
+        hands = [dict(row.items()) for row in _fetch_rows(self.client, sql, job_config)]
+        logger.info("hand_documents_loaded", count=len(hands), since=str(since) if since else None)
+        return hands
+
+    def get_hands_by_ids(self, hand_ids: List[str]) -> List[dict]:
+        """
+        검색 결과 hydration용 핸드 메타데이터 일괄 조회 (동기 호출, run_blocking으로 실행).
+
+        hand_id 개수와 관계없이 쿼리 한 번 (hand_id IN UNNEST(@ids)).
+
+        Args:
+            hand_ids: 조회할 hand_id 목록
+
+        Returns:
+            핸드 행 dict 리스트 (순서 보장 없음, 없는 hand_id는 제외)
+            HYDRATION_FIELDS 키를 모두 포함 (video_url / timestamp는 get_hand_by_id와 같이
+            video_files JOIN 전까지 NULL)
+        """
+        if not hand_ids:
+            return []
+        if self.mock_mode:
+            return self._mock_hands_by_ids(hand_ids)
+
+        table_name = settings.get_bq_table_full_name(settings.bq_table_hand_summary)
+        sql = f"""
+        SELECT hand_id, hero_name, villain_name, description, pot_bb, street, action,
+               tournament, tags,
+               CAST(NULL AS STRING) AS video_url,  -- TODO: JOIN with video_files table
+               CAST(NULL AS STRING) AS timestamp
+        FROM `{table_name}`
+        WHERE hand_id IN UNNEST(@ids)
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("ids", "STRING", list(hand_ids))
+            ]
+        )
+
+        hands = [dict(row.items()) for row in _fetch_rows(self.client, sql, job_config)]
+        logger.info("hands_batch_retrieved", requested=len(hand_ids), found=len(hands))
+        return hands
+
+    def _mock_hands_by_ids(self, hand_ids: List[str]) -> List[dict]:
+        """Mock 일괄 조회 (ATI 합본 파일 필드를 hand_summary 컬럼 이름으로 변환)"""
+        wanted = set(hand_ids)
+        return [
+            {
+                "hand_id": hand["hand_id"],
+                "hero_name": hand.get("hero_name"),
+                "villain_name": hand.get("villain_name"),
+                "description": hand.get("description"),
+                "pot_bb": hand.get("pot_bb"),
+                "street": hand.get("street"),
+                "action": hand.get("hero_action"),
+                "tournament": hand.get("tournament_id"),
+                "tags": hand.get("tags") or [],
+                "video_url": hand.get("video_url"),
+                "timestamp": hand.get("timestamp"),
+            }
+            for hand in _load_mock_hands()
+            if hand.get("hand_id") in wanted
+        ]
+
     async def _mock_get_hand(self, hand_id: str) -> HandDetail | None:
         """Mock 핸드 조회 (테스트용)"""
         logger.info("using_mock_bigquery", hand_id=hand_id)
@@ -170,12 +335,17 @@ class BigQueryService:
 class BigQueryAutocompleteService:
     """BigQuery 기반 자동완성 서비스"""
 
-    def __init__(self, client: Optional[bigquery.Client] = None):
+    def __init__(
+        self,
+        client: Optional[bigquery.Client] = None,
+        cache: Optional[PrefixResultCache] = None
+    ):
         """
         BigQuery 클라이언트 초기화
 
         Args:
             client: BigQuery 클라이언트 (테스트용 Mock 주입 가능)
+            cache: Prefix 결과 캐시 (기본: 설정값으로 생성, 비활성화 시 None)
         """
         if client:
             self.client = client
@@ -194,6 +364,16 @@ class BigQueryAutocompleteService:
 
         self.dataset = os.getenv("BQ_DATASET", settings.bq_dataset)
         self.table = os.getenv("BQ_TABLE_HAND_SUMMARY", settings.bq_table_hand_summary)
+        self.stats_table = os.getenv(
+            "BQ_TABLE_PLAYER_NAME_STATS", settings.bq_table_player_name_stats
+        )
+
+        if cache is None and settings.autocomplete_cache_enabled:
+            cache = PrefixResultCache(
+                max_entries=settings.autocomplete_cache_max_entries,
+                ttl_seconds=settings.autocomplete_cache_ttl_seconds
+            )
+        self.cache = cache
 
     def _validate_query(self, query: str) -> str:
         """
@@ -261,54 +441,45 @@ class BigQueryAutocompleteService:
             if self.client is None:
                 return await self._mock_autocomplete(cleaned_query, limit)
 
+            # Prefix 결과 캐시 (같은 prefix 재사용 / 짧은 prefix의 완전한 결과 narrowing)
+            if self.cache is not None:
+                cached = self.cache.get(cleaned_query, limit)
+                if cached is not None:
+                    logger.info("autocomplete_cache_hit", query=cleaned_query, count=len(cached))
+                    return cached
+
             # SQL 쿼리 구성
-            # LIKE 패턴 생성 (SQL Injection 방지를 위해 파라미터화)
-            query_pattern = f"{cleaned_query}%"
+            # 정규화 이름(name_lc) 범위 조건: prefix ≤ name_lc < prefix_next
+            # → 클러스터링 키로 블록 pruning (전체 hand_summary 재집계 없음)
+            prefix, prefix_next = prefix_range(cleaned_query)
 
-            # BigQuery 전체 테이블명
-            table_name = f"{settings.gcp_project}.{self.dataset}.{self.table}"
+            # 사전 집계 테이블 (ingestion 시 갱신)
+            table_name = f"{settings.gcp_project}.{self.dataset}.{self.stats_table}"
 
             # SQL 쿼리
             sql = f"""
-            WITH player_names AS (
-                SELECT hero_name AS name, COUNT(*) AS frequency
-                FROM `{table_name}`
-                WHERE LOWER(hero_name) LIKE LOWER(@query_pattern)
-                GROUP BY hero_name
-
-                UNION ALL
-
-                SELECT villain_name AS name, COUNT(*) AS frequency
-                FROM `{table_name}`
-                WHERE villain_name IS NOT NULL
-                  AND LOWER(villain_name) LIKE LOWER(@query_pattern)
-                GROUP BY villain_name
-            ),
-            aggregated AS (
-                SELECT
-                    name,
-                    SUM(frequency) AS total_frequency
-                FROM player_names
-                WHERE name IS NOT NULL
-                GROUP BY name
-            )
-            SELECT name
-            FROM aggregated
-            ORDER BY total_frequency DESC
+            SELECT display_name AS name
+            FROM `{table_name}`
+            WHERE name_lc >= @prefix AND name_lc < @prefix_next
+            ORDER BY frequency DESC
             LIMIT @limit
             """
 
             # 쿼리 파라미터 설정 (SQL Injection 방지)
             job_config = bigquery.QueryJobConfig(
                 query_parameters=[
-                    bigquery.ScalarQueryParameter("query_pattern", "STRING", query_pattern),
+                    bigquery.ScalarQueryParameter("prefix", "STRING", prefix),
+                    bigquery.ScalarQueryParameter("prefix_next", "STRING", prefix_next),
                     bigquery.ScalarQueryParameter("limit", "INT64", limit)
                 ]
             )
 
-            # 쿼리 실행
-            query_job = self.client.query(sql, job_config=job_config)
-            results = query_job.result()
+            # 쿼리 실행 (bigquery 스레드 풀, 이벤트 루프 비차단)
+            # 같은 prefix/limit 동시 요청은 BigQuery job 하나로 병합
+            results = await get_single_flight("bigquery_autocomplete").do(
+                (cleaned_query.lower(), limit),
+                lambda: run_blocking("bigquery", _fetch_rows, self.client, sql, job_config)
+            )
 
             # 결과 파싱
             suggestions = []
@@ -323,6 +494,10 @@ class BigQueryAutocompleteService:
                 suggestions=suggestions[:3]  # 로그에는 처음 3개만
             )
 
+            # 성공한 조회만 캐시 (에러 시 빈 리스트는 저장하지 않음)
+            if self.cache is not None:
+                self.cache.put(cleaned_query, limit, suggestions)
+
             return suggestions
 
         except ValueError as e:
@@ -333,6 +508,106 @@ class BigQueryAutocompleteService:
             # 에러 발생 시 빈 리스트 반환 (fail gracefully)
             return []
 
+    def get_name_frequencies(self, max_names: int = 200000) -> List[Tuple[str, int]]:
+        """
+        자동완성 인덱스 빌드용 선수명 빈도 사전 조회 (동기 호출, run_blocking으로 실행).
+
+        요청마다 호출하지 않고, 인메모리 인덱스 재빌드 시에만 사용한다.
+
+        Args:
+            max_names: 최대 이름 개수 (빈도 상위)
+
+        Returns:
+            (이름, 빈도) 리스트 (빈도 내림차순)
+        """
+        if self.client is None:
+            # Mock 모드: 목록 순서를 빈도로 간주
+            total = len(MOCK_PLAYER_NAMES)
+            return [(name, total - i) for i, name in enumerate(MOCK_PLAYER_NAMES)]
+
+        table_name = f"{settings.gcp_project}.{self.dataset}.{self.stats_table}"
+
+        sql = f"""
+        SELECT display_name AS name, frequency
+        FROM `{table_name}`
+        ORDER BY frequency DESC
+        LIMIT @limit
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("limit", "INT64", max_names)
+            ]
+        )
+
+        query_job = self.client.query(sql, job_config=job_config)
+        frequencies = [
+            (row.name, int(row.frequency))
+            for row in query_job.result(timeout=settings.bigquery_query_timeout_seconds)
+            if row.name
+        ]
+
+        logger.info("autocomplete_name_frequencies_loaded", count=len(frequencies))
+        return frequencies
+
+    def get_entity_frequencies(self, max_per_type: int = 50000) -> List[Tuple[str, str, int]]:
+        """
+        자동완성 엔티티 사전 조회 (태그, 토너먼트, 스트리트 액션).
+
+        hand_summary 컬럼(tags, tournament, street, action)만 사용한다 (mock 모드도 같은 타입).
+        동기 호출 (run_blocking으로 실행), 인메모리 인덱스 재빌드 시에만 사용한다.
+
+        Args:
+            max_per_type: 타입별 최대 엔티티 개수 (빈도 상위)
+
+        Returns:
+            (텍스트, 타입, 빈도) 리스트
+        """
+        if self.client is None:
+            return self._mock_entity_frequencies(max_per_type)
+
+        table_name = f"{settings.gcp_project}.{self.dataset}.{self.table}"
+
+        # hand_summary 스키마 기준 (get_hand_by_id와 같은 컬럼, entity_dictionary.extract_entities와 같은 규칙)
+        sql = f"""
+        WITH entities AS (
+            SELECT tag AS text, 'tag' AS type FROM `{table_name}`, UNNEST(tags) AS tag
+            UNION ALL SELECT tournament, 'tournament' FROM `{table_name}`
+            UNION ALL SELECT CONCAT(LOWER(TRIM(street)), ' ', LOWER(TRIM(action))), 'street_action' FROM `{table_name}`
+        )
+        SELECT text, type, COUNT(*) AS frequency
+        FROM entities
+        WHERE text IS NOT NULL AND TRIM(text) != ''
+        GROUP BY text, type
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY type ORDER BY COUNT(*) DESC) <= @max_per_type
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("max_per_type", "INT64", max_per_type)
+            ]
+        )
+
+        frequencies = [
+            (row.text, row.type, int(row.frequency))
+            for row in _fetch_rows(self.client, sql, job_config)
+        ]
+
+        logger.info("autocomplete_entity_frequencies_loaded", count=len(frequencies))
+        return frequencies
+
+    def _mock_entity_frequencies(self, max_per_type: int) -> List[Tuple[str, str, int]]:
+        """Mock 엔티티 사전 (mock_data/synthetic_ati 합본 파일 집계, 없으면 빈 사전)"""
+        hands = _load_mock_hands()
+
+        per_type: dict = {}
+        frequencies = []
+        for text, entity_type, count in count_entities(hands):
+            per_type[entity_type] = per_type.get(entity_type, 0) + 1
+            if per_type[entity_type] <= max_per_type:
+                frequencies.append((text, entity_type, count))
+        return frequencies
+
     async def _mock_autocomplete(self, query: str, limit: int) -> List[str]:
         """
         Mock 자동완성 (테스트용)
@@ -346,34 +621,10 @@ class BigQueryAutocompleteService:
         """
         logger.info("using_mock_autocomplete", query=query, limit=limit)
 
-        # Mock 데이터
-        mock_names = [
-            "Phil Ivey",
-            "Phil Hellmuth",
-            "Philip Ng",
-            "Tom Dwan",
-            "Daniel Negreanu",
-            "Doug Polk",
-            "Junglemann",
-            "Fedor Holz",
-            "Vanessa Selbst",
-            "Antonio Esfandiari",
-            "Jason Koon",
-            "Dan Smith",
-            "Bryn Kenney",
-            "Justin Bonomo",
-            "Stephen Chidwick",
-            "David Peters",
-            "Sam Greenwood",
-            "Mikita Badziakouski",
-            "Isaac Haxton",
-            "Timothy Adams"
-        ]
-
         # 대소문자 구분 없이 prefix 매칭
         query_lower = query.lower()
         suggestions = [
-            name for name in mock_names
+            name for name in MOCK_PLAYER_NAMES
             if name.lower().startswith(query_lower)
         ]
 
@@ -0,0 +1,349 @@
+"""
+BM25 인메모리 역색인 (Hybrid Search의 키워드 leg)
+hand_summary의 핸드 설명 / 선수명 / 태그 / 토너먼트를 토큰화해 프로세스 메모리에서 BM25 검색
+
+Architecture:
+- BM25Index: term → {doc 번호: tf} 역색인, 문서 길이/평균 길이로 Okapi BM25 점수 계산
+- 증분 갱신: upsert(hand_id, text)로 문서 교체 (기존 posting 제거 후 추가), 재빌드 없이 반영
+- HandTextIndex: 시작 시 전체 빌드, 이후 refresh_seconds마다 updated_at >= watermark 행만 upsert
+  (watermark와 같은 시각에 늦게 커밋된 행 포함, 재조회된 행은 hand_id 기준 멱등 upsert)
+- reciprocal_rank_fusion(): 벡터 leg / BM25 leg 순위를 RRF(k=60)로 결합 (점수 스케일 무관)
+- 정확한 선수명 쿼리("Phil Ivey")는 is_exact_name()으로 판별 → 벡터 leg를 기다리지 않음
+"""
+
+import asyncio
+import heapq
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import structlog
+
+from app.config import settings
+from app.services.async_io import run_blocking
+
+logger = structlog.get_logger()
+
+
+# 단어 문자만 토큰으로 사용 ('_'는 구분자: "BAD_BEAT" → "bad", "beat")
+_TOKEN = re.compile(r"[^\W_]+")
+
+# 문서 텍스트로 사용하는 hand_summary / ATI 필드
+DOCUMENT_FIELDS = (
+    "hero_name", "villain_name", "description", "tournament", "tournament_id",
+    "street", "action", "hero_action", "hand_type",
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 단어 토큰 목록"""
+    return _TOKEN.findall(text.lower())
+
+
+def hand_document(hand: Mapping) -> str:
+    """핸드 한 행 → BM25 문서 텍스트 (설명, 선수명, 태그, 토너먼트 등)"""
+    parts = [str(hand[field]) for field in DOCUMENT_FIELDS if hand.get(field)]
+    parts.extend(str(tag) for tag in hand.get("tags") or [] if tag)
+    return " ".join(parts)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]],
+    k: int = 60,
+    limit: Optional[int] = None
+) -> List[Tuple[str, float]]:
+    """
+    Reciprocal Rank Fusion
+
+    score(d) = Σ 1 / (k + rank_i(d)), rank는 1부터 시작
+
+    Args:
+        rankings: 순위 리스트 목록 (각각 hand_id 순서)
+        k: RRF 상수 (클수록 하위 순위 영향 증가)
+        limit: 반환 개수 (None이면 전체)
+
+    Returns:
+        (hand_id, rrf 점수) 리스트 (점수 내림차순, 동점은 먼저 등장한 순서)
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, hand_id in enumerate(ranking, start=1):
+            scores[hand_id] = scores.get(hand_id, 0.0) + 1.0 / (k + rank)
+
+    fused = sorted(scores.items(), key=lambda item: -item[1])
+    return fused[:limit] if limit is not None else fused
+
+
+class BM25Index:
+    """
+    증분 갱신 가능한 BM25 역색인
+
+    Example:
+        >>> index = BM25Index()
+        >>> index.upsert("hand_001", "Phil Ivey bluffs the river")
+        >>> index.search("ivey bluff", top_k=5)
+        [("hand_001", 0.58)]
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Args:
+            k1: tf 포화 계수
+            b: 문서 길이 정규화 계수
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_ids: Dict[str, int] = {}
+        self._hand_ids: List[Optional[str]] = []
+        self._doc_terms: List[Optional[Counter]] = []
+        self._doc_lengths: List[int] = []
+        self._total_length = 0
+        self._free: List[int] = []
+        self._names: Counter = Counter()
+        self._doc_names: Dict[int, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def upsert(self, hand_id: str, text: str, names: Iterable[str] = ()):
+        """
+        문서 추가/교체
+
+        Args:
+            hand_id: 핸드 ID
+            text: 문서 텍스트 (hand_document 결과)
+            names: 정확한 이름 쿼리로 취급할 선수명 (hero/villain)
+        """
+        terms = Counter(tokenize(text))
+        normalized_names = tuple(" ".join(tokenize(name)) for name in names if name)
+
+        with self._lock:
+            self._remove_locked(hand_id)
+
+            # 제거된 문서 번호 재사용 (주기적 upsert로 배열이 커지지 않도록)
+            if self._free:
+                doc = self._free.pop()
+            else:
+                doc = len(self._hand_ids)
+                self._hand_ids.append(None)
+                self._doc_terms.append(None)
+                self._doc_lengths.append(0)
+            length = sum(terms.values())
+            self._doc_ids[hand_id] = doc
+            self._hand_ids[doc] = hand_id
+            self._doc_terms[doc] = terms
+            self._doc_lengths[doc] = length
+            self._total_length += length
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[doc] = tf
+            if normalized_names:
+                self._doc_names[doc] = normalized_names
+                self._names.update(normalized_names)
+
+    def remove(self, hand_id: str) -> bool:
+        """문서 제거 (없으면 False)"""
+        with self._lock:
+            return self._remove_locked(hand_id)
+
+    def _remove_locked(self, hand_id: str) -> bool:
+        doc = self._doc_ids.pop(hand_id, None)
+        if doc is None:
+            return False
+
+        for term in self._doc_terms[doc]:
+            posting = self._postings[term]
+            del posting[doc]
+            if not posting:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths[doc]
+        self._hand_ids[doc] = None
+        self._doc_terms[doc] = None
+        self._doc_lengths[doc] = 0
+        self._free.append(doc)
+        for name in self._doc_names.pop(doc, ()):
+            self._names[name] -= 1
+            if self._names[name] <= 0:
+                del self._names[name]
+        return True
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        BM25 top-k 검색
+
+        Returns:
+            (hand_id, BM25 점수) 리스트 (점수 내림차순, 매칭 없으면 빈 리스트)
+        """
+        terms = set(tokenize(query))
+        if not terms or top_k <= 0:
+            return []
+
+        with self._lock:
+            n = len(self._doc_ids)
+            if n == 0:
+                return []
+            avg_length = self._total_length / n
+
+            scores: Dict[int, float] = {}
+            for term in terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                df = len(posting)
+                idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+                for doc, tf in posting.items():
+                    norm = self.k1 * (1.0 - self.b + self.b * self._doc_lengths[doc] / avg_length)
+                    scores[doc] = scores.get(doc, 0.0) + idf * tf * (self.k1 + 1.0) / (tf + norm)
+
+            top = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+            return [(self._hand_ids[doc], score) for doc, score in top]
+
+    def is_exact_name(self, query: str) -> bool:
+        """쿼리가 색인된 선수명과 정확히 일치하는지 ("phil  IVEY" == "Phil Ivey")"""
+        return " ".join(tokenize(query)) in self._names
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def stats(self) -> dict:
+        return {
+            "documents": len(self._doc_ids),
+            "terms": len(self._postings),
+            "names": len(self._names),
+            "avg_length": self._total_length / len(self._doc_ids) if self._doc_ids else 0.0,
+        }
+
+
+def _hand_names(hand: Mapping) -> Tuple[str, ...]:
+    return tuple(hand[field] for field in ("hero_name", "villain_name") if hand.get(field))
+
+
+class HandTextIndex:
+    """
+    hand_summary BM25 인덱스 서비스
+
+    - 시작 시 백그라운드로 전체 빌드, 이후 refresh_seconds 주기로 증분 갱신
+    - 증분 갱신은 updated_at watermark 이후 행만 조회해 upsert (전체 재빌드 없음)
+    - 업로드/동기화 경로는 index_hands()로 즉시 반영 가능
+    """
+
+    def __init__(self, bq_service=None, refresh_seconds: Optional[int] = None):
+        self.bq_service = bq_service
+        self.refresh_seconds = refresh_seconds or settings.bm25_refresh_seconds
+        self.index = BM25Index(k1=settings.bm25_k1, b=settings.bm25_b)
+        self.watermark = None
+        self.built = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.refresh_count = 0
+        self.refresh_failures = 0
+        self.last_refresh_ms: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.built
+
+    def index_hands(self, hands: Iterable[Mapping]) -> int:
+        """핸드 행 upsert (동기, 반영된 행 수 반환)"""
+        count = 0
+        for hand in hands:
+            hand_id = hand.get("hand_id")
+            if not hand_id:
+                continue
+            self.index.upsert(hand_id, hand_document(hand), _hand_names(hand))
+            updated_at = hand.get("updated_at")
+            if updated_at is not None and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+            count += 1
+        return count
+
+    async def refresh(self) -> int:
+        """
+        watermark 이후 변경된 핸드를 조회해 색인 (첫 호출은 전체 빌드)
+
+        Returns:
+            반영된 행 수 (실패 시 기존 색인 유지, 0 반환)
+        """
+        if self.bq_service is None:
+            from app.services.bigquery import BigQueryService
+
+            self.bq_service = BigQueryService()
+
+        start = time.perf_counter()
+        try:
+            hands = await run_blocking(
+                "bigquery", self.bq_service.get_hand_documents, self.watermark
+            )
+            count = await run_blocking("bm25", self.index_hands, hands)
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.error("bm25_index_refresh_failed", error=str(e))
+            return 0
+
+        self.built = True
+        self.refresh_count += 1
+        self.last_refresh_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            "bm25_index_refreshed",
+            upserted=count,
+            documents=len(self.index),
+            refresh_ms=self.last_refresh_ms,
+        )
+        return count
+
+    async def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """BM25 검색 (bm25 스레드 풀, 실패 시 빈 리스트)"""
+        try:
+            return await run_blocking("bm25", self.index.search, query, top_k)
+        except Exception as e:
+            logger.error("bm25_search_failed", error=str(e), query=query[:50])
+            return []
+
+    def is_exact_name(self, query: str) -> bool:
+        return self.index.is_exact_name(query)
+
+    async def _refresh_loop(self):
+        """주기적 증분 갱신 루프"""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start_background_refresh(self):
+        """백그라운드 갱신 태스크 시작 (첫 전체 빌드 포함)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """백그라운드 갱신 태스크 종료"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def stats(self) -> dict:
+        """헬스 체크용 상태"""
+        return {
+            "ready": self.is_ready,
+            **self.index.stats(),
+            "watermark": str(self.watermark) if self.watermark is not None else None,
+            "refresh_count": self.refresh_count,
+            "refresh_failures": self.refresh_failures,
+            "last_refresh_ms": self.last_refresh_ms,
+            "refresh_seconds": self.refresh_seconds,
+        }
+
+
+# 싱글톤 인스턴스
+_hand_text_index: Optional[HandTextIndex] = None
+
+
+def get_hand_text_index() -> HandTextIndex:
+    """HandTextIndex 싱글톤 인스턴스 반환"""
+    global _hand_text_index
+    if _hand_text_index is None:
+        _hand_text_index = HandTextIndex()
+    return _hand_text_index
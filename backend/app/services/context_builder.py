@@ -0,0 +1,235 @@
+"""
+토큰 예산 기반 RAG 컨텍스트 빌더
+CPU/Ollama에서 Qwen 지연은 프롬프트 길이에 비례 → 핸드를 관련도 순으로 예산 안에서만 채움
+
+Architecture:
+- TokenCounter: llm_tokenizer_path(Qwen tokenizer.json)가 있고 tokenizers가 설치되어 있으면 정확한 토큰 수,
+  아니면 로컬 근사 (한글 음절 1, 영문 단어 ceil(len/4), 숫자 3자리당 1, 기호 1) — 선택 의존성
+- 핸드 블록은 값이 있는 필드만 한 줄씩 (빈 줄 / 들여쓰기 패딩 없음)
+- 설명은 순위별 몫(예산 × (1/순위) / Σ 1/순위)까지만 → 1위 핸드의 긴 설명이 뒤 핸드 자리를 먹지 않음
+- 몫이나 남은 예산보다 긴 설명은 쿼리 관련 문장만 남기도록 줄임
+  (쿼리 단어 겹침 점수 상위 문장, 원래 순서 유지)
+- 설명 없이도 들어가지 않으면 중단, 결과에 프롬프트 / 컨텍스트 토큰 수와 사용·축약 핸드 수 기록
+- 토큰 수는 tokenizer가 없으면 근사값 (TokenCounter.backend == "approximate", 응답에도 표시)
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+import structlog
+
+from app.config import settings
+from app.models import HandResult
+from app.services.bm25_index import tokenize
+
+logger = structlog.get_logger()
+
+# 근사 토큰 단위: 한글 음절 / 영문·숫자 덩어리 / 공백 아닌 기호
+_APPROX_TOKEN = re.compile(r"[가-힣]|[A-Za-z]+|\d+|[^\sA-Za-z\d가-힣]")
+# 문장 경계 (마침표 / 물음표 / 느낌표 / 줄바꿈 뒤)
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def approximate_token_count(text: str) -> int:
+    """tokenizer 없이 쓰는 토큰 수 근사 (BPE 토크나이저보다 약간 크게 잡음)"""
+    total = 0
+    for piece in _APPROX_TOKEN.findall(text):
+        if piece.isascii() and piece.isalpha():
+            total += math.ceil(len(piece) / 4)
+        elif piece.isdigit():
+            total += math.ceil(len(piece) / 3)
+        else:
+            total += 1
+    return total
+
+
+class TokenCounter:
+    """
+    프롬프트 토큰 수 계산기
+
+    Example:
+        >>> counter = TokenCounter()
+        >>> counter.count("Phil Ivey의 블러프 전략은?")
+        10
+    """
+
+    def __init__(self, tokenizer_path: str = "", cache_size: int = 4096):
+        """
+        Args:
+            tokenizer_path: HF tokenizer.json 경로 (빈 값 / tokenizers 미설치 시 근사)
+            cache_size: 텍스트별 토큰 수 LRU 크기 (같은 핸드 블록 반복 계산 방지)
+        """
+        self._encode: Optional[Callable[[str], int]] = None
+        if tokenizer_path:
+            self._encode = self._load_tokenizer(tokenizer_path)
+        self.backend = "tokenizer" if self._encode is not None else "approximate"
+        self.count = lru_cache(maxsize=cache_size)(self._count)
+
+    @staticmethod
+    def _load_tokenizer(path: str) -> Optional[Callable[[str], int]]:
+        try:
+            from tokenizers import Tokenizer
+        except ImportError:
+            logger.warning("context_builder_tokenizers_missing", fallback="approximate")
+            return None
+        try:
+            tokenizer = Tokenizer.from_file(path)
+        except Exception as e:
+            logger.error("context_builder_tokenizer_load_failed", path=path, error=str(e))
+            return None
+        return lambda text: len(tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def _count(self, text: str) -> int:
+        if self._encode is not None:
+            return self._encode(text)
+        return approximate_token_count(text)
+
+
+class BuiltContext(NamedTuple):
+    """컨텍스트 빌드 결과"""
+    text: str
+    hands_used: int
+    hands_truncated: int
+    context_tokens: int
+
+
+def render_hand(index: int, hand: HandResult, description: Optional[str] = None) -> str:
+    """핸드 블록 (값이 있는 필드만)"""
+    lines = [f"핸드 {index} ({hand.hand_id})"]
+    if description is None:
+        description = hand.description
+    if description:
+        lines.append(f"- 설명: {description}")
+    players = hand.hero_name + (f" vs {hand.villain_name}" if hand.villain_name else "")
+    lines.append(f"- 선수: {players}")
+    lines.append(f"- {hand.street} {hand.action}, Pot {hand.pot_bb:g} BB")
+    if hand.tournament:
+        lines.append(f"- Tournament: {hand.tournament}")
+    if hand.tags:
+        lines.append(f"- Tags: {', '.join(hand.tags)}")
+    return "\n".join(lines)
+
+
+def rank_shares(count: int) -> List[float]:
+    """순위별 설명 예산 비율 (1/순위 가중치, 합 1)"""
+    weights = [1.0 / rank for rank in range(1, count + 1)]
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+class ContextBuilder:
+    """
+    토큰 예산 안에서 관련도 순으로 핸드 컨텍스트 구성
+
+    Example:
+        >>> builder = ContextBuilder(TokenCounter())
+        >>> context = builder.build("Ivey river bluff", hands, budget_tokens=800, max_hands=5)
+        >>> context.hands_used, context.context_tokens
+        (4, 781)
+    """
+
+    SEPARATOR = "\n\n"
+
+    def __init__(self, counter: Optional[TokenCounter] = None):
+        self.counter = counter or TokenCounter()
+
+    def _relevant_description(
+        self, query_terms: set, description: str, render: Callable[[str], str], budget: int
+    ) -> Optional[str]:
+        """
+        설명을 쿼리 관련 문장만 남겨 예산에 맞춤
+
+        Returns:
+            줄인 설명 (빈 문자열이면 설명 생략), 설명 없이도 예산 초과면 None
+        """
+        if self.counter.count(render("")) > budget:
+            return None
+
+        sentences = split_sentences(description)
+        ranked = sorted(
+            range(len(sentences)),
+            key=lambda i: (-len(query_terms & set(tokenize(sentences[i]))), i),
+        )
+        chosen: List[int] = []
+        for i in ranked:
+            candidate = sorted(chosen + [i])
+            text = " ".join(sentences[j] for j in candidate)
+            if self.counter.count(render(text)) <= budget:
+                chosen = candidate
+        return " ".join(sentences[j] for j in chosen)
+
+    def build(
+        self,
+        query: str,
+        hands: Sequence[HandResult],
+        budget_tokens: int,
+        max_hands: Optional[int] = None
+    ) -> BuiltContext:
+        """
+        컨텍스트 구성
+
+        Args:
+            query: 사용자 질문 (설명 축약 시 문장 관련도 기준)
+            hands: 검색된 핸드 (관련도 순)
+            budget_tokens: 컨텍스트에 쓸 수 있는 토큰 수
+            max_hands: 최대 핸드 수
+
+        Returns:
+            BuiltContext (text, hands_used, hands_truncated, context_tokens)
+        """
+        query_terms = set(tokenize(query))
+        separator_tokens = self.counter.count(self.SEPARATOR)
+        candidates = list(hands[:max_hands])
+        shares = rank_shares(len(candidates))
+        blocks: List[str] = []
+        used_tokens = 0
+        truncated = 0
+
+        for hand, share in zip(candidates, shares):
+            remaining = budget_tokens - used_tokens - (separator_tokens if blocks else 0)
+            index = len(blocks) + 1
+            block = render_hand(index, hand)
+            tokens = self.counter.count(block)
+            # 설명은 순위별 몫까지만 (설명 없는 블록 + 몫), 남은 예산도 넘지 않음
+            limit = min(
+                remaining,
+                self.counter.count(render_hand(index, hand, "")) + math.floor(budget_tokens * share),
+            )
+
+            if tokens > limit:
+                description = self._relevant_description(
+                    query_terms,
+                    hand.description,
+                    lambda text: render_hand(index, hand, text),
+                    limit,
+                )
+                if description is None:
+                    break
+                block = render_hand(index, hand, description)
+                tokens = self.counter.count(block)
+                truncated += 1
+
+            used_tokens += tokens + (separator_tokens if blocks else 0)
+            blocks.append(block)
+
+        if not blocks:
+            return BuiltContext("검색 결과가 없습니다.", 0, 0, 0)
+        return BuiltContext(self.SEPARATOR.join(blocks), len(blocks), truncated, used_tokens)
+
+
+# 싱글톤 인스턴스
+_context_builder: Optional[ContextBuilder] = None
+
+
+def get_context_builder() -> ContextBuilder:
+    """ContextBuilder 싱글톤 인스턴스 반환 (설정값으로 생성)"""
+    global _context_builder
+    if _context_builder is None:
+        _context_builder = ContextBuilder(TokenCounter(settings.llm_tokenizer_path))
+    return _context_builder
@@ -0,0 +1,221 @@
+"""
+쿼리 임베딩 캐시 (TextEmbedding-004 앞단)
+"Phil Ivey bluff" 같은 반복 쿼리는 임베딩 API를 호출하지 않고 캐시된 벡터 사용
+
+Architecture:
+- 키: (모델 버전, task type, 정규화 텍스트) → 모델 교체 시 자동으로 다른 키
+- Tier 1: 프로세스 내 LRU (OrderedDict)
+- Tier 2 (선택): SQLite 디스크 캐시, 벡터는 packed float32 BLOB (768차원 = 3KB)
+  → 재시작/다른 워커에서도 재사용, 디스크 hit는 LRU로 승격
+- 디스크 I/O는 동기 → 호출 측에서 run_blocking("embedding_cache", ...)으로 실행
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_embedding_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (소문자, 앞뒤/연속 공백 정리)"""
+    return _WHITESPACE.sub(" ", text.strip().lower())
+
+
+def pack_vector(vector: List[float]) -> bytes:
+    """float 리스트 → packed float32"""
+    return array("f", vector).tobytes()
+
+
+def unpack_vector(blob: bytes) -> List[float]:
+    """packed float32 → float 리스트"""
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class SQLiteEmbeddingStore:
+    """디스크 임베딩 캐시 (키 → packed float32 BLOB)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY,"
+            " dimension INTEGER NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        return unpack_vector(row[0]) if row else None
+
+    def put(self, key: str, vector: List[float]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, dimension, vector, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, len(vector), pack_vector(vector), time.time())
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingCache:
+    """
+    2단계 임베딩 캐시 (LRU + 선택적 SQLite)
+
+    Example:
+        >>> cache = EmbeddingCache(model_version="text-embedding-004", max_entries=10000)
+        >>> cache.get("Phil Ivey bluff", "RETRIEVAL_QUERY")
+        None
+        >>> cache.put("Phil Ivey bluff", "RETRIEVAL_QUERY", vector)
+        >>> cache.get("phil ivey  bluff", "RETRIEVAL_QUERY")  # 정규화 후 같은 키
+        [...]
+    """
+
+    def __init__(
+        self,
+        model_version: str,
+        max_entries: int = 10000,
+        disk_store: Optional[SQLiteEmbeddingStore] = None
+    ):
+        """
+        Args:
+            model_version: 임베딩 모델 이름/버전 (키에 포함)
+            max_entries: LRU 최대 항목 수
+            disk_store: 디스크 캐시 (None이면 메모리만 사용)
+        """
+        self.model_version = model_version
+        self.max_entries = max_entries
+        self.disk_store = disk_store
+        self._entries: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _key(self, text: str, task_type: str) -> Tuple[str, str]:
+        return task_type, normalize_embedding_text(text)
+
+    def _disk_key(self, key: Tuple[str, str]) -> str:
+        raw = "\x1f".join((self.model_version, *key))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: Tuple[str, str], vector: List[float]):
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, text: str, task_type: str) -> Optional[List[float]]:
+        """
+        캐시 조회 (LRU → 디스크 순, 디스크 hit는 LRU로 승격)
+
+        Returns:
+            임베딩 벡터 (없으면 None)
+        """
+        key = self._key(text, task_type)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return vector
+
+        if self.disk_store is not None:
+            try:
+                vector = self.disk_store.get(self._disk_key(key))
+            except sqlite3.Error as e:
+                logger.warning("embedding_cache_disk_read_failed", error=str(e))
+                vector = None
+            if vector is not None:
+                self._remember(key, vector)
+                self.disk_hits += 1
+                return vector
+
+        self.misses += 1
+        return None
+
+    def put(self, text: str, task_type: str, vector: List[float]):
+        """임베딩 저장 (LRU + 디스크)"""
+        key = self._key(text, task_type)
+        vector = list(vector)
+        self._remember(key, vector)
+
+        if self.disk_store is not None:
+            try:
+                self.disk_store.put(self._disk_key(key), vector)
+            except sqlite3.Error as e:
+                logger.warning("embedding_cache_disk_write_failed", error=str(e))
+
+    def clear(self):
+        """LRU 항목 제거 (디스크는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """헬스 체크용 hit/miss 카운터"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "model_version": self.model_version,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "disk_path": self.disk_store.path if self.disk_store is not None else None,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def create_embedding_cache() -> Optional[EmbeddingCache]:
+    """설정값으로 임베딩 캐시 생성 (비활성화 시 None)"""
+    if not settings.embedding_cache_enabled:
+        return None
+
+    disk_store = None
+    if settings.embedding_cache_disk_path:
+        try:
+            disk_store = SQLiteEmbeddingStore(settings.embedding_cache_disk_path)
+        except sqlite3.Error as e:
+            logger.warning(
+                "embedding_cache_disk_unavailable",
+                path=settings.embedding_cache_disk_path,
+                error=str(e)
+            )
+
+    return EmbeddingCache(
+        model_version=settings.vertex_embedding_model,
+        max_entries=settings.embedding_cache_max_entries,
+        disk_store=disk_store
+    )
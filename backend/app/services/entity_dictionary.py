@@ -0,0 +1,67 @@
+"""
+자동완성 엔티티 추출/집계 (태그, 토너먼트, 스트리트 액션)
+hand_summary / ATI 메타데이터 행에서 자동완성 대상 엔티티를 뽑아 빈도를 센다
+
+Architecture:
+- 엔티티 타입별로 별도 빈도 사전 (player는 선수명 빈도 사전을 그대로 사용)
+- street_action: "river" + "call" → "river call" (소문자, 사용자가 입력하는 형태)
+- 태그는 원본 표기 유지 ("BAD_BEAT"), 검색 시 '_'는 공백으로 정규화
+- BigQuery 집계(get_entity_frequencies)와 Mock 모드 집계가 같은 규칙을 따름
+  → hand_summary 컬럼(tags, tournament, street, action)에서 나오는 타입만 노출
+"""
+
+from collections import Counter
+from typing import Iterable, List, Mapping, NamedTuple, Tuple
+
+# 응답에 노출되는 엔티티 타입 (그룹 순서)
+ENTITY_TYPES = ("player", "tag", "tournament", "street_action")
+
+
+class EntitySuggestion(NamedTuple):
+    """타입이 붙은 자동완성 결과"""
+    text: str
+    type: str
+    count: int
+
+
+def street_action(street: str, action: str) -> str:
+    """스트리트 + 액션을 자동완성 표기로 변환 ("RIVER", "Call" → "river call")"""
+    return f"{street.strip().lower()} {action.strip().lower()}"
+
+
+def extract_entities(hand: Mapping) -> List[Tuple[str, str]]:
+    """
+    핸드 메타데이터 한 행에서 (텍스트, 타입) 목록 추출 (player 제외)
+
+    ATI 스키마(tournament_id, hero_action)와 hand_summary 스키마(tournament, action)를 모두 지원한다.
+    hand_summary에 없는 ATI 전용 필드(hand_type, 포지션)는 운영 사전과 맞추기 위해 추출하지 않는다.
+    """
+    entities: List[Tuple[str, str]] = []
+
+    for tag in hand.get("tags") or []:
+        if tag:
+            entities.append((tag, "tag"))
+
+    tournament = hand.get("tournament_id") or hand.get("tournament")
+    if tournament:
+        entities.append((tournament, "tournament"))
+
+    street = hand.get("street")
+    action = hand.get("hero_action") or hand.get("action")
+    if street and action:
+        entities.append((street_action(street, action), "street_action"))
+
+    return entities
+
+
+def count_entities(hands: Iterable[Mapping]) -> List[Tuple[str, str, int]]:
+    """
+    핸드 목록에서 엔티티 빈도 집계
+
+    Returns:
+        (텍스트, 타입, 빈도) 리스트 (빈도 내림차순)
+    """
+    counts: Counter = Counter()
+    for hand in hands:
+        counts.update(extract_entities(hand))
+    return [(text, entity_type, count) for (text, entity_type), count in counts.most_common()]
@@ -307,18 +307,21 @@ class FirestoreService:
             hand_ids: List of hand document IDs
 
         Returns:
-            List of hand dictionaries
+            List of hand dictionaries (missing IDs are skipped, order not guaranteed)
         """
         try:
             hands = []
+            collection = self.db.collection("hands_phh")  # PHH schema collection
 
-            # Firestore batch get (max 500 documents)
+            # Firestore batch get (max 500 documents per get_all round trip)
             for i in range(0, len(hand_ids), 500):
                 batch_ids = hand_ids[i:i+500]
+                refs = [collection.document(hand_id) for hand_id in batch_ids]
 
-                for hand_id in batch_ids:
-                    hand_data = self.get_hand_by_id(hand_id)
-                    if hand_data:
+                for doc in self.db.get_all(refs):
+                    if doc.exists:
+                        hand_data = doc.to_dict()
+                        hand_data["hand_id"] = doc.id
                         hands.append(hand_data)
 
             logger.info(f"Batch fetched {len(hands)} hands")
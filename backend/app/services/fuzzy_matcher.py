@@ -0,0 +1,207 @@
+"""
+오타 교정 후보 생성 (SymSpell 방식 삭제 인덱스)
+선수명/태그 사전에서 편집 거리 ≤2 후보를 네트워크 호출 없이 in-process로 반환
+
+Architecture:
+- 빌드: 각 단어의 앞 prefix_length 글자에서 최대 max_distance개 문자를 삭제한 변형을 키로 색인
+- 조회: 쿼리 prefix의 삭제 변형으로 후보 집합을 모은 뒤 bounded Levenshtein으로 검증
+- 검증: 대각선 밴드만 계산하고 행 최솟값이 한도를 넘으면 즉시 종료
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+def normalize_term(text: str) -> str:
+    """소문자 변환 + 연속 공백 정리"""
+    return " ".join(text.lower().split())
+
+
+def bounded_levenshtein(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance (편집 거리), 한도 초과 시 조기 종료
+
+    Args:
+        s1: 첫 번째 문자열
+        s2: 두 번째 문자열
+        max_distance: 최대 관심 거리 (None이면 정확한 거리 계산)
+
+    Returns:
+        편집 거리. max_distance를 넘으면 max_distance + 1
+
+    Examples:
+        >>> bounded_levenshtein("Junglman", "Junglemann")
+        2
+        >>> bounded_levenshtein("abcdef", "uvwxyz", max_distance=2)
+        3
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    len1, len2 = len(s1), len(s2)
+    if max_distance is None:
+        max_distance = len1
+    elif len1 - len2 > max_distance:
+        return max_distance + 1
+
+    if len2 == 0:
+        return len1 if len1 <= max_distance else max_distance + 1
+
+    over = max_distance + 1
+    previous_row = list(range(len2 + 1))
+    for i in range(1, len1 + 1):
+        c1 = s1[i - 1]
+        # 대각선 밴드 [i - max, i + max] 밖은 한도를 넘으므로 계산 생략
+        lo = max(1, i - max_distance)
+        hi = min(len2, i + max_distance)
+        current_row = [over] * (len2 + 1)
+        if lo == 1:
+            current_row[0] = i
+        row_min = current_row[0] if lo == 1 else over
+        for j in range(lo, hi + 1):
+            cost = previous_row[j - 1] + (c1 != s2[j - 1])
+            deletion = previous_row[j] + 1
+            insertion = current_row[j - 1] + 1
+            value = min(cost, deletion, insertion)
+            current_row[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return over
+        previous_row = current_row
+
+    distance = previous_row[len2]
+    return distance if distance <= max_distance else over
+
+
+class FuzzyMatch(NamedTuple):
+    """오타 교정 후보"""
+    term: str
+    distance: int
+    count: int
+
+
+class SymSpellIndex:
+    """
+    SymSpell 방식 삭제 인덱스 (불변, 재빌드 시 통째로 교체)
+
+    - 삭제 변형은 단어 앞 prefix_length 글자에 대해서만 만들어 변형 수를 제한
+    - 변형 문자열 대신 (hash, term id)를 int64 하나로 묶은 정렬 배열에 저장해
+      10만 단어에서도 수십 MB 수준으로 유지. hash 충돌은 후보만 늘릴 뿐
+      최종 거리 검증에서 걸러지므로 결과에는 영향이 없다.
+    """
+
+    _ID_BITS = 22
+    _ID_MASK = (1 << _ID_BITS) - 1
+    _HASH_MASK = (1 << (63 - _ID_BITS)) - 1
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, int]] = (),
+        max_distance: int = 2,
+        prefix_length: int = 7
+    ):
+        """
+        Args:
+            entries: (표시 단어, 빈도) 목록
+            max_distance: 최대 편집 거리
+            prefix_length: 삭제 변형을 만들 prefix 길이
+        """
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._terms: List[str] = []          # 정규화 단어
+        self._display: List[str] = []        # 표시 단어
+        self._counts: List[int] = []
+
+        # 정규화 키 기준 병합 (빈도 합산)
+        term_ids: Dict[str, int] = {}
+        for term, count in entries:
+            if not term:
+                continue
+            key = normalize_term(term)
+            if not key:
+                continue
+            term_id = term_ids.get(key)
+            if term_id is not None:
+                self._counts[term_id] += count
+                continue
+            if len(self._terms) > self._ID_MASK:
+                raise ValueError("SymSpellIndex supports at most 4M terms")
+            term_ids[key] = len(self._terms)
+            self._terms.append(key)
+            self._display.append(term)
+            self._counts.append(count)
+
+        self._packed = array("q", sorted(
+            (variant << self._ID_BITS) | term_id
+            for term_id, key in enumerate(self._terms)
+            for variant in self._delete_variants(key[:self.prefix_length])
+        ))
+
+    def _delete_variants(self, key: str) -> Set[int]:
+        """key에서 최대 max_distance개 문자를 삭제한 변형의 hash (key 자신 포함)"""
+        variants = {key}
+        frontier = {key}
+        for _ in range(self.max_distance):
+            next_frontier = set()
+            for word in frontier:
+                for i in range(len(word)):
+                    next_frontier.add(word[:i] + word[i + 1:])
+            variants |= next_frontier
+            frontier = next_frontier
+        return {hash(variant) & self._HASH_MASK for variant in variants}
+
+    def _candidates(self, key: str) -> Set[int]:
+        """쿼리 prefix의 삭제 변형과 같은 변형을 가진 term id 집합"""
+        packed = self._packed
+        n = len(packed)
+        candidate_ids: Set[int] = set()
+        for variant in self._delete_variants(key[:self.prefix_length]):
+            i = bisect_left(packed, variant << self._ID_BITS)
+            while i < n and packed[i] >> self._ID_BITS == variant:
+                candidate_ids.add(packed[i] & self._ID_MASK)
+                i += 1
+        return candidate_ids
+
+    def lookup(
+        self,
+        query: str,
+        max_distance: Optional[int] = None,
+        limit: int = 5
+    ) -> List[FuzzyMatch]:
+        """
+        편집 거리 ≤ max_distance인 단어 조회
+
+        Args:
+            query: 사용자 입력
+            max_distance: 최대 편집 거리 (기본: 인덱스 설정값)
+            limit: 최대 결과 개수
+
+        Returns:
+            FuzzyMatch 리스트 (거리 오름차순 → 빈도 내림차순)
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        key = normalize_term(query)
+        if not key or limit <= 0:
+            return []
+
+        matches = []
+        key_len = len(key)
+        for term_id in self._candidates(key):
+            term = self._terms[term_id]
+            if abs(len(term) - key_len) > max_distance:
+                continue
+            distance = bounded_levenshtein(key, term, max_distance)
+            if distance <= max_distance:
+                matches.append(
+                    FuzzyMatch(self._display[term_id], distance, self._counts[term_id])
+                )
+
+        matches.sort(key=lambda m: (m.distance, -m.count, m.term))
+        return matches[:limit]
+
+    def __len__(self) -> int:
+        return len(self._terms)
@@ -0,0 +1,204 @@
+"""
+검색 결과 Hydration (hand_id → 핸드 메타데이터 결합)
+Vector Search / BM25 결과는 hand_id와 점수만 있으므로 HandResult 필드를 채워 넣음
+
+Architecture:
+- 핸드별 LRU + TTL 캐시 → 같은 핸드가 다시 검색되면 조회 없음
+- 캐시 miss 핸드는 한 번의 파라미터 쿼리로 일괄 조회 (hand_id IN UNNEST(@ids))
+  → 결과 20개 페이지도 왕복 최대 1회
+- 결과 순서는 입력(ANN/RRF) 순서 유지, 메타데이터를 찾지 못한 핸드는 제외
+- HandResult 필수 필드가 NULL인 행도 제외 (검색 전체가 500이 되지 않도록, 캐시하지 않음)
+- 이미 메타데이터가 있는 결과(Mock 검색 등)는 그대로 통과
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from app.config import settings
+from app.services.async_io import run_blocking
+
+logger = structlog.get_logger()
+
+
+# HandResult에 필요한 메타데이터 필드 (검색 결과의 hand_id / distance / 점수는 유지)
+HYDRATION_FIELDS = (
+    "hero_name", "villain_name", "description", "pot_bb", "street", "action",
+    "tournament", "tags", "video_url", "timestamp",
+)
+
+
+# HandResult 필수 필드 (NULL이면 응답 모델 생성 실패)
+REQUIRED_FIELDS = ("hero_name", "description", "pot_bb", "street", "action")
+
+
+def is_hydrated(result: dict) -> bool:
+    """HandResult 필수 필드가 이미 있는지 여부"""
+    return "hero_name" in result and "description" in result
+
+
+class HandHydrator:
+    """
+    검색 결과 메타데이터 결합기
+
+    Example:
+        >>> hydrator = HandHydrator(fetch_fn=bq_service.get_hands_by_ids)
+        >>> await hydrator.hydrate([{"hand_id": "hand_001", "distance": 0.91}])
+        [{"hand_id": "hand_001", "distance": 0.91, "hero_name": "Phil Ivey", ...}]
+    """
+
+    def __init__(
+        self,
+        fetch_fn: Optional[Callable[[List[str]], List[dict]]] = None,
+        max_entries: int = 10000,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            fetch_fn: hand_id 목록 → 메타데이터 행 리스트 (동기, bigquery 스레드 풀에서 실행)
+                      None이면 첫 사용 시 BigQueryService.get_hands_by_ids
+            max_entries: 핸드 캐시 최대 항목 수 (초과 시 LRU 제거)
+            ttl_seconds: 캐시 항목 유효 시간 (메타데이터 수정 반영 주기)
+            clock: 시계 함수 (테스트용 주입 가능)
+        """
+        self.fetch_fn = fetch_fn
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.not_found = 0
+        self.incomplete = 0
+        self.failures = 0
+
+    def _lookup(self, hand_id: str, now: float) -> Optional[dict]:
+        entry = self._entries.get(hand_id)
+        if entry is None:
+            return None
+        expires_at, metadata = entry
+        if expires_at <= now:
+            del self._entries[hand_id]
+            return None
+        self._entries.move_to_end(hand_id)
+        return metadata
+
+    def _store(self, hand_id: str, metadata: dict, now: float):
+        self._entries[hand_id] = (now + self.ttl_seconds, metadata)
+        self._entries.move_to_end(hand_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _fetch(self, hand_ids: List[str]) -> Dict[str, dict]:
+        """캐시 miss 핸드 일괄 조회 (왕복 1회, 실패 시 빈 dict)"""
+        if self.fetch_fn is None:
+            from app.services.bigquery import BigQueryService
+
+            self.fetch_fn = BigQueryService().get_hands_by_ids
+
+        self.fetches += 1
+        try:
+            rows = await run_blocking("bigquery", self.fetch_fn, hand_ids)
+        except Exception as e:
+            self.failures += 1
+            logger.error("hand_hydration_fetch_failed", error=str(e), hand_count=len(hand_ids))
+            return {}
+
+        fetched = {}
+        for row in rows:
+            if not row.get("hand_id"):
+                continue
+            missing_fields = [field for field in REQUIRED_FIELDS if row.get(field) is None]
+            if missing_fields:
+                self.incomplete += 1
+                logger.warning(
+                    "hand_hydration_incomplete", hand_id=row["hand_id"], missing=missing_fields
+                )
+                continue
+            fetched[row["hand_id"]] = {field: row.get(field) for field in HYDRATION_FIELDS}
+        return fetched
+
+    async def hydrate(self, results: Sequence[dict]) -> List[dict]:
+        """
+        검색 결과에 핸드 메타데이터 결합
+
+        Args:
+            results: 검색 결과 (hand_id 필수, 순서 = 순위)
+
+        Returns:
+            메타데이터가 채워진 결과 (입력 순서 유지, 메타데이터 없는 핸드 제외)
+        """
+        now = self.clock()
+        metadata: Dict[str, dict] = {}
+        missing: List[str] = []
+
+        for result in results:
+            hand_id = result["hand_id"]
+            if is_hydrated(result) or hand_id in metadata or hand_id in missing:
+                continue
+            cached = self._lookup(hand_id, now)
+            if cached is not None:
+                self.hits += 1
+                metadata[hand_id] = cached
+            else:
+                self.misses += 1
+                missing.append(hand_id)
+
+        if missing:
+            fetched = await self._fetch(missing)
+            for hand_id, row in fetched.items():
+                self._store(hand_id, row, now)
+            metadata.update(fetched)
+
+        hydrated = []
+        for result in results:
+            if is_hydrated(result):
+                hydrated.append(result)
+                continue
+            row = metadata.get(result["hand_id"])
+            if row is None:
+                self.not_found += 1
+                logger.warning("hand_hydration_missing", hand_id=result["hand_id"])
+                continue
+            hydrated.append({**row, "tags": row.get("tags") or [], **result})
+
+        return hydrated
+
+    def invalidate(self, hand_id: str):
+        """핸드 캐시 항목 제거 (메타데이터 수정 시)"""
+        self._entries.pop(hand_id, None)
+
+    def stats(self) -> dict:
+        """헬스 체크용 hit/miss / 조회 횟수"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetches": self.fetches,
+            "not_found": self.not_found,
+            "incomplete": self.incomplete,
+            "failures": self.failures,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_hand_hydrator: Optional[HandHydrator] = None
+
+
+def get_hand_hydrator() -> HandHydrator:
+    """HandHydrator 싱글톤 인스턴스 반환 (설정값으로 생성)"""
+    global _hand_hydrator
+    if _hand_hydrator is None:
+        _hand_hydrator = HandHydrator(
+            max_entries=settings.hand_cache_max_entries,
+            ttl_seconds=settings.hand_cache_ttl_seconds,
+        )
+    return _hand_hydrator
@@ -0,0 +1,247 @@
+"""
+LLM 호출 Admission Control + 우선순위 큐
+Ollama(CPU)는 동시에 몇 개의 생성만 처리 가능 → 과부하를 llm_timeout 후 클라이언트 타임아웃 대신
+즉시 503으로 돌려줌
+
+Architecture:
+- 동시 생성 수 max_concurrency 제한, 초과 요청은 (priority, 도착 순서) 힙에서 대기
+- 슬롯 반납 시 다음 대기자에게 바로 넘김 (활성 수 유지, 재경쟁 없음)
+- 생성 시간 EWMA로 예상 대기 = ceil((앞 대기자 + 1) / max_concurrency) × 평균 생성 시간
+- 큐가 가득 찼거나 예상 대기가 deadline을 넘으면 대기열에 넣지 않고 LLMOverloaded (→ 503 + Retry-After)
+- 대기 중 deadline 초과 / 클라이언트 취소 시 대기열에서 제거 (이미 넘겨받은 슬롯은 반납)
+- 대기 / 생성 시간은 LatencyHistogram으로 헬스 체크에 노출
+- OpenAI 호환 클라이언트는 keep-alive httpx 커넥션 풀 하나를 공유 (get_llm_http_client)
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import structlog
+
+from app.config import settings
+from app.services.metrics import LatencyHistogram
+
+logger = structlog.get_logger()
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_INTERACTIVE = 0  # 스트리밍: 사용자가 토큰을 기다리는 중
+PRIORITY_NORMAL = 1
+PRIORITY_BATCH = 2
+
+
+class LLMOverloaded(Exception):
+    """LLM 과부하로 요청 거절 (큐 가득 참 / 예상 대기 > deadline / 대기 중 deadline 초과)"""
+
+    def __init__(self, reason: str, expected_wait_seconds: float, queue_depth: int):
+        self.reason = reason
+        self.expected_wait_seconds = expected_wait_seconds
+        self.queue_depth = queue_depth
+        super().__init__(
+            f"LLM overloaded ({reason}): expected wait {expected_wait_seconds:.1f}s, "
+            f"{queue_depth} queued"
+        )
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.expected_wait_seconds))
+
+
+class LLMScheduler:
+    """
+    동시 실행 제한 + 우선순위 대기열
+
+    Example:
+        >>> scheduler = LLMScheduler(max_concurrency=2, max_queue=16, deadline_seconds=20)
+        >>> async with scheduler.slot(PRIORITY_INTERACTIVE):
+        ...     response = await client.chat.completions.create(...)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 2,
+        max_queue: int = 16,
+        deadline_seconds: float = 20.0,
+        initial_service_seconds: float = 5.0,
+        alpha: float = 0.2,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_concurrency: 동시 생성 수 (Ollama OLLAMA_NUM_PARALLEL과 맞춤)
+            max_queue: 최대 대기 요청 수
+            deadline_seconds: 허용 대기 시간 (예상 대기가 더 길면 즉시 거절, 대기 중 초과 시 포기)
+            initial_service_seconds: 관측 전 생성 시간 추정치
+            alpha: 생성 시간 EWMA 가중치
+            clock: 시계 함수 (테스트용 주입 가능)
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.deadline_seconds = deadline_seconds
+        self.service_seconds = initial_service_seconds
+        self.alpha = alpha
+        self.clock = clock
+
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        self.queue_time_ms = LatencyHistogram(resolution=0.1)
+        self.service_time_ms = LatencyHistogram(resolution=0.1)
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    def expected_wait(self, priority: int) -> float:
+        """이 우선순위로 지금 들어오면 예상되는 대기 시간 (초)"""
+        if self.active < self.max_concurrency and not self.queue_depth:
+            return 0.0
+        ahead = sum(
+            1 for p, _, waiter in self._waiters if p <= priority and not waiter.done()
+        )
+        return math.ceil((ahead + 1) / self.max_concurrency) * self.service_seconds
+
+    def _reject(self, reason: str, expected_wait: float):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        logger.warning(
+            "llm_request_rejected",
+            reason=reason,
+            expected_wait_seconds=round(expected_wait, 2),
+            queue_depth=self.queue_depth,
+            active=self.active,
+        )
+        raise LLMOverloaded(reason, expected_wait, self.queue_depth)
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> float:
+        """
+        생성 슬롯 획득
+
+        Returns:
+            대기 시간 (초)
+
+        Raises:
+            LLMOverloaded: 큐 가득 참 / 예상 대기 > deadline / 대기 중 deadline 초과
+        """
+        start = self.clock()
+        if self.active < self.max_concurrency and not self.queue_depth:
+            self.active += 1
+            self.admitted += 1
+            self.queue_time_ms.record(0.0)
+            return 0.0
+
+        expected_wait = self.expected_wait(priority)
+        if self.queue_depth >= self.max_queue:
+            self._reject("queue_full", expected_wait)
+        if expected_wait > self.deadline_seconds:
+            self._reject("expected_wait", expected_wait)
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        try:
+            await asyncio.wait({waiter}, timeout=self.deadline_seconds)
+        except asyncio.CancelledError:
+            # 클라이언트 취소: 이미 넘겨받은 슬롯은 다음 대기자에게
+            if waiter.done() and not waiter.cancelled():
+                self._handoff()
+            waiter.cancel()
+            raise
+
+        if not waiter.done():
+            waiter.cancel()
+            # Retry-After는 이미 기다린 시간이 아니라 지금부터의 예상 대기
+            self._reject("queue_timeout", self.expected_wait(priority))
+
+        waited = self.clock() - start
+        self.admitted += 1
+        self.queue_time_ms.record(waited * 1000)
+        return waited
+
+    def _handoff(self):
+        """슬롯 하나를 다음 대기자에게 넘기거나 반납"""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def release(self, service_seconds: Optional[float] = None):
+        """생성 슬롯 반납 (생성 시간 EWMA 갱신)"""
+        if service_seconds is not None:
+            self.service_time_ms.record(service_seconds * 1000)
+            self.service_seconds += self.alpha * (service_seconds - self.service_seconds)
+        self._handoff()
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_NORMAL) -> AsyncIterator[float]:
+        """acquire / release 컨텍스트 (대기 시간을 반환, 생성 시간은 자동 기록)"""
+        waited = await self.acquire(priority)
+        start = self.clock()
+        try:
+            yield waited
+        finally:
+            self.release(self.clock() - start)
+
+    def stats(self) -> dict:
+        """헬스 체크용 대기열 / 대기·생성 시간 분포"""
+        return {
+            "active": self.active,
+            "queued": self.queue_depth,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "deadline_seconds": self.deadline_seconds,
+            "service_seconds_ewma": round(self.service_seconds, 3),
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "queue_time_ms": self.queue_time_ms.to_dict((50, 90, 99)),
+            "service_time_ms": self.service_time_ms.to_dict((50, 90, 99)),
+        }
+
+
+# 싱글톤 인스턴스
+_llm_scheduler: Optional[LLMScheduler] = None
+_llm_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """LLMScheduler 싱글톤 인스턴스 반환 (설정값으로 생성)"""
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        _llm_scheduler = LLMScheduler(
+            max_concurrency=settings.llm_max_concurrency,
+            max_queue=settings.llm_max_queue,
+            deadline_seconds=settings.llm_queue_deadline_seconds,
+            initial_service_seconds=settings.llm_initial_service_seconds,
+        )
+    return _llm_scheduler
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """LLM 엔드포인트용 공유 keep-alive 커넥션 풀 (프로세스당 하나)"""
+    global _llm_http_client
+    if _llm_http_client is None or _llm_http_client.is_closed:
+        _llm_http_client = httpx.AsyncClient(
+            timeout=settings.llm_timeout,
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_concurrency + settings.llm_keepalive_connections,
+                max_keepalive_connections=settings.llm_keepalive_connections,
+                keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+            ),
+        )
+    return _llm_http_client
+
+
+async def close_llm_http_client():
+    """종료 시 커넥션 풀 정리"""
+    global _llm_http_client
+    if _llm_http_client is not None:
+        await _llm_http_client.aclose()
+        _llm_http_client = None
@@ -1,39 +1,148 @@
 """
 Qwen3-8B LLM 서비스
 OpenAI API 호환 클라이언트로 Ollama 또는 Hugging Face Endpoint 연동
+컨텍스트는 ContextBuilder가 rag_prompt_token_budget 안에서 관련도 순으로 구성
+생성 호출은 LLMScheduler 슬롯 안에서만 실행 (동시 생성 수 제한, 과부하 시 LLMOverloaded)
 """
 
 from openai import AsyncOpenAI
 from app.config import settings
 from app.models import HandResult
+from app.services.context_builder import ContextBuilder, get_context_builder
+from app.services.llm_scheduler import (
+    PRIORITY_NORMAL,
+    LLMScheduler,
+    get_llm_http_client,
+    get_llm_scheduler,
+)
+from typing import AsyncIterator, NamedTuple, Optional
 import structlog
 
 logger = structlog.get_logger()
 
 
+class BuiltPrompt(NamedTuple):
+    """프롬프트 + 요청별 토큰 수 (tokenizer == "approximate"면 근사값)"""
+    text: str
+    prompt_tokens: int
+    context_tokens: int
+    hands_used: int
+    hands_truncated: int
+    tokenizer: str = "approximate"
+
+    @property
+    def prompt_tokens_approximate(self) -> bool:
+        return self.tokenizer != "tokenizer"
+
+
 class LLMService:
     """Qwen3-8B LLM 서비스 (Thinking Mode 지원)"""
 
-    def __init__(self):
-        """OpenAI 호환 클라이언트 초기화"""
-        self.client = AsyncOpenAI(
-            base_url=settings.llm_base_url,
-            api_key=settings.llm_api_key,
-            timeout=settings.llm_timeout,
-        )
+    def __init__(
+        self,
+        context_builder: Optional[ContextBuilder] = None,
+        scheduler: Optional[LLMScheduler] = None
+    ):
+        """
+        OpenAI 호환 클라이언트 초기화 (공유 keep-alive 커넥션 풀 사용)
+
+        Args:
+            context_builder: 토큰 예산 컨텍스트 빌더 (기본: 설정값 싱글톤)
+            scheduler: 생성 호출 admission control (기본: 설정값 싱글톤)
+        """
+        self._client = self._connect()
         self.model = settings.llm_model
         self.temperature = settings.llm_temperature
         self.max_tokens = settings.llm_max_tokens
+        self.context_builder = context_builder or get_context_builder()
+        self.scheduler = scheduler or get_llm_scheduler()
 
         logger.info(
             "llm_service_initialized",
             provider=settings.llm_provider,
             model=settings.llm_model,
             base_url=settings.llm_base_url,
+            max_concurrency=self.scheduler.max_concurrency,
+        )
+
+    def _connect(self) -> AsyncOpenAI:
+        """공유 커넥션 풀 위에 OpenAI 호환 클라이언트 생성"""
+        self._http_client = get_llm_http_client()
+        return AsyncOpenAI(
+            base_url=settings.llm_base_url,
+            api_key=settings.llm_api_key,
+            timeout=settings.llm_timeout,
+            http_client=self._http_client,
+        )
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """
+        OpenAI 호환 클라이언트
+
+        종료 시 공유 풀이 닫힌 뒤 같은 프로세스에서 다시 시작되면(lifespan 재시작) 새 풀로 재생성
+        """
+        if self._http_client is not None and self._http_client.is_closed:
+            self._client = self._connect()
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        """외부에서 주입한 클라이언트 (풀 관리 안 함)"""
+        self._client = client
+        self._http_client = None
+
+    def build_prompt(self, query: str, hands: list[HandResult]) -> BuiltPrompt:
+        """
+        토큰 예산 안에서 프롬프트 생성
+
+        템플릿(질문 포함) 토큰을 뺀 나머지 예산으로 핸드를 관련도 순으로 채우고,
+        긴 설명은 질문과 관련 있는 문장만 남긴다.
+
+        Args:
+            query: 사용자 질문
+            hands: 검색된 핸드 리스트 (관련도 순)
+
+        Returns:
+            BuiltPrompt (프롬프트, 프롬프트 / 컨텍스트 토큰 수, 사용 / 축약 핸드 수)
+        """
+        counter = self.context_builder.counter
+        template_tokens = counter.count(self._build_prompt(query, ""))
+        context = self.context_builder.build(
+            query,
+            hands,
+            budget_tokens=max(0, settings.rag_prompt_token_budget - template_tokens),
+            max_hands=settings.rag_context_hands,
+        )
+        text = self._build_prompt(query, context.text)
+        prompt = BuiltPrompt(
+            text=text,
+            prompt_tokens=counter.count(text),
+            context_tokens=context.context_tokens,
+            hands_used=context.hands_used,
+            hands_truncated=context.hands_truncated,
+            tokenizer=counter.backend,
         )
 
+        logger.info(
+            "llm_prompt_built",
+            query=query[:50],
+            prompt_tokens=prompt.prompt_tokens,
+            context_tokens=prompt.context_tokens,
+            hands_used=prompt.hands_used,
+            hands_truncated=prompt.hands_truncated,
+            hands_retrieved=len(hands),
+            tokenizer=prompt.tokenizer,
+        )
+        return prompt
+
     async def generate_answer(
-        self, query: str, hands: list[HandResult], use_thinking_mode: bool = True
+        self,
+        query: str,
+        hands: list[HandResult],
+        use_thinking_mode: bool = True,
+        prompt: Optional[BuiltPrompt] = None,
+        priority: int = PRIORITY_NORMAL
     ) -> str:
         """
         RAG 답변 생성
@@ -42,64 +151,103 @@ class LLMService:
             query: 사용자 질문
             hands: 검색된 핸드 리스트 (컨텍스트)
             use_thinking_mode: Qwen3 Thinking Mode 사용 여부
+            prompt: build_prompt() 결과 (None이면 내부에서 생성)
+            priority: 대기열 우선순위 (작을수록 먼저)
 
         Returns:
             LLM이 생성한 답변 (한국어)
+
+        Raises:
+            LLMOverloaded: 대기열이 가득 찼거나 예상 대기가 deadline 초과
         """
-        # 1. 컨텍스트 생성 (검색된 핸드들을 텍스트로 포맷팅)
-        context = self._format_hands(hands)
-
-        # 2. 프롬프트 생성 (한국어/영어 템플릿 선택 가능)
-        prompt = self._build_prompt(query, context)
-
-        # 3. Qwen3-8B API 호출
-        try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                extra_body={"thinking": use_thinking_mode},  # Qwen3 Thinking Mode
-            )
-
-            answer = response.choices[0].message.content
-
-            logger.info(
-                "llm_generation_success",
-                query=query[:50],
-                answer_length=len(answer),
-                thinking_mode=use_thinking_mode,
-            )
-
-            return answer
-
-        except Exception as e:
-            logger.error("llm_generation_error", error=str(e), query=query[:50])
-            raise
-
-    def _format_hands(self, hands: list[HandResult]) -> str:
-        """핸드 리스트를 LLM 컨텍스트용 텍스트로 변환"""
-        if not hands:
-            return "검색 결과가 없습니다."
-
-        context_parts = []
-        for i, hand in enumerate(hands[:settings.rag_context_hands], 1):
-            hand_text = f"""
-핸드 {i}:
-- ID: {hand.hand_id}
-- 설명: {hand.description}
-- Hero: {hand.hero_name}
-{f"- Villain: {hand.villain_name}" if hand.villain_name else ""}
-- Pot: {hand.pot_bb} BB
-- Street: {hand.street}
-- Action: {hand.action}
-{f"- Tournament: {hand.tournament}" if hand.tournament else ""}
-{f"- Tags: {', '.join(hand.tags)}" if hand.tags else ""}
----
-"""
-            context_parts.append(hand_text.strip())
+        # 1-2. 토큰 예산 안에서 컨텍스트 + 프롬프트 생성 (한국어/영어 템플릿 선택 가능)
+        prompt = prompt or self.build_prompt(query, hands)
+
+        # 3. 생성 슬롯 획득 후 Qwen3-8B API 호출
+        async with self.scheduler.slot(priority) as waited:
+            try:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt.text}],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    extra_body={"thinking": use_thinking_mode},  # Qwen3 Thinking Mode
+                )
+
+                answer = response.choices[0].message.content
+
+                logger.info(
+                    "llm_generation_success",
+                    query=query[:50],
+                    answer_length=len(answer),
+                    thinking_mode=use_thinking_mode,
+                    queue_time_ms=round(waited * 1000, 1),
+                )
+
+                return answer
+
+            except Exception as e:
+                logger.error("llm_generation_error", error=str(e), query=query[:50])
+                raise
+
+    async def stream_answer(
+        self,
+        query: str,
+        hands: list[HandResult],
+        use_thinking_mode: bool = True,
+        prompt: Optional[BuiltPrompt] = None,
+        priority: int = PRIORITY_NORMAL
+    ) -> AsyncIterator[str]:
+        """
+        RAG 답변 스트리밍 (OpenAI 호환 stream=True, 토큰 조각이 도착하는 대로 전달)
 
-        return "\n\n".join(context_parts)
+        Args:
+            query: 사용자 질문
+            hands: 검색된 핸드 리스트 (컨텍스트)
+            use_thinking_mode: Qwen3 Thinking Mode 사용 여부
+            prompt: build_prompt() 결과 (None이면 내부에서 생성)
+            priority: 대기열 우선순위 (작을수록 먼저)
+
+        Yields:
+            답변 텍스트 조각 (delta.content, 추론 과정 / 빈 조각은 제외)
+
+        Raises:
+            LLMOverloaded: 대기열이 가득 찼거나 예상 대기가 deadline 초과 (첫 조각 전)
+        """
+        prompt = prompt or self.build_prompt(query, hands)
+
+        # 생성 슬롯은 스트림이 끝나거나 클라이언트가 끊을 때까지 유지
+        async with self.scheduler.slot(priority) as waited:
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt.text}],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    stream=True,
+                    extra_body={"thinking": use_thinking_mode},  # Qwen3 Thinking Mode
+                )
+
+                answer_length = 0
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    text = chunk.choices[0].delta.content
+                    if text:
+                        answer_length += len(text)
+                        yield text
+
+                logger.info(
+                    "llm_stream_success",
+                    query=query[:50],
+                    answer_length=answer_length,
+                    thinking_mode=use_thinking_mode,
+                    queue_time_ms=round(waited * 1000, 1),
+                )
+
+            except Exception as e:
+                logger.error("llm_stream_error", error=str(e), query=query[:50])
+                raise
 
     def _build_prompt(self, query: str, context: str) -> str:
         """RAG 프롬프트 생성 (한국어 템플릿)"""
@@ -0,0 +1,182 @@
+"""
+로컬 벡터 인덱스 (NumPy, Vertex AI Vector Search 복제본 / 오프라인 백엔드)
+내보낸 핸드 임베딩을 프로세스 메모리에 올려 find_neighbors 네트워크 왕복 없이 top-k 검색
+
+Architecture:
+- 임베딩은 연속(C-order) float32 행렬 하나 (n × d), 행은 L2 정규화 → 내적 = 코사인 유사도
+- exact: 행렬-벡터 곱 한 번 + argpartition으로 top-k 후보만 정렬 (O(n·d), 전체 정렬 없음)
+- hnsw: hnswlib가 설치되어 있고 코퍼스가 hnsw_threshold 이상이면 근사 검색 (선택 의존성)
+- 저장 형식: .npz (ids, vectors) — scripts/export_hand_embeddings.py로 Firestore에서 내보냄
+- 대규모 코퍼스는 quantized_vector_index (int8 / PQ 코드 + 디스크 원본 재순위화)로 대체 가능
+- 반환 score는 Vertex AI DOT_PRODUCT distance와 같은 의미 (클수록 유사)
+"""
+
+from typing import Iterable, List, Literal, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (영벡터는 그대로)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class LocalVectorIndex:
+    """
+    인메모리 top-k 벡터 인덱스
+
+    Example:
+        >>> index = LocalVectorIndex.load("exports/hand_embeddings.npz")
+        >>> index.search(query_embedding, top_k=10)
+        [("hand_042", 0.91), ("hand_007", 0.88), ...]
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        vectors,
+        algorithm: Literal["auto", "exact", "hnsw"] = "auto",
+        hnsw_threshold: int = 200000
+    ):
+        """
+        Args:
+            ids: hand_id 목록 (vectors 행 순서와 동일)
+            vectors: (n, d) 임베딩 (float32로 변환, 행 정규화)
+            algorithm: exact | hnsw | auto (n ≥ hnsw_threshold이고 hnswlib 설치 시 hnsw)
+            hnsw_threshold: auto 모드에서 HNSW로 전환할 최소 벡터 수
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(ids):
+            raise ValueError(
+                f"vectors must be (len(ids), dim), got {matrix.shape} for {len(ids)} ids"
+            )
+
+        self.ids: List[str] = list(ids)
+        self.matrix = np.ascontiguousarray(_normalize_rows(matrix), dtype=np.float32)
+        self.dimension = self.matrix.shape[1]
+        self._hnsw = None
+
+        if algorithm == "hnsw" or (algorithm == "auto" and len(self.ids) >= hnsw_threshold):
+            self._hnsw = self._build_hnsw()
+        self.algorithm = "hnsw" if self._hnsw is not None else "exact"
+
+    def _build_hnsw(self):
+        """HNSW 그래프 빌드 (hnswlib 미설치 시 None → exact 검색)"""
+        try:
+            import hnswlib
+        except ImportError:
+            logger.warning("local_vector_index_hnswlib_missing", fallback="exact")
+            return None
+
+        graph = hnswlib.Index(space="ip", dim=self.dimension)
+        graph.init_index(max_elements=len(self.ids), ef_construction=200, M=16)
+        graph.add_items(self.matrix, np.arange(len(self.ids)))
+        graph.set_ef(128)
+        return graph
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping], **kwargs) -> "LocalVectorIndex":
+        """
+        hand 레코드({"hand_id", "embedding"})에서 생성 (임베딩 없는 레코드는 건너뜀)
+        """
+        ids, vectors = [], []
+        for record in records:
+            embedding = record.get("embedding")
+            if record.get("hand_id") and embedding:
+                ids.append(record["hand_id"])
+                vectors.append(embedding)
+        if not vectors:
+            raise ValueError("No records with embeddings")
+        return cls(ids, np.asarray(vectors, dtype=np.float32), **kwargs)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "LocalVectorIndex":
+        """.npz 파일 로드 (ids, vectors)"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls([str(i) for i in data["ids"]], data["vectors"], **kwargs)
+
+    def save(self, path: str):
+        """.npz 파일로 저장 (정규화된 float32 행렬)"""
+        np.savez(path, ids=np.asarray(self.ids), vectors=self.matrix)
+
+    def search(self, query: Sequence[float], top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        top-k 이웃 검색
+
+        Args:
+            query: 쿼리 임베딩 (정규화는 내부에서 수행)
+            top_k: 반환 개수
+
+        Returns:
+            (hand_id, score) 리스트 (score 내림차순)
+        """
+        n = len(self.ids)
+        if n == 0 or top_k <= 0:
+            return []
+
+        q = np.asarray(query, dtype=np.float32)
+        if q.shape != (self.dimension,):
+            raise ValueError(f"query dimension {q.shape} != index dimension {self.dimension}")
+        norm = np.linalg.norm(q)
+        if norm > 0:
+            q = q / norm
+        k = min(top_k, n)
+
+        if self._hnsw is not None:
+            labels, distances = self._hnsw.knn_query(q, k=k)
+            # hnswlib ip space: distance = 1 - dot
+            return [(self.ids[i], float(1.0 - d)) for i, d in zip(labels[0], distances[0])]
+
+        scores = self.matrix @ q
+        if k < n:
+            candidates = np.argpartition(scores, n - k)[n - k:]
+        else:
+            candidates = np.arange(n)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.ids[i], float(scores[i])) for i in order]
+
+    def stats(self) -> dict:
+        """헬스 체크용 상태"""
+        return {
+            "vectors": len(self.ids),
+            "dimension": self.dimension,
+            "algorithm": self.algorithm,
+            "memory_mb": round(self.matrix.nbytes / 1e6, 2),
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def load_local_vector_index() -> Optional[LocalVectorIndex]:
+    """
+    설정값(local_vector_index_path)으로 로컬 인덱스 로드 (경로 없음/실패 시 None)
+    local_vector_index_quantization이 int8/pq면 QuantizedVectorIndex (같은 search 인터페이스)
+    """
+    path = settings.local_vector_index_path
+    if not path:
+        return None
+    try:
+        if settings.local_vector_index_quantization != "none":
+            from app.services.quantized_vector_index import QuantizedVectorIndex
+
+            index = QuantizedVectorIndex.load(
+                path, rerank_factor=settings.local_vector_index_rerank_factor
+            )
+        else:
+            index = LocalVectorIndex.load(
+                path, hnsw_threshold=settings.local_vector_index_hnsw_threshold
+            )
+    except (OSError, KeyError, ValueError) as e:
+        logger.error("local_vector_index_load_failed", path=path, error=str(e))
+        return None
+
+    logger.info("local_vector_index_loaded", path=path, **index.stats())
+    return index
@@ -0,0 +1,126 @@
+"""
+지연 시간/크기 분포 계측 (HDR 스타일 히스토그램)
+정렬 리스트 인덱싱 대신 고정 상대 오차 버킷으로 백분위 계산
+
+Architecture:
+- 값은 resolution 단위 정수로 변환 후 log-linear 버킷에 카운트 (sparse dict)
+- 버킷 폭은 값의 2^-(precision_bits-1) 이하 → precision_bits=7이면 상대 오차 < 1.6%
+- 백분위는 해당 버킷의 상한값 (HdrHistogram의 highest equivalent value와 같은 의미)
+- merge(): 여러 히스토그램 합산 (단계별/워커별 결과 병합)
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+DEFAULT_PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    HDR 스타일 히스토그램
+
+    Example:
+        >>> hist = LatencyHistogram(resolution=0.001)  # ms 값을 µs 정밀도로 기록
+        >>> hist.record(12.5)
+        >>> hist.percentile(99)
+        12.5...
+    """
+
+    def __init__(self, resolution: float = 0.001, precision_bits: int = 7):
+        """
+        Args:
+            resolution: 최소 구분 단위 (기록 값과 같은 단위, 예: ms 기록 시 0.001 = 1µs)
+            precision_bits: 버킷당 유효 비트 수 (클수록 정밀, 버킷 수 증가)
+        """
+        self.resolution = resolution
+        self.precision_bits = precision_bits
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _bucket(self, units: int) -> int:
+        """정수 값이 속한 버킷의 하한"""
+        shift = max(0, units.bit_length() - self.precision_bits)
+        return (units >> shift) << shift
+
+    def _bucket_upper(self, bucket: int) -> int:
+        """버킷 상한 (같은 버킷으로 기록되는 가장 큰 정수 값)"""
+        shift = max(0, bucket.bit_length() - self.precision_bits)
+        return bucket + (1 << shift) - 1
+
+    def record(self, value: float, count: int = 1):
+        """값 기록 (음수는 0으로 기록)"""
+        value = max(0.0, value)
+        bucket = self._bucket(int(value / self.resolution))
+        self._counts[bucket] = self._counts.get(bucket, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        p 백분위 값 (0 < p ≤ 100, 기록이 없으면 None)
+
+        상위 백분위가 실제 관측 최댓값을 넘지 않도록 max로 제한한다.
+        """
+        if self.count == 0:
+            return None
+        # 정확히 p%의 관측값이 이 값 이하가 되는 최소 순위 (nearest-rank)
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                return min(self._bucket_upper(bucket) * self.resolution, self.max)
+        return self.max
+
+    def percentiles(self, ps: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+        """{"p50": ..., "p99.9": ...}"""
+        return {f"p{p:g}": self.percentile(p) for p in ps}
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def merge(self, other: "LatencyHistogram"):
+        """다른 히스토그램 합산 (resolution/precision_bits가 같아야 함)"""
+        if (other.resolution, other.precision_bits) != (self.resolution, self.precision_bits):
+            raise ValueError("Cannot merge histograms with different resolution/precision")
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def reset(self):
+        """모든 기록 제거"""
+        self._counts.clear()
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def to_dict(self, ps: Iterable[float] = DEFAULT_PERCENTILES, buckets: bool = False) -> dict:
+        """
+        JSON 직렬화용 요약 (buckets=True면 버킷별 카운트 포함 → 실행 간 분포 비교용)
+        """
+        summary = {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            **self.percentiles(ps),
+        }
+        if buckets:
+            summary["resolution"] = self.resolution
+            summary["precision_bits"] = self.precision_bits
+            summary["buckets"] = {
+                str(bucket): self._counts[bucket] for bucket in sorted(self._counts)
+            }
+        return summary
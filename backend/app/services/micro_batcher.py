@@ -0,0 +1,149 @@
+"""
+비동기 Micro-batcher (동시 단건 요청을 한 번의 배치 호출로 병합)
+동시 요청마다 get_embeddings([단건])을 따로 부르지 않고 수 ms 동안 모아 한 번에 호출
+
+Architecture:
+- 첫 요청 도착 시 max_wait_ms 타이머 시작, max_batch_size가 차면 즉시 전송
+- 배치 결과는 입력 순서대로 각 대기 코루틴의 Future에 전달 (실패 시 배치 전체에 예외 전달)
+- 배치 크기 / 대기 시간 / 배치 호출 시간을 LatencyHistogram으로 기록 → 윈도우 튜닝용
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+import structlog
+
+from app.config import settings
+from app.services.metrics import LatencyHistogram
+
+logger = structlog.get_logger()
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[K, R]):
+    """
+    단건 요청 → 배치 호출 병합기
+
+    Example:
+        >>> batcher = MicroBatcher("vertex_embedding", embed_batch, max_batch_size=16, max_wait_ms=5)
+        >>> vector = await batcher.submit("Phil Ivey bluff")
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[K]], Awaitable[List[R]]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Args:
+            name: 배치 이름 (로그/헬스 체크용)
+            batch_fn: 입력 리스트 → 같은 길이/순서의 결과 리스트를 반환하는 코루틴 함수
+            max_batch_size: 배치 최대 크기 (도달 시 즉시 전송)
+            max_wait_ms: 첫 요청 후 최대 대기 시간
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._pending: List[Tuple[K, asyncio.Future, float]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+        self.batch_sizes = LatencyHistogram(resolution=1.0)
+        self.wait_ms = LatencyHistogram()
+        self.batch_call_ms = LatencyHistogram()
+        self.failures = 0
+
+    async def submit(self, item: K) -> R:
+        """
+        요청 추가 후 배치 결과 대기
+
+        Returns:
+            item에 해당하는 결과 (배치 호출 실패 시 예외 전파)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future, loop.time()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """대기 중인 요청을 배치로 전송"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        # 전송 전에 취소된 요청은 제외
+        batch = [entry for entry in batch if not entry[1].done()]
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[K, asyncio.Future, float]]):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _, _, enqueued in batch:
+            self.wait_ms.record((started - enqueued) * 1000)
+        self.batch_sizes.record(len(batch))
+
+        try:
+            results = await self.batch_fn([item for item, _, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self.name} batch returned {len(results)} results for {len(batch)} inputs"
+                )
+        except Exception as e:
+            self.failures += 1
+            logger.warning("micro_batch_failed", batcher=self.name, size=len(batch), error=str(e))
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.batch_call_ms.record((loop.time() - started) * 1000)
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        """헬스 체크용 배치 크기 / 대기 시간 분포"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": self.batch_sizes.count,
+            "items": int(self.batch_sizes.total),
+            "failures": self.failures,
+            "pending": len(self._pending),
+            "batch_size": self.batch_sizes.to_dict((50, 90, 99)),
+            "wait_ms": self.wait_ms.to_dict((50, 90, 99)),
+            "batch_call_ms": self.batch_call_ms.to_dict((50, 90, 99)),
+        }
+
+
+def create_embedding_batcher(
+    batch_fn: Callable[[List[str]], Awaitable[List[list]]]
+) -> Optional[MicroBatcher]:
+    """설정값으로 쿼리 임베딩 micro-batcher 생성 (비활성화 시 None)"""
+    if not settings.embedding_batch_enabled:
+        return None
+    return MicroBatcher(
+        "vertex_embedding",
+        batch_fn,
+        max_batch_size=settings.embedding_batch_max_size,
+        max_wait_ms=settings.embedding_batch_max_wait_ms
+    )
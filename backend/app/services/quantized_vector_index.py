@@ -0,0 +1,411 @@
+"""
+양자화 벡터 인덱스 (int8 / PQ, 로컬·오프라인 벡터 경로용)
+수백만 핸드의 768차원 float32 행렬(핸드당 3KB)을 메모리에 올리지 않고 압축 코드로 후보 검색
+
+Architecture:
+- int8: 차원별 대칭 스케일(max|x| / 127) 스칼라 양자화 → 핸드당 d 바이트 (float32 대비 1/4)
+  점수 = codes @ (scale * q), 청크 단위로 float32 변환 (임시 메모리 상한)
+- pq: d를 m개 부분공간으로 나누고 부분공간별 256-centroid k-means → 핸드당 m 바이트
+  점수 = 부분공간별 q·centroid 룩업 테이블(ADC) 합
+- 재순위화: 양자화 점수 상위 top_k * rerank_factor 후보만 디스크의 원본 float32 행렬(np.memmap)로
+  정확한 내적 재계산 → 메모리는 코드만, recall은 원본에 근접
+- 저장 형식: <name>.npz (ids, method, 코드, 스케일/코드북) + <name>.vectors.npy (정규화 원본, 재순위화용)
+- LocalVectorIndex와 같은 search / stats 인터페이스 (vertex_search에서 그대로 교체 가능)
+- recall_report(): 정확 검색 대비 recall@k / 메모리 / 지연 비교 (scripts/quantization_report.py)
+"""
+
+import os
+import time
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from app.services.local_vector_index import LocalVectorIndex, _normalize_rows
+
+logger = structlog.get_logger()
+
+QuantizationMethod = Literal["int8", "pq"]
+
+# 점수 계산 시 한 번에 float32로 변환하는 코드 행 수 (768차원 기준 약 25MB)
+SCORE_CHUNK_ROWS = 8192
+
+
+def vectors_path_for(path: str) -> str:
+    """양자화 인덱스 .npz 경로 → 재순위화용 원본 벡터 .npy 경로"""
+    root, _ = os.path.splitext(path)
+    return f"{root}.vectors.npy"
+
+
+# ====================
+# 양자화기
+# ====================
+
+class Int8Quantizer:
+    """차원별 대칭 int8 스칼라 양자화"""
+
+    method = "int8"
+
+    def __init__(self, scale: np.ndarray):
+        self.scale = np.asarray(scale, dtype=np.float32)
+
+    @classmethod
+    def train(cls, vectors: np.ndarray) -> "Int8Quantizer":
+        scale = np.abs(vectors).max(axis=0) / 127.0
+        scale[scale == 0] = 1.0
+        return cls(scale)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        codes = np.rint(vectors / self.scale)
+        return np.clip(codes, -127, 127).astype(np.int8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return codes.astype(np.float32) * self.scale
+
+    def score(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """근사 내적 (codes · (scale * q))"""
+        weights = (self.scale * query).astype(np.float32)
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_CHUNK_ROWS):
+            chunk = codes[start:start + SCORE_CHUNK_ROWS]
+            scores[start:start + len(chunk)] = chunk.astype(np.float32) @ weights
+        return scores
+
+    def params(self) -> Dict[str, np.ndarray]:
+        return {"scale": self.scale}
+
+    @property
+    def nbytes(self) -> int:
+        return self.scale.nbytes
+
+
+class ProductQuantizer:
+    """Product Quantization (부분공간별 k-means 코드북, 코드 = uint8 centroid 인덱스)"""
+
+    method = "pq"
+
+    def __init__(self, codebooks: np.ndarray):
+        """
+        Args:
+            codebooks: (m, ks, d / m) 부분공간별 centroid
+        """
+        self.codebooks = np.asarray(codebooks, dtype=np.float32)
+        self.subspaces, self.centroids, self.sub_dimension = self.codebooks.shape
+
+    @classmethod
+    def train(
+        cls,
+        vectors: np.ndarray,
+        subspaces: int = 96,
+        iterations: int = 20,
+        sample_size: int = 50000,
+        seed: int = 0
+    ) -> "ProductQuantizer":
+        """
+        부분공간별 k-means (Lloyd) 학습
+
+        Args:
+            vectors: (n, d) 정규화된 학습 벡터
+            subspaces: 부분공간 수 m (d의 약수)
+            iterations: k-means 반복 횟수
+            sample_size: 학습에 사용할 최대 벡터 수
+            seed: 샘플링 / 초기 centroid 시드
+        """
+        n, dimension = vectors.shape
+        if dimension % subspaces:
+            raise ValueError(f"dimension {dimension} is not divisible by subspaces {subspaces}")
+
+        rng = np.random.default_rng(seed)
+        if n > sample_size:
+            vectors = vectors[rng.choice(n, sample_size, replace=False)]
+        centroids = min(256, len(vectors))
+        sub_dimension = dimension // subspaces
+
+        codebooks = np.empty((subspaces, centroids, sub_dimension), dtype=np.float32)
+        for j in range(subspaces):
+            sub = vectors[:, j * sub_dimension:(j + 1) * sub_dimension]
+            codebook = sub[rng.choice(len(sub), centroids, replace=False)].copy()
+            for _ in range(iterations):
+                assignment = _nearest_centroid(sub, codebook)
+                sums = np.zeros_like(codebook)
+                np.add.at(sums, assignment, sub)
+                counts = np.bincount(assignment, minlength=centroids)
+                filled = counts > 0
+                # 빈 클러스터는 이전 centroid 유지
+                codebook[filled] = sums[filled] / counts[filled, None]
+            codebooks[j] = codebook
+        return cls(codebooks)
+
+    def _split(self, vectors: np.ndarray) -> np.ndarray:
+        return vectors.reshape(len(vectors), self.subspaces, self.sub_dimension)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        codes = np.empty((len(vectors), self.subspaces), dtype=np.uint8)
+        for start in range(0, len(vectors), SCORE_CHUNK_ROWS):
+            chunk = self._split(vectors[start:start + SCORE_CHUNK_ROWS])
+            for j in range(self.subspaces):
+                codes[start:start + len(chunk), j] = _nearest_centroid(chunk[:, j], self.codebooks[j])
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        parts = self.codebooks[np.arange(self.subspaces), codes]
+        return parts.reshape(len(codes), -1)
+
+    def score(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """비대칭 거리 계산 (ADC): 부분공간별 q·centroid 룩업 테이블 합"""
+        table = np.einsum("mkd,md->mk", self.codebooks, query.reshape(self.subspaces, -1))
+        columns = np.arange(self.subspaces)
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_CHUNK_ROWS):
+            chunk = codes[start:start + SCORE_CHUNK_ROWS]
+            scores[start:start + len(chunk)] = table[columns, chunk].sum(axis=1)
+        return scores
+
+    def params(self) -> Dict[str, np.ndarray]:
+        return {"codebooks": self.codebooks}
+
+    @property
+    def nbytes(self) -> int:
+        return self.codebooks.nbytes
+
+
+def _nearest_centroid(vectors: np.ndarray, codebook: np.ndarray) -> np.ndarray:
+    """L2 최근접 centroid 인덱스 (‖x‖²는 argmin에 무관하므로 생략)"""
+    distances = (codebook ** 2).sum(axis=1) - 2.0 * vectors @ codebook.T
+    return distances.argmin(axis=1)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 상위 k개 인덱스 (내림차순, argpartition으로 전체 정렬 없음)"""
+    n = len(scores)
+    if k < n:
+        candidates = np.argpartition(scores, n - k)[n - k:]
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+# ====================
+# 인덱스
+# ====================
+
+class QuantizedVectorIndex:
+    """
+    양자화 코드 기반 top-k 벡터 인덱스 (원본 벡터로 재순위화)
+
+    Example:
+        >>> index = QuantizedVectorIndex.build(ids, vectors, method="int8")
+        >>> index.save("exports/hand_embeddings.int8.npz")
+        >>> index = QuantizedVectorIndex.load("exports/hand_embeddings.int8.npz", rerank_factor=4)
+        >>> index.search(query_embedding, top_k=10)
+        [("hand_042", 0.91), ("hand_007", 0.88), ...]
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        codes: np.ndarray,
+        quantizer,
+        full_vectors: Optional[np.ndarray] = None,
+        rerank_factor: int = 4
+    ):
+        """
+        Args:
+            ids: hand_id 목록 (codes 행 순서와 동일)
+            codes: 양자화 코드 (int8: (n, d), pq: (n, m) uint8)
+            quantizer: Int8Quantizer | ProductQuantizer
+            full_vectors: 정규화된 원본 (n, d) 행렬 (보통 np.memmap, None이면 재순위화 없음)
+            rerank_factor: 재순위화 후보 배수 (top_k * rerank_factor, 0이면 재순위화 없음)
+        """
+        if len(codes) != len(ids):
+            raise ValueError(f"codes must have len(ids) rows, got {len(codes)} for {len(ids)} ids")
+        if full_vectors is not None and len(full_vectors) != len(ids):
+            raise ValueError(f"full vectors must have len(ids) rows, got {len(full_vectors)}")
+
+        self.ids: List[str] = list(ids)
+        self.codes = codes
+        self.quantizer = quantizer
+        self.full_vectors = full_vectors
+        self.rerank_factor = rerank_factor
+        self.dimension = (
+            full_vectors.shape[1] if full_vectors is not None
+            else quantizer.decode(codes[:1]).shape[1] if len(codes) else 0
+        )
+        self.algorithm = quantizer.method
+
+    @classmethod
+    def build(
+        cls,
+        ids: Sequence[str],
+        vectors,
+        method: QuantizationMethod = "int8",
+        pq_subspaces: int = 96,
+        rerank_factor: int = 4
+    ) -> "QuantizedVectorIndex":
+        """
+        원본 벡터에서 양자화 인덱스 생성 (원본은 메모리에 유지, save() 후 load()하면 memmap)
+        """
+        matrix = np.ascontiguousarray(
+            _normalize_rows(np.asarray(vectors, dtype=np.float32)), dtype=np.float32
+        )
+        if method == "int8":
+            quantizer = Int8Quantizer.train(matrix)
+        elif method == "pq":
+            quantizer = ProductQuantizer.train(matrix, subspaces=pq_subspaces)
+        else:
+            raise ValueError(f"Unknown quantization method: {method}")
+        return cls(ids, quantizer.encode(matrix), quantizer, matrix, rerank_factor)
+
+    @classmethod
+    def from_local_index(cls, index: LocalVectorIndex, **kwargs) -> "QuantizedVectorIndex":
+        """LocalVectorIndex(.npz 내보내기)에서 생성"""
+        return cls.build(index.ids, index.matrix, **kwargs)
+
+    @classmethod
+    def load(cls, path: str, rerank_factor: int = 4) -> "QuantizedVectorIndex":
+        """
+        .npz 로드, 원본 벡터(.vectors.npy)는 있으면 memmap (페이지 캐시에만 올라감)
+        """
+        with np.load(path, allow_pickle=False) as data:
+            method = str(data["method"])
+            ids = [str(i) for i in data["ids"]]
+            codes = data["codes"]
+            if method == "int8":
+                quantizer = Int8Quantizer(data["scale"])
+            elif method == "pq":
+                quantizer = ProductQuantizer(data["codebooks"])
+            else:
+                raise ValueError(f"Unknown quantization method in {path}: {method}")
+
+        full_vectors = None
+        vectors_path = vectors_path_for(path)
+        if rerank_factor > 0 and os.path.exists(vectors_path):
+            full_vectors = np.load(vectors_path, mmap_mode="r")
+        elif rerank_factor > 0:
+            logger.warning("quantized_index_vectors_missing", path=vectors_path, rerank=False)
+        return cls(ids, codes, quantizer, full_vectors, rerank_factor)
+
+    def save(self, path: str):
+        """.npz (코드 + 양자화 파라미터) + .vectors.npy (재순위화용 원본)"""
+        np.savez(
+            path,
+            ids=np.asarray(self.ids),
+            method=np.asarray(self.quantizer.method),
+            codes=self.codes,
+            **self.quantizer.params(),
+        )
+        if self.full_vectors is not None:
+            np.save(vectors_path_for(path), np.asarray(self.full_vectors, dtype=np.float32))
+
+    def search(self, query: Sequence[float], top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        top-k 이웃 검색 (양자화 점수로 후보 선정 → 원본 벡터로 재순위화)
+
+        Args:
+            query: 쿼리 임베딩 (정규화는 내부에서 수행)
+            top_k: 반환 개수
+
+        Returns:
+            (hand_id, score) 리스트 (score 내림차순, 재순위화 시 정확한 내적)
+        """
+        n = len(self.ids)
+        if n == 0 or top_k <= 0:
+            return []
+
+        q = np.asarray(query, dtype=np.float32)
+        if q.shape != (self.dimension,):
+            raise ValueError(f"query dimension {q.shape} != index dimension {self.dimension}")
+        norm = np.linalg.norm(q)
+        if norm > 0:
+            q = q / norm
+        k = min(top_k, n)
+
+        approx = self.quantizer.score(self.codes, q)
+        if self.full_vectors is None or self.rerank_factor <= 0:
+            return [(self.ids[i], float(approx[i])) for i in _top_k(approx, k)]
+
+        # 후보 행만 디스크에서 읽어 정확한 내적 (정렬된 인덱스 → 순차 읽기에 가깝게)
+        candidates = np.sort(_top_k(approx, min(n, k * self.rerank_factor)))
+        exact = np.asarray(self.full_vectors[candidates], dtype=np.float32) @ q
+        order = _top_k(exact, k)
+        return [(self.ids[candidates[i]], float(exact[i])) for i in order]
+
+    @property
+    def memory_bytes(self) -> int:
+        """상주 메모리 (코드 + 양자화 파라미터, memmap 원본 제외)"""
+        return self.codes.nbytes + self.quantizer.nbytes
+
+    def stats(self) -> dict:
+        """헬스 체크용 상태"""
+        return {
+            "vectors": len(self.ids),
+            "dimension": self.dimension,
+            "algorithm": self.algorithm,
+            "memory_mb": round(self.memory_bytes / 1e6, 2),
+            "bytes_per_vector": self.codes.shape[1] * self.codes.itemsize if len(self.codes) else 0,
+            "rerank_factor": self.rerank_factor if self.full_vectors is not None else 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+# ====================
+# Recall 리포트
+# ====================
+
+def recall_report(
+    exact_index: LocalVectorIndex,
+    candidates: Dict[str, object],
+    queries: np.ndarray,
+    top_k: int = 10
+) -> List[dict]:
+    """
+    정확 검색 대비 recall@k / 메모리 / 지연 비교
+
+    Args:
+        exact_index: 기준 인덱스 (float32 exact)
+        candidates: 이름 → 비교할 인덱스 (search / stats 인터페이스)
+        queries: (q, d) 쿼리 벡터
+        top_k: recall 기준 k
+
+    Returns:
+        [{"name", "memory_mb", "bytes_per_vector", "recall", "p50_ms", "p99_ms"}, ...]
+        (첫 행은 기준 인덱스)
+    """
+    truth = [{hand_id for hand_id, _ in exact_index.search(q, top_k)} for q in queries]
+
+    rows = []
+    for name, index in [("float32 exact", exact_index), *candidates.items()]:
+        hits = 0
+        latencies = []
+        for q, expected in zip(queries, truth):
+            start = time.perf_counter()
+            found = index.search(q, top_k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            hits += len(expected & {hand_id for hand_id, _ in found})
+
+        stats = index.stats()
+        rows.append({
+            "name": name,
+            "memory_mb": stats["memory_mb"],
+            "bytes_per_vector": stats.get("bytes_per_vector", exact_index.dimension * 4),
+            "recall": hits / max(1, sum(len(expected) for expected in truth)),
+            "p50_ms": float(np.percentile(latencies, 50)) if latencies else 0.0,
+            "p99_ms": float(np.percentile(latencies, 99)) if latencies else 0.0,
+        })
+    return rows
+
+
+def format_recall_report(rows: List[dict], top_k: int) -> str:
+    """recall_report() 결과 → Markdown 표"""
+    lines = [
+        f"| index | bytes/vector | memory (MB) | recall@{top_k} | p50 (ms) | p99 (ms) |",
+        "|---|---:|---:|---:|---:|---:|",
+    ]
+    for row in rows:
+        lines.append(
+            f"| {row['name']} | {row['bytes_per_vector']} | {row['memory_mb']:.2f} "
+            f"| {row['recall']:.4f} | {row['p50_ms']:.2f} | {row['p99_ms']:.2f} |"
+        )
+    return "\n".join(lines)
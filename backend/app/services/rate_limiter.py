@@ -0,0 +1,267 @@
+"""
+Rate Limiter (GCRA: Generic Cell Rate Algorithm)
+키(IP)당 TAT(theoretical arrival time) 하나만 저장하는 O(1) 토큰 버킷
+
+Architecture:
+- InMemoryRateLimitBackend: 워커 프로세스 로컬 dict, 유휴 키는 백그라운드 태스크가 주기적으로 제거
+  (요청 경로에서는 sweep하지 않음 → 트래픽이 없어도 메모리 회수, 특정 요청에 비용 몰리지 않음)
+- RedisRateLimitBackend: Lua 스크립트로 원자적 갱신, Redis 서버 시계 사용
+  → 여러 uvicorn 워커가 같은 한도를 공유, 유휴 키는 TTL로 자동 만료
+  선택 의존성 redis (backend/README.md 참고), 미설치 / 장애 시 인메모리로 대체하며 error 로그
+"""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class RateLimitResult:
+    """Rate limit 판정 결과"""
+    allowed: bool
+    remaining: int
+    retry_after_seconds: float
+
+
+class InMemoryRateLimitBackend:
+    """
+    프로세스 로컬 GCRA 저장소
+
+    TAT가 현재 시각 이전인 키는 새 키와 상태가 같으므로, 백그라운드 태스크가
+    sweep_interval마다 제거해 메모리가 지금까지 본 모든 IP 수만큼 늘어나지 않도록 한다.
+    """
+
+    def __init__(
+        self,
+        sweep_interval_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.clock = clock
+        self._tat: Dict[str, float] = {}
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    async def update(
+        self,
+        key: str,
+        emission_interval: float,
+        burst_tolerance: float
+    ) -> Tuple[bool, float, float]:
+        """
+        GCRA 갱신
+
+        Returns:
+            (허용 여부, 갱신 후 TAT - now, 재시도까지 남은 초)
+        """
+        now = self.clock()
+        tat = max(self._tat.get(key, now), now)
+        if tat - now > burst_tolerance:
+            return False, tat - now, tat - burst_tolerance - now
+
+        new_tat = tat + emission_interval
+        self._tat[key] = new_tat
+        return True, new_tat - now, 0.0
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """유휴 키 제거 (제거된 키 개수 반환)"""
+        now = self.clock() if now is None else now
+        idle = [key for key, tat in self._tat.items() if tat <= now]
+        for key in idle:
+            del self._tat[key]
+        if idle:
+            logger.info("rate_limit_idle_keys_evicted", evicted=len(idle), active=len(self._tat))
+        return len(idle)
+
+    async def _sweep_loop(self):
+        """주기적 유휴 키 제거 루프"""
+        while True:
+            await asyncio.sleep(self.sweep_interval_seconds)
+            self.sweep()
+
+    def start_background_sweep(self):
+        """백그라운드 sweep 태스크 시작"""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self):
+        """백그라운드 sweep 태스크 종료"""
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+    def reset(self):
+        """모든 상태 초기화"""
+        self._tat.clear()
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class RedisRateLimitBackend:
+    """
+    Redis 공유 GCRA 저장소 (여러 워커 간 한도 공유)
+
+    TAT는 밀리초 정수로 저장하고, 키 TTL을 (TAT - now)로 설정해
+    유휴 키가 Redis에서 자동 만료되도록 한다.
+    """
+
+    # KEYS[1]=key, ARGV[1]=emission interval(ms), ARGV[2]=burst tolerance(ms)
+    # 반환: {allowed, TAT - now (ms), retry_after (ms)}
+    GCRA_SCRIPT = """
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    local interval = tonumber(ARGV[1])
+    local tolerance = tonumber(ARGV[2])
+    local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+    if tat < now then
+        tat = now
+    end
+    if tat - now > tolerance then
+        return {0, tat - now, tat - tolerance - now}
+    end
+    local new_tat = tat + interval
+    redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+    return {1, new_tat - now, 0}
+    """
+
+    def __init__(self, redis_url: str, key_prefix: str = "ratelimit:autocomplete:"):
+        import redis.asyncio as redis  # 선택 의존성 (rate_limit_backend=redis 일 때만 필요)
+
+        self.client = redis.from_url(redis_url)
+        self.key_prefix = key_prefix
+        self._script = self.client.register_script(self.GCRA_SCRIPT)
+
+    async def update(
+        self,
+        key: str,
+        emission_interval: float,
+        burst_tolerance: float
+    ) -> Tuple[bool, float, float]:
+        """GCRA 갱신 (Lua 스크립트로 원자적 실행)"""
+        allowed, delay_ms, retry_ms = await self._script(
+            keys=[self.key_prefix + key],
+            args=[math.ceil(emission_interval * 1000), math.floor(burst_tolerance * 1000)],
+        )
+        return bool(allowed), delay_ms / 1000, retry_ms / 1000
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Redis 키는 TTL로 만료되므로 별도 정리 불필요"""
+        return 0
+
+    def start_background_sweep(self):
+        """TTL 만료 사용 → 백그라운드 태스크 없음"""
+
+    async def stop(self):
+        """Redis 연결 종료"""
+        await self.client.aclose()
+
+
+class RateLimiter:
+    """
+    GCRA Rate Limiter
+
+    limit_per_period 요청을 period_seconds 동안 균등하게 허용하고,
+    burst개까지는 연속 요청을 허용한다.
+    """
+
+    def __init__(
+        self,
+        limit_per_period: int,
+        period_seconds: float = 60.0,
+        burst: Optional[int] = None,
+        backend=None,
+    ):
+        self.limit_per_period = limit_per_period
+        self.period_seconds = period_seconds
+        self.burst = burst or limit_per_period
+        self.emission_interval = period_seconds / limit_per_period
+        self.burst_tolerance = self.emission_interval * (self.burst - 1)
+        self.backend = backend if backend is not None else InMemoryRateLimitBackend()
+        self._fallback_backend: Optional[InMemoryRateLimitBackend] = None
+        self._sweeping = False
+
+    async def check(self, key: str) -> RateLimitResult:
+        """
+        요청 1건을 소비하고 허용 여부 반환
+
+        공유 백엔드 장애 시 프로세스 로컬 백엔드로 대체한다 (fail-open 대신 워커 단위 제한 유지).
+        """
+        try:
+            allowed, delay, retry_after = await self.backend.update(
+                key, self.emission_interval, self.burst_tolerance
+            )
+        except Exception as e:
+            logger.warning("rate_limit_backend_error", error=str(e))
+            if self._fallback_backend is None:
+                # 워커 간 공유 한도가 사라짐 → 운영자가 알 수 있도록 한 번 error로 기록
+                logger.error(
+                    "rate_limit_fallback_to_memory",
+                    backend=type(self.backend).__name__,
+                    error=str(e),
+                )
+                self._fallback_backend = InMemoryRateLimitBackend(
+                    sweep_interval_seconds=settings.rate_limit_idle_sweep_seconds
+                )
+                if self._sweeping:
+                    self._fallback_backend.start_background_sweep()
+            allowed, delay, retry_after = await self._fallback_backend.update(
+                key, self.emission_interval, self.burst_tolerance
+            )
+
+        if not allowed:
+            return RateLimitResult(False, 0, retry_after)
+
+        remaining = int((self.burst_tolerance + self.emission_interval - delay) / self.emission_interval + 1e-9)
+        return RateLimitResult(True, max(remaining, 0), 0.0)
+
+    def start_background_sweep(self):
+        """백엔드 유휴 키 sweep 시작 (앱 startup에서 호출)"""
+        self._sweeping = True
+        self.backend.start_background_sweep()
+        if self._fallback_backend is not None:
+            self._fallback_backend.start_background_sweep()
+
+    async def stop(self):
+        """sweep 태스크 / 연결 종료 (앱 shutdown에서 호출)"""
+        self._sweeping = False
+        await self.backend.stop()
+        if self._fallback_backend is not None:
+            await self._fallback_backend.stop()
+
+
+def create_rate_limiter() -> RateLimiter:
+    """설정값으로 자동완성 Rate Limiter 생성 (redis 미설치 시 인메모리로 대체, error 로그)"""
+    backend = None
+    if settings.rate_limit_backend == "redis":
+        try:
+            backend = RedisRateLimitBackend(settings.redis_url)
+        except ImportError as e:
+            logger.error(
+                "rate_limit_redis_unavailable",
+                error=str(e),
+                hint="pip install 'redis>=5.0.1' (backend/README.md 선택 의존성)",
+                fallback="memory",
+            )
+    if backend is None:
+        backend = InMemoryRateLimitBackend(
+            sweep_interval_seconds=settings.rate_limit_idle_sweep_seconds
+        )
+
+    return RateLimiter(
+        limit_per_period=settings.rate_limit_per_minute,
+        period_seconds=60.0,
+        burst=settings.rate_limit_burst,
+        backend=backend,
+    )
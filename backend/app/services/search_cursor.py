@@ -0,0 +1,152 @@
+"""
+검색 커서 (서버 측 순위 후보 캐시 + 불투명 커서)
+"Load more" / 다음 페이지 요청이 임베딩 생성 / ANN 호출 없이 다음 구간만 hydration하도록
+
+Architecture:
+- 첫 페이지: top_k × search_cursor_page_multiple개 순위 후보(hand_id + 점수, hydration 전)를 검색해 저장
+  (search_cursor_depth 상한, 페이지를 넘기지 않는 클라이언트는 깊은 검색 비용을 내지 않음)
+- 후보가 잘린 목록(complete=False)이면 커서가 끝에 닿을 때 그 offset부터 더 깊게 다시 검색
+- 커서 = base64url("{후보 목록 키}:{offset}") → 클라이언트는 내용을 해석하지 않고 그대로 전달
+- 후보 목록은 LRU + TTL (OrderedDict), 쿼리 / 필터 지문을 함께 저장해 다른 검색의 커서 재사용 방지
+- 만료 / 다른 쿼리의 커서는 miss → 호출자가 다시 검색해 같은 offset부터 이어서 반환 (graceful degradation)
+"""
+
+import base64
+import binascii
+import secrets
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, List, NamedTuple, Optional, Tuple
+
+from app.config import settings
+
+
+class CandidateList(NamedTuple):
+    """캐시된 순위 후보 목록"""
+    fingerprint: Hashable
+    results: list
+    expires_at: float
+    complete: bool
+
+
+def encode_cursor(key: str, offset: int) -> str:
+    """후보 목록 키 + offset → 불투명 커서"""
+    raw = f"{key}:{offset}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    불투명 커서 → (후보 목록 키, offset)
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, offset = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").rsplit(":", 1)
+        offset = int(offset)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not key or offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key, offset
+
+
+class SearchCursorStore:
+    """
+    순위 후보 목록 LRU + TTL 캐시
+
+    Example:
+        >>> store = SearchCursorStore()
+        >>> key = store.put(("river bluff", filters.cache_key()), ranked_results)
+        >>> cursor = encode_cursor(key, 5)
+        >>> store.get(key, ("river bluff", filters.cache_key()))[5:10]
+        [{"hand_id": "hand_006", "distance": 0.83}, ...]
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: 최대 후보 목록 수 (초과 시 LRU 제거)
+            ttl_seconds: 후보 목록 유효 시간 (커서 만료)
+            clock: 시계 함수 (테스트용 주입 가능)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[str, CandidateList]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, fingerprint: Hashable, results: List[dict], complete: bool = True) -> str:
+        """
+        후보 목록 저장 → 키 (추측 불가능한 랜덤 토큰)
+
+        Args:
+            fingerprint: 쿼리 / 필터 지문
+            results: 순위 후보
+            complete: 더 깊은 후보가 없는 목록인지 (False면 끝에서 다시 검색)
+        """
+        key = secrets.token_urlsafe(12)
+        self._entries[key] = CandidateList(
+            fingerprint, list(results), self.clock() + self.ttl_seconds, complete
+        )
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return key
+
+    def get(self, key: str, fingerprint: Hashable) -> Optional[List[dict]]:
+        """
+        후보 목록 조회
+
+        Returns:
+            후보 목록 (없음 / 만료 / 다른 쿼리·필터의 키면 None)
+        """
+        entry = self.lookup(key, fingerprint)
+        return entry.results if entry is not None else None
+
+    def lookup(self, key: str, fingerprint: Hashable) -> Optional[CandidateList]:
+        """후보 목록 항목 조회 (complete 여부 포함, 없음 / 만료 / 다른 지문이면 None)"""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self.clock():
+            del self._entries[key]
+            entry = None
+        if entry is None or entry.fingerprint != fingerprint:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def stats(self) -> dict:
+        """헬스 체크용 상태"""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# 싱글톤 인스턴스
+_search_cursor_store: Optional[SearchCursorStore] = None
+
+
+def get_search_cursor_store() -> SearchCursorStore:
+    """SearchCursorStore 싱글톤 인스턴스 반환 (설정값으로 생성)"""
+    global _search_cursor_store
+    if _search_cursor_store is None:
+        _search_cursor_store = SearchCursorStore(
+            max_entries=settings.search_cursor_max_entries,
+            ttl_seconds=settings.search_cursor_ttl_seconds,
+        )
+    return _search_cursor_store
@@ -0,0 +1,86 @@
+"""
+Single-flight 요청 병합 (동일 키의 진행 중 백엔드 호출 공유)
+방송 직후 같은 선수 검색이 몰려도 같은 BigQuery job / Vertex AI 호출은 한 번만 실행
+
+Architecture:
+- 키별로 진행 중인 Task 하나를 공유, 완료되면 즉시 제거 (결과 캐시 아님)
+- 대기자는 asyncio.shield로 기다림 → 한 호출자가 취소돼도 다른 대기자의 호출은 계속 진행
+- 이름별 SingleFlight 레지스트리로 실행/병합 횟수를 헬스 체크에 노출
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    동일 키 동시 호출 병합기
+
+    Example:
+        >>> flight = get_single_flight("bigquery_hand")
+        >>> hand = await flight.do(hand_id, lambda: fetch_hand(hand_id))
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.executions = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn()을 실행
+
+        Args:
+            key: 병합 키 (같은 결과를 돌려줄 요청은 같은 키)
+            fn: 백엔드 호출 코루틴 팩토리
+
+        Returns:
+            fn() 결과 (병합된 호출자는 같은 객체를 공유하므로 변경하지 말 것)
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.collapsed += 1
+        else:
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            self.executions += 1
+            future.add_done_callback(lambda f: self._release(key, f))
+
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고 방지
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> dict:
+        """실행/병합 횟수"""
+        total = self.executions + self.collapsed
+        return {
+            "executions": self.executions,
+            "collapsed": self.collapsed,
+            "in_flight": len(self._in_flight),
+            "collapse_ratio": self.collapsed / total if total else 0.0,
+        }
+
+
+# 이름별 싱글톤 레지스트리 (서비스 인스턴스가 요청마다 생성되어도 병합 유지)
+_flights: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """이름별 SingleFlight 인스턴스 반환"""
+    flight = _flights.get(name)
+    if flight is None:
+        flight = _flights[name] = SingleFlight(name)
+    return flight
+
+
+def single_flight_stats() -> Dict[str, dict]:
+    """헬스 체크용 전체 SingleFlight 통계"""
+    return {name: flight.stats() for name, flight in _flights.items()}
@@ -0,0 +1,132 @@
+"""
+자동완성 Tier 스케줄러 (Hedged request + 응답 마감 시간)
+느린 tier를 앞 tier가 끝날 때까지 기다리지 않고 겹쳐서 실행
+
+Architecture:
+- tier 0은 즉시 시작, 다음 tier는 hedge_delay 후 시작 (앞 tier들이 결과 부족으로 끝나면 즉시 시작)
+- hedge_delay_ms=0이면 모든 tier를 동시에 시작
+- 완료된 tier들의 결과가 min_results 이상이면 남은 tier 취소 (cancelled)
+- deadline_ms에 도달하면 그때까지 도착한 결과만 병합하고 나머지 취소 (timeout)
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+TierFactory = Callable[[], Awaitable[List[str]]]
+
+
+@dataclass
+class TierOutcome:
+    """tier별 실행 결과"""
+    tier: str
+    status: str = "skipped"  # ok | error | timeout | cancelled | skipped
+    elapsed_ms: Optional[float] = None
+    results: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def merge_results(outcomes: Sequence[TierOutcome], limit: Optional[int] = None) -> List[str]:
+    """성공한 tier 결과를 tier 우선순위대로 병합 (중복 제거, 순서 유지)"""
+    merged = list(dict.fromkeys(
+        item for outcome in outcomes if outcome.status == "ok" for item in outcome.results
+    ))
+    return merged if limit is None else merged[:limit]
+
+
+class TierScheduler:
+    """
+    우선순위 순서의 tier 목록을 hedged 방식으로 실행
+
+    Example:
+        >>> scheduler = TierScheduler(deadline_ms=150, hedge_delay_ms=30, min_results=3)
+        >>> outcomes = await scheduler.run([("bigquery_cache", bq), ("vertex_ai", vertex)])
+        >>> merge_results(outcomes, limit=5)
+    """
+
+    def __init__(self, deadline_ms: float, hedge_delay_ms: float, min_results: int = 3):
+        """
+        Args:
+            deadline_ms: 응답 마감 시간 (이후 도착 결과는 버림)
+            hedge_delay_ms: 다음 tier 시작 지연 (0이면 동시 실행)
+            min_results: 이 개수 이상 모이면 남은 tier 취소
+        """
+        self.deadline = deadline_ms / 1000
+        self.hedge_delay = hedge_delay_ms / 1000
+        self.min_results = min_results
+
+    async def run(self, tiers: Sequence[Tuple[str, TierFactory]]) -> List[TierOutcome]:
+        """
+        tier 실행
+
+        Args:
+            tiers: (tier 이름, 결과 리스트를 반환하는 코루틴 팩토리) 목록 (우선순위 순)
+
+        Returns:
+            입력 순서와 같은 TierOutcome 리스트
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + self.deadline
+        outcomes = [TierOutcome(tier=name) for name, _ in tiers]
+        started_at: Dict[int, float] = {}
+        pending: Dict[asyncio.Task, int] = {}
+        next_tier = 0
+
+        def launch():
+            nonlocal next_tier
+            started_at[next_tier] = loop.time()
+            pending[asyncio.ensure_future(tiers[next_tier][1]())] = next_tier
+            next_tier += 1
+
+        if tiers:
+            launch()
+
+        try:
+            while pending or next_tier < len(tiers):
+                now = loop.time()
+                if now >= deadline:
+                    break
+
+                if next_tier < len(tiers):
+                    hedge_at = started_at[next_tier - 1] + self.hedge_delay
+                    if not pending or now >= hedge_at:
+                        launch()
+                        continue
+                    timeout = min(deadline, hedge_at) - now
+                else:
+                    timeout = deadline - now
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    i = pending.pop(task)
+                    outcome = outcomes[i]
+                    outcome.elapsed_ms = (loop.time() - started_at[i]) * 1000
+                    try:
+                        outcome.results = list(task.result())
+                        outcome.status = "ok"
+                    except Exception as e:
+                        outcome.status = "error"
+                        outcome.error = str(e)
+                        logger.warning("autocomplete_tier_failed", tier=outcome.tier, error=str(e))
+
+                if len(merge_results(outcomes)) >= self.min_results:
+                    break
+        finally:
+            # 남은 tier 취소 (마감 초과: timeout, 결과 충분: cancelled)
+            timed_out = loop.time() >= deadline
+            for task, i in pending.items():
+                task.cancel()
+                outcomes[i].status = "timeout" if timed_out else "cancelled"
+                outcomes[i].elapsed_ms = (loop.time() - started_at[i]) * 1000
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return outcomes
@@ -0,0 +1,102 @@
+"""
+Vertex AI Vector Search restricts / crowding tag
+메타데이터 필터를 ANN 쿼리 안에서 처리 (Python 후처리 필터 + over-fetch 제거)
+
+Architecture:
+- 업로드 경로(sync, scripts/vertex-ai/upload_embeddings.py, Cloud Function)가 datapoint마다
+  token restricts(tournament_id, tag) + numeric restrict(pot_bb) + crowding tag(tournament_id) 부착
+- 검색 경로는 같은 namespace로 filter / numeric_filter 전달 → 인덱스 안에서 필터링, 페이지가 항상 참
+- 같은 namespace의 allow 토큰은 OR, 서로 다른 namespace는 AND (Vertex AI restricts 의미)
+- restricts 없이 업로드된 기존 datapoint는 필터 쿼리에 매칭되지 않음 → 재업로드 필요
+"""
+
+from typing import List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# restricts namespace (업로드/검색 양쪽이 같은 이름을 사용해야 함)
+TOURNAMENT_NAMESPACE = "tournament_id"
+TAG_NAMESPACE = "tag"
+POT_NAMESPACE = "pot_bb"
+
+
+class VectorFilters(NamedTuple):
+    """검색 메타데이터 필터 (None/빈 값은 필터 없음)"""
+    tournament_id: Optional[str] = None
+    tags: Optional[Sequence[str]] = None
+    min_pot_bb: Optional[float] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.tournament_id and not self.tags and self.min_pot_bb is None
+
+    def cache_key(self) -> tuple:
+        """single-flight 병합 키용 (태그 순서 무관)"""
+        return (self.tournament_id, tuple(sorted(self.tags or ())), self.min_pot_bb)
+
+
+def hand_tournament(hand: Mapping) -> Optional[str]:
+    """핸드의 토너먼트 식별자 (ATI: tournament_id, hand_summary: tournament)"""
+    return hand.get("tournament_id") or hand.get("tournament")
+
+
+def datapoint_restricts(hand: Mapping) -> dict:
+    """
+    IndexDatapoint restricts 필드 (upsert_datapoints용 dict)
+
+    Returns:
+        {"restricts": [...], "numeric_restricts": [...], "crowding_tag": {...}} (값 있는 필드만)
+    """
+    fields: dict = {}
+
+    restricts = []
+    tournament = hand_tournament(hand)
+    if tournament:
+        restricts.append({"namespace": TOURNAMENT_NAMESPACE, "allow_list": [str(tournament)]})
+    tags = [str(tag) for tag in hand.get("tags") or [] if tag]
+    if tags:
+        restricts.append({"namespace": TAG_NAMESPACE, "allow_list": tags})
+    if restricts:
+        fields["restricts"] = restricts
+
+    pot_bb = hand.get("pot_bb")
+    if pot_bb is not None:
+        fields["numeric_restricts"] = [{"namespace": POT_NAMESPACE, "value_float": float(pot_bb)}]
+
+    # 같은 토너먼트 핸드가 결과를 독점하지 않도록 (per_crowding_attribute_neighbor_count)
+    if tournament:
+        fields["crowding_tag"] = {"crowding_attribute": str(tournament)}
+
+    return fields
+
+
+def query_restricts(filters: Optional[VectorFilters]) -> Tuple[List, List]:
+    """
+    find_neighbors(filter=..., numeric_filter=...) 인자
+
+    Returns:
+        (Namespace 리스트, NumericNamespace 리스트)
+    """
+    if filters is None or filters.is_empty:
+        return [], []
+
+    from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
+        Namespace,
+        NumericNamespace,
+    )
+
+    token_filters = []
+    if filters.tournament_id:
+        token_filters.append(Namespace(TOURNAMENT_NAMESPACE, [filters.tournament_id], []))
+    if filters.tags:
+        token_filters.append(Namespace(TAG_NAMESPACE, list(filters.tags), []))
+
+    numeric_filters = []
+    if filters.min_pot_bb is not None:
+        numeric_filters.append(
+            NumericNamespace(
+                name=POT_NAMESPACE,
+                value_float=float(filters.min_pot_bb),
+                op="GREATER_EQUAL",
+            )
+        )
+
+    return token_filters, numeric_filters
@@ -1,23 +1,88 @@
 """
 Vertex AI Vector Search 서비스
 Hybrid Search: BM25 + Vector (RRF)
+
+Handles:
+- search_type=hybrid: 인메모리 BM25(HandTextIndex) leg와 벡터 leg를 동시에 실행, RRF로 결합
+- search_stream(): BM25 결과를 벡터 leg보다 먼저 "lexical" 단계로 내보냄 (스트리밍 응답용)
+- TextEmbeddingModel / MatchingEngineIndexEndpoint는 프로세스당 한 번 생성해 모든 요청이 재사용
+- 시작 시 warmup()으로 더미 호출 (첫 요청의 모델 로드/채널 연결 지연 제거)
+- 호출 실패 시에만 핸들을 버리고 다음 호출에서 다시 생성
+- 쿼리 임베딩은 EmbeddingCache(LRU + 선택적 SQLite)를 먼저 조회
+- 캐시 miss 동시 요청은 MicroBatcher로 모아 get_embeddings() 한 번에 배치 호출
+- vector_backend: vertex (find_neighbors) | replica (LocalVectorIndex 우선, 실패 시 Vertex)
+  | local (LocalVectorIndex만 사용, 오프라인 개발/벤치마크)
+- 임계값 필터링 결과가 top_k보다 적으면 AdaptiveFetcher가 num_neighbors를 늘려 재조회
+- 메타데이터 필터는 restricts(filter / numeric_filter)로 전달, index_hand()는 restricts 포함 upsert
 """
 
 from google.cloud import aiplatform
 from app.config import settings
+from app.services.adaptive_fetch import create_adaptive_fetcher
+from app.services.async_io import run_blocking
+from app.services.bm25_index import HandTextIndex, get_hand_text_index, reciprocal_rank_fusion
+from app.services.embedding_cache import EmbeddingCache, create_embedding_cache
+from app.services.local_vector_index import LocalVectorIndex, load_local_vector_index
+from app.services.micro_batcher import create_embedding_batcher
+from app.services.single_flight import get_single_flight
+from app.services.vector_restricts import VectorFilters, datapoint_restricts, query_restricts
 import structlog
 import json
 import asyncio
-from typing import List, Dict
+import threading
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 
 logger = structlog.get_logger()
 
+# 검색 쿼리 임베딩 task type (캐시 키에 포함)
+QUERY_TASK_TYPE = "RETRIEVAL_QUERY"
+# 색인 문서 임베딩 task type (sync / 업로드 경로)
+DOCUMENT_TASK_TYPE = "RETRIEVAL_DOCUMENT"
+
 
 class VertexSearchService:
     """Vertex AI Vector Search 서비스"""
 
-    def __init__(self):
-        """Vertex AI 클라이언트 초기화"""
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        local_index: Optional[LocalVectorIndex] = None,
+        text_index: Optional[HandTextIndex] = None
+    ):
+        """
+        Vertex AI 클라이언트 초기화
+
+        Args:
+            embedding_cache: 쿼리 임베딩 캐시 (기본: 설정값으로 생성, 비활성화 시 None)
+            local_index: 로컬 벡터 인덱스 (기본: vector_backend가 vertex가 아니면 설정 경로에서 로드)
+            text_index: BM25 인덱스 (기본: search_type=hybrid면 공유 HandTextIndex)
+        """
+        self.embedding_cache = (
+            embedding_cache if embedding_cache is not None else create_embedding_cache()
+        )
+        self.embedding_batcher = create_embedding_batcher(self._embed_batch)
+        self.adaptive_fetcher = create_adaptive_fetcher()
+        self.vector_backend = settings.vector_backend
+        if local_index is None and self.vector_backend != "vertex":
+            local_index = load_local_vector_index()
+        self.local_index = local_index
+
+        # Hybrid Search BM25 leg (search_type=hybrid일 때만, 비활성화 시 벡터 검색만)
+        if text_index is None and settings.search_type == "hybrid" and settings.bm25_enabled:
+            text_index = get_hand_text_index()
+        self.text_index = text_index
+        self.rrf_k = settings.rrf_k
+        self.exact_name_shortcut = settings.hybrid_exact_name_shortcut
+
+        # 재사용 핸들 (최초 사용 또는 warmup 시 생성, 실패 시 폐기)
+        self._embedding_model = None
+        self._index_endpoint = None
+        self._index = None
+        self._handle_lock = threading.Lock()
+        self.handle_creations = {"embedding_model": 0, "index_endpoint": 0, "index": 0}
+        self.handle_resets = {"embedding_model": 0, "index_endpoint": 0, "index": 0}
+        self.warmed_up = False
+
         if settings.enable_mock_mode:
             logger.info("vertex_search_mock_mode_enabled")
             self.mock_mode = True
@@ -35,7 +100,11 @@ class VertexSearchService:
             )
 
     async def search(
-        self, query: str, top_k: int = 5, similarity_threshold: float = 0.7
+        self,
+        query: str,
+        top_k: int = 5,
+        similarity_threshold: float = 0.7,
+        filters: Optional[VectorFilters] = None
     ) -> list[dict]:
         """
         포커 핸드 검색
@@ -44,6 +113,7 @@ class VertexSearchService:
             query: 검색 쿼리
             top_k: 반환할 결과 개수
             similarity_threshold: 유사도 임계값
+            filters: 메타데이터 필터 (Vertex AI restricts로 인덱스 안에서 처리)
 
         Returns:
             검색 결과 리스트 (dict)
@@ -52,30 +122,177 @@ class VertexSearchService:
             return await self._mock_search(query, top_k)
 
         try:
-            # Step 1: 쿼리 임베딩 생성 (TextEmbedding-004)
-            query_embedding = await self._generate_embedding(query)
-
-            # Step 2: Vertex AI Vector Search 호출
-            results = await self._vector_search(query_embedding, top_k)
-
-            # Step 3: 유사도 필터링
-            filtered_results = [
-                result for result in results if result.get("distance", 0) >= similarity_threshold
-            ]
+            if filters is not None and not filters.is_empty:
+                # BM25 leg는 메타데이터 필터를 지원하지 않음 → 필터 쿼리는 벡터 검색만
+                results = await self._vector_leg(query, top_k, similarity_threshold, filters)
+            elif self.text_index is not None:
+                results = await self._hybrid_search(query, top_k, similarity_threshold)
+            else:
+                results = await self._vector_leg(query, top_k, similarity_threshold)
 
             logger.info(
                 "vertex_search_success",
                 query=query[:50],
-                total_results=len(filtered_results),
+                total_results=len(results),
                 top_k=top_k,
             )
 
-            return filtered_results[:top_k]
+            return results[:top_k]
 
         except Exception as e:
             logger.error("vertex_search_error", error=str(e), query=query[:50])
             raise
 
+    async def _vector_leg(
+        self,
+        query: str,
+        top_k: int,
+        similarity_threshold: float,
+        filters: Optional[VectorFilters] = None
+    ) -> list[dict]:
+        """벡터 검색 (임베딩 → Vector Search → 유사도 필터링)"""
+        # Step 1: 쿼리 임베딩 생성 (TextEmbedding-004)
+        query_embedding = await self._generate_embedding(query)
+
+        # Step 2: Vertex AI Vector Search 호출 (메타데이터 필터는 restricts로 전달)
+        filtered = filters is not None and not filters.is_empty
+        fetcher = self.adaptive_fetcher
+        if fetcher is None:
+            if filtered:
+                results = await self._vector_search(query_embedding, top_k, filters)
+            else:
+                results = await self._vector_search(query_embedding, top_k)
+
+            # Step 3: 유사도 필터링
+            return [
+                result for result in results if result.get("distance", 0) >= similarity_threshold
+            ]
+
+        # Step 2-3: 임계값을 통과한 결과가 top_k개가 될 때까지 num_neighbors를 늘려 재조회
+        outcome = await fetcher.fetch(
+            lambda n: self._vector_search(
+                query_embedding, top_k, filters if filtered else None, num_neighbors=n
+            ),
+            keep=lambda result: result.get("distance", 0) >= similarity_threshold,
+            top_k=top_k,
+            key=(round(similarity_threshold, 3), filtered),
+        )
+        logger.info(
+            "adaptive_fetch_complete",
+            rounds=outcome.rounds,
+            num_neighbors=outcome.num_neighbors,
+            results=len(outcome.results),
+            top_k=top_k,
+            exhausted=outcome.exhausted,
+        )
+        return outcome.results
+
+    async def search_stream(
+        self,
+        query: str,
+        top_k: int = 5,
+        similarity_threshold: float = 0.7,
+        filters: Optional[VectorFilters] = None
+    ) -> AsyncIterator[Tuple[str, list[dict]]]:
+        """
+        단계별 포커 핸드 검색 (스트리밍 응답용)
+
+        Hybrid 검색이면 BM25 결과를 벡터 leg보다 먼저 "lexical" 단계로 내보내고,
+        마지막에 RRF 결합 결과를 "final" 단계로 내보낸다. 그 외 경로는 "final" 한 번.
+
+        Yields:
+            (단계 이름, 검색 결과 리스트) — "lexical"은 잠정 결과, "final"은 search()와 같은 결과
+        """
+        if self.mock_mode:
+            yield "final", await self._mock_search(query, top_k)
+            return
+
+        if filters is not None and not filters.is_empty:
+            results = await self._vector_leg(query, top_k, similarity_threshold, filters)
+            yield "final", results[:top_k]
+        elif self.text_index is not None:
+            async for stage, results in self._hybrid_stages(query, top_k, similarity_threshold):
+                yield stage, results
+        else:
+            results = await self._vector_leg(query, top_k, similarity_threshold)
+            yield "final", results[:top_k]
+
+    async def _hybrid_search(
+        self, query: str, top_k: int, similarity_threshold: float
+    ) -> list[dict]:
+        """
+        BM25 + Vector 검색 (두 leg 동시 실행 후 RRF 결합, _hybrid_stages의 최종 결과)
+        """
+        results: list[dict] = []
+        async for _, results in self._hybrid_stages(query, top_k, similarity_threshold):
+            pass
+        return results
+
+    async def _hybrid_stages(
+        self, query: str, top_k: int, similarity_threshold: float
+    ) -> AsyncIterator[Tuple[str, list[dict]]]:
+        """
+        BM25 + Vector 검색 단계 (두 leg 동시 실행)
+
+        - BM25 결과가 있으면 벡터 leg를 기다리기 전에 "lexical" 단계로 먼저 내보냄
+        - 정확한 선수명 쿼리는 BM25 결과만으로 "final" (벡터 leg를 기다리지 않음)
+        - 그 외에는 RRF 결합 결과가 "final"
+        - 벡터 leg 결과에는 distance, BM25 leg 결과에는 bm25_score가 붙음
+        """
+        candidates = top_k * 2
+        vector_task = asyncio.ensure_future(
+            self._vector_leg(query, candidates, similarity_threshold)
+        )
+        try:
+            keyword_hits = await self.text_index.search(query, candidates)
+            keyword_results = [
+                {
+                    "hand_id": hand_id,
+                    "distance": None,
+                    "bm25_score": score,
+                    "rrf_score": 1.0 / (self.rrf_k + rank),
+                }
+                for rank, (hand_id, score) in enumerate(keyword_hits[:top_k], start=1)
+            ]
+
+            if keyword_hits and self.exact_name_shortcut and self.text_index.is_exact_name(query):
+                logger.info("hybrid_search_exact_name", query=query[:50], results=len(keyword_hits))
+                yield "final", keyword_results
+                return
+
+            if keyword_results:
+                yield "lexical", keyword_results
+
+            vector_hits = await vector_task
+        finally:
+            # 벡터 leg를 기다리지 않은 경우 취소
+            # (진행 중인 임베딩 + 캐시 저장은 single-flight 태스크가 shield 안에서 마저 완료)
+            if not vector_task.done():
+                vector_task.cancel()
+
+        by_id = {hit["hand_id"]: dict(hit) for hit in vector_hits}
+        bm25_scores = dict(keyword_hits)
+        fused = reciprocal_rank_fusion(
+            [list(by_id), [hand_id for hand_id, _ in keyword_hits]],
+            k=self.rrf_k,
+            limit=top_k,
+        )
+
+        results = []
+        for hand_id, rrf_score in fused:
+            result = by_id.get(hand_id) or {"hand_id": hand_id, "distance": None}
+            result["bm25_score"] = bm25_scores.get(hand_id)
+            result["rrf_score"] = rrf_score
+            results.append(result)
+
+        logger.info(
+            "hybrid_search_fused",
+            vector_results=len(vector_hits),
+            bm25_results=len(keyword_hits),
+            fused_results=len(results),
+        )
+        yield "final", results
+
     async def _generate_embedding(self, text: str) -> list[float]:
         """
         TextEmbedding-004로 텍스트 임베딩 생성
@@ -87,25 +304,18 @@ class VertexSearchService:
             768차원 임베딩 벡터
         """
         try:
-            import vertexai
-            from vertexai.language_models import TextEmbeddingModel, TextEmbeddingInput
-
-            # Vertex AI 초기화
-            vertexai.init(
-                project=settings.gcp_project,
-                location=settings.gcp_location
+            # 반복 쿼리는 임베딩 API를 호출하지 않음
+            cached = await self._cache_call("get", text, QUERY_TASK_TYPE)
+            if cached is not None:
+                logger.info("embedding_cache_hit", text_length=len(text))
+                return cached
+
+            # 같은 텍스트 동시 요청은 하나로 병합 (임베딩 + 캐시 저장을 한 태스크로 공유)
+            # single-flight는 shield로 기다리므로 호출자가 취소돼도 태스크는 끝까지 실행되어 캐시됨
+            embedding_vector = await get_single_flight("vertex_embedding").do(
+                text, lambda: self._embed_and_cache(text)
             )
 
-            # TextEmbedding-004 모델 로드
-            model = TextEmbeddingModel.from_pretrained(settings.vertex_embedding_model)
-
-            # 임베딩 생성 (RETRIEVAL_QUERY 타입 사용)
-            input_obj = TextEmbeddingInput(text=text, task_type="RETRIEVAL_QUERY")
-            embeddings = model.get_embeddings([input_obj])
-
-            # 임베딩 벡터 추출
-            embedding_vector = embeddings[0].values
-
             logger.info(
                 "embedding_generated",
                 text_length=len(text),
@@ -119,34 +329,295 @@ class VertexSearchService:
             # Fallback: 제로 벡터 반환 (검색은 실패하지만 서비스는 유지)
             return [0.0] * settings.vertex_embedding_dimension
 
-    async def _vector_search(self, query_embedding: list[float], top_k: int) -> list[dict]:
+    async def _embed_and_cache(self, text: str) -> list[float]:
+        """캐시 miss 임베딩 생성 후 캐시 저장 (single-flight 태스크 안에서 실행)"""
+        # 서로 다른 텍스트는 micro-batch로 묶어 호출
+        # (임베딩 API 호출은 동기 → vertex 스레드 풀에서 실행, 모델 핸들은 재사용)
+        if self.embedding_batcher is not None:
+            embedding_vector = await self.embedding_batcher.submit(text)
+        else:
+            embedding_vector = await run_blocking(
+                "vertex", self._embed_sync, text, timeout=settings.vertex_call_timeout_seconds
+            )
+
+        # 성공한 임베딩만 캐시 (Fallback 제로 벡터는 저장하지 않음)
+        await self._cache_call("put", text, QUERY_TASK_TYPE, embedding_vector)
+        return embedding_vector
+
+    async def embed_query(self, text: str) -> Optional[list[float]]:
+        """
+        검색 쿼리 임베딩 (RAG 답변 캐시 키용, 검색 직후라면 임베딩 캐시 hit)
+
+        Returns:
+            768차원 임베딩 벡터 (Mock 모드 / 생성 실패 시 None)
+        """
+        if self.mock_mode:
+            return None
+        embedding = await self._generate_embedding(text)
+        return embedding if any(embedding) else None
+
+    async def _cache_call(self, method: str, *args):
+        """임베딩 캐시 호출 (디스크 tier가 있으면 embedding_cache 스레드 풀에서 실행)"""
+        cache = self.embedding_cache
+        if cache is None:
+            return None
+        if cache.disk_store is None:
+            return getattr(cache, method)(*args)
+        return await run_blocking("embedding_cache", getattr(cache, method), *args)
+
+    def _get_embedding_model(self):
+        """TextEmbeddingModel 핸들 (프로세스당 한 번 로드)"""
+        model = self._embedding_model
+        if model is None:
+            with self._handle_lock:
+                model = self._embedding_model
+                if model is None:
+                    import vertexai
+                    from vertexai.language_models import TextEmbeddingModel
+
+                    vertexai.init(
+                        project=settings.gcp_project,
+                        location=settings.gcp_location
+                    )
+                    model = TextEmbeddingModel.from_pretrained(settings.vertex_embedding_model)
+                    self._embedding_model = model
+                    self.handle_creations["embedding_model"] += 1
+                    logger.info("vertex_embedding_model_loaded", model=settings.vertex_embedding_model)
+        return model
+
+    def _get_index_endpoint(self):
+        """MatchingEngineIndexEndpoint 핸들 (프로세스당 한 번 생성)"""
+        endpoint = self._index_endpoint
+        if endpoint is None:
+            with self._handle_lock:
+                endpoint = self._index_endpoint
+                if endpoint is None:
+                    endpoint = aiplatform.MatchingEngineIndexEndpoint(
+                        index_endpoint_name=settings.vertex_ai_index_endpoint
+                    )
+                    self._index_endpoint = endpoint
+                    self.handle_creations["index_endpoint"] += 1
+                    logger.info(
+                        "vertex_index_endpoint_loaded",
+                        index_endpoint=settings.vertex_ai_index_endpoint
+                    )
+        return endpoint
+
+    def _get_index(self):
+        """MatchingEngineIndex 핸들 (datapoint upsert용, 프로세스당 한 번 생성)"""
+        index = self._index
+        if index is None:
+            with self._handle_lock:
+                index = self._index
+                if index is None:
+                    index = aiplatform.MatchingEngineIndex(index_name=settings.vertex_index_id)
+                    self._index = index
+                    self.handle_creations["index"] += 1
+                    logger.info("vertex_index_loaded", index_id=settings.vertex_index_id)
+        return index
+
+    def _reset_handle(self, name: str, handle):
+        """호출 실패한 핸들 폐기 (다른 스레드가 이미 교체했으면 유지)"""
+        with self._handle_lock:
+            attr = f"_{name}"
+            if getattr(self, attr) is handle:
+                setattr(self, attr, None)
+                self.handle_resets[name] += 1
+                logger.warning("vertex_handle_reset", handle=name)
+
+    def _embed_sync(self, text: str) -> list[float]:
+        """TextEmbedding-004 동기 호출 (run_blocking으로 실행)"""
+        from vertexai.language_models import TextEmbeddingInput
+
+        model = self._get_embedding_model()
+
+        # 임베딩 생성 (RETRIEVAL_QUERY 타입 사용)
+        input_obj = TextEmbeddingInput(text=text, task_type=QUERY_TASK_TYPE)
+        try:
+            embeddings = model.get_embeddings([input_obj])
+        except Exception:
+            self._reset_handle("embedding_model", model)
+            raise
+
+        # 임베딩 벡터 추출
+        return embeddings[0].values
+
+    def _embed_document_sync(self, text: str) -> list[float]:
+        """색인 문서 임베딩 (RETRIEVAL_DOCUMENT, 쿼리 캐시/배치 미사용)"""
+        from vertexai.language_models import TextEmbeddingInput
+
+        model = self._get_embedding_model()
+        try:
+            embeddings = model.get_embeddings(
+                [TextEmbeddingInput(text=text, task_type=DOCUMENT_TASK_TYPE)]
+            )
+        except Exception:
+            self._reset_handle("embedding_model", model)
+            raise
+        return embeddings[0].values
+
+    async def generate_embedding(self, text: str) -> list[float]:
+        """
+        색인할 핸드 요약 텍스트 임베딩 (sync 경로)
+
+        Returns:
+            768차원 임베딩 벡터 (실패 시 예외 전파 → 호출 측에서 해당 핸드 실패 처리)
+        """
+        return await run_blocking("vertex", self._embed_document_sync, text, timeout=settings.vertex_call_timeout_seconds)
+
+    def _upsert_datapoints_sync(self, datapoints: List[dict]):
+        """datapoint upsert 동기 호출 (run_blocking으로 실행)"""
+        index = self._get_index()
+        try:
+            index.upsert_datapoints(datapoints=datapoints)
+        except Exception:
+            self._reset_handle("index", index)
+            raise
+
+    async def index_hand(self, hand_id: str, embedding: list[float], hand: Dict):
+        """
+        핸드 한 개를 Vector Search에 upsert (restricts / crowding tag 포함)
+
+        Args:
+            hand_id: datapoint ID
+            embedding: 문서 임베딩
+            hand: 핸드 메타데이터 (tournament_id/tournament, tags, pot_bb → restricts)
+        """
+        if self.mock_mode:
+            logger.info("vertex_index_hand_mock", hand_id=hand_id)
+            return
+
+        datapoint = {
+            "datapoint_id": hand_id,
+            "feature_vector": list(embedding),
+            **datapoint_restricts(hand),
+        }
+        await run_blocking("vertex", self._upsert_datapoints_sync, [datapoint], timeout=settings.vertex_call_timeout_seconds)
+        logger.info(
+            "vertex_hand_indexed",
+            hand_id=hand_id,
+            restricts=len(datapoint.get("restricts", [])),
+        )
+
+    async def _embed_batch(self, texts: List[str]) -> List[list[float]]:
+        """micro-batcher 배치 함수 (vertex 스레드 풀에서 실행)"""
+        return await run_blocking("vertex", self._embed_batch_sync, texts, timeout=settings.vertex_call_timeout_seconds)
+
+    def _embed_batch_sync(self, texts: List[str]) -> List[list[float]]:
+        """여러 쿼리를 get_embeddings() 한 번으로 임베딩 (단건은 _embed_sync 사용)"""
+        if len(texts) == 1:
+            return [self._embed_sync(texts[0])]
+
+        from vertexai.language_models import TextEmbeddingInput
+
+        model = self._get_embedding_model()
+        inputs = [TextEmbeddingInput(text=text, task_type=QUERY_TASK_TYPE) for text in texts]
+        try:
+            embeddings = model.get_embeddings(inputs)
+        except Exception:
+            self._reset_handle("embedding_model", model)
+            raise
+
+        return [embedding.values for embedding in embeddings]
+
+    def _find_neighbors_sync(
+        self,
+        query_embedding: list[float],
+        num_neighbors: int,
+        filters: Optional[VectorFilters] = None
+    ):
+        """Vector Search 동기 호출 (run_blocking으로 실행, 필터는 restricts로 전달)"""
+        endpoint = self._get_index_endpoint()
+        token_filters, numeric_filters = query_restricts(filters)
+        try:
+            return endpoint.find_neighbors(
+                deployed_index_id=settings.vertex_ai_deployed_index_id,
+                queries=[query_embedding],
+                num_neighbors=num_neighbors,
+                filter=token_filters or None,
+                numeric_filter=numeric_filters or None
+            )
+        except Exception:
+            self._reset_handle("index_endpoint", endpoint)
+            raise
+
+    async def warmup(self) -> bool:
+        """
+        핸들 생성 + 더미 임베딩/Vector Search 호출 (앱 시작 시)
+
+        Returns:
+            성공 여부 (실패해도 예외를 올리지 않음, 첫 요청에서 다시 생성)
+        """
+        if self.mock_mode:
+            return True
+
+        try:
+            embedding = await run_blocking("vertex", self._embed_sync, "warmup")
+            if self.vector_backend != "local":
+                await run_blocking("vertex", self._find_neighbors_sync, embedding, 1)
+            self.warmed_up = True
+            logger.info("vertex_warmup_complete")
+            return True
+        except Exception as e:
+            logger.warning("vertex_warmup_failed", error=str(e))
+            return False
+
+    def handle_stats(self) -> dict:
+        """헬스 체크용 핸들 상태"""
+        return {
+            "embedding_model_ready": self._embedding_model is not None,
+            "index_endpoint_ready": self._index_endpoint is not None,
+            "index_ready": self._index is not None,
+            "warmed_up": self.warmed_up,
+            "vector_backend": self.vector_backend,
+            "local_index": self.local_index.stats() if self.local_index is not None else None,
+            "creations": dict(self.handle_creations),
+            "resets": dict(self.handle_resets),
+        }
+
+    async def _vector_search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        filters: Optional[VectorFilters] = None,
+        num_neighbors: Optional[int] = None
+    ) -> list[dict]:
         """
         Vertex AI Vector Search 호출
 
         Args:
             query_embedding: 768차원 쿼리 임베딩 벡터
             top_k: 반환할 결과 개수
+            filters: 메타데이터 필터 (restricts, 로컬 인덱스는 미지원)
+            num_neighbors: 조회/반환 개수 (적응형 over-fetch, None이면 top_k * 2 조회 후 top_k 반환)
 
         Returns:
             검색 결과 리스트 (hand_id, distance 포함)
         """
+        filtered = filters is not None and not filters.is_empty
+        if self.vector_backend == "local" and filtered:
+            logger.warning("local_vector_index_filters_unsupported", filters=filters.cache_key())
+        if self.vector_backend == "local" or (self.vector_backend == "replica" and not filtered):
+            local_results = await self._local_vector_search(query_embedding, num_neighbors or top_k)
+            if local_results is not None or self.vector_backend == "local":
+                return local_results or []
+
+        # restricts가 있으면 인덱스 안에서 필터링되므로 결과가 필터 때문에 줄지 않음
+        # 유사도 임계값 필터링을 위해 2배 조회 (적응형 over-fetch는 요청한 개수만)
+        fetch_count = num_neighbors or top_k * 2
+        args = (query_embedding, fetch_count) + ((filters,) if filtered else ())
         try:
-            # Vertex AI Index Endpoint 로드
-            endpoint = aiplatform.MatchingEngineIndexEndpoint(
-                index_endpoint_name=settings.vertex_ai_index_endpoint
-            )
-
-            # Vector Search 수행
-            response = endpoint.find_neighbors(
-                deployed_index_id=settings.vertex_ai_deployed_index_id,
-                queries=[query_embedding],
-                num_neighbors=top_k * 2  # 필터링을 위해 더 많이 가져옴
+            # Vector Search 수행 (vertex 스레드 풀, 이벤트 루프 비차단)
+            # 같은 임베딩/top_k/필터 동시 요청은 Vector Search 호출 하나로 병합
+            response = await get_single_flight("vertex_vector_search").do(
+                (tuple(query_embedding), fetch_count, filters.cache_key() if filtered else None),
+                lambda: run_blocking("vertex", self._find_neighbors_sync, *args, timeout=settings.vertex_call_timeout_seconds)
             )
 
             # 결과 파싱
             results = []
             if response and len(response) > 0:
-                for neighbor in response[0][:top_k]:
+                for neighbor in response[0][:num_neighbors or top_k]:
                     results.append({
                         "hand_id": neighbor.id,
                         "distance": neighbor.distance
@@ -165,6 +636,29 @@ class VertexSearchService:
             # Fallback: 빈 결과 반환
             return []
 
+    async def _local_vector_search(
+        self, query_embedding: list[float], top_k: int
+    ) -> Optional[list[dict]]:
+        """
+        LocalVectorIndex 검색 (vector_index 스레드 풀, 행렬 곱은 GIL 해제)
+
+        Returns:
+            _vector_search와 같은 형식의 결과 (인덱스 미로드/실패 시 None)
+        """
+        index = self.local_index
+        if index is None:
+            logger.warning("local_vector_index_unavailable", vector_backend=self.vector_backend)
+            return None
+
+        try:
+            neighbors = await run_blocking("vector_index", index.search, query_embedding, top_k)
+        except Exception as e:
+            logger.error("local_vector_search_failed", error=str(e))
+            return None
+
+        logger.info("local_vector_search_complete", results_count=len(neighbors), top_k=top_k)
+        return [{"hand_id": hand_id, "distance": score} for hand_id, score in neighbors]
+
     async def _mock_search(self, query: str, top_k: int) -> list[dict]:
         """Mock 검색 (테스트용)"""
         logger.info("using_mock_search", query=query[:50])
@@ -311,3 +805,15 @@ class VertexSearchService:
                     keywords.append(tag)
 
         return keywords
+
+
+# 싱글톤 인스턴스 (모든 라우터가 같은 모델/엔드포인트 핸들 공유)
+_vertex_search_service: Optional[VertexSearchService] = None
+
+
+def get_vertex_search_service() -> VertexSearchService:
+    """VertexSearchService 싱글톤 인스턴스 반환"""
+    global _vertex_search_service
+    if _vertex_search_service is None:
+        _vertex_search_service = VertexSearchService()
+    return _vertex_search_service
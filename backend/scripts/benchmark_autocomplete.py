@@ -2,17 +2,64 @@
 """
 Autocomplete API 성능 벤치마크
 목표: p95 < 100ms
+
+Modes:
+- closed: 동시 사용자 N명이 배치 단위로 요청 (기존 방식, 큐잉 지연이 드러나지 않음)
+- open: 고정 도착률(constant arrival rate) 부하. 지연 시간은 "보냈어야 할 시각"부터 측정
+  → 서버가 밀려도 요청 발생이 늦춰지지 않아 coordinated omission 없음
+  --ramp "50:10,100:10,200:10:32" 처럼 단계별 도착률(req/s):지속 시간(s)[:최대 동시 요청]
+
+Targets:
+- --url: 실행 중인 서버
+- --in-process: app.main.app을 ASGI로 직접 호출, BigQuery/Vertex AI는 지연 시간 설정 가능한 stub
+  (backend/ 디렉터리에서 실행, .env.poc 설정 사용)
+
+결과는 HDR 스타일 히스토그램(app.services.metrics.LatencyHistogram)으로 집계하고
+--output JSON에 git commit, 설정, 단계별 백분위, 히스토그램 버킷을 기록해 실행 간 비교
 """
 
 import asyncio
+import os
+import subprocess
+import sys
 import time
-import statistics
 import httpx
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import argparse
 from tabulate import tabulate
 import json
 
+# backend/ 를 import 경로에 추가 (scripts/ 에서 직접 실행 시)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.metrics import LatencyHistogram  # noqa: E402
+
+
+# (도착률 req/s, 지속 시간 s, 최대 동시 요청 수 또는 None)
+Stage = Tuple[float, float, Optional[int]]
+
+
+class BenchmarkRecorder:
+    """요청 결과 집계 (지연 시간 히스토그램 + 상태 코드/소스 분포)"""
+
+    def __init__(self):
+        # latency: 예정 시각 → 응답 완료 (open 모드의 큐잉 지연 포함)
+        # service_time: 실제 전송 → 응답 완료
+        self.latency = LatencyHistogram()
+        self.service_time = LatencyHistogram()
+        self.status_codes: dict = {}
+        self.sources: dict = {}
+        self.errors: list = []
+
+    def record(self, latency_ms: float, service_ms: float, status: int, source: str):
+        self.latency.record(latency_ms)
+        self.service_time.record(service_ms)
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        if status == 200:
+            self.sources[source] = self.sources.get(source, 0) + 1
+        else:
+            self.errors.append((latency_ms, status, source))
+
 
 async def measure_request(client: httpx.AsyncClient, query: str, limit: int = 5) -> Tuple[float, int, str]:
     """
@@ -44,110 +91,177 @@ async def measure_request(client: httpx.AsyncClient, query: str, limit: int = 5)
         return duration, -1, str(e)
 
 
+async def warmup(client: httpx.AsyncClient):
+    print("Warming up...")
+    for _ in range(5):
+        await measure_request(client, "warmup")
+
+
 async def run_benchmark(
-    base_url: str,
+    client: httpx.AsyncClient,
     queries: List[str],
     num_requests: int = 100,
     concurrent_users: int = 10
-) -> dict:
+) -> BenchmarkRecorder:
     """
-    벤치마크 실행
+    Closed-loop 벤치마크 (배치 단위 동시 요청)
 
     Args:
-        base_url: API 서버 URL
+        client: HTTP 클라이언트
         queries: 테스트 쿼리 목록
         num_requests: 총 요청 수
         concurrent_users: 동시 사용자 수
 
     Returns:
-        벤치마크 결과 딕셔너리
+        BenchmarkRecorder
     """
-    results = {
-        "response_times": [],
-        "status_codes": {},
-        "sources": {},
-        "errors": []
-    }
+    recorder = BenchmarkRecorder()
+    await warmup(client)
 
-    async with httpx.AsyncClient(base_url=base_url) as client:
-        # Warmup
-        print("Warming up...")
-        for _ in range(5):
-            await measure_request(client, "warmup")
+    print(f"Running closed-loop benchmark: {num_requests} requests with {concurrent_users} concurrent users...")
 
-        print(f"Running benchmark: {num_requests} requests with {concurrent_users} concurrent users...")
+    for batch_start in range(0, num_requests, concurrent_users):
+        batch = [
+            measure_request(client, queries[i % len(queries)])
+            for i in range(batch_start, min(batch_start + concurrent_users, num_requests))
+        ]
+        for duration, status, source in await asyncio.gather(*batch):
+            recorder.record(duration, duration, status, source)
 
-        # Create tasks
-        tasks = []
-        for i in range(num_requests):
-            query = queries[i % len(queries)]
-            tasks.append(measure_request(client, query))
-
-            # Control concurrency
-            if len(tasks) >= concurrent_users:
-                batch_results = await asyncio.gather(*tasks)
-
-                for duration, status, source in batch_results:
-                    results["response_times"].append(duration)
-                    results["status_codes"][status] = results["status_codes"].get(status, 0) + 1
+    return recorder
 
-                    if status == 200:
-                        results["sources"][source] = results["sources"].get(source, 0) + 1
-                    elif status != 200:
-                        results["errors"].append((duration, status, source))
 
-                tasks = []
+async def run_open_loop(
+    client: httpx.AsyncClient,
+    queries: List[str],
+    stages: List[Stage]
+) -> Tuple[BenchmarkRecorder, List[dict]]:
+    """
+    Open-loop 벤치마크 (고정 도착률, 단계별 ramp)
 
-        # Process remaining tasks
-        if tasks:
-            batch_results = await asyncio.gather(*tasks)
-            for duration, status, source in batch_results:
-                results["response_times"].append(duration)
-                results["status_codes"][status] = results["status_codes"].get(status, 0) + 1
+    요청 i의 예정 시각은 단계 시작 + i / rate로 고정한다. 동시 요청 상한에 막히거나
+    서버가 느려져도 예정 시각은 밀리지 않으므로, 기다린 시간이 지연 시간에 그대로 포함된다.
 
-                if status == 200:
-                    results["sources"][source] = results["sources"].get(source, 0) + 1
-                elif status != 200:
-                    results["errors"].append((duration, status, source))
+    Args:
+        client: HTTP 클라이언트
+        queries: 테스트 쿼리 목록
+        stages: (도착률, 지속 시간, 최대 동시 요청) 목록
 
-    return results
+    Returns:
+        (전체 결과, 단계별 요약 리스트)
+    """
+    overall = BenchmarkRecorder()
+    stage_summaries = []
+    await warmup(client)
+
+    loop = asyncio.get_running_loop()
+    request_no = 0
+
+    for rate, duration, max_in_flight in stages:
+        stage = BenchmarkRecorder()
+        limiter = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        total = int(rate * duration)
+        print(
+            f"Running open-loop stage: {rate:g} req/s for {duration:g}s "
+            f"({total} requests, max in-flight {max_in_flight or 'unbounded'})..."
+        )
 
+        async def fire(query: str, scheduled: float):
+            if limiter is not None:
+                async with limiter:
+                    service_ms, status, source = await measure_request(client, query)
+            else:
+                service_ms, status, source = await measure_request(client, query)
+            latency_ms = (loop.time() - scheduled) * 1000
+            stage.record(latency_ms, service_ms, status, source)
+            overall.record(latency_ms, service_ms, status, source)
+
+        stage_start = loop.time()
+        tasks = []
+        max_dispatch_lag_ms = 0.0
+        for i in range(total):
+            scheduled = stage_start + i / rate
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                max_dispatch_lag_ms = max(max_dispatch_lag_ms, -delay * 1000)
+            tasks.append(asyncio.ensure_future(fire(queries[request_no % len(queries)], scheduled)))
+            request_no += 1
+
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - stage_start
+
+        stage_summaries.append({
+            "target_rate": rate,
+            "duration_s": duration,
+            "max_in_flight": max_in_flight,
+            "achieved_rate": total / elapsed if elapsed > 0 else None,
+            "max_dispatch_lag_ms": max_dispatch_lag_ms,
+            "latency_ms": stage.latency.to_dict(),
+            "service_time_ms": stage.service_time.to_dict(),
+            "status_codes": {str(k): v for k, v in stage.status_codes.items()},
+        })
+
+    return overall, stage_summaries
+
+
+def parse_ramp(spec: str) -> List[Stage]:
+    """
+    ramp 문자열 파싱
 
-def analyze_results(results: dict) -> dict:
+    Example:
+        >>> parse_ramp("50:10,100:10:32")
+        [(50.0, 10.0, None), (100.0, 10.0, 32)]
+    """
+    stages = []
+    for part in spec.split(","):
+        fields = part.strip().split(":")
+        if len(fields) not in (2, 3):
+            raise ValueError(f"Invalid ramp stage '{part}' (expected rate:duration[:max_in_flight])")
+        rate, duration = float(fields[0]), float(fields[1])
+        if rate <= 0 or duration <= 0:
+            raise ValueError(f"Invalid ramp stage '{part}' (rate and duration must be positive)")
+        max_in_flight = int(fields[2]) if len(fields) == 3 else None
+        stages.append((rate, duration, max_in_flight))
+    return stages
+
+
+def analyze_results(recorder: BenchmarkRecorder) -> dict:
     """
-    결과 분석 및 통계 계산
+    결과 분석 및 통계 계산 (히스토그램 기반 백분위)
 
     Returns:
         분석된 통계 딕셔너리
     """
-    response_times = results["response_times"]
+    hist = recorder.latency
 
-    if not response_times:
+    if hist.count == 0:
         return {"error": "No successful requests"}
 
-    # Sort for percentile calculation
-    sorted_times = sorted(response_times)
+    percentiles = hist.percentiles((50, 75, 90, 95, 99, 99.9))
 
     stats = {
-        "total_requests": len(response_times),
-        "min_ms": min(response_times),
-        "max_ms": max(response_times),
-        "mean_ms": statistics.mean(response_times),
-        "median_ms": statistics.median(response_times),
-        "stdev_ms": statistics.stdev(response_times) if len(response_times) > 1 else 0,
-        "p50_ms": sorted_times[int(len(sorted_times) * 0.50)],
-        "p75_ms": sorted_times[int(len(sorted_times) * 0.75)],
-        "p90_ms": sorted_times[int(len(sorted_times) * 0.90)],
-        "p95_ms": sorted_times[int(len(sorted_times) * 0.95)],
-        "p99_ms": sorted_times[int(len(sorted_times) * 0.99)] if len(sorted_times) > 100 else sorted_times[-1],
-        "status_codes": results["status_codes"],
-        "sources": results["sources"],
-        "error_count": len(results["errors"])
+        "total_requests": hist.count,
+        "min_ms": hist.min,
+        "max_ms": hist.max,
+        "mean_ms": hist.mean,
+        "median_ms": percentiles["p50"],
+        "p50_ms": percentiles["p50"],
+        "p75_ms": percentiles["p75"],
+        "p90_ms": percentiles["p90"],
+        "p95_ms": percentiles["p95"],
+        "p99_ms": percentiles["p99"],
+        "p99_9_ms": percentiles["p99.9"],
+        "service_time_ms": recorder.service_time.to_dict(),
+        "status_codes": recorder.status_codes,
+        "sources": recorder.sources,
+        "error_count": len(recorder.errors)
     }
 
     # Calculate success rate
-    success_count = results["status_codes"].get(200, 0)
-    stats["success_rate"] = (success_count / len(response_times)) * 100
+    success_count = recorder.status_codes.get(200, 0)
+    stats["success_rate"] = (success_count / hist.count) * 100
 
     # Check SLA compliance
     stats["sla_p95_100ms"] = stats["p95_ms"] < 100
@@ -172,6 +286,7 @@ def print_results(stats: dict):
         ["p90", f"{stats['p90_ms']:.2f}", "✅" if stats['p90_ms'] < 90 else "⚠️"],
         ["p95", f"{stats['p95_ms']:.2f}", "✅" if stats['p95_ms'] < 100 else "❌"],
         ["p99", f"{stats['p99_ms']:.2f}", "✅" if stats['p99_ms'] < 200 else "❌"],
+        ["p99.9", f"{stats['p99_9_ms']:.2f}", ""],
         ["Max", f"{stats['max_ms']:.2f}", ""],
     ]
 
@@ -208,7 +323,7 @@ def print_results(stats: dict):
     print(f"  Total Requests: {stats['total_requests']}")
     print(f"  Success Rate: {stats['success_rate']:.1f}%")
     print(f"  Error Count: {stats['error_count']}")
-    print(f"  Standard Deviation: {stats['stdev_ms']:.2f}ms")
+    print(f"  Service Time p99: {stats['service_time_ms']['p99']:.2f}ms")
 
     # Final verdict
     print("\n🎯 Final Verdict:")
@@ -222,11 +337,105 @@ def print_results(stats: dict):
         print("  ❌ NEEDS IMPROVEMENT - SLA targets not met")
 
 
+# ====================
+# In-process target (ASGI + stub backends)
+# ====================
+
+def build_in_process_client(
+    bigquery_latency_ms: float,
+    vertex_latency_ms: float,
+    cold_index: bool
+) -> httpx.AsyncClient:
+    """
+    app.main.app을 ASGI로 직접 호출하는 클라이언트 (네트워크/GCP 없이 핸들러 경로만 측정)
+
+    Args:
+        bigquery_latency_ms: BigQuery stub 응답 지연
+        vertex_latency_ms: Vertex AI stub 응답 지연
+        cold_index: True면 인메모리 인덱스 미준비 상태 (BigQuery tier 경로 측정)
+    """
+    # 다른 라우터의 GCP 클라이언트도 만들지 않도록 mock 모드로 import
+    os.environ["ENABLE_MOCK_MODE"] = "true"
+    from app.main import app
+    from app.api import autocomplete
+    from app.services.autocomplete_index import AutocompleteIndex, get_autocomplete_index
+    from app.services.bigquery import MOCK_PLAYER_NAMES
+    from app.services.rate_limiter import InMemoryRateLimitBackend, RateLimiter
+
+    class StubBigQuery:
+        cache = None
+
+        async def get_autocomplete_suggestions(self, query: str, limit: int = 10) -> List[str]:
+            await asyncio.sleep(bigquery_latency_ms / 1000)
+            prefix = query.lower()
+            return [name for name in MOCK_PLAYER_NAMES if name.lower().startswith(prefix)][:limit]
+
+        def get_name_frequencies(self, max_names: int = 200000):
+            return [(name, len(MOCK_PLAYER_NAMES) - i) for i, name in enumerate(MOCK_PLAYER_NAMES)]
+
+    class StubVertex:
+        async def semantic_autocomplete(self, query: str, limit: int = 5, **kwargs) -> List[str]:
+            await asyncio.sleep(vertex_latency_ms / 1000)
+            return []
+
+    bq_stub, vertex_stub = StubBigQuery(), StubVertex()
+    index = AutocompleteIndex(bq_service=bq_stub)
+    if not cold_index:
+        index.build(bq_stub.get_name_frequencies())
+
+    app.dependency_overrides[autocomplete.get_bigquery_service] = lambda: bq_stub
+    app.dependency_overrides[autocomplete.get_vertex_service] = lambda: vertex_stub
+    app.dependency_overrides[get_autocomplete_index] = lambda: index
+    # 단일 클라이언트 IP로 부하를 주므로 rate limit 해제
+    autocomplete.rate_limiter = RateLimiter(
+        limit_per_period=10**9, period_seconds=60.0, burst=10**9,
+        backend=InMemoryRateLimitBackend()
+    )
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://in-process")
+
+
+def git_commit() -> Optional[str]:
+    """현재 git commit (실행 간 비교용, git 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args, queries: List[str]) -> Tuple[BenchmarkRecorder, List[dict]]:
+    if args.in_process:
+        client = build_in_process_client(
+            args.stub_bigquery_ms, args.stub_vertex_ms, args.cold_index
+        )
+    else:
+        client = httpx.AsyncClient(base_url=args.url)
+
+    async with client:
+        if args.mode == "open":
+            stages = parse_ramp(args.ramp) if args.ramp else [(args.rate, args.duration, args.max_in_flight)]
+            return await run_open_loop(client, queries, stages)
+        return await run_benchmark(client, queries, args.requests, args.concurrent), []
+
+
 def main():
     parser = argparse.ArgumentParser(description="Autocomplete API Performance Benchmark")
     parser.add_argument("--url", default="http://localhost:8000", help="API base URL")
-    parser.add_argument("--requests", type=int, default=100, help="Number of requests")
-    parser.add_argument("--concurrent", type=int, default=10, help="Concurrent users")
+    parser.add_argument("--mode", choices=["closed", "open"], default="closed",
+                        help="closed: batched concurrent users, open: constant arrival rate")
+    parser.add_argument("--requests", type=int, default=100, help="Number of requests (closed)")
+    parser.add_argument("--concurrent", type=int, default=10, help="Concurrent users (closed)")
+    parser.add_argument("--rate", type=float, default=50.0, help="Arrival rate in req/s (open)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duration in seconds (open)")
+    parser.add_argument("--max-in-flight", type=int, help="Max concurrent requests (open, default unbounded)")
+    parser.add_argument("--ramp", help='Open-loop stages "rate:duration[:max_in_flight],..." (overrides --rate/--duration)')
+    parser.add_argument("--in-process", action="store_true", help="Call app.main.app via ASGI with stubbed backends")
+    parser.add_argument("--stub-bigquery-ms", type=float, default=5.0, help="BigQuery stub latency (in-process)")
+    parser.add_argument("--stub-vertex-ms", type=float, default=80.0, help="Vertex AI stub latency (in-process)")
+    parser.add_argument("--cold-index", action="store_true", help="Leave the in-memory index unbuilt (in-process)")
     parser.add_argument("--output", help="Save results to JSON file")
 
     args = parser.parse_args()
@@ -251,15 +460,13 @@ def main():
     ]
 
     # Run async benchmark
-    results = asyncio.run(run_benchmark(
-        args.url,
-        test_queries,
-        args.requests,
-        args.concurrent
-    ))
+    recorder, stages = asyncio.run(run(args, test_queries))
 
     # Analyze results
-    stats = analyze_results(results)
+    stats = analyze_results(recorder)
+    if "error" in stats:
+        print(stats["error"])
+        sys.exit(1)
 
     # Print results
     print_results(stats)
@@ -269,16 +476,26 @@ def main():
         with open(args.output, 'w') as f:
             json.dump({
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "git_commit": git_commit(),
                 "config": {
-                    "url": args.url,
+                    "mode": args.mode,
+                    "target": "in-process" if args.in_process else args.url,
                     "total_requests": args.requests,
-                    "concurrent_users": args.concurrent
+                    "concurrent_users": args.concurrent,
+                    "rate": args.rate,
+                    "duration_s": args.duration,
+                    "max_in_flight": args.max_in_flight,
+                    "ramp": args.ramp,
+                    "stub_bigquery_ms": args.stub_bigquery_ms if args.in_process else None,
+                    "stub_vertex_ms": args.stub_vertex_ms if args.in_process else None,
+                    "cold_index": args.cold_index if args.in_process else None,
                 },
                 "stats": stats,
-                "raw_response_times": results["response_times"][:100]  # Save first 100 for analysis
+                "stages": stages,
+                "histogram_ms": recorder.latency.to_dict(buckets=True)
             }, f, indent=2)
         print(f"\n💾 Results saved to {args.output}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
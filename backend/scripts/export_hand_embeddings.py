@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+핸드 임베딩 내보내기 (Firestore → LocalVectorIndex .npz)
+vector_backend=replica/local에서 사용할 로컬 벡터 인덱스 파일 생성
+
+Usage:
+    python scripts/export_hand_embeddings.py --output exports/hand_embeddings.npz --limit 100000
+    # .env.poc: LOCAL_VECTOR_INDEX_PATH=exports/hand_embeddings.npz, VECTOR_BACKEND=replica
+
+    # 양자화 저장소도 함께 생성 (hand_embeddings.int8.npz + hand_embeddings.int8.vectors.npy)
+    python scripts/export_hand_embeddings.py --output exports/hand_embeddings.npz --quantize int8
+    # .env.poc: LOCAL_VECTOR_INDEX_PATH=exports/hand_embeddings.int8.npz, LOCAL_VECTOR_INDEX_QUANTIZATION=int8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# backend/ 를 import 경로에 추가 (scripts/ 에서 직접 실행 시)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.firestore import get_firestore_service  # noqa: E402
+from app.services.local_vector_index import LocalVectorIndex  # noqa: E402
+from app.services.quantized_vector_index import QuantizedVectorIndex  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export hand embeddings for LocalVectorIndex")
+    parser.add_argument("--output", required=True, help="Output .npz path")
+    parser.add_argument("--limit", type=int, default=100000, help="Max hands to read from Firestore")
+    parser.add_argument(
+        "--quantize", choices=["int8", "pq"], help="Also write a quantized store next to --output"
+    )
+    parser.add_argument("--pq-subspaces", type=int, default=96, help="PQ subspaces (divides dim)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    hands = get_firestore_service().get_all_hands(limit=args.limit)
+    index = LocalVectorIndex.from_records(hands, algorithm="exact")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    index.save(args.output)
+
+    print(
+        f"Exported {len(index)} of {len(hands)} hands "
+        f"(dim={index.dimension}, {index.stats()['memory_mb']} MB) "
+        f"to {args.output} in {time.perf_counter() - start:.1f}s"
+    )
+
+    if args.quantize:
+        quantized = QuantizedVectorIndex.from_local_index(
+            index, method=args.quantize, pq_subspaces=args.pq_subspaces
+        )
+        root, ext = os.path.splitext(args.output)
+        quantized_path = f"{root}.{args.quantize}{ext}"
+        quantized.save(quantized_path)
+        print(
+            f"Wrote {args.quantize} store ({quantized.stats()['memory_mb']} MB resident) "
+            f"to {quantized_path}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,13 @@ Coverage:
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timedelta
+import asyncio
 import time
 
 # Import the app
 from app.main import app
 from app.api import autocomplete
+from app.services.rate_limiter import InMemoryRateLimitBackend
 
 client = TestClient(app)
 
@@ -144,75 +145,53 @@ def test_autocomplete_limit_validation():
 # Rate Limiting 테스트
 # ====================
 
-def test_autocomplete_rate_limiting():
-    """Rate limiting: 100 req/min 초과 시 429"""
-    # Clear rate limit storage
-    autocomplete.rate_limit_storage.clear()
+@pytest.fixture
+def fake_clock_rate_limiter(monkeypatch):
+    """가짜 시계를 쓰는 인메모리 백엔드로 교체 (테스트 간 상태 격리)"""
+    clock = {"now": 1000.0}
+    backend = InMemoryRateLimitBackend(clock=lambda: clock["now"])
+    monkeypatch.setattr(autocomplete.rate_limiter, "backend", backend)
+    return clock
 
-    with patch('app.api.autocomplete.get_bigquery_service') as mock_bq, \
-         patch('app.api.autocomplete.get_vertex_service') as mock_vertex:
 
-        mock_bq_service = MagicMock()
-        mock_bq_service.get_autocomplete_suggestions = AsyncMock(
-            return_value=["Test Result"]
-        )
-        mock_bq.return_value = mock_bq_service
+def exhaust_rate_limit(client_ip: str):
+    """해당 IP의 버스트 한도를 모두 소비"""
+    for _ in range(autocomplete.rate_limiter.burst):
+        assert asyncio.run(autocomplete.rate_limiter.check(client_ip)).allowed
 
-        mock_vertex_service = MagicMock()
-        mock_vertex.return_value = mock_vertex_service
-
-        # Simulate requests from same IP
-        test_ip = "192.168.1.1"
 
-        # Mock client IP
-        with patch('app.api.autocomplete.get_client_ip', return_value=test_ip):
-            # Fill up rate limit
-            now = datetime.now()
-            autocomplete.rate_limit_storage[test_ip] = [
-                now - timedelta(seconds=i) for i in range(100)
-            ]
+def test_autocomplete_rate_limiting(fake_clock_rate_limiter):
+    """Rate limiting: 100 req/min 초과 시 429"""
+    test_ip = "192.168.1.1"
 
-            # 101st request should be rejected
-            response = client.get("/api/autocomplete?q=Phil")
+    with patch('app.api.autocomplete.get_client_ip', return_value=test_ip):
+        # Fill up rate limit
+        exhaust_rate_limit(test_ip)
 
-            assert response.status_code == 429
-            data = response.json()
-            assert data["detail"]["error"] == "Rate limit exceeded"
-            assert "100 requests per minute" in data["detail"]["message"]
+        # 101st request should be rejected
+        response = client.get("/api/autocomplete?q=Phil")
 
-    # Clean up
-    autocomplete.rate_limit_storage.clear()
+        assert response.status_code == 429
+        data = response.json()
+        assert data["detail"]["error"] == "Rate limit exceeded"
+        assert "100 requests per minute" in data["detail"]["message"]
+        assert int(response.headers["Retry-After"]) >= 1
 
 
-def test_autocomplete_rate_limit_window_reset():
+def test_autocomplete_rate_limit_window_reset(fake_clock_rate_limiter):
     """Rate limiting: 1분 후 윈도우 리셋"""
-    autocomplete.rate_limit_storage.clear()
-
-    with patch('app.api.autocomplete.get_bigquery_service') as mock_bq, \
-         patch('app.api.autocomplete.get_vertex_service') as mock_vertex:
-
-        mock_bq_service = MagicMock()
-        mock_bq_service.get_autocomplete_suggestions = AsyncMock(
-            return_value=["Test Result"]
-        )
-        mock_bq.return_value = mock_bq_service
+    test_ip = "192.168.1.2"
 
-        mock_vertex_service = MagicMock()
-        mock_vertex.return_value = mock_vertex_service
+    with patch('app.api.autocomplete.get_client_ip', return_value=test_ip):
+        exhaust_rate_limit(test_ip)
+        assert client.get("/api/autocomplete?q=Phil").status_code == 429
 
-        test_ip = "192.168.1.2"
+        # 1분 경과 → 한도 회복
+        fake_clock_rate_limiter["now"] += 60
 
-        with patch('app.api.autocomplete.get_client_ip', return_value=test_ip):
-            # Add old requests (>1 minute ago)
-            old_time = datetime.now() - timedelta(minutes=2)
-            autocomplete.rate_limit_storage[test_ip] = [old_time for _ in range(100)]
-
-            # Should allow new request (old ones expired)
-            response = client.get("/api/autocomplete?q=Phil")
-
-            assert response.status_code == 200
+        response = client.get("/api/autocomplete?q=Phil")
 
-    autocomplete.rate_limit_storage.clear()
+        assert response.status_code == 200
 
 
 # ====================
@@ -439,6 +418,132 @@ def test_autocomplete_empty_results():
         assert data["source"] == "hybrid"  # Both were tried
 
 
+# ====================
+# In-Memory Index (Tier 0) 테스트
+# ====================
+
+def test_autocomplete_memory_index():
+    """인덱스 준비 시 BigQuery 호출 없이 메모리에서 응답"""
+    from app.services.autocomplete_index import AutocompleteIndex, get_autocomplete_index
+
+    index = AutocompleteIndex(bq_service=MagicMock())
+    index.build([("Phil Ivey", 50), ("Phil Hellmuth", 30), ("Philip Ng", 5), ("Tom Dwan", 40)])
+
+    mock_bq_service = MagicMock()
+    mock_bq_service.get_autocomplete_suggestions = AsyncMock(return_value=[])
+
+    app.dependency_overrides[get_autocomplete_index] = lambda: index
+    app.dependency_overrides[autocomplete.get_bigquery_service] = lambda: mock_bq_service
+    try:
+        response = client.get("/api/autocomplete?q=phil&limit=3")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["source"] == "memory_index"
+    assert data["suggestions"] == ["Phil Ivey", "Phil Hellmuth", "Philip Ng"]
+    mock_bq_service.get_autocomplete_suggestions.assert_not_called()
+
+
+def test_autocomplete_typed_entities():
+    """선수명 외 엔티티: 타입별 빈도순 응답, 선수명 결과가 부족하면 suggestions에도 포함"""
+    from app.services.autocomplete_index import AutocompleteIndex, get_autocomplete_index
+
+    index = AutocompleteIndex(bq_service=MagicMock())
+    index.build(
+        [("Phil Ivey", 50)],
+        [("river call", "street_action", 9), ("river bluff", "street_action", 12),
+         ("RIVER_RAT", "tag", 2), ("mpp_2024", "tournament", 17)]
+    )
+
+    mock_vertex_service = MagicMock()
+    mock_vertex_service.semantic_autocomplete = AsyncMock(return_value=[])
+
+    app.dependency_overrides[get_autocomplete_index] = lambda: index
+    app.dependency_overrides[autocomplete.get_vertex_service] = lambda: mock_vertex_service
+    try:
+        response = client.get("/api/autocomplete?q=river&limit=5")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["entities"] == [
+        {"text": "RIVER_RAT", "type": "tag", "count": 2},
+        {"text": "river bluff", "type": "street_action", "count": 12},
+        {"text": "river call", "type": "street_action", "count": 9},
+    ]
+    assert data["suggestions"][:3] == ["river bluff", "river call", "RIVER_RAT"]
+
+
+def test_autocomplete_slow_vertex_tier_hits_deadline(monkeypatch):
+    """prefix tier 결과 부족 + Vertex AI 지연 → 마감 시간에 prefix 결과만 반환"""
+    import asyncio as aio
+    from app.services.tier_scheduler import TierScheduler
+
+    mock_bq_service = MagicMock()
+    mock_bq_service.get_autocomplete_suggestions = AsyncMock(return_value=["Junglemann"])
+
+    async def slow_semantic_autocomplete(**kwargs):
+        await aio.sleep(5)
+        return ["Daniel Dvoress"]
+
+    mock_vertex_service = MagicMock()
+    mock_vertex_service.semantic_autocomplete = slow_semantic_autocomplete
+
+    monkeypatch.setattr(
+        autocomplete, "tier_scheduler",
+        TierScheduler(deadline_ms=50, hedge_delay_ms=10, min_results=3)
+    )
+    app.dependency_overrides[autocomplete.get_bigquery_service] = lambda: mock_bq_service
+    app.dependency_overrides[autocomplete.get_vertex_service] = lambda: mock_vertex_service
+    try:
+        response = client.get("/api/autocomplete?q=Junglman&limit=3")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["suggestions"] == ["Junglemann"]
+    assert data["source"] == "bigquery_cache"
+    assert [(t["tier"], t["status"]) for t in data["tiers"]] == [
+        ("bigquery_cache", "ok"), ("vertex_ai", "timeout")
+    ]
+    assert data["response_time_ms"] < 1000
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_handler_does_not_block_event_loop():
+    """느린 BigQuery 호출이 진행 중이어도 핸들러가 이벤트 루프를 막지 않음"""
+    import httpx
+    from app.services.bigquery import BigQueryAutocompleteService
+    from app.services.autocomplete_index import AutocompleteIndex, get_autocomplete_index
+    from tests.services.test_async_io import LoopLagMonitor, MAX_LOOP_LAG_MS, Row, slow_query_job
+
+    bq_client = MagicMock()
+    bq_client.query.return_value = slow_query_job(
+        [Row(name="Phil Ivey"), Row(name="Phil Hellmuth"), Row(name="Philip Ng")]
+    )
+    slow_bq_service = BigQueryAutocompleteService(client=bq_client)
+
+    app.dependency_overrides[autocomplete.get_bigquery_service] = lambda: slow_bq_service
+    app.dependency_overrides[get_autocomplete_index] = lambda: AutocompleteIndex(bq_service=MagicMock())
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            async with LoopLagMonitor() as monitor:
+                response = await async_client.get(
+                    "/api/autocomplete?q=Phil", headers={"X-Forwarded-For": "10.9.9.9"}
+                )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["suggestions"][0] == "Phil Ivey"
+    assert monitor.max_lag_ms < MAX_LOOP_LAG_MS
+
+
 # ====================
 # Health Check 테스트
 # ====================
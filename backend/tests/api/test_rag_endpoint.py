@@ -0,0 +1,194 @@
+"""
+테스트: RAG API 엔드포인트
+1:1 페어링: backend/app/api/rag.py
+
+Coverage:
+- 스트리밍: context 이벤트 먼저, 토큰 조각 그대로 전달, done 이벤트에 time_to_first_token_ms
+- 검색 결과 없음: 고정 답변 한 조각, LLM 미호출
+- 스트림 도중 LLM 오류 → error 이벤트
+- 시맨틱 답변 캐시: 유사 질문 + 같은 컨텍스트는 LLM 생성 없이 cache_hit
+- LLM 과부하: /api/rag 503 + Retry-After, 스트림은 status 503 error 이벤트
+- lifespan 재시작: 종료 시 닫힌 LLM 커넥션 풀을 다시 쓰지 않음
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.api import rag
+from app.main import app
+from app.services.answer_cache import SemanticAnswerCache
+from app.services.llm_scheduler import LLMOverloaded
+
+client = TestClient(app)
+
+
+def _hand(i: int) -> dict:
+    return {
+        "hand_id": f"hand_{i:03d}",
+        "distance": 0.9,
+        "hero_name": "Phil Ivey",
+        "description": f"hand {i}",
+        "pot_bb": 100.0,
+        "street": "River",
+        "action": "Bluff",
+        "tags": [],
+    }
+
+
+def _events(response) -> list:
+    """SSE 본문 → [(event, data)]"""
+    events = []
+    for frame in response.text.strip().split("\n\n"):
+        event_line, data_line = frame.split("\n")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return events
+
+
+@pytest.fixture
+def search_results():
+    """검색 결과를 바꿔 끼울 수 있는 Vertex 검색 + hydration Mock (답변 캐시 끔 → 임베딩 API 미호출)"""
+    search = AsyncMock(return_value=[_hand(1), _hand(2)])
+    hydrate = AsyncMock(side_effect=lambda results: list(results))
+    with patch("app.api.rag.vertex_search.search", search), \
+         patch("app.api.rag.hand_hydrator.hydrate", hydrate), \
+         patch("app.api.rag.answer_cache", None):
+        yield search
+
+
+def _token_stream(*chunks):
+    async def stream_answer(**kwargs):
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    return Mock(side_effect=stream_answer)
+
+
+# ====================
+# 스트리밍 테스트
+# ====================
+
+def test_rag_stream_sends_context_then_tokens(search_results):
+    """context → token 조각 → done (time_to_first_token_ms 별도 보고)"""
+    stream_answer = _token_stream("Phil Ivey는 ", "리버에서 ", "블러프합니다.")
+    with patch("app.api.rag.llm_service.stream_answer", stream_answer):
+        response = client.post("/api/rag/stream", json={"query": "Ivey bluff"})
+
+    events = _events(response)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert [name for name, _ in events] == ["context", "token", "token", "token", "done"]
+    assert [h["hand_id"] for h in events[0][1]["context_hands"]] == ["hand_001", "hand_002"]
+    assert "".join(data["text"] for name, data in events if name == "token") == (
+        "Phil Ivey는 리버에서 블러프합니다."
+    )
+    done = events[-1][1]
+    assert done["time_to_first_token_ms"] is not None
+    assert done["time_to_first_token_ms"] <= done["llm_time_ms"] <= done["total_time_ms"]
+    # tokenizer 미설정 → 프롬프트 토큰 수는 근사값으로 표시
+    assert done["prompt_tokens"] > 0 and done["prompt_tokens_approximate"] is True
+
+
+def test_rag_stream_no_results_skips_llm(search_results):
+    """검색 결과 없음 → 고정 답변, LLM 호출 없음"""
+    search_results.return_value = []
+    stream_answer = _token_stream("unused")
+    with patch("app.api.rag.llm_service.stream_answer", stream_answer):
+        events = _events(client.post("/api/rag/stream", json={"query": "unknown"}))
+
+    assert [name for name, _ in events] == ["context", "token", "done"]
+    assert events[0][1]["context_hands"] == []
+    assert events[-1][1]["llm_time_ms"] == 0.0
+    stream_answer.assert_not_called()
+
+
+def test_rag_stream_llm_error_event(search_results):
+    """토큰 전송 도중 LLM 오류 → error 이벤트로 종료"""
+    stream_answer = _token_stream("Phil ", RuntimeError("connection reset"))
+    with patch("app.api.rag.llm_service.stream_answer", stream_answer):
+        events = _events(client.post("/api/rag/stream", json={"query": "Ivey bluff"}))
+
+    assert [name for name, _ in events] == ["context", "token", "error"]
+    assert "connection reset" in events[-1][1]["detail"]
+
+
+# ====================
+# 시맨틱 답변 캐시 테스트
+# ====================
+
+def test_rag_paraphrase_served_from_answer_cache(search_results):
+    """같은 핸드를 검색한 유사 질문 → LLM 호출 없이 cache_hit"""
+    embeddings = {"Phil Ivey bluff strategy?": [1.0, 0.0], "How does Ivey bluff?": [0.99, 0.05]}
+    embed_query = AsyncMock(side_effect=lambda text: embeddings[text])
+    generate_answer = AsyncMock(return_value="Ivey는 리버에서 블러프합니다.")
+    with patch("app.api.rag.vertex_search.embed_query", embed_query), \
+         patch("app.api.rag.llm_service.generate_answer", generate_answer), \
+         patch("app.api.rag.answer_cache", SemanticAnswerCache(similarity_threshold=0.9)):
+        first = client.post("/api/rag", json={"query": "Phil Ivey bluff strategy?"}).json()
+        second = client.post("/api/rag", json={"query": "How does Ivey bluff?"}).json()
+        stream_answer = _token_stream("unused")
+        with patch("app.api.rag.llm_service.stream_answer", stream_answer):
+            events = _events(client.post("/api/rag/stream", json={"query": "How does Ivey bluff?"}))
+
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is True
+    assert second["answer"] == first["answer"]
+    assert second["llm_time_ms"] == 0.0
+    generate_answer.assert_awaited_once()
+    assert events[1] == ("token", {"text": "Ivey는 리버에서 블러프합니다."})
+    assert events[-1][1]["cache_hit"] is True
+    stream_answer.assert_not_called()
+
+
+# ====================
+# LLM 과부하 테스트
+# ====================
+
+def test_rag_llm_overloaded_returns_503(search_results):
+    """생성 대기열 거절 → 503 + Retry-After (500으로 뭉개지지 않음)"""
+    generate_answer = AsyncMock(side_effect=LLMOverloaded("expected_wait", 41.2, 16))
+    with patch("app.api.rag.llm_service.generate_answer", generate_answer):
+        response = client.post("/api/rag", json={"query": "Ivey bluff"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "42"
+    assert response.json()["detail"]["error"] == "llm_overloaded"
+    assert response.json()["detail"]["reason"] == "expected_wait"
+
+
+def test_rag_stream_llm_overloaded_event(search_results):
+    """스트림은 context 이후 status 503 error 이벤트"""
+    stream_answer = _token_stream(LLMOverloaded("queue_full", 12.0, 16))
+    with patch("app.api.rag.llm_service.stream_answer", stream_answer):
+        events = _events(client.post("/api/rag/stream", json={"query": "Ivey bluff"}))
+
+    assert [name for name, _ in events] == ["context", "error"]
+    assert events[-1][1]["status"] == 503
+    assert events[-1][1]["detail"]["retry_after"] == 12
+
+
+# ====================
+# lifespan 테스트
+# ====================
+
+def test_llm_client_usable_after_lifespan_restart(monkeypatch):
+    """shutdown(공유 풀 종료) → 같은 프로세스에서 다시 startup해도 LLM 클라이언트는 열린 풀 사용"""
+    from app import main
+
+    # 네트워크를 타는 startup 작업(인덱스 빌드 / Vertex warmup)은 끔 → lifespan만 빠르게 두 번
+    monkeypatch.setattr(main.settings, "autocomplete_index_enabled", False)
+    monkeypatch.setattr(main.settings, "bm25_enabled", False)
+    monkeypatch.setattr(main.settings, "vertex_warmup_on_startup", False)
+
+    with TestClient(app):
+        first_pool = rag.llm_service.client._client
+    assert first_pool.is_closed
+
+    with TestClient(app):
+        pool = rag.llm_service.client._client
+        assert pool is not first_pool
+        assert not pool.is_closed
@@ -0,0 +1,154 @@
+"""
+테스트: 검색 API 엔드포인트
+1:1 페어링: backend/app/api/search.py
+
+Coverage:
+- 커서 페이지네이션: 첫 페이지만 검색, 다음 페이지는 캐시된 후보 구간만 hydration
+- 마지막 페이지 next_cursor 없음, 잘못된 커서 400
+- 만료된 커서: 다시 검색해 같은 offset부터 반환
+- 후보 깊이: 첫 검색은 top_k × search_cursor_page_multiple, 잘린 목록을 다 넘기면 그 offset부터 더 깊게
+- 스트리밍: lexical 결과 먼저, 핸드당 한 번, done 이벤트에 최종 순위, SSE 프레임, 오류 이벤트
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
+
+from app.main import app
+from app.services.search_cursor import SearchCursorStore
+
+client = TestClient(app)
+
+
+def _hand(i: int) -> dict:
+    return {
+        "hand_id": f"hand_{i:03d}",
+        "distance": 1 - i / 100,
+        "hero_name": "Phil Ivey",
+        "description": f"hand {i}",
+        "pot_bb": 100.0,
+        "street": "River",
+        "action": "Call",
+        "tags": [],
+    }
+
+
+@pytest.fixture
+def search_mocks():
+    """Vertex 검색(후보 12개) + hydration(그대로 반환) + 새 커서 저장소"""
+    search = AsyncMock(return_value=[_hand(i) for i in range(12)])
+    hydrate = AsyncMock(side_effect=lambda results: list(results))
+    with patch("app.api.search.vertex_search.search", search), \
+         patch("app.api.search.hand_hydrator.hydrate", hydrate), \
+         patch("app.api.search.cursor_store", SearchCursorStore()) as store:
+        yield search, hydrate, store
+
+
+def test_search_pages_with_cursor(search_mocks):
+    """다음 페이지는 임베딩 / ANN 호출 없이 캐시된 후보 구간만"""
+    search, hydrate, _ = search_mocks
+
+    first = client.get("/api/search?query=river bluff&top_k=5").json()
+    second = client.get(f"/api/search?query=river bluff&top_k=5&cursor={first['next_cursor']}").json()
+    third = client.get(f"/api/search?query=river bluff&top_k=5&cursor={second['next_cursor']}").json()
+
+    assert search.await_count == 1
+    assert [r["hand_id"] for r in first["results"]] == [f"hand_{i:03d}" for i in range(5)]
+    assert [r["hand_id"] for r in second["results"]] == [f"hand_{i:03d}" for i in range(5, 10)]
+    assert [r["hand_id"] for r in third["results"]] == ["hand_010", "hand_011"]
+    assert third["next_cursor"] is None
+    assert [len(call.args[0]) for call in hydrate.await_args_list] == [5, 5, 2]
+
+
+def test_search_cursor_for_other_query_searches_again(search_mocks):
+    """다른 쿼리의 커서 / 만료된 커서 → 다시 검색해 같은 offset부터"""
+    search, _, _ = search_mocks
+    first = client.get("/api/search?query=river bluff&top_k=5").json()
+
+    response = client.get(f"/api/search?query=hero call&top_k=5&cursor={first['next_cursor']}")
+
+    assert response.status_code == 200
+    assert search.await_count == 2
+    assert search.await_args.kwargs["top_k"] >= 10
+    assert response.json()["results"][0]["hand_id"] == "hand_005"
+
+
+def test_search_fetches_shallow_then_deeper_on_exhaustion(search_mocks):
+    """첫 검색은 top_k × 배수만, 캐시된 후보를 다 넘기면 그 offset부터 다시 검색"""
+    search, _, _ = search_mocks
+    search.side_effect = lambda **kwargs: [_hand(i) for i in range(kwargs["top_k"])]
+
+    first = client.get("/api/search?query=river bluff&top_k=2").json()
+    cursor = first["next_cursor"]
+    for _ in range(3):
+        cursor = client.get(f"/api/search?query=river bluff&top_k=2&cursor={cursor}").json()["next_cursor"]
+    fifth = client.get(f"/api/search?query=river bluff&top_k=2&cursor={cursor}").json()
+
+    assert [call.kwargs["top_k"] for call in search.await_args_list] == [8, 16]
+    assert [r["hand_id"] for r in fifth["results"]] == ["hand_008", "hand_009"]
+    assert fifth["next_cursor"] is not None
+
+
+def test_search_invalid_cursor_returns_400(search_mocks):
+    """해석할 수 없는 커서 → 400"""
+    response = client.get("/api/search?query=river bluff&cursor=not-a-cursor!")
+
+    assert response.status_code == 400
+
+
+# ====================
+# 스트리밍 테스트
+# ====================
+
+def _stream(*stages):
+    async def search_stream(**kwargs):
+        for stage in stages:
+            if isinstance(stage, Exception):
+                raise stage
+            yield stage
+
+    return search_stream
+
+
+def test_search_stream_sends_lexical_results_first():
+    """lexical 결과 먼저 전송, final에서는 새 핸드만, done에 최종 순위"""
+    stream = _stream(
+        ("lexical", [_hand(1), _hand(2)]),
+        ("final", [_hand(3), _hand(1)]),
+    )
+    hydrate = AsyncMock(side_effect=lambda results: list(results))
+    with patch("app.api.search.vertex_search.search_stream", stream), \
+         patch("app.api.search.hand_hydrator.hydrate", hydrate):
+        response = client.get("/api/search/stream?query=ivey bluff&top_k=2")
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [(e["type"], e.get("stage"), e.get("result", {}).get("hand_id")) for e in events] == [
+        ("result", "lexical", "hand_001"),
+        ("result", "lexical", "hand_002"),
+        ("result", "final", "hand_003"),
+        ("done", None, None),
+    ]
+    assert events[-1]["hand_ids"] == ["hand_003", "hand_001"]
+    assert events[-1]["first_result_ms"] <= events[-1]["search_time_ms"]
+    assert [len(call.args[0]) for call in hydrate.await_args_list] == [2, 1]
+
+
+def test_search_stream_sse_and_error_event():
+    """Accept: text/event-stream → SSE 프레임, 스트림 도중 오류는 error 이벤트"""
+    stream = _stream(("lexical", [_hand(1)]), RuntimeError("vector leg failed"))
+    hydrate = AsyncMock(side_effect=lambda results: list(results))
+    with patch("app.api.search.vertex_search.search_stream", stream), \
+         patch("app.api.search.hand_hydrator.hydrate", hydrate):
+        response = client.get(
+            "/api/search/stream?query=ivey bluff", headers={"Accept": "text/event-stream"}
+        )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = response.text.strip().split("\n\n")
+    assert frames[0].startswith("event: result\ndata: ")
+    assert frames[-1].startswith("event: error\n")
+    assert "vector leg failed" in frames[-1]
@@ -0,0 +1,185 @@
+"""
+단위 테스트: 적응형 over-fetch
+1:1 페어링: backend/app/services/adaptive_fetch.py
+
+Coverage:
+- SelectivityEstimator: 첫 관측 / EWMA / 하한
+- AdaptiveFetcher: 생존 비율이 높으면 1라운드, 부족하면 기하급수 증가
+- 종료 조건: 인덱스 소진 / max_neighbors / 지연 예산
+- 이전 요청의 생존 비율로 다음 요청의 첫 num_neighbors 결정
+- VertexSearchService._vector_leg: 라운드마다 num_neighbors 전달
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.adaptive_fetch import AdaptiveFetcher, SelectivityEstimator
+
+
+# ====================
+# Fixtures
+# ====================
+
+class FakeIndex:
+    """num_neighbors → 순위순 결과 (every번째 결과만 임계값 통과, size개에서 소진)"""
+
+    def __init__(self, size: int = 1000, every: int = 1):
+        self.size = size
+        self.every = every
+        self.calls = []
+
+    async def __call__(self, num_neighbors: int):
+        self.calls.append(num_neighbors)
+        return [
+            {"rank": i, "distance": 0.9 if i % self.every == 0 else 0.1}
+            for i in range(min(num_neighbors, self.size))
+        ]
+
+
+def keep(hit: dict) -> bool:
+    return hit["distance"] >= 0.5
+
+
+class FakeClock:
+    def __init__(self, step: float = 0.0):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+# ====================
+# SelectivityEstimator 테스트
+# ====================
+
+def test_estimator_ewma_and_floor():
+    """첫 관측은 그대로, 이후 EWMA, 하한 적용"""
+    estimator = SelectivityEstimator(alpha=0.5, initial=0.5, floor=0.05)
+    assert estimator.estimate("k") == 0.5
+
+    estimator.record("k", fetched=10, kept=2)
+    assert estimator.estimate("k") == pytest.approx(0.2)
+
+    estimator.record("k", fetched=10, kept=6)
+    assert estimator.estimate("k") == pytest.approx(0.4)
+
+    estimator.record("k", fetched=0, kept=0)
+    assert estimator.estimate("k") == pytest.approx(0.4)
+
+    estimator.record("zero", fetched=10, kept=0)
+    assert estimator.estimate("zero") == 0.05
+
+
+# ====================
+# AdaptiveFetcher 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_single_round_when_selective_enough():
+    """생존 비율이 충분하면 1라운드로 top_k 확보"""
+    index = FakeIndex()
+    fetcher = AdaptiveFetcher(SelectivityEstimator(initial=0.5))
+
+    outcome = await fetcher.fetch(index, keep, top_k=10, key="t")
+
+    assert outcome.rounds == 1
+    assert index.calls == [20]
+    assert [hit["rank"] for hit in outcome.results] == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_grows_geometrically_until_top_k():
+    """결과가 부족하면 num_neighbors 증가 (최소 growth 배, 관측 비율로 점프)"""
+    index = FakeIndex(every=5)
+    fetcher = AdaptiveFetcher(SelectivityEstimator(alpha=0.5, initial=1.0), growth=2.0)
+
+    outcome = await fetcher.fetch(index, keep, top_k=10, key="t")
+
+    assert index.calls == [10, 50]
+    assert outcome.rounds == 2
+    assert len(outcome.results) == 10
+    assert fetcher.stats()["short_results"] == 0
+
+
+@pytest.mark.asyncio
+async def test_next_query_starts_from_learned_selectivity():
+    """이전 요청의 생존 비율로 다음 요청은 1라운드"""
+    index = FakeIndex(every=5)
+    fetcher = AdaptiveFetcher(SelectivityEstimator(alpha=0.5, initial=1.0))
+
+    first = await fetcher.fetch(index, keep, top_k=10, key="t")
+    index.calls.clear()
+    second = await fetcher.fetch(index, keep, top_k=10, key="t")
+
+    assert first.rounds == 2
+    assert second.rounds == 1
+    assert index.calls == [50]
+
+
+@pytest.mark.asyncio
+async def test_stops_when_index_exhausted():
+    """요청보다 적게 반환되면 더 늘려도 소용없음"""
+    index = FakeIndex(size=15, every=3)
+    fetcher = AdaptiveFetcher(SelectivityEstimator(initial=1.0))
+
+    outcome = await fetcher.fetch(index, keep, top_k=10, key="t")
+
+    assert outcome.exhausted is True
+    assert len(outcome.results) == 5
+    assert fetcher.stats()["short_results"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stops_at_max_neighbors():
+    """num_neighbors 상한 도달 시 종료"""
+    index = FakeIndex(every=100)
+    fetcher = AdaptiveFetcher(SelectivityEstimator(initial=1.0), max_neighbors=50)
+
+    outcome = await fetcher.fetch(index, keep, top_k=10, key="t")
+
+    assert max(index.calls) == 50
+    assert outcome.num_neighbors == 50
+    assert len(outcome.results) == 1
+
+
+@pytest.mark.asyncio
+async def test_stops_when_budget_spent():
+    """지연 예산을 넘기면 추가 라운드 없음"""
+    index = FakeIndex(every=100)
+    fetcher = AdaptiveFetcher(
+        SelectivityEstimator(initial=1.0), budget_ms=100, clock=FakeClock(step=0.2)
+    )
+
+    outcome = await fetcher.fetch(index, keep, top_k=10, key="t")
+
+    assert outcome.rounds == 1
+    assert fetcher.stats()["queries"] == 1
+
+
+# ====================
+# VertexSearchService 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_vector_leg_passes_num_neighbors_per_round():
+    """_vector_leg: 임계값 통과 결과가 부족하면 더 큰 num_neighbors로 재조회"""
+    from app.services.vertex_search import VertexSearchService
+
+    service = VertexSearchService.__new__(VertexSearchService)
+    service.adaptive_fetcher = AdaptiveFetcher(SelectivityEstimator(initial=1.0))
+    service._generate_embedding = AsyncMock(return_value=[0.1])
+
+    async def vector_search(embedding, top_k, filters=None, num_neighbors=None):
+        return [
+            {"hand_id": f"hand_{i}", "distance": 0.9 if i % 2 == 0 else 0.1}
+            for i in range(num_neighbors)
+        ]
+
+    service._vector_search = AsyncMock(side_effect=vector_search)
+
+    results = await service._vector_leg("river bluff", 5, 0.5)
+
+    assert [r["hand_id"] for r in results] == ["hand_0", "hand_2", "hand_4", "hand_6", "hand_8"]
+    assert [c.kwargs["num_neighbors"] for c in service._vector_search.call_args_list] == [5, 10]
@@ -0,0 +1,74 @@
+"""
+단위 테스트: RAG 시맨틱 답변 캐시
+1:1 페어링: backend/app/services/answer_cache.py
+
+Coverage:
+- 유사 쿼리 + 같은 hand_id 집합(순서 무관) → hit, 컨텍스트 / 생성 옵션이 다르면 miss
+- 유사도 임계값 미달 miss, 가장 가까운 항목 선택
+- TTL 만료 / LRU 제거, 제로 벡터 / 빈 답변 미저장
+"""
+
+from app.services.answer_cache import SemanticAnswerCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+HANDS = ["hand_001", "hand_002"]
+
+
+def test_lookup_requires_same_context_and_similar_query():
+    """같은 컨텍스트 + 유사 쿼리만 hit"""
+    cache = SemanticAnswerCache(similarity_threshold=0.9)
+    cache.store([1.0, 0.0], HANDS, "answer", variant=True)
+
+    assert cache.lookup([0.98, 0.1], list(reversed(HANDS)), variant=True) == "answer"
+    assert cache.lookup([0.98, 0.1], ["hand_001"], variant=True) is None
+    assert cache.lookup([0.98, 0.1], HANDS, variant=False) is None
+    assert cache.lookup([0.0, 1.0], HANDS, variant=True) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+
+
+def test_lookup_picks_most_similar_entry():
+    """같은 컨텍스트에 여러 답변 → 가장 가까운 쿼리의 답변"""
+    cache = SemanticAnswerCache(similarity_threshold=0.5)
+    cache.store([1.0, 0.0], HANDS, "first")
+    cache.store([0.0, 1.0], HANDS, "second")
+
+    assert cache.lookup([0.3, 0.9], HANDS) == "second"
+
+
+def test_ttl_and_lru_eviction():
+    """TTL 만료 / max_entries 초과 시 제거"""
+    clock = FakeClock()
+    cache = SemanticAnswerCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.store([1.0, 0.0], ["hand_001"], "a")
+
+    clock.now = 11
+    assert cache.lookup([1.0, 0.0], ["hand_001"]) is None
+    assert cache.stats()["size"] == 0
+
+    cache.store([1.0, 0.0], ["hand_001"], "a")
+    cache.store([1.0, 0.0], ["hand_002"], "b")
+    cache.lookup([1.0, 0.0], ["hand_001"])
+    cache.store([1.0, 0.0], ["hand_003"], "c")
+
+    assert cache.lookup([1.0, 0.0], ["hand_002"]) is None
+    assert cache.lookup([1.0, 0.0], ["hand_001"]) == "a"
+    assert cache.stats()["contexts"] == 2
+
+
+def test_zero_vector_and_empty_answer_not_stored():
+    """Fallback 제로 벡터 / 빈 답변은 저장하지 않음"""
+    cache = SemanticAnswerCache()
+    cache.store([0.0, 0.0], HANDS, "answer")
+    cache.store([1.0, 0.0], HANDS, "")
+
+    assert cache.stats()["size"] == 0
+    assert cache.lookup([0.0, 0.0], HANDS) is None
@@ -0,0 +1,256 @@
+"""
+단위 테스트: 비동기 I/O 계층 (이름 붙은 스레드 풀)
+1:1 페어링: backend/app/services/async_io.py
+
+Coverage:
+- run_blocking: 이름 붙은 풀에서 실행, 예외 전파, contextvars 유지
+- run_blocking timeout: 호출자는 TimeoutError, 실행 중인 호출은 끝날 때까지 in_flight 집계
+- 풀 크기 상한 (동시 실행 스레드 수 제한), 상태 조회
+- BigQuery 쿼리에 result(timeout=) 전달
+- 이벤트 루프 차단 감지: 느린 동기 GCP 호출 중에도 루프 지연 < MAX_LOOP_LAG_MS (서비스 + HTTP 핸들러)
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from app.services.async_io import io_pool_stats, run_blocking, shutdown_io_pools
+from app.services.bigquery import BigQueryAutocompleteService, BigQueryService
+from app.services.vertex_search import VertexSearchService
+
+# 핸들러가 이벤트 루프를 이 시간 이상 막으면 실패
+MAX_LOOP_LAG_MS = 50
+
+# 느린 동기 GCP 호출 시뮬레이션 (MAX_LOOP_LAG_MS보다 충분히 길게)
+SLOW_CALL_SECONDS = 0.2
+
+
+# ====================
+# Helpers
+# ====================
+
+class LoopLagMonitor:
+    """1ms 주기 tick의 최대 지연을 측정 (루프가 막히면 tick이 밀림)"""
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.max_lag_ms = 0.0
+        self._task = None
+        self._tick_start = None
+
+    def _record(self):
+        lag_ms = (time.perf_counter() - self._tick_start - self.interval) * 1000
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    async def _run(self):
+        while True:
+            self._tick_start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self._record()
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._run())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc):
+        # 진행 중인 tick도 반영 (루프를 막은 뒤 양보 없이 끝난 경우)
+        self._record()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+def slow_query_job(rows):
+    """result()가 SLOW_CALL_SECONDS 동안 스레드를 막는 BigQuery job mock"""
+    job = Mock()
+
+    def result(timeout=None):
+        time.sleep(SLOW_CALL_SECONDS)
+        return rows
+
+    job.result.side_effect = result
+    return job
+
+
+class Row:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+@pytest.fixture(autouse=True)
+def reset_pools():
+    yield
+    shutdown_io_pools(wait=True)
+
+
+# ====================
+# run_blocking 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_run_blocking_uses_named_pool():
+    """풀 이름이 스레드 이름에 반영"""
+    name = await run_blocking("bigquery", lambda: threading.current_thread().name)
+
+    assert name.startswith("io-bigquery")
+    assert "bigquery" in io_pool_stats()
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_propagates_exception():
+    """동기 함수 예외는 호출자에게 그대로 전파"""
+    def fail():
+        raise RuntimeError("BigQuery unavailable")
+
+    with pytest.raises(RuntimeError, match="BigQuery unavailable"):
+        await run_blocking("bigquery", fail)
+
+    assert io_pool_stats()["bigquery"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_keeps_contextvars():
+    """contextvars(로깅 컨텍스트 등)를 풀 스레드에서도 유지"""
+    request_id = contextvars.ContextVar("request_id")
+    request_id.set("req-123")
+
+    assert await run_blocking("firestore", request_id.get) == "req-123"
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_timeout_keeps_call_in_flight():
+    """타임아웃 시 호출자는 즉시 포기, 스레드의 호출은 끝날 때까지 in_flight에 남음"""
+    release = threading.Event()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await run_blocking("vertex", release.wait, 5, timeout=0.01)
+
+    assert io_pool_stats()["vertex"]["in_flight"] == 1
+    release.set()
+    await asyncio.sleep(0.05)
+    assert io_pool_stats()["vertex"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bigquery_query_passes_result_timeout():
+    """BigQuery job 대기에 bigquery_query_timeout_seconds 상한"""
+    from app.config import settings
+
+    service = BigQueryService.__new__(BigQueryService)
+    service.mock_mode = False
+    service.client = Mock()
+    service.client.query.return_value.result.return_value = []
+
+    await service.get_hand_by_id("hand_001")
+
+    service.client.query.return_value.result.assert_called_once_with(
+        timeout=settings.bigquery_query_timeout_seconds
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_size_bounded():
+    """풀 크기 이상으로 동시에 실행되지 않음 (미등록 이름은 기본 크기)"""
+    from app.config import settings
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    await asyncio.gather(*(run_blocking("bounded_test", work) for _ in range(12)))
+
+    assert peak <= settings.io_pool_default_workers
+    assert io_pool_stats()["bounded_test"]["max_workers"] == settings.io_pool_default_workers
+
+
+# ====================
+# 이벤트 루프 차단 감지 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_bigquery_autocomplete_does_not_block_loop():
+    """느린 BigQuery 자동완성 쿼리 중에도 이벤트 루프가 막히지 않음"""
+    client = Mock()
+    client.query.return_value = slow_query_job([Row(name="Phil Ivey")])
+    service = BigQueryAutocompleteService(client=client)
+
+    async with LoopLagMonitor() as monitor:
+        results = await service.get_autocomplete_suggestions("Phil", limit=5)
+
+    assert results == ["Phil Ivey"]
+    assert monitor.max_lag_ms < MAX_LOOP_LAG_MS
+
+
+@pytest.mark.asyncio
+async def test_bigquery_get_hand_does_not_block_loop():
+    """느린 핸드 상세 조회 중에도 이벤트 루프가 막히지 않음"""
+    service = BigQueryService.__new__(BigQueryService)
+    service.mock_mode = False
+    service.client = Mock()
+    service.client.query.return_value = slow_query_job([])
+
+    async with LoopLagMonitor() as monitor:
+        hand = await service.get_hand_by_id("hand_001")
+
+    assert hand is None
+    assert monitor.max_lag_ms < MAX_LOOP_LAG_MS
+
+
+@pytest.mark.asyncio
+async def test_vertex_vector_search_does_not_block_loop():
+    """느린 Vector Search 호출 중에도 이벤트 루프가 막히지 않음"""
+    service = VertexSearchService.__new__(VertexSearchService)
+    service.mock_mode = False
+    service.vector_backend = "vertex"
+
+    def slow_find_neighbors(query_embedding, num_neighbors):
+        time.sleep(SLOW_CALL_SECONDS)
+        neighbor = MagicMock(id="hand_001", distance=0.9)
+        return [[neighbor]]
+
+    service._find_neighbors_sync = slow_find_neighbors
+
+    async with LoopLagMonitor() as monitor:
+        results = await service._vector_search([0.1] * 768, top_k=1)
+
+    assert results == [{"hand_id": "hand_001", "distance": 0.9}]
+    assert monitor.max_lag_ms < MAX_LOOP_LAG_MS
+
+
+@pytest.mark.asyncio
+async def test_hand_detail_handler_does_not_block_loop():
+    """HTTP 핸들러 수준: 느린 BigQuery 조회 중인 /api/hands 요청이 이벤트 루프를 막지 않음"""
+    import httpx
+
+    from app.api import hands
+    from app.main import app
+
+    service = BigQueryService.__new__(BigQueryService)
+    service.mock_mode = False
+    service.client = Mock()
+    service.client.query.return_value = slow_query_job([])
+
+    with patch.object(hands, "bigquery_service", service):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            async with LoopLagMonitor() as monitor:
+                response = await client.get("/api/hands/hand_001")
+
+    assert response.status_code == 404
+    assert monitor.max_lag_ms < MAX_LOOP_LAG_MS
@@ -0,0 +1,149 @@
+"""
+단위 테스트: 자동완성 Prefix 결과 캐시
+1:1 페어링: backend/app/services/autocomplete_cache.py
+
+Coverage:
+- 같은 prefix hit (대소문자 무관, limit 처리)
+- narrowing: 짧은 prefix의 완전한 결과를 로컬 필터링 / 불완전한 결과는 재사용 안 함
+- TTL 만료, LRU 제거, 카운터
+- BigQueryAutocompleteService 연동: 연속 키 입력 시 BigQuery 1회 조회
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from app.services.autocomplete_cache import PrefixResultCache
+from app.services.bigquery import BigQueryAutocompleteService
+
+
+# ====================
+# Fixtures
+# ====================
+
+@pytest.fixture
+def clock():
+    return {"now": 0.0}
+
+
+@pytest.fixture
+def cache(clock):
+    return PrefixResultCache(max_entries=100, ttl_seconds=60, clock=lambda: clock["now"])
+
+
+PH_RESULTS = ["Phil Ivey", "Phil Hellmuth", "Philip Ng", "Phil Galfond"]
+
+
+# ====================
+# 조회 테스트
+# ====================
+
+def test_exact_hit_case_insensitive(cache):
+    """같은 prefix는 대소문자 무관하게 hit"""
+    cache.put("Ph", limit=10, results=PH_RESULTS)
+
+    assert cache.get("pH", limit=10) == PH_RESULTS
+    assert cache.get("ph", limit=2) == PH_RESULTS[:2]
+    assert cache.stats()["hits"] == 2
+
+
+def test_incomplete_result_needs_larger_limit(cache):
+    """limit만큼 꽉 찬(불완전한) 결과는 더 큰 limit 요청에 답하지 않음"""
+    cache.put("ph", limit=2, results=PH_RESULTS[:2])
+
+    assert cache.get("ph", limit=2) == PH_RESULTS[:2]
+    assert cache.get("ph", limit=5) is None
+
+
+def test_narrowing_from_complete_prefix(cache):
+    """완전한 짧은 prefix 결과를 필터링해 긴 prefix에 응답"""
+    cache.put("ph", limit=10, results=PH_RESULTS)
+
+    assert cache.get("phil", limit=10) == PH_RESULTS
+    assert cache.get("Phil ", limit=10) == ["Phil Ivey", "Phil Hellmuth", "Phil Galfond"]
+    assert cache.get("phil i", limit=10) == ["Phil Ivey"]
+    assert cache.get("philx", limit=10) == []
+
+    stats = cache.stats()
+    assert stats["narrowing_hits"] == 4
+    assert stats["misses"] == 0
+
+
+def test_no_narrowing_from_incomplete_prefix(cache):
+    """불완전한 결과는 narrowing에 사용하지 않음 (누락 가능)"""
+    cache.put("ph", limit=2, results=PH_RESULTS[:2])
+
+    assert cache.get("phili", limit=5) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_narrowed_entry_keeps_parent_expiry(cache, clock):
+    """narrowing으로 만든 항목은 부모보다 오래 유지되지 않음"""
+    cache.put("ph", limit=10, results=PH_RESULTS)
+    clock["now"] = 50
+    assert cache.get("phil", limit=5) is not None
+
+    clock["now"] = 61
+    assert cache.get("phil", limit=5) is None
+
+
+# ====================
+# 만료 / 제거 테스트
+# ====================
+
+def test_ttl_expiry(cache, clock):
+    """TTL 경과 시 miss"""
+    cache.put("tom", limit=10, results=["Tom Dwan"])
+    clock["now"] = 61
+
+    assert cache.get("tom", limit=10) is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction(clock):
+    """최대 항목 수 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = PrefixResultCache(max_entries=2, ttl_seconds=60, clock=lambda: clock["now"])
+    cache.put("aa", limit=5, results=["Aa"])
+    cache.put("bb", limit=5, results=["Bb"])
+    cache.get("aa", limit=5)
+    cache.put("cc", limit=5, results=["Cc"])
+
+    assert cache.get("bb", limit=5) is None
+    assert cache.get("aa", limit=5) == ["Aa"]
+    assert cache.stats()["evictions"] == 1
+
+
+# ====================
+# BigQueryAutocompleteService 연동 테스트
+# ====================
+
+class Row:
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.mark.asyncio
+async def test_service_keystrokes_query_bigquery_once(cache):
+    """"ph" → "phi" → "phil" → "phil i" 연속 입력 시 BigQuery는 첫 입력만 조회"""
+    client = Mock()
+    job = Mock()
+    job.result.return_value = [Row(name) for name in PH_RESULTS]
+    client.query.return_value = job
+    service = BigQueryAutocompleteService(client=client, cache=cache)
+
+    for prefix in ["ph", "phi", "phil", "phil i"]:
+        results = await service.get_autocomplete_suggestions(prefix, limit=10)
+
+    assert results == ["Phil Ivey"]
+    assert client.query.call_count == 1
+    assert cache.stats()["narrowing_hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_service_does_not_cache_errors(cache):
+    """BigQuery 에러로 인한 빈 결과는 캐시하지 않음"""
+    client = Mock()
+    client.query.side_effect = Exception("BigQuery timeout")
+    service = BigQueryAutocompleteService(client=client, cache=cache)
+
+    assert await service.get_autocomplete_suggestions("phil", limit=5) == []
+    assert len(cache) == 0
@@ -0,0 +1,263 @@
+"""
+단위 테스트: 자동완성 인메모리 Prefix 인덱스
+1:1 페어링: backend/app/services/autocomplete_index.py
+
+Coverage:
+- PrefixIndex: 빈도순 정렬, 대소문자 무관, 미리 계산된 노드 / 깊은 prefix 경로
+- AutocompleteIndex: 빌드, 재빌드 실패 시 기존 인덱스 유지, 상태 조회, 오타 교정
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from app.services.autocomplete_index import PrefixIndex, AutocompleteIndex
+
+
+# ====================
+# Fixtures
+# ====================
+
+@pytest.fixture
+def name_frequencies():
+    """(이름, 빈도) 샘플"""
+    return [
+        ("Phil Hellmuth", 30),
+        ("Phil Ivey", 50),
+        ("Philip Ng", 5),
+        ("Phil Galfond", 12),
+        ("Tom Dwan", 40),
+        ("Tom Marchese", 8),
+        ("Junglemann", 20),
+    ]
+
+
+# ====================
+# PrefixIndex 테스트
+# ====================
+
+def test_prefix_index_frequency_order(name_frequencies):
+    """짧은 prefix: 미리 계산된 top-k가 빈도순"""
+    index = PrefixIndex(name_frequencies, top_k=10)
+
+    assert index.search("Ph", limit=10) == [
+        "Phil Ivey", "Phil Hellmuth", "Phil Galfond", "Philip Ng"
+    ]
+
+
+def test_prefix_index_deep_prefix(name_frequencies):
+    """precompute_depth보다 긴 prefix는 구간 탐색으로 계산"""
+    index = PrefixIndex(name_frequencies, top_k=10, precompute_depth=2)
+
+    assert index.search("Phil ", limit=10) == ["Phil Ivey", "Phil Hellmuth", "Phil Galfond"]
+    assert index.search("Philip", limit=10) == ["Philip Ng"]
+
+
+def test_prefix_index_case_insensitive(name_frequencies):
+    """대소문자 및 연속 공백 무관"""
+    index = PrefixIndex(name_frequencies)
+
+    assert index.search("TOM", limit=5) == index.search("tom", limit=5)
+    assert index.search("phil   ivey", limit=5) == ["Phil Ivey"]
+
+
+def test_prefix_index_limit(name_frequencies):
+    """limit 적용 (top_k보다 큰 limit도 정확히 계산)"""
+    index = PrefixIndex(name_frequencies, top_k=2)
+
+    assert index.search("Phil", limit=2) == ["Phil Ivey", "Phil Hellmuth"]
+    assert len(index.search("Phil", limit=4)) == 4
+
+
+def test_prefix_index_no_match(name_frequencies):
+    """매칭 없음 / 빈 입력"""
+    index = PrefixIndex(name_frequencies)
+
+    assert index.search("xyz", limit=5) == []
+    assert index.search("   ", limit=5) == []
+
+
+def test_prefix_index_merges_case_variants():
+    """대소문자만 다른 이름은 빈도 합산, 최빈 표기 사용"""
+    index = PrefixIndex([("Phil Ivey", 10), ("phil ivey", 3), ("Phil Hellmuth", 12)])
+
+    assert len(index) == 2
+    assert index.search("phil", limit=5) == ["Phil Ivey", "Phil Hellmuth"]
+
+
+def test_prefix_index_skips_empty_names():
+    """None/빈 이름 제외"""
+    index = PrefixIndex([(None, 5), ("", 3), ("Tom Dwan", 1)])
+
+    assert len(index) == 1
+
+
+# ====================
+# AutocompleteIndex 테스트
+# ====================
+
+def test_autocomplete_index_not_ready():
+    """빌드 전에는 준비되지 않음"""
+    index = AutocompleteIndex(bq_service=Mock())
+
+    assert index.is_ready is False
+    assert index.search("Phil") == []
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_index_rebuild(name_frequencies):
+    """BigQuery 빈도 사전으로 재빌드"""
+    bq_service = Mock()
+    bq_service.get_name_frequencies.return_value = name_frequencies
+    index = AutocompleteIndex(bq_service=bq_service, max_names=1000)
+
+    count = await index.rebuild()
+
+    assert count == len(name_frequencies)
+    assert index.is_ready is True
+    assert index.search("Tom", limit=1) == ["Tom Dwan"]
+    bq_service.get_name_frequencies.assert_called_once_with(1000)
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_index_rebuild_failure_keeps_previous(name_frequencies):
+    """재빌드 실패 시 기존 인덱스 유지"""
+    bq_service = Mock()
+    bq_service.get_name_frequencies.return_value = name_frequencies
+    index = AutocompleteIndex(bq_service=bq_service)
+    await index.rebuild()
+
+    bq_service.get_name_frequencies.side_effect = Exception("BigQuery unavailable")
+    count = await index.rebuild()
+
+    assert count == 0
+    assert index.is_ready is True
+    assert index.search("Junglem") == ["Junglemann"]
+    assert index.stats()["build_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_index_background_refresh(name_frequencies):
+    """백그라운드 태스크가 첫 빌드를 수행하고 정상 종료"""
+    import asyncio
+
+    bq_service = Mock()
+    bq_service.get_name_frequencies.return_value = name_frequencies
+    index = AutocompleteIndex(bq_service=bq_service, refresh_seconds=3600)
+
+    index.start_background_refresh()
+    for _ in range(100):
+        if index.is_ready:
+            break
+        await asyncio.sleep(0.01)
+    await index.stop()
+
+    assert index.is_ready is True
+    assert index.stats()["build_count"] == 1
+
+
+def test_autocomplete_index_typo_correction(name_frequencies):
+    """같은 사전으로 오타 교정 후보 생성"""
+    index = AutocompleteIndex(bq_service=Mock(), typo_max_distance=2)
+    index.build(name_frequencies)
+
+    assert index.correct("Junglman") == ["Junglemann"]
+    assert index.correct("Phil Ivy", limit=1) == ["Phil Ivey"]
+
+
+# ====================
+# EntityDictionary 테스트
+# ====================
+
+@pytest.fixture
+def entity_frequencies():
+    """(텍스트, 타입, 빈도) 샘플"""
+    return [
+        ("river call", "street_action", 9),
+        ("river raise", "street_action", 7),
+        ("river bluff", "street_action", 12),
+        ("BAD_BEAT", "tag", 6),
+        ("BLUFF", "tournament", 15),
+        ("BLUFF_CATCH", "tag", 3),
+        ("mpp_2024", "tournament", 17),
+    ]
+
+
+def test_prefix_index_top_returns_counts(name_frequencies):
+    """top(): search()와 같은 순서로 빈도 포함"""
+    index = PrefixIndex(name_frequencies)
+
+    assert index.top("Tom", limit=2) == [("Tom Dwan", 40), ("Tom Marchese", 8)]
+    assert [name for name, _ in index.top("Phil", limit=3)] == index.search("Phil", limit=3)
+
+
+def test_prefix_index_underscore_as_space():
+    """'_'는 공백과 동일 취급 ("bad beat" → "BAD_BEAT")"""
+    index = PrefixIndex([("BAD_BEAT", 6), ("BADUGI", 1)])
+
+    assert index.search("bad b") == ["BAD_BEAT"]
+    assert index.search("bad_") == ["BAD_BEAT"]
+
+
+def test_entity_dictionary_grouped_by_type(entity_frequencies, name_frequencies):
+    """타입 그룹 순서, 그룹 내 빈도순, 선수명 인덱스 재사용"""
+    from app.services.autocomplete_index import EntityDictionary
+    from app.services.entity_dictionary import EntitySuggestion
+
+    players = PrefixIndex(name_frequencies)
+    entities = EntityDictionary(entity_frequencies, players=players)
+
+    assert entities.search("riv") == [
+        EntitySuggestion("river bluff", "street_action", 12),
+        EntitySuggestion("river call", "street_action", 9),
+        EntitySuggestion("river raise", "street_action", 7),
+    ]
+    assert [(e.text, e.type) for e in entities.search("bl")] == [
+        ("BLUFF_CATCH", "tag"), ("BLUFF", "tournament")
+    ]
+    assert entities.search("Tom", limit_per_type=1) == [EntitySuggestion("Tom Dwan", "player", 40)]
+    assert entities.sizes()["player"] == len(players)
+
+
+def test_entity_dictionary_type_filter_and_limit(entity_frequencies):
+    """types 필터 / 타입별 limit, 알 수 없는 타입 무시"""
+    from app.services.autocomplete_index import EntityDictionary
+
+    entities = EntityDictionary(entity_frequencies + [("x", "unknown", 1)])
+
+    assert [e.text for e in entities.search("b", types=["tournament"])] == ["BLUFF"]
+    assert [e.text for e in entities.search("river", limit_per_type=1)] == ["river bluff"]
+    assert "unknown" not in entities.sizes()
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_index_rebuild_with_entities(name_frequencies, entity_frequencies):
+    """재빌드 시 엔티티 사전도 함께 교체"""
+    bq_service = Mock()
+    bq_service.get_name_frequencies.return_value = name_frequencies
+    bq_service.get_entity_frequencies.return_value = entity_frequencies
+    index = AutocompleteIndex(bq_service=bq_service)
+
+    await index.rebuild()
+
+    assert [e.text for e in index.suggest_entities("river", limit_per_type=2)] == [
+        "river bluff", "river call"
+    ]
+    assert index.stats()["entities"]["street_action"] == 3
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_index_entity_failure_keeps_names(name_frequencies, entity_frequencies):
+    """엔티티 조회 실패: 선수명 인덱스는 재빌드, 직전 엔티티 사전 유지"""
+    bq_service = Mock()
+    bq_service.get_name_frequencies.return_value = name_frequencies
+    bq_service.get_entity_frequencies.return_value = entity_frequencies
+    index = AutocompleteIndex(bq_service=bq_service)
+    await index.rebuild()
+
+    bq_service.get_name_frequencies.return_value = [("Tom Dwan", 1)]
+    bq_service.get_entity_frequencies.side_effect = Exception("hand_summary unavailable")
+    count = await index.rebuild()
+
+    assert count == 1
+    assert index.search("Phil") == []
+    assert [e.text for e in index.suggest_entities("mpp")] == ["mpp_2024"]
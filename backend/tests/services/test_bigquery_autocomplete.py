@@ -89,9 +89,10 @@ async def test_get_autocomplete_suggestions_success(service, mock_bq_client):
     # Verify SQL query parameters
     call_args = mock_bq_client.query.call_args
     job_config = call_args[1]['job_config']
-    assert len(job_config.query_parameters) == 2
-    assert job_config.query_parameters[0].value == "Phil%"  # query_pattern
-    assert job_config.query_parameters[1].value == 10  # limit
+    assert len(job_config.query_parameters) == 3
+    assert job_config.query_parameters[0].value == "phil"  # prefix
+    assert job_config.query_parameters[1].value == "phim"  # prefix_next
+    assert job_config.query_parameters[2].value == 10  # limit
 
 
 @pytest.mark.asyncio
@@ -113,10 +114,10 @@ async def test_get_autocomplete_suggestions_frequency_order(service, mock_bq_cli
     assert results == expected_results
     assert results[0] == "Tom Dwan"  # Most frequent first
 
-    # Verify SQL contains ORDER BY total_frequency DESC
+    # Verify SQL contains ORDER BY frequency DESC
     call_args = mock_bq_client.query.call_args
     sql_query = call_args[0][0]
-    assert "ORDER BY total_frequency DESC" in sql_query
+    assert "ORDER BY frequency DESC" in sql_query
 
 
 @pytest.mark.asyncio
@@ -142,7 +143,7 @@ async def test_get_autocomplete_suggestions_limit(service, mock_bq_client):
     # Verify LIMIT parameter
     call_args = mock_bq_client.query.call_args
     job_config = call_args[1]['job_config']
-    assert job_config.query_parameters[1].value == limit
+    assert job_config.query_parameters[2].value == limit
 
 
 @pytest.mark.asyncio
@@ -164,11 +165,11 @@ async def test_get_autocomplete_suggestions_case_insensitive(service, mock_bq_cl
         # Assert
         assert results == expected_results, f"Failed for query: {query}"
 
-        # Verify SQL uses LOWER() for case-insensitive matching
+        # Verify SQL uses a range predicate on the lower-cased name
         call_args = mock_bq_client.query.call_args
         sql_query = call_args[0][0]
-        assert "LOWER(hero_name) LIKE LOWER(@query_pattern)" in sql_query
-        assert "LOWER(villain_name) LIKE LOWER(@query_pattern)" in sql_query
+        assert "name_lc >= @prefix AND name_lc < @prefix_next" in sql_query
+        assert call_args[1]['job_config'].query_parameters[0].value == "phil"
 
 
 @pytest.mark.asyncio
@@ -262,8 +263,8 @@ async def test_get_autocomplete_suggestions_special_chars_cleaned(service, mock_
     # Verify cleaned query (특수문자 제거됨)
     call_args = mock_bq_client.query.call_args
     job_config = call_args[1]['job_config']
-    query_pattern = job_config.query_parameters[0].value
-    assert query_pattern == "PhilIvey%"  # 특수문자 제거됨
+    prefix = job_config.query_parameters[0].value
+    assert prefix == "philivey"  # 특수문자 제거 + 소문자 정규화
 
 
 @pytest.mark.asyncio
@@ -287,8 +288,7 @@ async def test_get_autocomplete_suggestions_query_too_long(service, mock_bq_clie
     # Verify query was truncated to 100 chars
     call_args = mock_bq_client.query.call_args
     job_config = call_args[1]['job_config']
-    query_pattern = job_config.query_parameters[0].value
-    cleaned_query = query_pattern.rstrip('%')
+    cleaned_query = job_config.query_parameters[0].value
     assert len(cleaned_query) <= 100
 
 
@@ -371,11 +371,11 @@ async def test_get_autocomplete_suggestions_sql_injection_prevented(service, moc
         # 파라미터화된 쿼리 사용 확인
         assert job_config is not None
         assert hasattr(job_config, 'query_parameters')
-        assert len(job_config.query_parameters) == 2
+        assert len(job_config.query_parameters) == 3
 
         # SQL 문자열에 직접 값이 삽입되지 않았는지 확인
         sql_query = call_args[0][0]
-        assert "@query_pattern" in sql_query  # 플레이스홀더 사용
+        assert "@prefix" in sql_query  # 플레이스홀더 사용
         assert "DROP TABLE" not in sql_query
         assert "DELETE FROM" not in sql_query
 
@@ -653,6 +653,35 @@ async def test_autocomplete_duplicate_names_in_result(service, mock_bq_client):
     assert results == raw_results
 
 
+# ====================
+# player_name_stats 범위 조회 테스트
+# ====================
+
+def test_prefix_range():
+    """prefix → [prefix, prefix_next) 반열린 구간 (소문자 정규화)"""
+    from app.services.bigquery import prefix_range
+
+    assert prefix_range("Phil") == ("phil", "phim")
+    assert prefix_range("phil ") == ("phil ", "phil!")
+    assert prefix_range("Tom-") == ("tom-", "tom.")
+    assert prefix_range("zz") == ("zz", "z{")
+
+
+def test_get_name_frequencies_reads_stats_table(service, mock_bq_client):
+    """인덱스 재빌드는 사전 집계 테이블에서 빈도 조회"""
+    mock_query_job = Mock()
+    row = MockRow("Phil Ivey")
+    row.frequency = 50
+    mock_query_job.result.return_value = [row]
+    mock_bq_client.query.return_value = mock_query_job
+
+    assert service.get_name_frequencies(max_names=100) == [("Phil Ivey", 50)]
+
+    sql_query = mock_bq_client.query.call_args[0][0]
+    assert settings.bq_table_player_name_stats in sql_query
+    assert "hand_summary" not in sql_query
+
+
 # ====================
 # Constructor 테스트
 # ====================
@@ -696,3 +725,62 @@ def test_constructor_without_client_real_mode(mock_client_class):
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "--cov=app.services.bigquery", "--cov-report=term-missing"])
+
+
+# ====================
+# 엔티티 사전 조회 테스트
+# ====================
+
+def test_get_entity_frequencies_reads_hand_summary(service, mock_bq_client):
+    """엔티티 사전은 hand_summary에서 타입별 빈도 상위 N개 조회"""
+    row = Mock()
+    row.text, row.type, row.frequency = "river call", "street_action", 9
+    mock_query_job = Mock()
+    mock_query_job.result.return_value = [row]
+    mock_bq_client.query.return_value = mock_query_job
+
+    assert service.get_entity_frequencies(max_per_type=100) == [("river call", "street_action", 9)]
+
+    sql_query = mock_bq_client.query.call_args[0][0]
+    assert settings.bq_table_hand_summary in sql_query
+    assert "UNNEST(tags)" in sql_query
+    params = mock_bq_client.query.call_args[1]["job_config"].query_parameters
+    assert params[0].value == 100
+
+
+def test_get_entity_frequencies_returns_typed_rows(service, mock_bq_client):
+    """조회 행 → (텍스트, 타입, 빈도), 타입은 응답에 노출되는 엔티티 타입만"""
+    from app.services.entity_dictionary import ENTITY_TYPES
+
+    rows = []
+    for text, entity_type, frequency in [
+        ("BAD_BEAT", "tag", 6),
+        ("WSOP 2024", "tournament", "4"),
+        ("river call", "street_action", 9),
+    ]:
+        row = Mock()
+        row.text, row.type, row.frequency = text, entity_type, frequency
+        rows.append(row)
+    mock_bq_client.query.return_value.result.return_value = rows
+
+    frequencies = service.get_entity_frequencies()
+
+    assert frequencies == [
+        ("BAD_BEAT", "tag", 6),
+        ("WSOP 2024", "tournament", 4),
+        ("river call", "street_action", 9),
+    ]
+    assert {entity_type for _, entity_type, _ in frequencies} <= set(ENTITY_TYPES) - {"player"}
+
+
+def test_get_entity_frequencies_mock_mode():
+    """Mock 모드: synthetic ATI 합본 파일을 집계"""
+    service = BigQueryAutocompleteService(client=Mock(spec=bigquery.Client))
+    service.client = None
+
+    frequencies = service.get_entity_frequencies(max_per_type=2)
+
+    types = [entity_type for _, entity_type, _ in frequencies]
+    assert ("river call", "street_action", 9) in service.get_entity_frequencies()
+    assert all(types.count(t) <= 2 for t in set(types))
+    assert set(types) == {"tag", "tournament", "street_action"}
@@ -0,0 +1,323 @@
+"""
+단위 테스트: BM25 인메모리 역색인 / Hybrid Search
+1:1 페어링: backend/app/services/bm25_index.py
+
+Coverage:
+- tokenize / hand_document: 소문자 단어 토큰, '_' 분리, 태그/선수명 포함
+- BM25Index: 점수 순위, 증분 upsert/remove, 문서 번호 재사용, 정확한 선수명 판별
+- reciprocal_rank_fusion: 점수 계산, 양쪽 leg에 있는 문서 우선
+- HandTextIndex: 전체 빌드 → watermark 증분 갱신, 갱신 실패 시 기존 색인 유지
+- VertexSearchService hybrid: RRF 결합, 정확한 선수명은 벡터 leg를 기다리지 않음
+- VertexSearchService.search_stream: BM25 결과가 벡터 leg 완료 전에 lexical 단계로 먼저 나옴
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import Mock
+
+from app.services.bm25_index import (
+    BM25Index,
+    HandTextIndex,
+    hand_document,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+
+
+# ====================
+# Fixtures
+# ====================
+
+@pytest.fixture
+def hands():
+    """hand_summary 샘플 행"""
+    return [
+        {
+            "hand_id": "hand_001",
+            "hero_name": "Phil Ivey",
+            "villain_name": "Tom Dwan",
+            "description": "Ivey makes a huge bluff on the river",
+            "tags": ["BLUFF", "HIGH_STAKES"],
+        },
+        {
+            "hand_id": "hand_002",
+            "hero_name": "Tom Dwan",
+            "villain_name": "Phil Hellmuth",
+            "description": "Dwan hero calls with ace high",
+            "tags": ["HERO_CALL"],
+        },
+        {
+            "hand_id": "hand_003",
+            "hero_name": "Junglemann",
+            "villain_name": "Daniel Negreanu",
+            "description": "Cooler: set over set on the flop",
+            "tags": ["COOLER", "BAD_BEAT"],
+        },
+    ]
+
+
+@pytest.fixture
+def index(hands):
+    bm25 = BM25Index()
+    for hand in hands:
+        bm25.upsert(hand["hand_id"], hand_document(hand), (hand["hero_name"], hand["villain_name"]))
+    return bm25
+
+
+# ====================
+# 토큰화 테스트
+# ====================
+
+def test_tokenize_splits_underscores():
+    """'_'는 구분자, 소문자 변환"""
+    assert tokenize("BAD_BEAT on the River!") == ["bad", "beat", "on", "the", "river"]
+
+
+def test_hand_document_includes_names_and_tags(hands):
+    """선수명/설명/태그가 문서 텍스트에 포함"""
+    text = hand_document(hands[0])
+
+    assert "Phil Ivey" in text and "Tom Dwan" in text
+    assert "HIGH_STAKES" in text
+
+
+# ====================
+# BM25Index 테스트
+# ====================
+
+def test_search_ranks_by_bm25(index):
+    """여러 쿼리 term이 매칭된 문서가 상위"""
+    results = index.search("ivey bluff", top_k=3)
+
+    assert results[0][0] == "hand_001"
+    assert all(a[1] >= b[1] for a, b in zip(results, results[1:]))
+
+
+def test_search_rare_term_outranks_common(index):
+    """idf: 흔한 term(dwan, 2개 문서)보다 드문 term(cooler)의 문서가 상위"""
+    results = index.search("dwan cooler", top_k=3)
+
+    assert results[0][0] == "hand_003"
+    assert {hand_id for hand_id, _ in results} == {"hand_001", "hand_002", "hand_003"}
+
+
+def test_search_no_match(index):
+    """매칭 없음 / 빈 쿼리"""
+    assert index.search("zzz", top_k=5) == []
+    assert index.search("  ", top_k=5) == []
+
+
+def test_upsert_replaces_document(index):
+    """같은 hand_id upsert 시 이전 term 제거 (재빌드 없음)"""
+    index.upsert("hand_003", "Junglemann check raises the turn", ("Junglemann",))
+
+    assert index.search("cooler", top_k=5) == []
+    assert index.search("turn", top_k=5)[0][0] == "hand_003"
+    assert len(index) == 3
+
+
+def test_remove_and_slot_reuse(index):
+    """제거된 문서 번호는 다음 upsert에서 재사용"""
+    assert index.remove("hand_002") is True
+    assert index.remove("hand_002") is False
+    assert index.search("hero call", top_k=5) == []
+
+    index.upsert("hand_004", "Fedor Holz hero call", ("Fedor Holz",))
+
+    assert len(index._hand_ids) == 3
+    assert index.search("hero call", top_k=5)[0][0] == "hand_004"
+
+
+def test_is_exact_name(index):
+    """정규화 후 선수명과 정확히 일치할 때만 True, 제거 시 반영"""
+    assert index.is_exact_name("phil  IVEY") is True
+    assert index.is_exact_name("phil") is False
+    assert index.is_exact_name("ivey bluff") is False
+
+    index.remove("hand_003")
+
+    assert index.is_exact_name("Junglemann") is False
+
+
+# ====================
+# RRF 테스트
+# ====================
+
+def test_reciprocal_rank_fusion_scores():
+    """score = Σ 1/(k + rank)"""
+    fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], k=60)
+
+    assert fused[0] == ("b", pytest.approx(1 / 62 + 1 / 61))
+    assert [hand_id for hand_id, _ in fused] == ["b", "a", "c"]
+
+
+def test_reciprocal_rank_fusion_limit():
+    """limit 적용"""
+    assert len(reciprocal_rank_fusion([["a", "b", "c"]], limit=2)) == 2
+
+
+# ====================
+# HandTextIndex 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_hand_text_index_incremental_refresh(hands):
+    """첫 갱신은 전체 빌드, 이후 watermark 이후 행만 조회해 upsert"""
+    t1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    t2 = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    bq_service = Mock()
+    bq_service.get_hand_documents.return_value = [dict(hand, updated_at=t1) for hand in hands]
+    text_index = HandTextIndex(bq_service=bq_service)
+
+    assert await text_index.refresh() == 3
+    assert text_index.is_ready is True
+    bq_service.get_hand_documents.assert_called_with(None)
+
+    bq_service.get_hand_documents.return_value = [
+        {"hand_id": "hand_004", "hero_name": "Fedor Holz", "description": "river overbet", "updated_at": t2}
+    ]
+    assert await text_index.refresh() == 1
+
+    bq_service.get_hand_documents.assert_called_with(t1)
+    assert text_index.watermark == t2
+    assert (await text_index.search("overbet", top_k=5))[0][0] == "hand_004"
+    assert text_index.stats()["documents"] == 4
+
+
+@pytest.mark.asyncio
+async def test_hand_text_index_refresh_includes_rows_at_watermark(hands):
+    """watermark와 같은 updated_at으로 늦게 커밋된 행도 색인, 재조회 행은 멱등 upsert"""
+    t1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    bq_service = Mock()
+    bq_service.get_hand_documents.return_value = [dict(hand, updated_at=t1) for hand in hands]
+    text_index = HandTextIndex(bq_service=bq_service)
+    await text_index.refresh()
+
+    bq_service.get_hand_documents.return_value = [dict(hands[0], updated_at=t1)] + [
+        {"hand_id": "hand_004", "hero_name": "Fedor Holz", "description": "river overbet", "updated_at": t1}
+    ]
+    await text_index.refresh()
+
+    bq_service.get_hand_documents.assert_called_with(t1)
+    assert text_index.stats()["documents"] == 4
+    assert (await text_index.search("overbet", top_k=5))[0][0] == "hand_004"
+
+
+def test_get_hand_documents_includes_watermark_timestamp():
+    """증분 조회 조건은 updated_at >= @since"""
+    from app.services.bigquery import BigQueryService
+
+    service = BigQueryService.__new__(BigQueryService)
+    service.mock_mode = False
+    service.client = Mock()
+    service.client.query.return_value.result.return_value = []
+
+    service.get_hand_documents(datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    assert "updated_at >= @since" in service.client.query.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_hand_text_index_refresh_failure_keeps_index(hands):
+    """갱신 실패 시 기존 색인 유지"""
+    bq_service = Mock()
+    bq_service.get_hand_documents.return_value = hands
+    text_index = HandTextIndex(bq_service=bq_service)
+    await text_index.refresh()
+
+    bq_service.get_hand_documents.side_effect = Exception("BigQuery unavailable")
+
+    assert await text_index.refresh() == 0
+    assert len(text_index.index) == 3
+    assert text_index.stats()["refresh_failures"] == 1
+
+
+# ====================
+# Hybrid Search 테스트
+# ====================
+
+def _hybrid_service(text_index, vector_leg):
+    from app.services.vertex_search import VertexSearchService
+
+    service = VertexSearchService.__new__(VertexSearchService)
+    service.mock_mode = False
+    service.text_index = text_index
+    service.rrf_k = 60
+    service.exact_name_shortcut = True
+    service._vector_leg = vector_leg
+    return service
+
+
+@pytest.fixture
+def text_index(index):
+    text_index = HandTextIndex(bq_service=Mock())
+    text_index.index = index
+    return text_index
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_both_legs(text_index):
+    """양쪽 leg에 있는 문서가 상위, 각 leg의 점수 유지"""
+    async def vector_leg(query, top_k, threshold):
+        return [
+            {"hand_id": "hand_009", "distance": 0.92},
+            {"hand_id": "hand_001", "distance": 0.85},
+        ]
+
+    service = _hybrid_service(text_index, vector_leg)
+
+    results = await service.search("ivey bluff", top_k=3)
+
+    assert [r["hand_id"] for r in results][:2] == ["hand_001", "hand_009"]
+    assert results[0]["distance"] == 0.85
+    assert results[0]["bm25_score"] > 0
+    assert results[1]["bm25_score"] is None
+    assert results[0]["rrf_score"] > results[1]["rrf_score"]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_exact_name_skips_vector_leg(text_index):
+    """정확한 선수명 쿼리는 느린 벡터 leg를 기다리지 않고 취소"""
+    cancelled = asyncio.Event()
+
+    async def slow_vector_leg(query, top_k, threshold):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    service = _hybrid_service(text_index, slow_vector_leg)
+
+    results = await asyncio.wait_for(service.search("Tom Dwan", top_k=5), timeout=1)
+
+    assert {r["hand_id"] for r in results} == {"hand_001", "hand_002"}
+    assert all(r["distance"] is None for r in results)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_search_stream_yields_lexical_before_vector_leg(text_index):
+    """lexical 단계는 벡터 leg 완료 전에, final은 RRF 결합 결과"""
+    release = asyncio.Event()
+
+    async def gated_vector_leg(query, top_k, threshold):
+        await release.wait()
+        return [{"hand_id": "hand_009", "distance": 0.92}]
+
+    service = _hybrid_service(text_index, gated_vector_leg)
+    stream = service.search_stream("ivey bluff", top_k=3)
+
+    stage, lexical = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert stage == "lexical"
+    assert lexical[0]["hand_id"] == "hand_001"
+    assert all(r["distance"] is None for r in lexical)
+
+    release.set()
+    stages = [item async for item in stream]
+
+    assert [stage for stage, _ in stages] == ["final"]
+    assert "hand_009" in {r["hand_id"] for r in stages[0][1]}
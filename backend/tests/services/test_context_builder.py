@@ -0,0 +1,147 @@
+"""
+단위 테스트: 토큰 예산 기반 RAG 컨텍스트 빌더
+1:1 페어링: backend/app/services/context_builder.py
+
+Coverage:
+- approximate_token_count: 한글 음절 / 영문 단어 / 숫자 / 기호 근사
+- TokenCounter: tokenizer 경로 없거나 tokenizers 미설치 시 근사 fallback
+- render_hand: 값이 있는 필드만
+- rank_shares: 1/순위 가중치
+- ContextBuilder: 관련도 순으로 예산 안에서 채움, 긴 설명은 쿼리 관련 문장만, 순위별 설명 몫, max_hands
+"""
+
+import pytest
+
+from app.models import HandResult
+from app.services.context_builder import (
+    ContextBuilder,
+    TokenCounter,
+    approximate_token_count,
+    rank_shares,
+    render_hand,
+)
+
+
+def _hand(i: int, description: str = "Short description.", **fields) -> HandResult:
+    return HandResult(
+        hand_id=f"hand_{i:03d}",
+        hero_name="Phil Ivey",
+        description=description,
+        pot_bb=120.0,
+        street="River",
+        action="Bluff",
+        **fields,
+    )
+
+
+LONG_DESCRIPTION = (
+    "The blinds are 400/800 with a 100 ante. "
+    "Preflop action is a standard open and call from the big blind. "
+    "The flop comes king high and both players check. "
+    "On the river Ivey fires a huge bluff with seven high. "
+    "The broadcast cuts to a commercial break afterwards."
+)
+
+
+# ====================
+# 토큰 수 테스트
+# ====================
+
+def test_approximate_token_count():
+    """한글 음절 1, 영문 4자당 1, 숫자 3자리당 1, 기호 1"""
+    assert approximate_token_count("블러프") == 3
+    assert approximate_token_count("Ivey bluffing") == 1 + 2
+    assert approximate_token_count("120000 BB!") == 2 + 1 + 1
+    assert approximate_token_count("") == 0
+
+
+def test_token_counter_falls_back_without_tokenizer(tmp_path):
+    """tokenizer 경로 없음 / 로드 실패 → 근사"""
+    assert TokenCounter().backend == "approximate"
+    counter = TokenCounter(str(tmp_path / "missing_tokenizer.json"))
+
+    assert counter.backend == "approximate"
+    assert counter.count("Phil Ivey") == approximate_token_count("Phil Ivey")
+
+
+# ====================
+# 렌더링 테스트
+# ====================
+
+def test_render_hand_skips_empty_fields():
+    """villain / tournament / tags가 없으면 줄 자체를 생략"""
+    block = render_hand(1, _hand(1))
+
+    assert block.splitlines() == [
+        "핸드 1 (hand_001)",
+        "- 설명: Short description.",
+        "- 선수: Phil Ivey",
+        "- River Bluff, Pot 120 BB",
+    ]
+    assert "Tom Dwan" in render_hand(1, _hand(1, villain_name="Tom Dwan", tags=["BLUFF"]))
+
+
+# ====================
+# ContextBuilder 테스트
+# ====================
+
+def test_build_packs_hands_in_order_within_budget():
+    """예산 안에서 관련도 순으로, 예산을 넘기지 않음"""
+    builder = ContextBuilder()
+    hands = [_hand(i) for i in range(1, 6)]
+    one_hand = builder.counter.count(render_hand(1, hands[0]))
+
+    context = builder.build("ivey bluff", hands, budget_tokens=one_hand * 2 + 5)
+
+    assert context.hands_used == 2
+    assert "hand_001" in context.text and "hand_002" in context.text
+    assert "hand_003" not in context.text
+    assert context.context_tokens <= one_hand * 2 + 5
+
+
+def test_build_truncates_long_description_to_relevant_sentences():
+    """긴 설명은 쿼리 관련 문장만 남김 (원래 순서 유지)"""
+    builder = ContextBuilder()
+    hand = _hand(1, LONG_DESCRIPTION)
+    short_block = builder.counter.count(
+        render_hand(1, hand, "On the river Ivey fires a huge bluff with seven high.")
+    )
+
+    context = builder.build("Ivey river bluff", [hand], budget_tokens=short_block + 2)
+
+    assert context.hands_truncated == 1
+    assert "huge bluff" in context.text
+    assert "commercial break" not in context.text
+    assert context.context_tokens <= short_block + 2
+
+
+def test_rank_shares():
+    """1/순위 가중치, 합 1"""
+    assert rank_shares(1) == [1.0]
+    shares = rank_shares(3)
+    assert shares[0] == pytest.approx(2 * shares[1]) == pytest.approx(3 * shares[2])
+    assert sum(shares) == pytest.approx(1.0)
+
+
+def test_build_caps_descriptions_by_rank():
+    """예산이 남아도 하위 순위 설명은 몫까지만 → 1위 설명은 그대로, 3위는 관련 문장 위주로 축약"""
+    builder = ContextBuilder()
+    hands = [_hand(i, LONG_DESCRIPTION) for i in (1, 2, 3)]
+    block = builder.counter.count(render_hand(1, hands[0]))
+
+    context = builder.build("Ivey river bluff", hands, budget_tokens=block * 3 + 10)
+
+    first, _, third = context.text.split(ContextBuilder.SEPARATOR)
+    assert context.hands_used == 3
+    assert context.hands_truncated == 1
+    assert LONG_DESCRIPTION in first
+    assert "huge bluff" in third and "commercial break" not in third
+
+
+def test_build_respects_max_hands_and_empty_input():
+    """max_hands 제한, 핸드 없으면 기본 문구"""
+    builder = ContextBuilder()
+
+    assert builder.build("q", [_hand(i) for i in range(5)], 10000, max_hands=2).hands_used == 2
+    assert builder.build("q", [], 1000).hands_used == 0
+    assert builder.build("q", [_hand(1)], budget_tokens=3).hands_used == 0
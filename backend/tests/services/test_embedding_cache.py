@@ -0,0 +1,118 @@
+"""
+단위 테스트: 쿼리 임베딩 캐시
+1:1 페어링: backend/app/services/embedding_cache.py
+
+Coverage:
+- 키: 텍스트 정규화, task type / 모델 버전 분리
+- LRU: hit/miss, 용량 초과 시 제거
+- SQLite tier: packed float32 저장, 재시작 후 재사용, LRU 승격
+- stats: hit ratio
+"""
+
+import pytest
+
+from app.services.embedding_cache import (
+    EmbeddingCache,
+    SQLiteEmbeddingStore,
+    normalize_embedding_text,
+    pack_vector,
+    unpack_vector,
+)
+
+TASK = "RETRIEVAL_QUERY"
+
+
+# ====================
+# 키 / 직렬화 테스트
+# ====================
+
+def test_normalize_embedding_text():
+    """대소문자, 앞뒤/연속 공백 무관"""
+    assert normalize_embedding_text("  Phil   Ivey\tBluff ") == "phil ivey bluff"
+
+
+def test_pack_vector_float32_roundtrip():
+    """packed float32: 차원당 4바이트, float32 정밀도로 복원"""
+    blob = pack_vector([0.5, -1.25, 0.1])
+
+    assert len(blob) == 12
+    assert unpack_vector(blob)[:2] == [0.5, -1.25]
+    assert unpack_vector(blob)[2] == pytest.approx(0.1, rel=1e-6)
+
+
+# ====================
+# LRU tier 테스트
+# ====================
+
+def test_memory_hit_with_normalized_text():
+    """정규화 후 같은 텍스트는 hit"""
+    cache = EmbeddingCache(model_version="text-embedding-004")
+    cache.put("Hero call river", TASK, [0.1, 0.2])
+
+    assert cache.get("hero  call RIVER ", TASK) == [0.1, 0.2]
+    assert cache.get("hero call turn", TASK) is None
+    assert cache.stats()["memory_hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_task_type_is_part_of_key():
+    """task type이 다르면 별도 항목"""
+    cache = EmbeddingCache(model_version="text-embedding-004")
+    cache.put("phil ivey", TASK, [0.1])
+
+    assert cache.get("phil ivey", "RETRIEVAL_DOCUMENT") is None
+
+
+def test_lru_eviction():
+    """용량 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = EmbeddingCache(model_version="m", max_entries=2)
+    cache.put("a", TASK, [1.0])
+    cache.put("b", TASK, [2.0])
+    cache.get("a", TASK)
+    cache.put("c", TASK, [3.0])
+
+    assert cache.get("b", TASK) is None
+    assert cache.get("a", TASK) == [1.0]
+    assert cache.stats()["size"] == 2
+
+
+# ====================
+# SQLite tier 테스트
+# ====================
+
+def test_disk_tier_survives_restart(tmp_path):
+    """디스크 tier: 새 프로세스(새 캐시 인스턴스)에서도 재사용, LRU로 승격"""
+    path = str(tmp_path / "embeddings.sqlite3")
+    first = EmbeddingCache(model_version="text-embedding-004", disk_store=SQLiteEmbeddingStore(path))
+    first.put("Phil Ivey bluff", TASK, [0.25, 0.5])
+
+    second = EmbeddingCache(model_version="text-embedding-004", disk_store=SQLiteEmbeddingStore(path))
+
+    assert second.get("phil ivey bluff", TASK) == [0.25, 0.5]
+    assert second.get("phil ivey bluff", TASK) == [0.25, 0.5]
+    assert second.stats()["disk_hits"] == 1
+    assert second.stats()["memory_hits"] == 1
+    assert len(second.disk_store) == 1
+
+
+def test_disk_tier_model_version_isolated(tmp_path):
+    """모델 버전이 다르면 디스크 항목을 재사용하지 않음"""
+    path = str(tmp_path / "embeddings.sqlite3")
+    EmbeddingCache(model_version="text-embedding-004", disk_store=SQLiteEmbeddingStore(path)) \
+        .put("phil ivey", TASK, [0.1])
+
+    upgraded = EmbeddingCache(model_version="text-embedding-005", disk_store=SQLiteEmbeddingStore(path))
+
+    assert upgraded.get("phil ivey", TASK) is None
+
+
+def test_disk_read_failure_is_miss(tmp_path):
+    """디스크 오류는 miss로 처리 (요청 실패 아님)"""
+    store = SQLiteEmbeddingStore(str(tmp_path / "embeddings.sqlite3"))
+    cache = EmbeddingCache(model_version="m", disk_store=store)
+    store.close()
+
+    assert cache.get("phil", TASK) is None
+    cache.put("phil", TASK, [0.1])
+    assert cache.get("phil", TASK) == [0.1]
@@ -0,0 +1,81 @@
+"""
+단위 테스트: 자동완성 엔티티 추출/집계
+1:1 페어링: backend/app/services/entity_dictionary.py
+
+Coverage:
+- extract_entities: ATI 스키마 / hand_summary 스키마 필드, 누락 필드
+- count_entities: 타입별 빈도 집계, 빈도 내림차순
+"""
+
+from app.services.entity_dictionary import (
+    count_entities,
+    extract_entities,
+    street_action,
+)
+
+
+# ====================
+# extract_entities 테스트
+# ====================
+
+def test_street_action_normalized():
+    """스트리트 + 액션 → 소문자 자동완성 표기"""
+    assert street_action("RIVER", " Call") == "river call"
+
+
+def test_extract_entities_ati_schema():
+    """ATI 스키마 필드에서 추출, hand_summary에 없는 필드(hand_type, 포지션)는 제외"""
+    hand = {
+        "hero_name": "Phil Ivey",
+        "tags": ["BAD_BEAT", "HERO_CALL"],
+        "tournament_id": "wsop_2024",
+        "street": "RIVER",
+        "hero_action": "call",
+        "hand_type": "BLUFF",
+        "hero_position": "BTN",
+        "villain_position": "BB",
+    }
+
+    assert extract_entities(hand) == [
+        ("BAD_BEAT", "tag"),
+        ("HERO_CALL", "tag"),
+        ("wsop_2024", "tournament"),
+        ("river call", "street_action"),
+    ]
+
+
+def test_extract_entities_hand_summary_schema():
+    """hand_summary 스키마 (tournament, action) 지원, 누락 필드는 건너뜀"""
+    hand = {"tournament": "High Stakes Poker", "street": "River", "action": "Bluff", "tags": None}
+
+    assert extract_entities(hand) == [
+        ("High Stakes Poker", "tournament"),
+        ("river bluff", "street_action"),
+    ]
+
+
+# ====================
+# count_entities 테스트
+# ====================
+
+def test_count_entities_frequency_order():
+    """타입별 빈도 집계, 빈도 내림차순"""
+    hands = [
+        {"street": "RIVER", "hero_action": "call", "tags": ["BAD_BEAT"]},
+        {"street": "RIVER", "hero_action": "call"},
+        {"street": "TURN", "hero_action": "fold", "tags": ["BAD_BEAT"]},
+        {"street": "RIVER", "hero_action": "call"},
+    ]
+
+    assert count_entities(hands) == [
+        ("river call", "street_action", 3),
+        ("BAD_BEAT", "tag", 2),
+        ("turn fold", "street_action", 1),
+    ]
+
+
+def test_count_entities_same_text_different_types():
+    """같은 텍스트라도 타입이 다르면 별도 집계"""
+    hands = [{"tags": ["WSOP"], "tournament": "WSOP"}]
+
+    assert sorted(count_entities(hands)) == [("WSOP", "tag", 1), ("WSOP", "tournament", 1)]
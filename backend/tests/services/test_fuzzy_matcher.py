@@ -0,0 +1,89 @@
+"""
+단위 테스트: 오타 교정 후보 생성 (SymSpell)
+1:1 페어링: backend/app/services/fuzzy_matcher.py
+
+Coverage:
+- bounded_levenshtein: 정확한 거리, 한도 초과 조기 종료
+- SymSpellIndex: 편집 거리 ≤2 후보, 거리/빈도 정렬, 대소문자 무관
+"""
+
+import pytest
+
+from app.services.fuzzy_matcher import bounded_levenshtein, SymSpellIndex, FuzzyMatch
+
+
+# ====================
+# Fixtures
+# ====================
+
+@pytest.fixture
+def index():
+    """선수명 사전 인덱스"""
+    return SymSpellIndex([
+        ("Junglemann", 20),
+        ("Phil Ivey", 50),
+        ("Phil Hellmuth", 30),
+        ("Tom Dwan", 40),
+        ("Tom Dwyer", 2),
+    ])
+
+
+# ====================
+# bounded_levenshtein 테스트
+# ====================
+
+def test_bounded_levenshtein_exact():
+    """한도 없이 정확한 거리"""
+    assert bounded_levenshtein("Phil Ivey", "Phil Ivey") == 0
+    assert bounded_levenshtein("Phil Ivy", "Phil Ivey") == 1
+    assert bounded_levenshtein("junglman", "junglemann") == 2
+    assert bounded_levenshtein("", "test") == 4
+    assert bounded_levenshtein("kitten", "sitting") == 3
+
+
+def test_bounded_levenshtein_early_exit():
+    """한도 초과 시 max_distance + 1 반환"""
+    assert bounded_levenshtein("abcdef", "uvwxyz", max_distance=2) == 3
+    assert bounded_levenshtein("a", "abcdefgh", max_distance=2) == 3
+    assert bounded_levenshtein("kitten", "sitting", max_distance=3) == 3
+
+
+# ====================
+# SymSpellIndex 테스트
+# ====================
+
+def test_lookup_typo_correction(index):
+    """"Junglman" → "Junglemann" (거리 2)"""
+    assert index.lookup("Junglman") == [FuzzyMatch("Junglemann", 2, 20)]
+
+
+def test_lookup_case_insensitive(index):
+    """대소문자/공백 무관"""
+    assert index.lookup("PHIL  IVY")[0].term == "Phil Ivey"
+
+
+def test_lookup_orders_by_distance_then_frequency(index):
+    """거리 오름차순 → 빈도 내림차순 (가까운 후보가 빈도보다 우선)"""
+    matches = index.lookup("Tom Dwer")
+
+    assert [m.term for m in matches] == ["Tom Dwyer", "Tom Dwan"]
+    assert [m.distance for m in matches] == [1, 2]
+
+
+def test_lookup_max_distance(index):
+    """max_distance 제한"""
+    assert index.lookup("Junglman", max_distance=1) == []
+    assert index.lookup("completely different") == []
+
+
+def test_lookup_limit(index):
+    """limit 적용"""
+    assert len(index.lookup("Tom Dwer", limit=1)) == 1
+
+
+def test_index_merges_duplicate_terms():
+    """대소문자만 다른 단어는 빈도 합산"""
+    index = SymSpellIndex([("Tom Dwan", 3), ("tom dwan", 4)])
+
+    assert len(index) == 1
+    assert index.lookup("Tom Dwan") == [FuzzyMatch("Tom Dwan", 0, 7)]
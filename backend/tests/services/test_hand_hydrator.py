@@ -0,0 +1,199 @@
+"""
+단위 테스트: 검색 결과 Hydration
+1:1 페어링: backend/app/services/hand_hydrator.py
+
+Coverage:
+- 캐시 miss 핸드는 조회 한 번으로 일괄 조회, 결과 순서(ANN 순위) 유지
+- 핸드별 LRU: 다시 검색된 핸드는 조회 없음, TTL 만료 / LRU 제거
+- 메타데이터 없는 핸드 / 필수 필드가 NULL인 행 제외, 조회 실패 시 graceful degradation
+- 이미 메타데이터가 있는 결과(Mock 검색)는 그대로 통과
+- BigQueryService.get_hands_by_ids: HYDRATION_FIELDS 모두 반환 (Mock 모드 / video_url, timestamp 컬럼)
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from app.models import HandResult
+from app.services.hand_hydrator import HYDRATION_FIELDS, HandHydrator
+
+
+# ====================
+# Fixtures
+# ====================
+
+def _row(hand_id: str) -> dict:
+    return {
+        "hand_id": hand_id,
+        "hero_name": f"hero_{hand_id}",
+        "villain_name": None,
+        "description": f"description {hand_id}",
+        "pot_bb": 100.0,
+        "street": "River",
+        "action": "Call",
+        "tournament": "WSOP",
+        "tags": None,
+    }
+
+
+@pytest.fixture
+def fetch_fn():
+    """hand_id 목록 → 행 (순서 뒤섞어 반환, hand_404는 없음)"""
+    return Mock(side_effect=lambda ids: [_row(i) for i in reversed(ids) if i != "hand_404"])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# ====================
+# Hydration 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_hydrate_single_round_trip_preserves_order(fetch_fn):
+    """캐시 miss 20개 → 조회 1회, 입력 순서 유지, 검색 점수 유지"""
+    hydrator = HandHydrator(fetch_fn=fetch_fn)
+    results = [{"hand_id": f"hand_{i:03d}", "distance": 1 - i / 100} for i in range(20)]
+
+    hydrated = await hydrator.hydrate(results)
+
+    assert fetch_fn.call_count == 1
+    assert [r["hand_id"] for r in hydrated] == [r["hand_id"] for r in results]
+    assert hydrated[0]["hero_name"] == "hero_hand_000"
+    assert hydrated[0]["distance"] == 1.0
+    assert hydrated[0]["tags"] == []
+
+
+@pytest.mark.asyncio
+async def test_hydrate_cached_hands_skip_fetch(fetch_fn):
+    """다시 검색된 핸드는 조회 없음, 새 핸드만 조회"""
+    hydrator = HandHydrator(fetch_fn=fetch_fn)
+    await hydrator.hydrate([{"hand_id": "hand_001"}, {"hand_id": "hand_002"}])
+
+    await hydrator.hydrate([{"hand_id": "hand_002"}, {"hand_id": "hand_001"}])
+    assert fetch_fn.call_count == 1
+
+    await hydrator.hydrate([{"hand_id": "hand_001"}, {"hand_id": "hand_003"}])
+    assert fetch_fn.call_count == 2
+    fetch_fn.assert_called_with(["hand_003"])
+    assert hydrator.stats()["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_hydrate_duplicate_ids_fetched_once(fetch_fn):
+    """같은 hand_id가 여러 번 나와도 조회 목록에는 한 번"""
+    hydrator = HandHydrator(fetch_fn=fetch_fn)
+
+    hydrated = await hydrator.hydrate([{"hand_id": "hand_001"}, {"hand_id": "hand_001"}])
+
+    fetch_fn.assert_called_once_with(["hand_001"])
+    assert len(hydrated) == 2
+
+
+@pytest.mark.asyncio
+async def test_hydrate_drops_missing_hands(fetch_fn):
+    """메타데이터가 없는 핸드는 제외 (HandResult를 만들 수 없음)"""
+    hydrator = HandHydrator(fetch_fn=fetch_fn)
+
+    hydrated = await hydrator.hydrate([{"hand_id": "hand_404"}, {"hand_id": "hand_001"}])
+
+    assert [r["hand_id"] for r in hydrated] == ["hand_001"]
+    assert hydrator.stats()["not_found"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hydrate_drops_rows_with_null_required_fields():
+    """hero_name / description / pot_bb 등이 NULL인 행은 제외 → 나머지 결과는 HandResult 생성 가능"""
+    rows = [
+        {**_row("hand_001"), "hero_name": None},
+        {**_row("hand_002"), "pot_bb": None},
+        _row("hand_003"),
+    ]
+    fetch = Mock(return_value=rows)
+    hydrator = HandHydrator(fetch_fn=fetch)
+    results = [{"hand_id": f"hand_00{i}"} for i in (1, 2, 3)]
+
+    hydrated = await hydrator.hydrate(results)
+
+    assert [HandResult(**r).hand_id for r in hydrated] == ["hand_003"]
+    assert hydrator.stats()["incomplete"] == 2
+    # 불완전한 행은 캐시하지 않음 → 데이터가 고쳐지면 다음 검색에서 다시 조회
+    await hydrator.hydrate(results[:1])
+    assert fetch.call_args[0][0] == ["hand_001"]
+
+
+@pytest.mark.asyncio
+async def test_hydrate_fetch_failure_returns_empty():
+    """조회 실패 시 예외 없이 빈 결과"""
+    hydrator = HandHydrator(fetch_fn=Mock(side_effect=Exception("BigQuery unavailable")))
+
+    assert await hydrator.hydrate([{"hand_id": "hand_001"}]) == []
+    assert hydrator.stats()["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hydrate_passes_through_hydrated_results(fetch_fn):
+    """이미 메타데이터가 있는 결과는 조회 없이 그대로"""
+    hydrator = HandHydrator(fetch_fn=fetch_fn)
+    result = {"hand_id": "hand_001", "hero_name": "Phil Ivey", "description": "bluff"}
+
+    assert await hydrator.hydrate([result]) == [result]
+    fetch_fn.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_hydrate_ttl_and_lru_eviction(fetch_fn):
+    """TTL 만료 / max_entries 초과 시 다시 조회"""
+    clock = FakeClock()
+    hydrator = HandHydrator(fetch_fn=fetch_fn, max_entries=2, ttl_seconds=10, clock=clock)
+    await hydrator.hydrate([{"hand_id": "hand_001"}, {"hand_id": "hand_002"}])
+
+    clock.now = 11
+    await hydrator.hydrate([{"hand_id": "hand_001"}])
+    assert fetch_fn.call_count == 2
+
+    await hydrator.hydrate([{"hand_id": "hand_003"}, {"hand_id": "hand_004"}])
+    assert hydrator.stats()["size"] == 2
+
+
+# ====================
+# BigQueryService 일괄 조회 테스트
+# ====================
+
+def test_get_hands_by_ids_mock_mode():
+    """Mock 모드: ATI 합본 파일에서 hand_summary 컬럼 형태로 반환"""
+    from app.services.bigquery import BigQueryService
+
+    service = BigQueryService.__new__(BigQueryService)
+    service.mock_mode = True
+    service.client = None
+
+    hands = service.get_hands_by_ids(["mpp_2023_hand_0001", "missing"])
+
+    assert len(hands) == 1
+    assert hands[0]["hero_name"] == "Mikki Mase"
+    assert hands[0]["action"] == "raise"
+    assert set(HYDRATION_FIELDS) <= set(hands[0])
+    assert service.get_hands_by_ids([]) == []
+
+
+def test_get_hands_by_ids_selects_video_fields():
+    """BigQuery 조회 결과에도 video_url / timestamp 키 포함 (get_hand_by_id와 같은 형태)"""
+    from app.services.bigquery import BigQueryService
+
+    service = BigQueryService.__new__(BigQueryService)
+    service.mock_mode = False
+    service.client = Mock()
+    row = Mock()
+    row.items.return_value = {**_row("hand_001"), "video_url": None, "timestamp": None}.items()
+    service.client.query.return_value.result.return_value = [row]
+
+    hands = service.get_hands_by_ids(["hand_001"])
+
+    sql = service.client.query.call_args[0][0]
+    assert "AS video_url" in sql and "AS timestamp" in sql
+    assert set(HYDRATION_FIELDS) <= set(hands[0])
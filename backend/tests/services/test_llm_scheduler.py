@@ -0,0 +1,138 @@
+"""
+단위 테스트: LLM admission control + 우선순위 큐
+1:1 페어링: backend/app/services/llm_scheduler.py
+
+Coverage:
+- max_concurrency 초과 요청은 대기, 슬롯 반납 시 우선순위 → 도착 순서로 넘김
+- 큐 가득 참 / 예상 대기 > deadline → 대기열에 넣지 않고 즉시 LLMOverloaded
+- 대기 중 deadline 초과 / 취소 → 대기열에서 제거, 슬롯 누수 없음, Retry-After는 남은 예상 대기
+- 대기 / 생성 시간 히스토그램, 생성 시간 EWMA
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.llm_scheduler import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_NORMAL,
+    LLMOverloaded,
+    LLMScheduler,
+)
+
+
+async def _queued(scheduler: LLMScheduler, priority: int, order: list, name: str) -> asyncio.Task:
+    """대기열에 들어갈 때까지 진행시킨 acquire 태스크 (획득 순서를 order에 기록)"""
+    async def run():
+        await scheduler.acquire(priority)
+        order.append(name)
+
+    task = asyncio.create_task(run())
+    await asyncio.sleep(0)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_priority_handoff():
+    """동시 실행 상한 유지, 반납 시 높은 우선순위 → 먼저 온 순서"""
+    scheduler = LLMScheduler(max_concurrency=1, max_queue=8, deadline_seconds=60)
+    await scheduler.acquire()
+    order = []
+    tasks = [
+        await _queued(scheduler, PRIORITY_BATCH, order, "batch"),
+        await _queued(scheduler, PRIORITY_NORMAL, order, "normal-1"),
+        await _queued(scheduler, PRIORITY_INTERACTIVE, order, "interactive"),
+        await _queued(scheduler, PRIORITY_NORMAL, order, "normal-2"),
+    ]
+    assert scheduler.active == 1
+    assert scheduler.queue_depth == 4
+
+    for _ in tasks:
+        scheduler.release(1.0)
+        await asyncio.sleep(0)
+        assert scheduler.active == 1
+    await asyncio.gather(*tasks)
+
+    assert order == ["interactive", "normal-1", "normal-2", "batch"]
+    scheduler.release(1.0)
+    assert scheduler.active == 0
+    assert scheduler.stats()["admitted"] == 5
+
+
+@pytest.mark.asyncio
+async def test_queue_full_rejects_immediately():
+    """대기열이 가득 차면 대기 없이 거절"""
+    scheduler = LLMScheduler(max_concurrency=1, max_queue=1, deadline_seconds=60)
+    await scheduler.acquire()
+    waiter = await _queued(scheduler, PRIORITY_NORMAL, [], "queued")
+
+    with pytest.raises(LLMOverloaded) as excinfo:
+        await scheduler.acquire()
+
+    assert excinfo.value.reason == "queue_full"
+    assert scheduler.queue_depth == 1
+    assert scheduler.stats()["rejected"] == {"queue_full": 1}
+    waiter.cancel()
+
+
+@pytest.mark.asyncio
+async def test_expected_wait_over_deadline_rejects():
+    """예상 대기 = ceil((앞 대기자 + 1) / 동시 수) × 생성 시간 EWMA > deadline → 거절"""
+    scheduler = LLMScheduler(
+        max_concurrency=2, max_queue=8, deadline_seconds=10, initial_service_seconds=4
+    )
+    await scheduler.acquire()
+    await scheduler.acquire()
+    waiters = [await _queued(scheduler, PRIORITY_NORMAL, [], str(i)) for i in range(4)]
+
+    assert scheduler.expected_wait(PRIORITY_NORMAL) == 12.0  # 앞에 4명 → 3라운드
+    with pytest.raises(LLMOverloaded) as excinfo:
+        await scheduler.acquire(PRIORITY_BATCH)
+
+    assert excinfo.value.reason == "expected_wait"
+    assert excinfo.value.retry_after_seconds == 12
+    # 높은 우선순위는 뒤쪽 대기자를 앞지르므로 예상 대기가 짧음
+    assert scheduler.expected_wait(PRIORITY_INTERACTIVE) == 4.0
+    for waiter in waiters:
+        waiter.cancel()
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_and_cancellation_leave_no_waiters():
+    """대기 중 deadline 초과 / 취소된 대기자는 슬롯을 받지 않음"""
+    scheduler = LLMScheduler(
+        max_concurrency=1, max_queue=8, deadline_seconds=0.05, initial_service_seconds=0.01
+    )
+    await scheduler.acquire()
+
+    with pytest.raises(LLMOverloaded) as excinfo:
+        await scheduler.acquire()
+    assert excinfo.value.reason == "queue_timeout"
+    # Retry-After 근거는 지금부터의 예상 대기 (대기열이 비었으니 한 라운드)
+    assert excinfo.value.expected_wait_seconds == scheduler.expected_wait(PRIORITY_NORMAL) == 0.01
+
+    cancelled = await _queued(scheduler, PRIORITY_NORMAL, [], "cancelled")
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 0
+
+    scheduler.release(0.01)
+    assert scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_records_queue_and_service_time():
+    """slot(): 대기 시간 반환, 생성 시간 기록 + EWMA 갱신"""
+    scheduler = LLMScheduler(max_concurrency=1, initial_service_seconds=5.0, alpha=0.5)
+
+    async with scheduler.slot() as waited:
+        await asyncio.sleep(0.01)
+
+    stats = scheduler.stats()
+    assert waited == 0.0
+    assert scheduler.active == 0
+    assert stats["queue_time_ms"]["count"] == 1
+    assert stats["service_time_ms"]["count"] == 1
+    assert stats["service_time_ms"]["max"] >= 10
+    assert 2.5 < stats["service_seconds_ewma"] < 2.6
@@ -0,0 +1,112 @@
+"""
+단위 테스트: Qwen3-8B LLM 서비스
+1:1 페어링: backend/app/services/llm_service.py
+
+Coverage:
+- stream_answer: stream=True 호출, delta.content 조각 전달 (빈 조각 / choices 없는 청크 제외)
+- build_prompt: rag_prompt_token_budget 안에서 컨텍스트 구성, 프롬프트 토큰 수 보고
+- scheduler: 스트림이 끝날 때까지 생성 슬롯 유지, 클라이언트는 공유 커넥션 풀 사용
+- 종료 시 공유 풀이 닫힌 뒤 다시 시작되면 새 풀로 클라이언트 재생성
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.models import HandResult
+from app.services.llm_scheduler import LLMScheduler, close_llm_http_client, get_llm_http_client
+from app.services.llm_service import LLMService
+
+
+def _chunk(content):
+    if content is ...:
+        return SimpleNamespace(choices=[])
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_forwards_content_deltas():
+    """delta.content만 순서대로 전달"""
+    async def stream():
+        for content in ["Phil ", None, "", ..., "Ivey"]:
+            yield _chunk(content)
+
+    service = LLMService()
+    service.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=AsyncMock(return_value=stream())))
+    )
+
+    chunks = [text async for text in service.stream_answer("Ivey bluff", hands=[])]
+
+    assert chunks == ["Phil ", "Ivey"]
+    kwargs = service.client.chat.completions.create.await_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["extra_body"] == {"thinking": True}
+
+
+def test_build_prompt_respects_token_budget(monkeypatch):
+    """프롬프트 토큰 수 ≤ 예산, 예산이 작으면 핸드 수 감소"""
+    from app.services import llm_service
+
+    hands = [
+        HandResult(
+            hand_id=f"hand_{i:03d}",
+            hero_name="Phil Ivey",
+            description="Ivey bluffs the river with seven high. " * 5,
+            pot_bb=100.0,
+            street="River",
+            action="Bluff",
+        )
+        for i in range(5)
+    ]
+    service = LLMService()
+    monkeypatch.setattr(llm_service.settings, "rag_context_hands", 5)
+
+    monkeypatch.setattr(llm_service.settings, "rag_prompt_token_budget", 5000)
+    roomy = service.build_prompt("Ivey river bluff", hands)
+    monkeypatch.setattr(llm_service.settings, "rag_prompt_token_budget", 400)
+    tight = service.build_prompt("Ivey river bluff", hands)
+
+    assert roomy.hands_used == 5
+    assert tight.prompt_tokens <= 400
+    assert tight.hands_used < roomy.hands_used
+    assert tight.prompt_tokens == service.context_builder.counter.count(tight.text)
+    assert tight.tokenizer == "approximate" and tight.prompt_tokens_approximate
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_holds_scheduler_slot():
+    """스트림이 끝날 때까지 슬롯 점유, 종료 후 반납 + 생성 시간 기록"""
+    scheduler = LLMScheduler(max_concurrency=1)
+    service = LLMService(scheduler=scheduler)
+    assert service.client._client is LLMService(scheduler=scheduler).client._client
+
+    async def stream():
+        for content in ["Phil ", "Ivey"]:
+            yield _chunk(content)
+
+    service.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=AsyncMock(return_value=stream())))
+    )
+
+    chunks = service.stream_answer("Ivey bluff", hands=[])
+    assert await chunks.__anext__() == "Phil "
+    assert scheduler.active == 1
+    assert [text async for text in chunks] == ["Ivey"]
+
+    assert scheduler.active == 0
+    assert scheduler.stats()["service_time_ms"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_reconnects_after_pool_closed():
+    """close_llm_http_client() 후에도 닫힌 풀을 쓰지 않고 새 공유 풀로 재생성"""
+    service = LLMService()
+    old_pool = service.client._client
+
+    await close_llm_http_client()
+
+    assert old_pool.is_closed
+    assert service.client._client is not old_pool
+    assert service.client._client is get_llm_http_client()
+    assert not service.client._client.is_closed
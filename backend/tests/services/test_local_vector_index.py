@@ -0,0 +1,183 @@
+"""
+단위 테스트: 로컬 벡터 인덱스
+1:1 페어링: backend/app/services/local_vector_index.py
+
+Coverage:
+- exact top-k: 전수 정렬 결과와 동일 (argpartition), 정규화, k > n
+- 입력 검증: 차원 불일치
+- from_records / save / load (.npz)
+- HNSW 선택 의존성: 미설치 시 exact로 fallback
+- VertexSearchService vector_backend (local / replica fallback)
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from app.services.local_vector_index import LocalVectorIndex
+
+
+# ====================
+# Fixtures
+# ====================
+
+@pytest.fixture
+def corpus():
+    """무작위 임베딩 1000개 (64차원)"""
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(1000, 64)).astype(np.float32)
+    ids = [f"hand_{i:04d}" for i in range(1000)]
+    return ids, vectors
+
+
+# ====================
+# 검색 테스트
+# ====================
+
+def test_exact_top_k_matches_full_sort(corpus):
+    """argpartition top-k == 코사인 유사도 전체 정렬 상위 k"""
+    ids, vectors = corpus
+    index = LocalVectorIndex(ids, vectors, algorithm="exact")
+    query = vectors[42] + 0.1
+
+    results = index.search(query, top_k=10)
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:10]
+    assert [hand_id for hand_id, _ in results] == [ids[i] for i in expected]
+    assert results[0][0] == "hand_0042"
+    assert all(a[1] >= b[1] for a, b in zip(results, results[1:]))
+
+
+def test_scores_are_cosine_similarity():
+    """행/쿼리 정규화 후 내적 (Vertex DOT_PRODUCT distance와 같은 방향)"""
+    index = LocalVectorIndex(["a", "b"], [[2.0, 0.0], [0.0, 3.0]])
+
+    results = index.search([10.0, 0.0], top_k=2)
+
+    assert results[0] == ("a", pytest.approx(1.0))
+    assert results[1] == ("b", pytest.approx(0.0))
+
+
+def test_top_k_larger_than_corpus():
+    """k > n이면 전체 반환"""
+    index = LocalVectorIndex(["a", "b"], [[1.0, 0.0], [0.6, 0.8]])
+
+    assert [hand_id for hand_id, _ in index.search([1.0, 0.0], top_k=10)] == ["a", "b"]
+    assert index.search([1.0, 0.0], top_k=0) == []
+
+
+def test_dimension_mismatch_raises():
+    """ids/vectors 개수 불일치, 쿼리 차원 불일치"""
+    with pytest.raises(ValueError):
+        LocalVectorIndex(["a"], [[1.0], [2.0]])
+
+    index = LocalVectorIndex(["a"], [[1.0, 0.0]])
+    with pytest.raises(ValueError):
+        index.search([1.0, 0.0, 0.0])
+
+
+def test_matrix_is_contiguous_float32(corpus):
+    """연속 float32 행렬"""
+    ids, vectors = corpus
+    index = LocalVectorIndex(ids, vectors.astype(np.float64))
+
+    assert index.matrix.dtype == np.float32
+    assert index.matrix.flags["C_CONTIGUOUS"]
+    assert index.stats()["vectors"] == 1000
+
+
+# ====================
+# 생성 / 저장 테스트
+# ====================
+
+def test_from_records_skips_missing_embeddings():
+    """임베딩 없는 레코드는 건너뜀"""
+    index = LocalVectorIndex.from_records([
+        {"hand_id": "a", "embedding": [1.0, 0.0]},
+        {"hand_id": "b", "embedding": None},
+        {"hand_id": "c", "embedding": [0.0, 1.0]},
+    ])
+
+    assert index.ids == ["a", "c"]
+
+
+def test_save_and_load_roundtrip(tmp_path, corpus):
+    """.npz 저장 후 로드해도 같은 검색 결과"""
+    ids, vectors = corpus
+    index = LocalVectorIndex(ids, vectors)
+    path = str(tmp_path / "hand_embeddings.npz")
+
+    index.save(path)
+    loaded = LocalVectorIndex.load(path)
+
+    assert loaded.ids == ids
+    expected = index.search(vectors[3], top_k=5)
+    actual = loaded.search(vectors[3], top_k=5)
+    assert [hand_id for hand_id, _ in actual] == [hand_id for hand_id, _ in expected]
+    assert [score for _, score in actual] == pytest.approx([score for _, score in expected])
+
+
+def test_hnsw_without_hnswlib_falls_back_to_exact(corpus, monkeypatch):
+    """hnswlib 미설치 시 exact 검색"""
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_hnswlib(name, *args, **kwargs):
+        if name == "hnswlib":
+            raise ImportError("hnswlib")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_hnswlib)
+    ids, vectors = corpus
+
+    index = LocalVectorIndex(ids, vectors, algorithm="hnsw")
+
+    assert index.algorithm == "exact"
+    assert index.search(vectors[0], top_k=1)[0][0] == "hand_0000"
+
+
+# ====================
+# VertexSearchService vector_backend 테스트
+# ====================
+
+def _service(vector_backend, local_index):
+    from app.services.vertex_search import VertexSearchService
+
+    service = VertexSearchService.__new__(VertexSearchService)
+    service.mock_mode = False
+    service.vector_backend = vector_backend
+    service.local_index = local_index
+    service._find_neighbors_sync = Mock(return_value=[[Mock(id="vertex_hand", distance=0.8)]])
+    return service
+
+
+@pytest.mark.asyncio
+async def test_local_backend_serves_without_vertex():
+    """local: Vertex find_neighbors를 호출하지 않음"""
+    service = _service("local", LocalVectorIndex(["a", "b"], [[1.0, 0.0], [0.0, 1.0]]))
+
+    results = await service._vector_search([1.0, 0.1], top_k=1)
+
+    assert results == [{"hand_id": "a", "distance": pytest.approx(0.995, abs=1e-3)}]
+    service._find_neighbors_sync.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_local_backend_without_index_returns_empty():
+    """local: 인덱스가 없으면 Vertex로 넘어가지 않고 빈 결과"""
+    service = _service("local", None)
+
+    assert await service._vector_search([1.0, 0.0], top_k=1) == []
+    service._find_neighbors_sync.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_replica_backend_falls_back_to_vertex():
+    """replica: 로컬 검색 실패(차원 불일치 등) 시 Vertex로 fallback"""
+    service = _service("replica", LocalVectorIndex(["a"], [[1.0, 0.0, 0.0]]))
+
+    results = await service._vector_search([1.0, 0.0], top_k=1)
+
+    assert results == [{"hand_id": "vertex_hand", "distance": 0.8}]
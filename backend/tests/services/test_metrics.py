@@ -0,0 +1,118 @@
+"""
+단위 테스트: HDR 스타일 히스토그램
+1:1 페어링: backend/app/services/metrics.py
+
+Coverage:
+- 백분위: nearest-rank, 상대 오차 한도, 최댓값 제한, 빈 히스토그램
+- merge / reset / to_dict (버킷 포함 직렬화)
+"""
+
+import json
+
+import pytest
+
+from app.services.metrics import LatencyHistogram
+
+
+# ====================
+# 백분위 테스트
+# ====================
+
+def test_percentiles_within_relative_error():
+    """1..10000ms 균등 분포: 백분위가 상대 오차 2% 이내"""
+    hist = LatencyHistogram(resolution=0.001, precision_bits=7)
+    for ms in range(1, 10001):
+        hist.record(float(ms))
+
+    for p in (50, 90, 99, 99.9):
+        expected = 10000 * p / 100
+        assert hist.percentile(p) == pytest.approx(expected, rel=0.02)
+    assert hist.count == 10000
+    assert hist.min == 1.0
+    assert hist.max == 10000.0
+
+
+def test_percentile_tail_not_hidden():
+    """100개 중 1개만 느려도 p99는 빠른 값, p99.9/p100은 느린 값 (정렬 리스트 인덱싱 오류 없음)"""
+    hist = LatencyHistogram()
+    for _ in range(99):
+        hist.record(5.0)
+    hist.record(1000.0)
+
+    assert hist.percentile(99) == pytest.approx(5.0, rel=0.02)
+    assert hist.percentile(99.9) == 1000.0
+    assert hist.percentile(100) == 1000.0
+
+
+def test_percentile_capped_at_max():
+    """버킷 상한이 실제 최댓값을 넘지 않음"""
+    hist = LatencyHistogram()
+    hist.record(12.5)
+
+    assert hist.percentile(50) == 12.5
+    assert hist.percentiles((50, 99)) == {"p50": 12.5, "p99": 12.5}
+
+
+def test_empty_histogram():
+    """기록이 없으면 None"""
+    hist = LatencyHistogram()
+
+    assert hist.percentile(99) is None
+    assert hist.mean is None
+    assert hist.to_dict()["count"] == 0
+
+
+def test_negative_values_recorded_as_zero():
+    """음수는 0으로 기록"""
+    hist = LatencyHistogram()
+    hist.record(-1.0)
+
+    assert hist.min == 0.0
+    assert hist.percentile(50) == 0.0
+
+
+# ====================
+# merge / reset / 직렬화 테스트
+# ====================
+
+def test_merge():
+    """단계별 히스토그램 합산"""
+    a, b = LatencyHistogram(), LatencyHistogram()
+    a.record(1.0, count=3)
+    b.record(100.0)
+
+    a.merge(b)
+
+    assert a.count == 4
+    assert a.max == 100.0
+    assert a.mean == pytest.approx(103.0 / 4)
+    assert a.percentile(75) == pytest.approx(1.0, rel=0.02)
+
+
+def test_merge_rejects_different_resolution():
+    """정밀도가 다른 히스토그램은 합산 불가"""
+    with pytest.raises(ValueError):
+        LatencyHistogram(resolution=0.001).merge(LatencyHistogram(resolution=1.0))
+
+
+def test_reset():
+    """reset 후 빈 상태"""
+    hist = LatencyHistogram()
+    hist.record(3.0)
+    hist.reset()
+
+    assert hist.count == 0
+    assert hist.max is None
+
+
+def test_to_dict_with_buckets_is_json_serializable():
+    """버킷 포함 요약은 JSON으로 저장 가능 (실행 간 비교용)"""
+    hist = LatencyHistogram()
+    for ms in (1.0, 2.0, 2.0, 50.0):
+        hist.record(ms)
+
+    data = json.loads(json.dumps(hist.to_dict(buckets=True)))
+
+    assert data["count"] == 4
+    assert sum(data["buckets"].values()) == 4
+    assert set(data) >= {"p50", "p99", "p99.9", "resolution", "precision_bits"}
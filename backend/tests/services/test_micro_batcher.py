@@ -0,0 +1,141 @@
+"""
+단위 테스트: 비동기 Micro-batcher
+1:1 페어링: backend/app/services/micro_batcher.py
+
+Coverage:
+- 대기 시간 윈도우 안의 동시 요청 → 배치 호출 1회, 입력 순서대로 결과 전달
+- max_batch_size 도달 시 즉시 전송 / 윈도우 밖 요청은 다음 배치
+- 배치 실패 → 모든 대기자에게 예외, 결과 개수 불일치 검출
+- 취소된 요청 제외, 배치 크기/대기 시간 히스토그램
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.micro_batcher import MicroBatcher
+
+
+# ====================
+# Fixtures
+# ====================
+
+class RecordingBatchFn:
+    """배치 호출 기록용 배치 함수"""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def __call__(self, items):
+        self.calls.append(list(items))
+        await asyncio.sleep(self.delay)
+        return [item.upper() for item in items]
+
+
+# ====================
+# 배치 병합 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_batched():
+    """윈도우 안의 동시 요청은 배치 호출 1회, 결과는 각 요청에 순서대로"""
+    batch_fn = RecordingBatchFn()
+    batcher = MicroBatcher("test", batch_fn, max_batch_size=16, max_wait_ms=10)
+
+    results = await asyncio.gather(*(batcher.submit(q) for q in ["phil", "tom", "river"]))
+
+    assert results == ["PHIL", "TOM", "RIVER"]
+    assert batch_fn.calls == [["phil", "tom", "river"]]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_sent_without_waiting():
+    """max_batch_size가 차면 대기 시간 없이 즉시 전송"""
+    batch_fn = RecordingBatchFn()
+    batcher = MicroBatcher("test", batch_fn, max_batch_size=2, max_wait_ms=10_000)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(q) for q in ["a", "b", "c", "d"])), timeout=1
+    )
+
+    assert results == ["A", "B", "C", "D"]
+    assert batch_fn.calls == [["a", "b"], ["c", "d"]]
+
+
+@pytest.mark.asyncio
+async def test_requests_outside_window_use_next_batch():
+    """윈도우가 지난 뒤 도착한 요청은 다음 배치"""
+    batch_fn = RecordingBatchFn()
+    batcher = MicroBatcher("test", batch_fn, max_batch_size=16, max_wait_ms=1)
+
+    assert await batcher.submit("a") == "A"
+    assert await batcher.submit("b") == "B"
+    assert batch_fn.calls == [["a"], ["b"]]
+
+
+# ====================
+# 에러 / 취소 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_to_all():
+    """배치 호출 실패 → 배치의 모든 대기자에게 예외"""
+    async def failing(items):
+        raise RuntimeError("quota exceeded")
+
+    batcher = MicroBatcher("test", failing, max_batch_size=16, max_wait_ms=1)
+
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert batcher.stats()["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_result_count_mismatch_is_error():
+    """결과 개수가 입력과 다르면 예외"""
+    async def short(items):
+        return items[:1]
+
+    batcher = MicroBatcher("test", short, max_batch_size=16, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError, match="2 inputs"):
+        await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_excluded_from_batch():
+    """전송 전에 취소된 요청은 배치에서 제외"""
+    batch_fn = RecordingBatchFn()
+    batcher = MicroBatcher("test", batch_fn, max_batch_size=16, max_wait_ms=20)
+
+    cancelled = asyncio.ensure_future(batcher.submit("gone"))
+    kept = asyncio.ensure_future(batcher.submit("kept"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == "KEPT"
+    assert batch_fn.calls == [["kept"]]
+
+
+# ====================
+# 히스토그램 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_stats_histograms():
+    """배치 크기 / 대기 시간 / 배치 호출 시간 분포"""
+    batcher = MicroBatcher("test", RecordingBatchFn(delay=0.01), max_batch_size=16, max_wait_ms=5)
+
+    await asyncio.gather(*(batcher.submit(str(i)) for i in range(4)))
+    stats = batcher.stats()
+
+    assert stats["batches"] == 1
+    assert stats["items"] == 4
+    assert stats["batch_size"]["p50"] == 4
+    assert stats["wait_ms"]["count"] == 4
+    assert 3 <= stats["wait_ms"]["max"] < 100
+    assert stats["batch_call_ms"]["p99"] >= 10
@@ -0,0 +1,169 @@
+"""
+단위 테스트: 양자화 벡터 인덱스
+1:1 페어링: backend/app/services/quantized_vector_index.py
+
+Coverage:
+- int8: 메모리 1/4, 재순위화 없이도 높은 recall, 재순위화 시 정확한 점수
+- PQ: 코드 형태 (n, m) uint8, 재순위화로 recall 회복, 차원 검증
+- save / load: 원본 벡터 memmap, 원본 없으면 재순위화 없이 동작
+- load_local_vector_index: 설정으로 양자화 인덱스 선택
+- recall_report / format_recall_report
+"""
+
+import numpy as np
+import pytest
+
+from app.services.local_vector_index import LocalVectorIndex
+from app.services.quantized_vector_index import (
+    QuantizedVectorIndex,
+    format_recall_report,
+    recall_report,
+    vectors_path_for,
+)
+
+
+# ====================
+# Fixtures
+# ====================
+
+@pytest.fixture
+def corpus():
+    """군집 구조가 있는 임베딩 2000개 (64차원) + 쿼리 50개"""
+    rng = np.random.default_rng(11)
+    centers = rng.normal(size=(20, 64))
+    vectors = centers[rng.integers(0, 20, 2000)] + 0.5 * rng.normal(size=(2000, 64))
+    queries = centers[rng.integers(0, 20, 50)] + 0.5 * rng.normal(size=(50, 64))
+    ids = [f"hand_{i:04d}" for i in range(2000)]
+    return ids, vectors.astype(np.float32), queries.astype(np.float32)
+
+
+def recall(index, exact, queries, top_k=10) -> float:
+    hits = 0
+    for q in queries:
+        expected = {hand_id for hand_id, _ in exact.search(q, top_k)}
+        hits += len(expected & {hand_id for hand_id, _ in index.search(q, top_k)})
+    return hits / (len(queries) * top_k)
+
+
+# ====================
+# int8 테스트
+# ====================
+
+def test_int8_memory_and_recall(corpus):
+    """int8 코드는 float32의 1/4, 재순위화 없이도 recall 높음"""
+    ids, vectors, queries = corpus
+    exact = LocalVectorIndex(ids, vectors, algorithm="exact")
+    index = QuantizedVectorIndex.build(ids, vectors, method="int8", rerank_factor=0)
+
+    assert index.codes.dtype == np.int8
+    assert index.codes.nbytes * 4 == exact.matrix.nbytes
+    assert index.stats()["bytes_per_vector"] == 64
+    assert recall(index, exact, queries) >= 0.9
+
+
+def test_int8_rerank_returns_exact_scores(corpus):
+    """재순위화하면 점수는 원본 벡터 내적과 동일"""
+    ids, vectors, queries = corpus
+    exact = LocalVectorIndex(ids, vectors, algorithm="exact")
+    index = QuantizedVectorIndex.build(ids, vectors, method="int8", rerank_factor=4)
+
+    expected = exact.search(queries[0], 10)
+    found = index.search(queries[0], 10)
+
+    assert [hand_id for hand_id, _ in found] == [hand_id for hand_id, _ in expected]
+    assert [score for _, score in found] == pytest.approx([score for _, score in expected], abs=1e-5)
+
+
+# ====================
+# PQ 테스트
+# ====================
+
+def test_pq_codes_and_rerank_recall(corpus):
+    """PQ: 핸드당 m 바이트, 재순위화로 recall 회복"""
+    ids, vectors, queries = corpus
+    exact = LocalVectorIndex(ids, vectors, algorithm="exact")
+    approximate = QuantizedVectorIndex.build(ids, vectors, method="pq", pq_subspaces=16, rerank_factor=0)
+    reranked = QuantizedVectorIndex(
+        approximate.ids, approximate.codes, approximate.quantizer, approximate.full_vectors, 10
+    )
+
+    assert approximate.codes.shape == (2000, 16)
+    assert approximate.codes.dtype == np.uint8
+    assert approximate.stats()["bytes_per_vector"] == 16
+    assert recall(reranked, exact, queries) >= recall(approximate, exact, queries)
+    assert recall(reranked, exact, queries) >= 0.9
+
+
+def test_pq_dimension_must_divide():
+    """차원이 부분공간 수로 나누어지지 않으면 에러"""
+    vectors = np.ones((10, 10), dtype=np.float32)
+
+    with pytest.raises(ValueError, match="divisible"):
+        QuantizedVectorIndex.build([str(i) for i in range(10)], vectors, method="pq", pq_subspaces=3)
+
+
+# ====================
+# 저장 / 로드 테스트
+# ====================
+
+def test_save_and_load_memmaps_full_vectors(tmp_path, corpus):
+    """save → load: 코드는 메모리, 원본은 memmap, 검색 결과 동일"""
+    ids, vectors, queries = corpus
+    index = QuantizedVectorIndex.build(ids, vectors, method="pq", pq_subspaces=8)
+    path = str(tmp_path / "hands.pq.npz")
+    index.save(path)
+
+    loaded = QuantizedVectorIndex.load(path, rerank_factor=4)
+
+    assert isinstance(loaded.full_vectors, np.memmap)
+    assert loaded.algorithm == "pq"
+    assert loaded.search(queries[0], 5) == index.search(queries[0], 5)
+
+
+def test_load_without_vectors_skips_rerank(tmp_path, corpus):
+    """원본 .vectors.npy가 없으면 양자화 점수만으로 검색"""
+    ids, vectors, queries = corpus
+    path = str(tmp_path / "hands.int8.npz")
+    QuantizedVectorIndex.build(ids, vectors, method="int8").save(path)
+    (tmp_path / "hands.int8.vectors.npy").unlink()
+
+    loaded = QuantizedVectorIndex.load(path, rerank_factor=4)
+
+    assert loaded.full_vectors is None
+    assert loaded.stats()["rerank_factor"] == 0
+    assert len(loaded.search(queries[0], 5)) == 5
+
+
+def test_load_local_vector_index_selects_quantized(tmp_path, corpus, monkeypatch):
+    """local_vector_index_quantization 설정 시 QuantizedVectorIndex 로드"""
+    from app.services import local_vector_index
+
+    ids, vectors, _ = corpus
+    path = str(tmp_path / "hands.int8.npz")
+    QuantizedVectorIndex.build(ids, vectors, method="int8").save(path)
+    monkeypatch.setattr(local_vector_index.settings, "local_vector_index_path", path)
+    monkeypatch.setattr(local_vector_index.settings, "local_vector_index_quantization", "int8")
+
+    index = local_vector_index.load_local_vector_index()
+
+    assert isinstance(index, QuantizedVectorIndex)
+    assert vectors_path_for(path).endswith("hands.int8.vectors.npy")
+
+
+# ====================
+# 리포트 테스트
+# ====================
+
+def test_recall_report_rows(corpus):
+    """기준 행 recall 1.0 + 후보별 메모리 / recall"""
+    ids, vectors, queries = corpus
+    exact = LocalVectorIndex(ids, vectors, algorithm="exact")
+    candidates = {"int8": QuantizedVectorIndex.build(ids, vectors, method="int8", rerank_factor=0)}
+
+    rows = recall_report(exact, candidates, queries[:10], top_k=5)
+
+    assert [row["name"] for row in rows] == ["float32 exact", "int8"]
+    assert rows[0]["recall"] == 1.0
+    assert rows[0]["bytes_per_vector"] == 256
+    assert rows[1]["bytes_per_vector"] == 64
+    assert "recall@5" in format_recall_report(rows, 5)
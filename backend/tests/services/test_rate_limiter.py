@@ -0,0 +1,154 @@
+"""
+단위 테스트: GCRA Rate Limiter
+1:1 페어링: backend/app/services/rate_limiter.py
+
+Coverage:
+- RateLimiter: 버스트 허용 후 거부, 시간 경과에 따른 회복, remaining 계산
+- InMemoryRateLimitBackend: 유휴 키는 백그라운드 태스크가 제거 (요청 경로에서는 sweep 안 함)
+- 공유 백엔드 장애 시 인메모리 fallback (한 번 error 로그), redis 미설치 시 인메모리 백엔드
+"""
+
+import asyncio
+import builtins
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services import rate_limiter
+from app.services.rate_limiter import InMemoryRateLimitBackend, RateLimiter
+
+
+# ====================
+# Fixtures
+# ====================
+
+@pytest.fixture
+def clock():
+    """수동으로 진행시키는 가짜 시계"""
+    return {"now": 0.0}
+
+
+@pytest.fixture
+def backend(clock):
+    return InMemoryRateLimitBackend(sweep_interval_seconds=60, clock=lambda: clock["now"])
+
+
+# ====================
+# RateLimiter 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_burst_then_reject(backend):
+    """burst개까지 연속 허용, 그 다음은 거부"""
+    limiter = RateLimiter(limit_per_period=10, period_seconds=60, burst=5, backend=backend)
+
+    results = [await limiter.check("1.1.1.1") for _ in range(6)]
+
+    assert [r.allowed for r in results] == [True] * 5 + [False]
+    assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+    assert results[5].retry_after_seconds == pytest.approx(6.0)
+
+
+@pytest.mark.asyncio
+async def test_refill_over_time(backend, clock):
+    """emission interval마다 요청 1건씩 회복"""
+    limiter = RateLimiter(limit_per_period=60, period_seconds=60, burst=2, backend=backend)
+    assert (await limiter.check("ip")).allowed
+    assert (await limiter.check("ip")).allowed
+    assert not (await limiter.check("ip")).allowed
+
+    clock["now"] += 1.0
+
+    assert (await limiter.check("ip")).allowed
+    assert not (await limiter.check("ip")).allowed
+
+
+@pytest.mark.asyncio
+async def test_keys_are_independent(backend):
+    """IP별로 독립된 한도"""
+    limiter = RateLimiter(limit_per_period=1, period_seconds=60, backend=backend)
+
+    assert (await limiter.check("a")).allowed
+    assert not (await limiter.check("a")).allowed
+    assert (await limiter.check("b")).allowed
+
+
+# ====================
+# 유휴 키 제거 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_idle_keys_evicted_in_background(clock):
+    """TAT가 지난 키는 요청 없이도 백그라운드 sweep이 제거 → 메모리가 활성 IP 수에 비례"""
+    backend = InMemoryRateLimitBackend(sweep_interval_seconds=0.01, clock=lambda: clock["now"])
+    limiter = RateLimiter(limit_per_period=100, period_seconds=60, backend=backend)
+    for i in range(1000):
+        await limiter.check(f"10.0.{i // 256}.{i % 256}")
+
+    clock["now"] += 61
+    await limiter.check("active")
+    assert len(backend) == 1001  # 요청 경로에서는 sweep하지 않음
+
+    limiter.start_background_sweep()
+    await asyncio.sleep(0.05)
+    await limiter.stop()
+
+    assert len(backend) == 1
+
+
+def test_sweep_keeps_active_keys(backend, clock):
+    """아직 TAT가 남은 키는 유지"""
+    backend._tat.update({"idle": 5.0, "active": 100.0})
+    clock["now"] = 10.0
+
+    assert backend.sweep() == 1
+    assert len(backend) == 1
+
+
+# ====================
+# Fallback 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_backend_error_falls_back_to_memory():
+    """공유 백엔드 장애 시 프로세스 로컬 한도로 계속 제한"""
+    failing = AsyncMock()
+    failing.update.side_effect = ConnectionError("redis down")
+    limiter = RateLimiter(limit_per_period=2, period_seconds=60, backend=failing)
+
+    results = [await limiter.check("ip") for _ in range(3)]
+
+    assert [r.allowed for r in results] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_fallback_logged_once_as_error():
+    """공유 백엔드 → 인메모리 대체는 처음 한 번 error 로그"""
+    failing = AsyncMock()
+    failing.update.side_effect = ConnectionError("redis down")
+    limiter = RateLimiter(limit_per_period=2, period_seconds=60, backend=failing)
+
+    with patch.object(rate_limiter.logger, "error") as error:
+        for _ in range(3):
+            await limiter.check("ip")
+
+    error.assert_called_once()
+    assert error.call_args.args[0] == "rate_limit_fallback_to_memory"
+
+
+def test_create_rate_limiter_without_redis_package(monkeypatch):
+    """rate_limit_backend=redis인데 redis 미설치 → 인메모리 백엔드 + error 로그"""
+    real_import = builtins.__import__
+
+    def no_redis(name, *args, **kwargs):
+        if name.startswith("redis"):
+            raise ImportError("No module named 'redis'")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(rate_limiter.settings, "rate_limit_backend", "redis")
+    monkeypatch.setattr(builtins, "__import__", no_redis)
+    with patch.object(rate_limiter.logger, "error") as error:
+        limiter = rate_limiter.create_rate_limiter()
+
+    assert isinstance(limiter.backend, InMemoryRateLimitBackend)
+    assert error.call_args.args[0] == "rate_limit_redis_unavailable"
@@ -0,0 +1,83 @@
+"""
+단위 테스트: 검색 커서 / 순위 후보 캐시
+1:1 페어링: backend/app/services/search_cursor.py
+
+Coverage:
+- encode_cursor / decode_cursor: 왕복, 잘못된 커서
+- SearchCursorStore: 쿼리·필터 지문 검증, TTL 만료, LRU 제거, hit/miss 통계
+"""
+
+import pytest
+
+from app.services.search_cursor import SearchCursorStore, decode_cursor, encode_cursor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# ====================
+# 커서 인코딩 테스트
+# ====================
+
+def test_cursor_roundtrip():
+    """키 + offset 왕복 (URL-safe, 패딩 없음)"""
+    cursor = encode_cursor("abc_DEF-123", 40)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("abc_DEF-123", 40)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_cursor("", 5), "YWJj", encode_cursor("k", -1)])
+def test_decode_invalid_cursor(cursor):
+    """형식 오류 / 빈 키 / 음수 offset → ValueError"""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+# ====================
+# SearchCursorStore 테스트
+# ====================
+
+def test_store_get_checks_fingerprint():
+    """같은 쿼리·필터만 후보 목록 재사용"""
+    store = SearchCursorStore()
+    key = store.put(("river bluff", None), [{"hand_id": "hand_001"}])
+
+    assert store.get(key, ("river bluff", None)) == [{"hand_id": "hand_001"}]
+    assert store.get(key, ("hero call", None)) is None
+    assert store.get("unknown", ("river bluff", None)) is None
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 2
+
+
+def test_store_lookup_reports_truncated_list():
+    """lookup()은 잘린 후보 목록 여부(complete)를 함께 반환"""
+    store = SearchCursorStore()
+    key = store.put("q", [{"hand_id": "hand_001"}], complete=False)
+
+    entry = store.lookup(key, "q")
+
+    assert entry.complete is False
+    assert entry.results == [{"hand_id": "hand_001"}]
+    assert store.lookup(key, "other") is None
+
+
+def test_store_ttl_and_lru_eviction():
+    """TTL 만료 / max_entries 초과 시 후보 목록 제거"""
+    clock = FakeClock()
+    store = SearchCursorStore(max_entries=2, ttl_seconds=10, clock=clock)
+    first = store.put("q1", [])
+    second = store.put("q2", [])
+
+    clock.now = 11
+    assert store.get(first, "q1") is None
+
+    store.put("q3", [])
+    store.put("q4", [])
+    assert store.get(second, "q2") is None
+    assert store.stats()["size"] == 2
@@ -0,0 +1,195 @@
+"""
+단위 테스트: Single-flight 요청 병합
+1:1 페어링: backend/app/services/single_flight.py
+
+Coverage:
+- 같은 키 동시 호출은 한 번만 실행, 모든 호출자가 같은 결과 수신
+- 다른 키는 독립 실행, 완료 후 키 해제 (결과 캐시 아님)
+- 예외 공유, 한 호출자 취소 시 다른 대기자 영향 없음
+- 서비스 적용: BigQuery 자동완성 / 핸드 조회 / Vertex AI 임베딩 병합
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.single_flight import SingleFlight, get_single_flight, single_flight_stats
+
+
+# ====================
+# Helpers
+# ====================
+
+def counting_call(result, delay=0.02, error=None):
+    """호출 횟수를 세는 느린 백엔드 호출"""
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+
+    return call, calls
+
+
+# ====================
+# SingleFlight 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_concurrent_same_key_collapsed():
+    """같은 키 동시 호출 → 백엔드 1회, 나머지는 병합"""
+    flight = SingleFlight("test")
+    call, calls = counting_call(["Phil Ivey"])
+
+    results = await asyncio.gather(*(flight.do("phil", call) for _ in range(10)))
+
+    assert results == [["Phil Ivey"]] * 10
+    assert len(calls) == 1
+    assert flight.stats()["executions"] == 1
+    assert flight.stats()["collapsed"] == 9
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_not_collapsed():
+    """다른 키는 각각 실행"""
+    flight = SingleFlight("test")
+    call, calls = counting_call("ok")
+
+    await asyncio.gather(flight.do("a", call), flight.do("b", call))
+
+    assert len(calls) == 2
+    assert flight.stats()["collapsed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_not_cached():
+    """완료된 호출은 해제 → 다음 호출은 새로 실행"""
+    flight = SingleFlight("test")
+    call, calls = counting_call("ok", delay=0)
+
+    await flight.do("a", call)
+    await flight.do("a", call)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_shared_and_released():
+    """예외는 모든 대기자에게 전파되고 키는 해제"""
+    flight = SingleFlight("test")
+    call, calls = counting_call(None, error=RuntimeError("BigQuery down"))
+
+    results = await asyncio.gather(
+        *(flight.do("a", call) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(calls) == 1
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    """먼저 호출한 요청이 취소돼도 병합된 다른 대기자는 결과 수신"""
+    flight = SingleFlight("test")
+    call, calls = counting_call("ok", delay=0.05)
+
+    leader = asyncio.ensure_future(flight.do("a", call))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("a", call))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == "ok"
+    assert len(calls) == 1
+
+
+def test_registry_returns_same_instance():
+    """이름별 싱글톤 + 통계 노출"""
+    assert get_single_flight("registry_test") is get_single_flight("registry_test")
+    assert "registry_test" in single_flight_stats()
+
+
+# ====================
+# 서비스 적용 테스트
+# ====================
+
+class Row:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def slow_client(rows):
+    client = Mock()
+    job = Mock()
+
+    def result(timeout=None):
+        time.sleep(0.05)
+        return rows
+
+    job.result.side_effect = result
+    client.query.return_value = job
+    return client
+
+
+@pytest.mark.asyncio
+async def test_bigquery_autocomplete_collapses_identical_requests():
+    """같은 prefix 동시 요청은 BigQuery job 1개"""
+    from app.services.bigquery import BigQueryAutocompleteService
+
+    client = slow_client([Row(name="Phil Ivey"), Row(name="Phil Hellmuth")])
+    services = [BigQueryAutocompleteService(client=client) for _ in range(5)]
+
+    results = await asyncio.gather(
+        *(service.get_autocomplete_suggestions("Phil", limit=5) for service in services)
+    )
+
+    assert results == [["Phil Ivey", "Phil Hellmuth"]] * 5
+    assert client.query.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bigquery_hand_detail_collapses_identical_requests():
+    """같은 hand_id 동시 조회는 BigQuery job 1개"""
+    from app.services.bigquery import BigQueryService
+
+    service = BigQueryService.__new__(BigQueryService)
+    service.mock_mode = False
+    service.client = slow_client([])
+
+    results = await asyncio.gather(*(service.get_hand_by_id("hand_042") for _ in range(5)))
+
+    assert results == [None] * 5
+    assert service.client.query.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_vertex_embedding_collapses_identical_requests():
+    """같은 텍스트 동시 임베딩 요청은 Vertex AI 호출 1회"""
+    from app.services.vertex_search import VertexSearchService
+
+    calls = []
+
+    def slow_embed(text):
+        calls.append(text)
+        time.sleep(0.05)
+        return [0.1, 0.2]
+
+    service = VertexSearchService.__new__(VertexSearchService)
+    service.mock_mode = False
+    service.embedding_cache = None
+    service.embedding_batcher = None
+    service._embed_sync = slow_embed
+
+    results = await asyncio.gather(
+        *(service._generate_embedding("Junglemann river call") for _ in range(5))
+    )
+
+    assert results == [[0.1, 0.2]] * 5
+    assert len(calls) == 1
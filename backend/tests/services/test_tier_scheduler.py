@@ -0,0 +1,154 @@
+"""
+단위 테스트: 자동완성 Tier 스케줄러
+1:1 페어링: backend/app/services/tier_scheduler.py
+
+Coverage:
+- 앞 tier 결과 충분 시 다음 tier 미실행 (skipped) / 진행 중 tier 취소 (cancelled)
+- 앞 tier 결과 부족 시 즉시 다음 tier 시작, 결과 병합
+- hedge delay 경과 시 다음 tier 겹쳐 실행, deadline 초과 tier 버림 (timeout)
+- tier 에러 격리, merge_results 중복 제거
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.tier_scheduler import TierOutcome, TierScheduler, merge_results
+
+
+# ====================
+# Helpers
+# ====================
+
+def make_tier(results, delay=0.0, error=None, calls=None):
+    """delay초 후 results를 반환하는 tier 팩토리"""
+    async def tier():
+        if calls is not None:
+            calls.append(time.perf_counter())
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return list(results)
+    return tier
+
+
+def statuses(outcomes):
+    return [outcome.status for outcome in outcomes]
+
+
+# ====================
+# TierScheduler 테스트
+# ====================
+
+@pytest.mark.asyncio
+async def test_fast_primary_skips_fallback():
+    """첫 tier가 충분한 결과를 내면 다음 tier는 시작하지 않음"""
+    calls = []
+    scheduler = TierScheduler(deadline_ms=500, hedge_delay_ms=50, min_results=3)
+
+    outcomes = await scheduler.run([
+        ("memory_index", make_tier(["a", "b", "c"])),
+        ("vertex_ai", make_tier(["x"], calls=calls)),
+    ])
+
+    assert statuses(outcomes) == ["ok", "skipped"]
+    assert calls == []
+    assert merge_results(outcomes) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_insufficient_primary_starts_fallback_immediately():
+    """첫 tier 결과 부족 시 hedge delay를 기다리지 않고 다음 tier 시작"""
+    scheduler = TierScheduler(deadline_ms=1000, hedge_delay_ms=500, min_results=3)
+
+    start = time.perf_counter()
+    outcomes = await scheduler.run([
+        ("bigquery_cache", make_tier(["a"])),
+        ("vertex_ai", make_tier(["b", "a", "c"], delay=0.01)),
+    ])
+    elapsed = time.perf_counter() - start
+
+    assert statuses(outcomes) == ["ok", "ok"]
+    assert merge_results(outcomes) == ["a", "b", "c"]
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_hedge_overlaps_slow_primary():
+    """느린 첫 tier는 hedge delay 후 다음 tier와 겹쳐 실행 (직렬 합산 지연 없음)"""
+    scheduler = TierScheduler(deadline_ms=1000, hedge_delay_ms=20, min_results=3)
+
+    start = time.perf_counter()
+    outcomes = await scheduler.run([
+        ("bigquery_cache", make_tier(["a"], delay=0.1)),
+        ("vertex_ai", make_tier(["b", "c"], delay=0.1)),
+    ])
+    elapsed = time.perf_counter() - start
+
+    assert statuses(outcomes) == ["ok", "ok"]
+    assert merge_results(outcomes) == ["a", "b", "c"]
+    assert elapsed < 0.19
+
+
+@pytest.mark.asyncio
+async def test_losing_tier_cancelled():
+    """hedge된 tier가 먼저 충분한 결과를 내면 느린 tier는 취소"""
+    scheduler = TierScheduler(deadline_ms=1000, hedge_delay_ms=10, min_results=3)
+
+    outcomes = await scheduler.run([
+        ("bigquery_cache", make_tier(["a"], delay=5)),
+        ("vertex_ai", make_tier(["x", "y", "z"], delay=0.02)),
+    ])
+
+    assert statuses(outcomes) == ["cancelled", "ok"]
+    assert merge_results(outcomes) == ["x", "y", "z"]
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_partial_results():
+    """deadline 초과 tier는 timeout 처리, 도착한 결과만 반환"""
+    scheduler = TierScheduler(deadline_ms=50, hedge_delay_ms=0, min_results=3)
+
+    start = time.perf_counter()
+    outcomes = await scheduler.run([
+        ("bigquery_cache", make_tier(["a"], delay=0.005)),
+        ("vertex_ai", make_tier(["b"], delay=5)),
+    ])
+    elapsed = time.perf_counter() - start
+
+    assert statuses(outcomes) == ["ok", "timeout"]
+    assert outcomes[1].elapsed_ms >= 40
+    assert merge_results(outcomes) == ["a"]
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_tier_error_isolated():
+    """한 tier의 에러는 다른 tier 결과에 영향 없음"""
+    scheduler = TierScheduler(deadline_ms=500, hedge_delay_ms=50, min_results=3)
+
+    outcomes = await scheduler.run([
+        ("bigquery_cache", make_tier([], error=RuntimeError("BigQuery down"))),
+        ("vertex_ai", make_tier(["a", "b"])),
+    ])
+
+    assert statuses(outcomes) == ["error", "ok"]
+    assert outcomes[0].error == "BigQuery down"
+    assert merge_results(outcomes) == ["a", "b"]
+
+
+# ====================
+# merge_results 테스트
+# ====================
+
+def test_merge_results_priority_and_limit():
+    """tier 순서 유지, 중복 제거, 실패 tier 제외"""
+    outcomes = [
+        TierOutcome("memory_index", "ok", 1.0, ["a", "b"]),
+        TierOutcome("bigquery_cache", "timeout", 50.0, ["ignored"]),
+        TierOutcome("vertex_ai", "ok", 9.0, ["b", "c", "d"]),
+    ]
+
+    assert merge_results(outcomes) == ["a", "b", "c", "d"]
+    assert merge_results(outcomes, limit=3) == ["a", "b", "c"]
@@ -0,0 +1,153 @@
+"""
+단위 테스트: Vertex AI Vector Search restricts / crowding tag
+1:1 페어링: backend/app/services/vector_restricts.py
+
+Coverage:
+- datapoint_restricts: token / numeric restricts, crowding tag, 빈 값 생략
+- query_restricts: Namespace / NumericNamespace 변환, 빈 필터
+- VertexSearchService: find_neighbors에 restricts 전달, index_hand datapoint,
+  필터 쿼리는 BM25 leg 생략
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.services.vector_restricts import (
+    VectorFilters,
+    datapoint_restricts,
+    query_restricts,
+)
+
+
+# ====================
+# 업로드 경로 테스트
+# ====================
+
+def test_datapoint_restricts_full():
+    """tournament_id / tag token + pot_bb numeric + crowding tag"""
+    fields = datapoint_restricts({
+        "tournament_id": "wsop_2024",
+        "tags": ["BLUFF", "", "HERO_CALL"],
+        "pot_bb": 120,
+    })
+
+    assert fields["restricts"] == [
+        {"namespace": "tournament_id", "allow_list": ["wsop_2024"]},
+        {"namespace": "tag", "allow_list": ["BLUFF", "HERO_CALL"]},
+    ]
+    assert fields["numeric_restricts"] == [{"namespace": "pot_bb", "value_float": 120.0}]
+    assert fields["crowding_tag"] == {"crowding_attribute": "wsop_2024"}
+
+
+def test_datapoint_restricts_hand_summary_schema():
+    """hand_summary 스키마: tournament 컬럼 사용"""
+    fields = datapoint_restricts({"tournament": "High Stakes Poker"})
+
+    assert fields["restricts"] == [{"namespace": "tournament_id", "allow_list": ["High Stakes Poker"]}]
+    assert "numeric_restricts" not in fields
+
+
+def test_datapoint_restricts_empty():
+    """메타데이터 없으면 restricts 필드 없음"""
+    assert datapoint_restricts({"players": []}) == {}
+
+
+# ====================
+# 검색 경로 테스트
+# ====================
+
+def test_query_restricts_conversion():
+    """필터 → Namespace / NumericNamespace"""
+    token_filters, numeric_filters = query_restricts(
+        VectorFilters(tournament_id="wsop_2024", tags=["BLUFF", "COOLER"], min_pot_bb=100)
+    )
+
+    assert [(f.name, f.allow_tokens) for f in token_filters] == [
+        ("tournament_id", ["wsop_2024"]),
+        ("tag", ["BLUFF", "COOLER"]),
+    ]
+    assert numeric_filters[0].name == "pot_bb"
+    assert numeric_filters[0].value_float == 100.0
+    assert numeric_filters[0].op == "GREATER_EQUAL"
+
+
+def test_query_restricts_empty():
+    """빈 필터 → restricts 없음"""
+    assert query_restricts(None) == ([], [])
+    assert query_restricts(VectorFilters(tags=[])) == ([], [])
+    assert VectorFilters().is_empty is True
+    assert VectorFilters(min_pot_bb=0).is_empty is False
+
+
+def test_cache_key_ignores_tag_order():
+    """single-flight 키는 태그 순서 무관"""
+    assert (
+        VectorFilters(tags=["A", "B"]).cache_key()
+        == VectorFilters(tags=["B", "A"]).cache_key()
+    )
+
+
+# ====================
+# VertexSearchService 테스트
+# ====================
+
+@pytest.fixture
+def service():
+    from app.services.vertex_search import VertexSearchService
+
+    service = VertexSearchService.__new__(VertexSearchService)
+    service.mock_mode = False
+    service.vector_backend = "vertex"
+    service.local_index = None
+    service.adaptive_fetcher = None
+    return service
+
+
+def test_find_neighbors_passes_restricts(service):
+    """find_neighbors에 filter / numeric_filter 전달"""
+    endpoint = Mock()
+    endpoint.find_neighbors.return_value = [[]]
+    service._get_index_endpoint = Mock(return_value=endpoint)
+
+    service._find_neighbors_sync([0.1], 10, VectorFilters(tags=["BLUFF"], min_pot_bb=50))
+
+    kwargs = endpoint.find_neighbors.call_args.kwargs
+    assert [f.name for f in kwargs["filter"]] == ["tag"]
+    assert kwargs["numeric_filter"][0].value_float == 50.0
+
+    service._find_neighbors_sync([0.1], 10)
+
+    kwargs = endpoint.find_neighbors.call_args.kwargs
+    assert kwargs["filter"] is None
+    assert kwargs["numeric_filter"] is None
+
+
+@pytest.mark.asyncio
+async def test_index_hand_upserts_datapoint_with_restricts(service):
+    """index_hand: feature_vector + restricts + crowding tag upsert"""
+    index = Mock()
+    service._get_index = Mock(return_value=index)
+
+    await service.index_hand("hand_001", [0.1, 0.2], {"tournament_id": "wsop", "pot_bb": 80})
+
+    datapoint = index.upsert_datapoints.call_args.kwargs["datapoints"][0]
+    assert datapoint["datapoint_id"] == "hand_001"
+    assert datapoint["feature_vector"] == [0.1, 0.2]
+    assert datapoint["crowding_tag"] == {"crowding_attribute": "wsop"}
+    assert datapoint["numeric_restricts"][0]["value_float"] == 80.0
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_skips_bm25_leg(service):
+    """필터 쿼리는 벡터 leg만 (restricts 전달, BM25 leg는 필터 미지원)"""
+    service.text_index = Mock()
+    service.text_index.search = AsyncMock(return_value=[("hand_bm25", 3.0)])
+    service._generate_embedding = AsyncMock(return_value=[0.1])
+    service._find_neighbors_sync = Mock(return_value=[[Mock(id="hand_001", distance=0.9)]])
+    filters = VectorFilters(tournament_id="wsop")
+
+    results = await service.search("river bluff", top_k=5, similarity_threshold=0.5, filters=filters)
+
+    assert [r["hand_id"] for r in results] == ["hand_001"]
+    service.text_index.search.assert_not_called()
+    service._find_neighbors_sync.assert_called_once_with([0.1], 10, filters)
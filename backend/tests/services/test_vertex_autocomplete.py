@@ -8,6 +8,9 @@ Coverage:
 - 에러 케이스: API 장애, 타임아웃, graceful degradation
 - 성능 테스트: 응답 시간 <100ms (mock)
 - 오타 수정: "Junglman" → "Junglemann"
+- 재사용 핸들: 모델/엔드포인트 1회 생성, 실패 시 재생성, warmup
+- 임베딩 캐시: 반복 쿼리 API 호출 생략, 실패 결과 미저장
+- Micro-batching: 동시 쿼리 임베딩을 배치 호출 1회로 병합
 
 Target Coverage: 85%+
 """
@@ -32,6 +35,7 @@ def mock_settings():
         mock.gcp_location = "us-central1"
         mock.vertex_index_id = "test-index-id"
         mock.vertex_embedding_dimension = 768
+        mock.vertex_call_timeout_seconds = 10.0
         mock.search_type = "hybrid"
         yield mock
 
@@ -586,6 +590,195 @@ async def test_semantic_autocomplete_logging_error(service, caplog):
     # Should log error (structlog format)
 
 
+
+# ====================
+# 재사용 핸들 / Warmup 테스트
+# ====================
+
+def _embedding_result(values):
+    result = Mock()
+    result.values = values
+    return [result]
+
+
+def test_embedding_model_loaded_once(service):
+    """임베딩 모델은 프로세스당 한 번 로드 후 재사용"""
+    model = Mock()
+    model.get_embeddings.return_value = _embedding_result([0.1, 0.2])
+
+    with patch("vertexai.init") as mock_init, \
+         patch("vertexai.language_models.TextEmbeddingModel.from_pretrained",
+               return_value=model) as mock_load:
+        assert service._embed_sync("Phil Ivey bluff") == [0.1, 0.2]
+        assert service._embed_sync("hero call river") == [0.1, 0.2]
+
+    mock_init.assert_called_once()
+    mock_load.assert_called_once()
+    assert model.get_embeddings.call_count == 2
+    assert service.handle_stats()["creations"]["embedding_model"] == 1
+
+
+def test_embedding_model_recreated_after_failure(service):
+    """호출 실패 시에만 핸들 폐기 → 다음 호출에서 다시 로드"""
+    broken, healthy = Mock(), Mock()
+    broken.get_embeddings.side_effect = Exception("channel closed")
+    healthy.get_embeddings.return_value = _embedding_result([0.3])
+
+    with patch("vertexai.init"), \
+         patch("vertexai.language_models.TextEmbeddingModel.from_pretrained",
+               side_effect=[broken, healthy]) as mock_load:
+        with pytest.raises(Exception, match="channel closed"):
+            service._embed_sync("query")
+        assert service._embed_sync("query") == [0.3]
+
+    assert mock_load.call_count == 2
+    assert service.handle_stats()["resets"]["embedding_model"] == 1
+
+
+def test_index_endpoint_created_once(service):
+    """Index Endpoint 핸들은 한 번 생성 후 재사용"""
+    with patch("app.services.vertex_search.aiplatform") as mock_aiplatform:
+        endpoint = mock_aiplatform.MatchingEngineIndexEndpoint.return_value
+        endpoint.find_neighbors.return_value = [[]]
+
+        service._find_neighbors_sync([0.1] * 768, 10)
+        service._find_neighbors_sync([0.2] * 768, 10)
+
+    mock_aiplatform.MatchingEngineIndexEndpoint.assert_called_once()
+    assert endpoint.find_neighbors.call_count == 2
+
+
+def test_index_endpoint_recreated_after_failure(service):
+    """Vector Search 실패 시 엔드포인트 핸들 재생성"""
+    with patch("app.services.vertex_search.aiplatform") as mock_aiplatform:
+        mock_aiplatform.MatchingEngineIndexEndpoint.return_value.find_neighbors.side_effect = [
+            Exception("unavailable"), [[]]
+        ]
+
+        with pytest.raises(Exception):
+            service._find_neighbors_sync([0.1] * 768, 10)
+        service._find_neighbors_sync([0.1] * 768, 10)
+
+    assert mock_aiplatform.MatchingEngineIndexEndpoint.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_warmup_creates_handles(service):
+    """warmup: 더미 임베딩 + Vector Search 호출"""
+    service._embed_sync = Mock(return_value=[0.0] * 768)
+    service._find_neighbors_sync = Mock(return_value=[[]])
+
+    assert await service.warmup() is True
+
+    service._embed_sync.assert_called_once_with("warmup")
+    service._find_neighbors_sync.assert_called_once_with([0.0] * 768, 1)
+    assert service.handle_stats()["warmed_up"] is True
+
+
+@pytest.mark.asyncio
+async def test_warmup_failure_does_not_raise(service):
+    """warmup 실패는 로그만 남기고 False 반환 (첫 요청에서 재시도)"""
+    service._embed_sync = Mock(side_effect=Exception("quota exceeded"))
+
+    assert await service.warmup() is False
+    assert service.warmed_up is False
+
+
+@pytest.mark.asyncio
+async def test_generate_embedding_uses_cache(service):
+    """반복 쿼리는 임베딩 API 호출 없이 캐시 사용 (정규화 키)"""
+    from app.services.embedding_cache import EmbeddingCache
+
+    service.embedding_cache = EmbeddingCache(model_version="text-embedding-004")
+    service._embed_sync = Mock(return_value=[0.1] * 768)
+
+    first = await service._generate_embedding("Phil Ivey bluff")
+    second = await service._generate_embedding("phil ivey  bluff")
+
+    assert first == second == [0.1] * 768
+    service._embed_sync.assert_called_once_with("Phil Ivey bluff")
+    assert service.embedding_cache.stats()["hit_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_generate_embedding_failure_not_cached(service):
+    """임베딩 실패 시 제로 벡터는 캐시하지 않음"""
+    from app.services.embedding_cache import EmbeddingCache
+
+    service.embedding_cache = EmbeddingCache(model_version="text-embedding-004")
+    service._embed_sync = Mock(side_effect=[Exception("quota"), [0.2] * 768])
+
+    assert await service._generate_embedding("hero call river") == [0.0] * 768
+    assert await service._generate_embedding("hero call river") == [0.2] * 768
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_still_caches_embedding(service):
+    """호출자가 취소돼도 진행 중인 임베딩은 끝까지 생성되어 캐시 (하이브리드 벡터 leg 취소)"""
+    import threading
+
+    from app.services.embedding_cache import EmbeddingCache
+
+    service.embedding_cache = EmbeddingCache(model_version="text-embedding-004")
+    service.embedding_batcher = None
+    release = threading.Event()
+
+    def slow_embed(text):
+        release.wait(5)
+        return [0.3] * 768
+
+    service._embed_sync = Mock(side_effect=slow_embed)
+
+    caller = asyncio.ensure_future(service._generate_embedding("river bluff"))
+    await asyncio.sleep(0.01)
+    caller.cancel()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0.05)
+
+    assert await service._generate_embedding("river bluff") == [0.3] * 768
+    service._embed_sync.assert_called_once()
+    assert service.embedding_cache.stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embeddings_micro_batched(service):
+    """동시 캐시 miss 쿼리는 get_embeddings() 배치 호출 1회"""
+    from app.services.micro_batcher import MicroBatcher
+
+    service.embedding_cache = None
+    service.embedding_batcher = MicroBatcher(
+        "vertex_embedding", service._embed_batch, max_batch_size=16, max_wait_ms=20
+    )
+    model = Mock()
+    model.get_embeddings.side_effect = lambda inputs: [
+        Mock(values=[float(i)]) for i, _ in enumerate(inputs)
+    ]
+    service._get_embedding_model = Mock(return_value=model)
+
+    with patch("vertexai.language_models.TextEmbeddingInput", side_effect=lambda **kw: kw):
+        results = await asyncio.gather(
+            service._generate_embedding("Phil Ivey bluff"),
+            service._generate_embedding("hero call river"),
+            service._generate_embedding("Junglemann"),
+        )
+
+    assert results == [[0.0], [1.0], [2.0]]
+    model.get_embeddings.assert_called_once()
+    assert [i["text"] for i in model.get_embeddings.call_args[0][0]] == [
+        "Phil Ivey bluff", "hero call river", "Junglemann"
+    ]
+    assert service.embedding_batcher.stats()["batch_size"]["max"] == 3
+
+def test_get_vertex_search_service_singleton():
+    """모든 라우터가 같은 인스턴스(핸들) 공유"""
+    from app.services import vertex_search
+    from app.services.vertex_search import get_vertex_search_service
+
+    with patch.object(vertex_search, "_vertex_search_service", None):
+        assert get_vertex_search_service() is get_vertex_search_service()
+
 if __name__ == "__main__":
     # Run tests with coverage
     pytest.main([__file__, "-v", "--cov=app.services.vertex_search", "--cov-report=term-missing"])
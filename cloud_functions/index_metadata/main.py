@@ -5,7 +5,9 @@ v4.0.0 - Vertex AI Vector Search + BigQuery
 GCS Pub/Sub 트리거:
 - ATI가 GCS에 JSON 저장 시 자동 실행
 - BigQuery에 메타데이터 삽입
+- 자동완성용 선수명 빈도 테이블(player_name_stats) 갱신
 - Vertex AI Embedding 생성 (향후 Vector Search 인덱싱)
+  → restricts(tournament_id, tag, pot_bb) + crowding tag 포함 (검색 필터를 인덱스 안에서 처리)
 
 Deployment:
     gcloud functions deploy index-ati-metadata \
@@ -26,6 +28,11 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 import traceback
 
+# Vector Search restricts namespace (backend 검색 경로 / upload_embeddings.py와 동일)
+TOURNAMENT_NAMESPACE = "tournament_id"
+TAG_NAMESPACE = "tag"
+POT_NAMESPACE = "pot_bb"
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -40,6 +47,7 @@ class ATIMetadataProcessor:
         self.bq_client = bigquery.Client(project=project_id)
         self.dataset_id = "poker_archive"
         self.table_id = "hands"
+        self.name_stats_table_id = "player_name_stats"
 
         # Vertex AI 초기화
         aiplatform.init(project=project_id, location="us-central1")
@@ -139,6 +147,69 @@ class ATIMetadataProcessor:
             print(traceback.format_exc())
             return False
 
+    def update_player_name_stats(self, row: Dict[str, Any]) -> bool:
+        """자동완성용 선수명 빈도 갱신 (hero/villain, name_lc 기준 MERGE)
+
+        증분(+1) 대신 이 핸드에 나온 이름의 빈도를 핸드 테이블에서 다시 집계해 덮어씀
+        → Pub/Sub 재전송 / 함수 재시도로 같은 핸드가 두 번 처리돼도 이중 집계 없음 (멱등)
+        (백필 스크립트 create_player_name_stats.sh와 같은 집계식)
+
+        Args:
+            row: BigQuery에 삽입된 핸드 행
+
+        Returns:
+            성공 여부 (실패해도 핸드 인덱싱은 계속, 다음 백필에서 보정)
+        """
+        names_lc = sorted({
+            name.strip().lower()
+            for name in (row.get("hero_name"), row.get("villain_name"))
+            if name and name.strip()
+        })
+        if not names_lc:
+            return True
+
+        table_ref = f"{self.project_id}.{self.dataset_id}.{self.name_stats_table_id}"
+        source_ref = f"{self.project_id}.{self.dataset_id}.{self.table_id}"
+        query = f"""
+            MERGE `{table_ref}` T
+            USING (
+                SELECT
+                    LOWER(TRIM(name)) AS name_lc,
+                    ANY_VALUE(TRIM(name)) AS display_name,
+                    COUNT(*) AS frequency
+                FROM (
+                    SELECT hero_name AS name FROM `{source_ref}`
+                    UNION ALL
+                    SELECT villain_name AS name FROM `{source_ref}`
+                )
+                WHERE LOWER(TRIM(name)) IN UNNEST(@names_lc)
+                GROUP BY name_lc
+            ) S
+            ON T.name_lc = S.name_lc
+            WHEN MATCHED THEN
+                UPDATE SET frequency = S.frequency,
+                           updated_at = CURRENT_TIMESTAMP()
+            WHEN NOT MATCHED THEN
+                INSERT (name_lc, display_name, frequency, updated_at)
+                VALUES (S.name_lc, S.display_name, S.frequency, CURRENT_TIMESTAMP())
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("names_lc", "STRING", names_lc)
+            ]
+        )
+
+        try:
+            self.bq_client.query(query, job_config=job_config).result()
+            print(f"✅ player_name_stats updated: {names_lc}")
+            return True
+
+        except GoogleCloudError as e:
+            print(f"player_name_stats update failed: {e}")
+            print(traceback.format_exc())
+            return False
+
     def generate_embedding(self, text: str) -> Optional[List[float]]:
         """Vertex AI로 텍스트 임베딩 생성
 
@@ -165,11 +236,44 @@ class ATIMetadataProcessor:
             print(traceback.format_exc())
             return None
 
+    def build_restricts(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Vector Search batch import용 restricts / crowding tag
+
+        batch import JSON 형식 ("allow" 키, crowding_tag는 문자열)
+
+        Args:
+            metadata: ATI 메타데이터
+
+        Returns:
+            임베딩 JSON에 합칠 필드 (값 있는 필드만)
+        """
+        fields: Dict[str, Any] = {}
+
+        restricts = []
+        if metadata.get("tournament_id"):
+            restricts.append({"namespace": TOURNAMENT_NAMESPACE, "allow": [metadata["tournament_id"]]})
+        tags = [tag for tag in metadata.get("tags") or [] if tag]
+        if tags:
+            restricts.append({"namespace": TAG_NAMESPACE, "allow": tags})
+        if restricts:
+            fields["restricts"] = restricts
+
+        if metadata.get("pot_bb") is not None:
+            fields["numeric_restricts"] = [
+                {"namespace": POT_NAMESPACE, "value_float": float(metadata["pot_bb"])}
+            ]
+
+        if metadata.get("tournament_id"):
+            fields["crowding_tag"] = metadata["tournament_id"]
+
+        return fields
+
     def save_embedding_to_gcs(
         self,
         hand_id: str,
         embedding: List[float],
-        bucket_name: str = "ati-metadata-prod"
+        bucket_name: str = "ati-metadata-prod",
+        metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """임베딩을 GCS에 JSON으로 저장 (Vertex AI 인덱스 업로드용)
 
@@ -177,6 +281,7 @@ class ATIMetadataProcessor:
             hand_id: 핸드 ID
             embedding: 임베딩 벡터
             bucket_name: GCS 버킷 이름
+            metadata: ATI 메타데이터 (있으면 restricts / crowding tag 포함)
 
         Returns:
             성공 여부
@@ -185,7 +290,8 @@ class ATIMetadataProcessor:
             # embeddings/ 폴더에 저장
             embedding_data = {
                 "id": hand_id,
-                "embedding": embedding
+                "embedding": embedding,
+                **(self.build_restricts(metadata) if metadata else {})
             }
 
             bucket = self.storage_client.bucket(bucket_name)
@@ -239,6 +345,10 @@ class ATIMetadataProcessor:
             if not success:
                 return False
 
+            # 4-1. 자동완성용 선수명 빈도 갱신
+            if not self.update_player_name_stats(bq_row):
+                print("⚠️  player_name_stats update failed, but continuing...")
+
             # 5. Vertex AI Embedding 생성 및 저장
             embedding = self.generate_embedding(metadata["description"])
 
@@ -247,7 +357,8 @@ class ATIMetadataProcessor:
                 embedding_saved = self.save_embedding_to_gcs(
                     metadata["hand_id"],
                     embedding,
-                    bucket_name
+                    bucket_name,
+                    metadata=metadata
                 )
 
                 if not embedding_saved:
@@ -0,0 +1,86 @@
+#!/bin/bash
+# 자동완성용 선수명 빈도 테이블 생성 스크립트
+# player_name_stats: 정규화 이름(name_lc) 클러스터링
+#
+# 자동완성 요청은 전체 핸드 테이블을 재집계하지 않고
+# name_lc 범위 조건(name_lc >= @prefix AND name_lc < @prefix_next)으로 이 테이블만 조회한다.
+# 범위 조건은 CLUSTER BY name_lc 블록 프루닝으로 처리되므로 Search Index는 만들지 않는다
+# (Search Index는 SEARCH()/토큰 동등 조건용, 접두사 범위 스캔에는 쓰이지 않음).
+# 신규 핸드는 Cloud Function(index_metadata)이 해당 이름의 빈도를 원본에서 다시 집계해 MERGE한다
+# (아래 백필과 같은 집계식, 재시도해도 이중 집계 없음).
+
+set -e  # 에러 발생 시 즉시 종료
+
+# 환경변수 확인
+if [ -z "$GCP_PROJECT" ]; then
+    echo "Error: GCP_PROJECT 환경변수가 설정되지 않았습니다."
+    echo "사용법: export GCP_PROJECT=gg-poker-prod"
+    exit 1
+fi
+
+DATASET="${BQ_DATASET:-poker_archive}"
+SOURCE_TABLE="${BQ_SOURCE_TABLE:-hands}"
+TABLE="player_name_stats"
+
+echo "========================================="
+echo "player_name_stats 테이블 생성"
+echo "========================================="
+echo "프로젝트: $GCP_PROJECT"
+echo "데이터셋: $DATASET"
+echo "원본 테이블: $SOURCE_TABLE"
+echo "========================================="
+
+# 1. 테이블 생성 (name_lc 클러스터링)
+echo ""
+echo "[1/2] 테이블 생성 중..."
+bq query --project_id="$GCP_PROJECT" --use_legacy_sql=false "
+CREATE TABLE IF NOT EXISTS \`$GCP_PROJECT.$DATASET.$TABLE\` (
+    name_lc STRING NOT NULL OPTIONS(description='LOWER(TRIM(name)), prefix 범위 조회 키'),
+    display_name STRING NOT NULL OPTIONS(description='표시용 이름 (최초 등장 표기)'),
+    frequency INT64 NOT NULL OPTIONS(description='hero + villain 등장 횟수'),
+    updated_at TIMESTAMP
+)
+CLUSTER BY name_lc
+OPTIONS(description='자동완성용 선수명 빈도 (ingestion 시 갱신)')
+"
+echo "✅ 테이블 생성 완료"
+
+# 2. 기존 핸드로 빈도 백필 (재실행 시 전체 재계산, 스케줄 쿼리로도 사용 가능)
+echo ""
+echo "[2/2] 기존 데이터 백필 중..."
+bq query --project_id="$GCP_PROJECT" --use_legacy_sql=false "
+MERGE \`$GCP_PROJECT.$DATASET.$TABLE\` T
+USING (
+    SELECT
+        LOWER(TRIM(name)) AS name_lc,
+        ANY_VALUE(TRIM(name)) AS display_name,
+        COUNT(*) AS frequency
+    FROM (
+        SELECT hero_name AS name FROM \`$GCP_PROJECT.$DATASET.$SOURCE_TABLE\`
+        UNION ALL
+        SELECT villain_name AS name FROM \`$GCP_PROJECT.$DATASET.$SOURCE_TABLE\`
+    )
+    WHERE name IS NOT NULL AND TRIM(name) != ''
+    GROUP BY name_lc
+) S
+ON T.name_lc = S.name_lc
+WHEN MATCHED THEN
+    UPDATE SET frequency = S.frequency, updated_at = CURRENT_TIMESTAMP()
+WHEN NOT MATCHED THEN
+    INSERT (name_lc, display_name, frequency, updated_at)
+    VALUES (S.name_lc, S.display_name, S.frequency, CURRENT_TIMESTAMP())
+"
+echo "✅ 백필 완료"
+
+echo ""
+echo "========================================="
+echo "✅ player_name_stats 준비 완료!"
+echo "========================================="
+echo ""
+echo "테이블 전체 이름: $GCP_PROJECT:$DATASET.$TABLE"
+echo "클러스터링: name_lc"
+echo ""
+echo "백엔드 설정:"
+echo "  BQ_DATASET=$DATASET"
+echo "  BQ_TABLE_PLAYER_NAME_STATS=$TABLE"
+echo "========================================="
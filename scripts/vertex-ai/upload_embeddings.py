@@ -11,6 +11,8 @@ Workflow:
   2. Generate rich text descriptions from Open Hand History data
   3. Create embeddings using Vertex AI TextEmbedding-004
   4. Upload embeddings to Vertex AI Vector Search (100 hands per batch)
+     with token restricts (tournament_id, tag), numeric restrict (pot_bb)
+     and crowding tag (tournament_id) so search filters run inside the index
   5. Track progress and handle errors gracefully
 
 Usage:
@@ -48,6 +50,11 @@ EMBEDDING_MODEL = "text-embedding-004"  # 768 dimensions
 BATCH_SIZE = 100  # Vertex AI API batch limit
 TASK_TYPE = "RETRIEVAL_DOCUMENT"  # Optimal for search
 
+# Restrict namespaces (must match the search path filters)
+TOURNAMENT_NAMESPACE = "tournament_id"
+TAG_NAMESPACE = "tag"
+POT_NAMESPACE = "pot_bb"
+
 
 ###############################################################################
 # Helper Functions
@@ -172,6 +179,47 @@ def build_search_text(row: bigquery.Row) -> str:
     return ". ".join(parts)
 
 
+def _parse_json_list(value) -> List:
+    """JSON string or list -> list (invalid values -> empty list)"""
+    if not value:
+        return []
+    try:
+        parsed = json.loads(value) if isinstance(value, str) else value
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return list(parsed) if isinstance(parsed, (list, tuple)) else []
+
+
+def build_restricts(hand: Dict) -> Dict:
+    """
+    Build IndexDatapoint restrict fields for a hand
+
+    - restricts: tournament_id / tag token namespaces (allow lists)
+    - numeric_restricts: pot_bb (value_float)
+    - crowding_tag: tournament_id (limits neighbors per tournament at query time)
+
+    Returns:
+        Dict merged into the datapoint (only fields with values)
+    """
+    fields = {}
+
+    restricts = []
+    if hand.get("tournament_id"):
+        restricts.append({"namespace": TOURNAMENT_NAMESPACE, "allow_list": [str(hand["tournament_id"])]})
+    if hand.get("tags"):
+        restricts.append({"namespace": TAG_NAMESPACE, "allow_list": [str(tag) for tag in hand["tags"]]})
+    if restricts:
+        fields["restricts"] = restricts
+
+    if hand.get("pot_bb") is not None:
+        fields["numeric_restricts"] = [{"namespace": POT_NAMESPACE, "value_float": float(hand["pot_bb"])}]
+
+    if hand.get("tournament_id"):
+        fields["crowding_tag"] = {"crowding_attribute": str(hand["tournament_id"])}
+
+    return fields
+
+
 def get_hands_from_bigquery(limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
     """
     Query BigQuery hands_standard table for hand metadata
@@ -179,6 +227,7 @@ def get_hands_from_bigquery(limit: Optional[int] = None, offset: int = 0) -> Lis
     Returns list of dicts with:
       - hand_id: unique identifier
       - search_text: rich description for embedding
+      - tournament_id, tags, pot_bb: restrict values
     """
     log_info("=== BigQuery Data Retrieval ===")
     log_info(f"Dataset: {BIGQUERY_DATASET}")
@@ -224,9 +273,17 @@ def get_hands_from_bigquery(limit: Optional[int] = None, offset: int = 0) -> Lis
         # Build rich search text
         search_text = build_search_text(row)
 
+        try:
+            pot_bb = float(row.pot_size) if row.pot_size is not None else None
+        except (TypeError, ValueError):
+            pot_bb = None
+
         hands.append({
             "hand_id": row.hand_id,
-            "search_text": search_text
+            "search_text": search_text,
+            "tournament_id": row.get("tournament_id") or row.tournament_name,
+            "tags": [tag for tag in _parse_json_list(row.tags) if tag],
+            "pot_bb": pot_bb,
         })
 
     log_success(f"Retrieved {len(hands)} hands from BigQuery")
@@ -336,12 +393,13 @@ def upload_to_vector_search(hands: List[Dict], batch_size: int = BATCH_SIZE):
 
             log_success(f"  Generated {len(embeddings)} embeddings")
 
-            # 2. Create datapoints
+            # 2. Create datapoints (with restricts + crowding tag)
             datapoints = []
             for hand, embedding in zip(batch_hands, embeddings):
                 datapoints.append({
                     "datapoint_id": hand["hand_id"],
-                    "feature_vector": embedding
+                    "feature_vector": embedding,
+                    **build_restricts(hand)
                 })
 
             # 3. Upload to Vertex AI